@@ -0,0 +1,340 @@
+"""
+Archive of the assessment data of closed courses.
+
+The assessment workflows, peer workflows, assessments and assessment feedback
+of closed courses are moved to an archive database, configured with the
+ORA2_ARCHIVE_DATABASE setting (the alias of a database of DATABASES, migrated
+like the primary database), so that the tables of the primary database only
+grow with the courses that are running.
+
+The read APIs look up the primary database first, and the archive when the
+primary database has no data for a submission of an archived course.  The IDs
+of the archived courses are cached, so that the submissions of the running
+courses never query the archive.  Archived workflows are read-only.
+
+Courses are archived in batches of submissions.  Each batch is copied to the
+archive before it is removed from the primary database, and copying updates
+the rows that are already archived, so an interrupted archival is resumed
+by archiving the course again.
+"""
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.db.models import Max, Q
+
+from openassessment.assessment.models import (
+    Assessment, AssessmentFeedback, AssessmentFeedbackOption, AssessmentPart,
+    Criterion, CriterionOption, PeerWorkflow, PeerWorkflowItem, Rubric
+)
+from openassessment.assessment.models.ai import AI_ASSESSMENT_TYPE
+from openassessment.workflow.models import AssessmentWorkflow, AssessmentWorkflowCancellation, AssessmentWorkflowStep
+from submissions import api as sub_api
+
+
+logger = logging.getLogger(__name__)
+
+# Number of submissions to archive per transaction
+DEFAULT_BATCH_SIZE = 100
+
+# Maximum number of primary keys in a query, which keeps
+# queries below the limit of parameters of SQLite.
+MAX_IDS_PER_QUERY = 500
+
+ARCHIVED_COURSES_CACHE_KEY = u"openassessment.archive.archived_course_ids"
+
+# Time (in seconds) during which the IDs of the archived courses are cached.
+# Archiving a course forgets them, so this can safely be long.
+DEFAULT_ARCHIVED_COURSES_CACHE_TIMEOUT = 3600
+
+
+def archive_database():
+    """
+    Return the alias of the archive database, or None if archival is not configured.
+    """
+    return getattr(settings, 'ORA2_ARCHIVE_DATABASE', None)
+
+
+def is_archived(instance):
+    """
+    Check whether a model was loaded from the archive database.
+    """
+    alias = archive_database()
+    return alias is not None and instance._state.db == alias  # pylint: disable=protected-access
+
+
+def archived_course_ids():
+    """
+    Return the IDs of the courses with archived submissions, using the cache if possible.
+
+    Returns:
+        frozenset of unicode: Empty if the archive is not configured.
+
+    """
+    alias = archive_database()
+    if alias is None:
+        return frozenset()
+    course_ids = cache.get(ARCHIVED_COURSES_CACHE_KEY)
+    if course_ids is None:
+        course_ids = frozenset(
+            AssessmentWorkflow.objects.using(alias).order_by().values_list('course_id', flat=True).distinct()
+        )
+        timeout = getattr(settings, 'ORA2_ARCHIVED_COURSES_CACHE_TIMEOUT', DEFAULT_ARCHIVED_COURSES_CACHE_TIMEOUT)
+        cache.set(ARCHIVED_COURSES_CACHE_KEY, course_ids, timeout)
+    return course_ids
+
+
+def in_archived_course(submission_uuid):
+    """
+    Check whether a submission belongs to a course with archived submissions.
+
+    The course of the submission is only looked up (from the cache of the
+    submissions API) if some courses are archived.
+    """
+    course_ids = archived_course_ids()
+    if not course_ids:
+        return False
+    try:
+        submission = sub_api.get_submission_and_student(submission_uuid)
+    except sub_api.SubmissionError:
+        return False
+    return submission['student_item']['course_id'] in course_ids
+
+
+def fallback_to_archive(queryset, submission_uuid):
+    """
+    Evaluate a query on its database, then on the archive if it has no results there
+    and the submission it is about belongs to an archived course.
+
+    Args:
+        queryset (QuerySet): The query.
+        submission_uuid (str): The submission whose data is queried.
+
+    Returns:
+        list of models
+
+    """
+    results = list(queryset)
+    if not results and in_archived_course(submission_uuid):
+        results = list(queryset.using(archive_database()))
+    return results
+
+
+def get_with_fallback(queryset, submission_uuid):
+    """
+    Retrieve the model of a submission from the database of a query, or from the
+    archive if it is not found there and the submission belongs to an archived course.
+
+    Args:
+        queryset (QuerySet or Manager): The models to look up, which have a `submission_uuid` field.
+        submission_uuid (str): The submission.
+
+    Raises:
+        DoesNotExist: The model is neither in the database of the query nor in the archive.
+
+    """
+    try:
+        return queryset.get(submission_uuid=submission_uuid)
+    except queryset.model.DoesNotExist:
+        if not in_archived_course(submission_uuid):
+            raise
+        return queryset.using(archive_database()).get(submission_uuid=submission_uuid)
+
+
+def find_closed_courses(cutoff):
+    """
+    Find the courses in which no assessment workflow was modified since a date.
+
+    Args:
+        cutoff (datetime): The date.
+
+    Returns:
+        list of unicode: The IDs of the courses.
+
+    """
+    last_modified = AssessmentWorkflow.objects.values('course_id').annotate(
+        last_modified=Max('modified')
+    ).filter(last_modified__lt=cutoff).order_by('course_id')
+    return [course['course_id'] for course in last_modified]
+
+
+def archive_course(course_id, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Move the assessment data of a course to the archive database.
+
+    Args:
+        course_id (unicode): The course to archive.
+
+    Keyword Arguments:
+        batch_size (int): The number of submissions to archive per transaction.
+
+    Returns:
+        int: The number of submissions archived.
+
+    Raises:
+        ImproperlyConfigured: The archive database is not configured.
+
+    """
+    alias = archive_database()
+    if alias is None or alias not in settings.DATABASES:
+        raise ImproperlyConfigured(u"ORA2_ARCHIVE_DATABASE must be the alias of a database")
+
+    num_archived = 0
+    while True:
+        submission_uuids = list(
+            AssessmentWorkflow.objects.filter(course_id=course_id).order_by('id')
+            .values_list('submission_uuid', flat=True)[:batch_size]
+        )
+        if not submission_uuids:
+            break
+        _archive_submissions(submission_uuids, alias, remove_peer_workflows=False)
+        num_archived += len(submission_uuids)
+        logger.info(u"Archived {num} submissions of course {course_id}".format(num=num_archived, course_id=course_id))
+
+    # Peer workflows are removed once all the submissions of the course are archived,
+    # since removing a peer workflow removes the items of the submissions it graded.
+    while True:
+        submission_uuids = list(
+            PeerWorkflow.objects.filter(course_id=course_id).order_by('id')
+            .values_list('submission_uuid', flat=True)[:batch_size]
+        )
+        if not submission_uuids:
+            break
+        _archive_submissions(submission_uuids, alias, remove_peer_workflows=True)
+
+    return num_archived
+
+
+def _archive_submissions(submission_uuids, alias, remove_peer_workflows):
+    """
+    Copy the assessment data of submissions to the archive, then remove it from the primary database.
+
+    The peer workflow items graded by the authors of the submissions are archived with the
+    submissions, along with the workflows and assessments that they reference.  Assessments
+    made by the AI grading workflows are not archived, since the workflows reference them.
+    """
+    items = list(PeerWorkflowItem.objects.filter(
+        Q(author__submission_uuid__in=submission_uuids) | Q(scorer__submission_uuid__in=submission_uuids)
+    ))
+    peer_workflow_ids = set()
+    for item in items:
+        peer_workflow_ids.update([item.author_id, item.scorer_id])
+    peer_workflows = list(PeerWorkflow.objects.filter(submission_uuid__in=submission_uuids))
+    peer_workflows.extend(_in_batches(
+        PeerWorkflow.objects.exclude(submission_uuid__in=submission_uuids), 'id', peer_workflow_ids
+    ))
+
+    assessment_ids = set(item.assessment_id for item in items if item.assessment_id is not None)
+    assessments = list(
+        Assessment.objects.filter(submission_uuid__in=submission_uuids).exclude(score_type=AI_ASSESSMENT_TYPE)
+    )
+    assessment_ids.difference_update(assessment.id for assessment in assessments)
+    assessments.extend(_in_batches(Assessment.objects.all(), 'id', assessment_ids))
+    parts = _in_batches(AssessmentPart.objects.all(), 'assessment', [assessment.id for assessment in assessments])
+
+    rubric_ids = set(assessment.rubric_id for assessment in assessments)
+    feedback = list(AssessmentFeedback.objects.filter(submission_uuid__in=submission_uuids))
+    feedback_assessments = list(AssessmentFeedback.assessments.through.objects.filter(
+        assessmentfeedback__submission_uuid__in=submission_uuids
+    ))
+    feedback_options = list(AssessmentFeedback.options.through.objects.filter(
+        assessmentfeedback__submission_uuid__in=submission_uuids
+    ))
+
+    workflows = list(AssessmentWorkflow.objects.filter(submission_uuid__in=submission_uuids))
+    steps = list(AssessmentWorkflowStep.objects.filter(workflow__submission_uuid__in=submission_uuids))
+    cancellations = list(AssessmentWorkflowCancellation.objects.filter(
+        workflow__submission_uuid__in=submission_uuids
+    ))
+
+    with transaction.atomic(using=alias):
+        # Rubrics and feedback options are shared and never change,
+        # so they are only copied if they are not archived yet.
+        _copy(list(Rubric.objects.filter(id__in=rubric_ids)), alias, update=False)
+        _copy(list(Criterion.objects.filter(rubric__in=rubric_ids)), alias, update=False)
+        _copy(list(CriterionOption.objects.filter(criterion__rubric__in=rubric_ids)), alias, update=False)
+        _copy(
+            list(AssessmentFeedbackOption.objects.filter(
+                id__in=[link.assessmentfeedbackoption_id for link in feedback_options]
+            )),
+            alias, update=False
+        )
+
+        _copy(peer_workflows, alias)
+        _copy(assessments, alias)
+        _copy(parts, alias)
+        _copy(items, alias)
+        _copy(feedback, alias)
+        _copy(feedback_assessments, alias)
+        _copy(feedback_options, alias)
+        # Bulk inserts would reset the modification times of the workflows
+        _copy(workflows, alias, bulk=False)
+        _copy(steps, alias)
+        _copy(cancellations, alias)
+
+    # The course must be known to be archived before its data leaves the primary database,
+    # and the IDs are forgotten again afterwards in case a request cached them meanwhile.
+    cache.delete(ARCHIVED_COURSES_CACHE_KEY)
+    with transaction.atomic():
+        AssessmentFeedback.objects.filter(submission_uuid__in=submission_uuids).delete()
+        PeerWorkflowItem.objects.filter(author__submission_uuid__in=submission_uuids).delete()
+        Assessment.objects.filter(submission_uuid__in=submission_uuids).exclude(score_type=AI_ASSESSMENT_TYPE).delete()
+        AssessmentWorkflow.objects.filter(submission_uuid__in=submission_uuids).delete()
+        if remove_peer_workflows:
+            PeerWorkflow.objects.filter(submission_uuid__in=submission_uuids).delete()
+    cache.delete(ARCHIVED_COURSES_CACHE_KEY)
+
+
+def _copy(rows, alias, update=True, bulk=True):
+    """
+    Copy models to the archive, keeping their primary keys.
+
+    Args:
+        rows (list): The models to copy, all of the same type.
+        alias (unicode): The archive database.
+
+    Keyword Arguments:
+        update (bool): If True, update the models that are already archived.
+        bulk (bool): If True, insert the new models with bulk inserts.
+
+    """
+    if not rows:
+        return
+
+    model = type(rows[0])
+    archived_ids = set(_in_batches(
+        model.objects.using(alias), 'pk', [row.pk for row in rows], values=('pk',)
+    ))
+    new_rows = [row for row in rows if row.pk not in archived_ids]
+    if bulk:
+        model.objects.using(alias).bulk_create(new_rows)
+    else:
+        for row in new_rows:
+            row.save_base(raw=True, force_insert=True, using=alias)
+    if update:
+        for row in rows:
+            if row.pk in archived_ids:
+                row.save_base(raw=True, force_update=True, using=alias)
+
+
+def _in_batches(queryset, field_name, ids, values=None):
+    """
+    Retrieve the models whose field is one of many IDs, in batches of IDs.
+
+    Keyword Arguments:
+        values (tuple): If provided, retrieve the values of a field instead of models.
+
+    Returns:
+        list
+
+    """
+    ids = list(ids)
+    results = []
+    for start in xrange(0, len(ids), MAX_IDS_PER_QUERY):
+        batch = queryset.filter(**{u"{}__in".format(field_name): ids[start:start + MAX_IDS_PER_QUERY]})
+        if values:
+            batch = batch.values_list(*values, flat=True)
+        results.extend(batch)
+    return results
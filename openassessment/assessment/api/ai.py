@@ -1,8 +1,10 @@
 """
 Public interface for AI training and grading, used by students/course authors.
 """
+from importlib import import_module
 import logging
 from django.db import DatabaseError
+from django.utils.functional import SimpleLazyObject
 from submissions import api as sub_api
 from openassessment.assessment.serializers import (
     deserialize_training_examples, rubric_from_dict,
@@ -17,8 +19,10 @@ from openassessment.assessment.models import (
     InvalidRubricSelection, NoTrainingExamples,
     AI_ASSESSMENT_TYPE, AIClassifierSet
 )
-from openassessment.assessment.worker import training as training_tasks
-from openassessment.assessment.worker import grading as grading_tasks
+
+# The celery task modules are only imported when tasks are scheduled.
+training_tasks = SimpleLazyObject(lambda: import_module('openassessment.assessment.worker.training'))
+grading_tasks = SimpleLazyObject(lambda: import_module('openassessment.assessment.worker.grading'))
 
 
 logger = logging.getLogger(__name__)
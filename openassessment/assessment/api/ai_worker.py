@@ -34,6 +34,7 @@ def get_grading_task_params(grading_workflow_uuid):
         dict with keys:
             * essay_text (unicode): The text of the essay submission.
             * classifier_set (dict): Maps criterion names to serialized classifiers.
+            * classifier_set_id (int): ID of the classifier set.
             * valid_scores (dict): Maps criterion names to a list of valid scores for that criterion.
             * algorithm_id (unicode): ID of the algorithm used to perform training.
 
@@ -72,6 +73,7 @@ def get_grading_task_params(grading_workflow_uuid):
         return {
             'essay_text': workflow.essay_text,
             'classifier_set': workflow.classifier_set.classifier_data_by_criterion,
+            'classifier_set_id': workflow.classifier_set.pk,
             'algorithm_id': workflow.algorithm_id,
             'valid_scores': workflow.classifier_set.valid_scores_by_criterion,
         }
@@ -87,6 +89,90 @@ def get_grading_task_params(grading_workflow_uuid):
         raise AIGradingInternalError(msg)
 
 
+@dog_stats_api.timed('openassessment.assessment.ai.get_grading_tasks_params')
+def get_grading_tasks_params(grading_workflow_uuids):
+    """
+    Retrieve the parameters for many grading workflows at once,
+    grouped by the classifier set used to grade them.
+
+    Workflows that are already complete, that do not exist or that have
+    no classifier set are skipped (the latter two are logged).
+
+    Args:
+        grading_workflow_uuids (list of str): The UUIDs of the grading workflows.
+
+    Returns:
+        list of dicts with keys:
+            * essays (dict): Maps grading workflow UUIDs to the text of their essay submissions.
+            * classifier_set (dict): Maps criterion names to serialized classifiers.
+            * classifier_set_id (int): ID of the classifier set.
+            * valid_scores (dict): Maps criterion names to a list of valid scores for that criterion.
+            * algorithm_id (unicode): ID of the algorithm used to perform training.
+
+    Raises:
+        AIGradingInternalError
+
+    """
+    try:
+        workflows = list(
+            AIGradingWorkflow.objects.filter(
+                uuid__in=grading_workflow_uuids
+            ).select_related('classifier_set')
+        )
+    except DatabaseError as ex:
+        msg = (
+            u"An unexpected error occurred while retrieving "
+            u"{count} AI grading workflows: {ex}"
+        ).format(count=len(grading_workflow_uuids), ex=ex)
+        logger.exception(msg)
+        raise AIGradingInternalError(msg)
+
+    found_uuids = set(workflow.uuid for workflow in workflows)
+    for workflow_uuid in grading_workflow_uuids:
+        if workflow_uuid not in found_uuids:
+            logger.warning(u"Could not retrieve the AI grading workflow with uuid {}".format(workflow_uuid))
+
+    params_by_classifier_set = {}
+    for workflow in workflows:
+        if workflow.is_complete:
+            logger.info(u"Grading workflow with UUID {} is already marked complete".format(workflow.uuid))
+            continue
+
+        classifier_set = workflow.classifier_set
+        if classifier_set is None:
+            logger.error(
+                u"AI grading workflow with UUID {} has no classifier set, but was scheduled for grading".format(
+                    workflow.uuid
+                )
+            )
+            continue
+
+        params = params_by_classifier_set.get(classifier_set.pk)
+        if params is None:
+            try:
+                params = {
+                    'essays': {},
+                    'classifier_set': classifier_set.classifier_data_by_criterion,
+                    'classifier_set_id': classifier_set.pk,
+                    'algorithm_id': classifier_set.algorithm_id,
+                    'valid_scores': classifier_set.valid_scores_by_criterion,
+                }
+            except (
+                DatabaseError, ClassifierSerializeError, IncompleteClassifierSet,
+                ValueError, IOError, HTTPException
+            ) as ex:
+                msg = (
+                    u"An unexpected error occurred while retrieving "
+                    u"classifiers for the classifier set with ID {id}: {ex}"
+                ).format(id=classifier_set.pk, ex=ex)
+                logger.exception(msg)
+                raise AIGradingInternalError(msg)
+            params_by_classifier_set[classifier_set.pk] = params
+        params['essays'][workflow.uuid] = workflow.essay_text
+
+    return params_by_classifier_set.values()
+
+
 @dog_stats_api.timed('openassessment.assessment.ai.create_assessment')
 def create_assessment(grading_workflow_uuid, criterion_scores):
     """
@@ -150,6 +236,57 @@ def create_assessment(grading_workflow_uuid, criterion_scores):
     assessment_complete_signal.send(sender=None, submission_uuid=workflow.submission_uuid)
 
 
+@dog_stats_api.timed('openassessment.assessment.ai.create_assessments')
+def create_assessments(criterion_scores_by_workflow):
+    """
+    Create AI assessments for many grading workflows (complete the AI
+    grading tasks) in a single transaction.
+
+    Workflows that are already complete or that do not exist are skipped.
+
+    Args:
+        criterion_scores_by_workflow (dict): Maps grading workflow UUIDs
+            to dictionaries mapping criteria names to integer scores.
+
+    Returns:
+        None
+
+    Raises:
+        AIGradingInternalError
+
+    """
+    if not criterion_scores_by_workflow:
+        return
+
+    try:
+        workflows = [
+            workflow for workflow in AIGradingWorkflow.objects.filter(
+                uuid__in=criterion_scores_by_workflow.keys()
+            ).select_related('rubric')
+            if not workflow.is_complete
+        ]
+        AIGradingWorkflow.complete_bulk([
+            (workflow, criterion_scores_by_workflow[workflow.uuid])
+            for workflow in workflows
+        ])
+    except DatabaseError as ex:
+        msg = (
+            u"An unexpected error occurred while creating assessments "
+            u"for {count} AI grading workflows: {ex}"
+        ).format(count=len(criterion_scores_by_workflow), ex=ex)
+        logger.exception(msg)
+        raise AIGradingInternalError(msg)
+
+    logger.info(u"Created assessments for {} AI grading workflows".format(len(workflows)))
+
+    # Fire a signal to update the workflow API for each submission.
+    # The signal receiver is responsible for catching and logging
+    # all exceptions that may occur when updating the workflow.
+    from openassessment.assessment.signals import assessment_complete_signal
+    for workflow in workflows:
+        assessment_complete_signal.send(sender=None, submission_uuid=workflow.submission_uuid)
+
+
 @dog_stats_api.timed('openassessment.assessment.ai.get_training_task_params')
 def get_training_task_params(training_workflow_uuid):
     """
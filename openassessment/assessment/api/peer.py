@@ -9,6 +9,7 @@ from django.utils import timezone
 from django.db import DatabaseError, IntegrityError, transaction
 from dogapi import dog_stats_api
 
+from openassessment.archive import fallback_to_archive, get_with_fallback
 from openassessment.assessment.models import (
     Assessment, AssessmentFeedback, AssessmentPart,
     InvalidRubricSelection, PeerWorkflow, PeerWorkflowItem,
@@ -21,6 +22,7 @@ from openassessment.assessment.serializers import (
 from openassessment.assessment.errors import (
     PeerAssessmentRequestError, PeerAssessmentWorkflowError, PeerAssessmentInternalError
 )
+from openassessment.routers import replica_safe
 from submissions import api as sub_api
 
 logger = logging.getLogger("openassessment.assessment.api.peer")
@@ -384,10 +386,11 @@ def get_rubric_max_scores(submission_uuid):
             the submission, or its associated rubric.
     """
     try:
-        assessments = list(
+        assessments = fallback_to_archive(
             Assessment.objects.filter(
                 submission_uuid=submission_uuid
-            ).order_by("-scored_at", "-id").select_related("rubric")[:1]
+            ).order_by("-scored_at", "-id").select_related("rubric")[:1],
+            submission_uuid
         )
         if not assessments:
             return None
@@ -431,13 +434,15 @@ def get_assessment_median_scores(submission_uuid):
             information to form the median scores, an error is raised.
     """
     try:
-        workflow = PeerWorkflow.objects.get(submission_uuid=submission_uuid)
-        items = workflow.graded_by.filter(scored=True)
+        items = fallback_to_archive(
+            PeerWorkflowItem.objects.filter(
+                author__submission_uuid=submission_uuid, scored=True
+            ).select_related("assessment"),
+            submission_uuid
+        )
         assessments = [item.assessment for item in items]
         scores = Assessment.scores_by_criterion(assessments)
         return Assessment.get_median_score_dict(scores)
-    except PeerWorkflow.DoesNotExist:
-        return {}
     except DatabaseError:
         error_message = (
             u"Error getting assessment median scores for submission {uuid}"
@@ -486,6 +491,7 @@ def has_finished_required_evaluating(submission_uuid, required_assessments):
     return done, peers_graded
 
 
+@replica_safe
 def get_assessments(submission_uuid, limit=None):
     """Retrieve the assessments for a submission.
 
@@ -533,10 +539,13 @@ def get_assessments(submission_uuid, limit=None):
 
     """
     try:
-        assessments = Assessment.objects.filter(
-            submission_uuid=submission_uuid,
-            score_type=PEER_TYPE
-        )[:limit]
+        assessments = fallback_to_archive(
+            Assessment.objects.filter(
+                submission_uuid=submission_uuid,
+                score_type=PEER_TYPE
+            ).select_related("rubric")[:limit],
+            submission_uuid
+        )
         return serialize_assessments(assessments)
     except DatabaseError:
         error_message = (
@@ -781,9 +790,7 @@ def get_assessment_feedback(submission_uuid):
         PeerAssessmentInternalError: Error occurred while retrieving the feedback.
     """
     try:
-        feedback = AssessmentFeedback.objects.get(
-            submission_uuid=submission_uuid
-        )
+        feedback = get_with_fallback(AssessmentFeedback.objects, submission_uuid)
         return AssessmentFeedbackSerializer(feedback).data
     except AssessmentFeedback.DoesNotExist:
         return None
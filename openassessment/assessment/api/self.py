@@ -6,6 +6,7 @@ from django.db import DatabaseError, transaction
 from dogapi import dog_stats_api
 
 from submissions.api import get_submission_and_student, SubmissionNotFoundError
+from openassessment.archive import fallback_to_archive
 from openassessment.assessment.serializers import (
     InvalidRubric, full_assessment_dict, rubric_from_dict, serialize_assessments
 )
@@ -254,9 +255,9 @@ def get_assessment(submission_uuid):
     # but not at the database level.  Someone could take advantage of the race condition
     # between checking the number of self-assessments and creating a new self-assessment.
     # To be safe, we retrieve just the most recent submission.
-    serialized_assessments = serialize_assessments(Assessment.objects.filter(
+    serialized_assessments = serialize_assessments(fallback_to_archive(Assessment.objects.filter(
         score_type=SELF_TYPE, submission_uuid=submission_uuid
-    ).order_by('-scored_at')[:1])
+    ).order_by('-scored_at').select_related('rubric')[:1], submission_uuid))
 
     if not serialized_assessments:
         logger.info(
@@ -288,10 +289,11 @@ def get_assessment_scores_by_criteria(submission_uuid):
     """
     try:
         # This will always create a list of length 1
-        assessments = list(
+        assessments = fallback_to_archive(
             Assessment.objects.filter(
                 score_type=SELF_TYPE, submission_uuid=submission_uuid
-            ).order_by('-scored_at')[:1]
+            ).order_by('-scored_at')[:1],
+            submission_uuid
         )
         scores = Assessment.scores_by_criterion(assessments)
         # Since this is only being sent one score, the median score will be the
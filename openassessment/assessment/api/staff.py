@@ -3,15 +3,20 @@ Public interface for staff grading, used by students/course staff.
 """
 import logging
 from django.db import DatabaseError, transaction
+from django.db.models import Q
 from django.utils.timezone import now
 from dogapi import dog_stats_api
 
 from submissions import api as submissions_api
+from submissions.models import Submission
+from submissions.serializers import StudentItemSerializer, SubmissionSerializer
 
+from openassessment.archive import fallback_to_archive
 from openassessment.assessment.models import (
     Assessment, AssessmentFeedback, AssessmentPart,
-    InvalidRubricSelection, StaffWorkflow,
+    InvalidRubricSelection, PeerWorkflowItem, StaffWorkflow,
 )
+from openassessment.assessment.models.ai import AI_ASSESSMENT_TYPE
 from openassessment.assessment.serializers import (
     AssessmentFeedbackSerializer, RubricSerializer,
     full_assessment_dict, rubric_from_dict, serialize_assessments,
@@ -20,11 +25,17 @@ from openassessment.assessment.serializers import (
 from openassessment.assessment.errors import (
     StaffAssessmentRequestError, StaffAssessmentInternalError
 )
+from openassessment.assessment.api.peer import PEER_TYPE
+from openassessment.assessment.api.self import SELF_TYPE
+from openassessment.routers import replica_safe
 
 logger = logging.getLogger("openassessment.assessment.api.staff")
 
 STAFF_TYPE = "ST"
 
+# Number of assessments inserted per transaction by `create_assessments_bulk`.
+BULK_ASSESSMENT_CHUNK_SIZE = 100
+
 
 def submitter_is_finished(submission_uuid, staff_requirements):
     """
@@ -188,10 +199,10 @@ def get_latest_staff_assessment(submission_uuid):
 
     """
     try:
-        assessments = Assessment.objects.filter(
+        assessments = fallback_to_archive(Assessment.objects.filter(
             submission_uuid=submission_uuid,
             score_type=STAFF_TYPE,
-        )[:1]
+        )[:1], submission_uuid)
     except DatabaseError as ex:
         msg = (
             u"An error occurred while retrieving staff assessments "
@@ -206,6 +217,70 @@ def get_latest_staff_assessment(submission_uuid):
         return None
 
 
+def get_submission_report(submission_uuid):
+    """
+    Retrieve all the assessments of a submission and of its author, for the
+    learner information of the staff tools.
+
+    The assessments given to the submission and the peer assessments given
+    by its author are loaded with a single query, and the parts of all the
+    assessments that are not cached with another one.
+
+    Args:
+        submission_uuid (str): The UUID of the submission.
+
+    Returns:
+        dict with keys:
+            'peer_assessments' (list of dict): The peer assessments of the submission.
+            'submitted_assessments' (list of dict): The peer assessments given by the author of the submission.
+            'self_assessment' (dict or None): The latest self assessment of the submission.
+            'staff_assessment' (dict or None): The latest staff assessment of the submission.
+            'example_based_assessment' (dict or None): The latest AI assessment of the submission.
+            'rubric_max_scores' (dict or None): Maps the criteria names of the rubric of the latest
+                assessment of the submission to their maximum points, None if there is no assessment.
+
+    Raises:
+        StaffAssessmentInternalError if there are problems connecting to the database.
+
+    """
+    try:
+        submitted_ids = PeerWorkflowItem.objects.filter(
+            scorer__submission_uuid=submission_uuid,
+            assessment__isnull=False
+        ).values('assessment')
+        # Assessments are ordered from the most recent
+        assessments = serialize_assessments(fallback_to_archive(Assessment.objects.filter(
+            Q(submission_uuid=submission_uuid) | Q(pk__in=submitted_ids)
+        ).select_related("rubric"), submission_uuid))
+    except DatabaseError as ex:
+        msg = (
+            u"An error occurred while retrieving the assessments "
+            u"for the submission with UUID {uuid}: {ex}"
+        ).format(uuid=submission_uuid, ex=ex)
+        logger.exception(msg)
+        raise StaffAssessmentInternalError(msg)
+
+    received = [assessment for assessment in assessments if assessment['submission_uuid'] == submission_uuid]
+    latest = {}
+    for assessment in received:
+        latest.setdefault(assessment['score_type'], assessment)
+
+    return {
+        'peer_assessments': [assessment for assessment in received if assessment['score_type'] == PEER_TYPE],
+        'submitted_assessments': [
+            assessment for assessment in assessments
+            if assessment['submission_uuid'] != submission_uuid
+        ],
+        'self_assessment': latest.get(SELF_TYPE),
+        'staff_assessment': latest.get(STAFF_TYPE),
+        'example_based_assessment': latest.get(AI_ASSESSMENT_TYPE),
+        'rubric_max_scores': {
+            criterion['name']: criterion['points_possible']
+            for criterion in received[0]['rubric']['criteria']
+        } if received else None,
+    }
+
+
 def get_assessment_scores_by_criteria(submission_uuid):
     """Get the staff score for each rubric criterion
 
@@ -223,10 +298,11 @@ def get_assessment_scores_by_criteria(submission_uuid):
     """
     try:
         # This will always create a list of length 1
-        assessments = list(
+        assessments = fallback_to_archive(
             Assessment.objects.filter(
                 score_type=STAFF_TYPE, submission_uuid=submission_uuid
-            )[:1]
+            )[:1],
+            submission_uuid
         )
         scores = Assessment.scores_by_criterion(assessments)
         # Since this is only being sent one score, the median score will be the
@@ -291,6 +367,111 @@ def get_submission_to_assess(course_id, item_id, scorer_id):
         return None
 
 
+def get_submissions_to_assess(course_id, item_id, scorer_id, count):
+    """
+    Get a batch of submissions for staff evaluation.
+
+    Checks out up to `count` submissions for the given staff member in one
+    transaction, so that the next submission can be displayed as soon as the
+    current one has been graded.  Submissions the staff member has already
+    checked out are returned first.
+
+    Args:
+        course_id (str): The course that we would like to fetch submissions from.
+        item_id (str): The student_item (problem) that we would like to retrieve submissions for.
+        scorer_id (str): The user id of the staff member scoring these submissions.
+        count (int): The maximum number of submissions to check out.
+
+    Returns:
+        list of dict: Student submissions for assessment, each including the
+            serialized 'student_item', in the order they should be graded.
+            The list is empty if no submissions are available.
+
+    Raises:
+        StaffAssessmentInternalError: Raised when there is an internal error
+            retrieving staff workflow information.
+
+    Examples:
+        >>> get_submissions_to_assess("a_course_id", "an_item_id", "a_scorer_id", 2)
+        [
+            {
+                'uuid': u'10df7db776686822e501b05f452dc1e4b9141fe5',
+                'student_item': {'student_id': u'Bob', 'course_id': u'a_course_id', ...},
+                'attempt_number': 1,
+                'submitted_at': datetime.datetime(2014, 1, 29, 23, 14, 52, 649284, tzinfo=<UTC>),
+                'created_at': datetime.datetime(2014, 1, 29, 17, 14, 52, 668850, tzinfo=<UTC>),
+                'answer': { ... }
+            },
+            ...
+        ]
+
+    """
+    submission_uuids = StaffWorkflow.get_submissions_for_review(course_id, item_id, scorer_id, count)
+    if not submission_uuids:
+        logger.info(
+            u"No submission found for staff to assess ({}, {})"
+            .format(
+                course_id,
+                item_id,
+            )
+        )
+        return []
+
+    try:
+        submissions = Submission.objects.select_related('student_item').filter(uuid__in=submission_uuids)
+        submissions_by_uuid = {}
+        for submission in submissions:
+            submission_data = SubmissionSerializer(submission).data
+            submission_data['student_item'] = StudentItemSerializer(submission.student_item).data
+            submissions_by_uuid[submission_data['uuid']] = submission_data
+    except DatabaseError:
+        error_message = (
+            u"An error occurred while retrieving submissions {} for staff grading"
+        ).format(submission_uuids)
+        logger.exception(error_message)
+        raise StaffAssessmentInternalError(error_message)
+
+    missing_uuids = set(submission_uuids) - set(submissions_by_uuid)
+    if missing_uuids:
+        logger.error(
+            u"Could not find submissions with the uuids {}".format(sorted(missing_uuids))
+        )
+
+    return [
+        submissions_by_uuid[submission_uuid]
+        for submission_uuid in submission_uuids
+        if submission_uuid in submissions_by_uuid
+    ]
+
+
+def release_submissions_to_assess(course_id, item_id, scorer_id, submission_uuids=None):
+    """
+    Release submissions that a staff member checked out but did not grade,
+    for example when a batch returned by `get_submissions_to_assess` is abandoned.
+
+    Args:
+        course_id (str): The course the submissions belong to.
+        item_id (str): The student_item (problem) the submissions belong to.
+        scorer_id (str): The user id of the staff member who checked out the submissions.
+
+    Keyword Arguments:
+        submission_uuids (list of str): If provided, only release these submissions.
+            Otherwise release every ungraded submission checked out by the staff member.
+
+    Returns:
+        int: The number of submissions released.
+
+    Raises:
+        StaffAssessmentInternalError: Raised when there is an internal error
+            updating staff workflow information.
+
+    """
+    return StaffWorkflow.release_submissions_for_review(
+        course_id, item_id, scorer_id, submission_uuids=submission_uuids
+    )
+
+
+@replica_safe
 def get_staff_grading_statistics(course_id, item_id):
     """
     Returns the number of graded, ungraded, and in-progress submissions for staff grading.
@@ -451,3 +632,190 @@ def _complete_assessment(
     if scorer_workflow is not None:
         scorer_workflow.close_active_assessment(assessment, scorer_id)
     return assessment
+
+
+def create_assessments_bulk(assessments, scorer_id, rubric_dict, scored_at=None, chunk_size=None):
+    """
+    Create staff assessments for many submissions at once, for example when
+    grades were entered offline and are being uploaded for a whole course.
+
+    All selections are validated against the rubric before anything is
+    written.  Assessments and their parts are then inserted in chunks
+    (one transaction per chunk) and the staff workflows of each chunk
+    are closed with a single UPDATE.
+
+    This does not update the learners' assessment workflows; callers are
+    expected to do that for the returned submissions, as they would after
+    calling `create_assessment`.
+
+    Args:
+        assessments (list of dict): The assessments to create.  Each dict contains
+            'submission_uuid' and 'options_selected', and optionally
+            'criterion_feedback' and 'overall_feedback'.
+        scorer_id (str): The user ID of the staff member giving these assessments.
+        rubric_dict (dict): The rubric the assessments are made against.
+
+    Keyword Args:
+        scored_at (datetime): Optional argument to override the time in which
+            the assessments took place. If not specified, scored_at is set to now.
+        chunk_size (int): The number of assessments to create per transaction.
+            Defaults to BULK_ASSESSMENT_CHUNK_SIZE.
+
+    Returns:
+        list of str: The UUIDs of the assessed submissions, in the order given.
+
+    Raises:
+        StaffAssessmentRequestError: Raised when the rubric is invalid, a
+            submission appears more than once, or the selections for any
+            submission do not match the rubric.  No assessments are created.
+        StaffAssessmentInternalError: Raised when there is an internal error
+            while creating the assessments.  Chunks that were already
+            committed are kept.
+
+    Examples:
+        >>> create_assessments_bulk([
+        >>>     {"submission_uuid": "1", "options_selected": {"clarity": "Very clear"}},
+        >>>     {"submission_uuid": "2", "options_selected": {"clarity": "Not clear"}},
+        >>> ], "Tim", rubric_dict)
+        ["1", "2"]
+    """
+    if chunk_size is None:
+        chunk_size = BULK_ASSESSMENT_CHUNK_SIZE
+    if scored_at is None:
+        # All assessments share the timestamp, which is also used
+        # to find them again after the bulk insert.
+        scored_at = now()
+
+    try:
+        rubric = rubric_from_dict(rubric_dict)
+        validated = _validate_bulk_assessments(assessments, rubric.index)
+    except InvalidRubric:
+        error_message = u"The rubric definition is not valid."
+        logger.exception(error_message)
+        raise StaffAssessmentRequestError(error_message)
+    except DatabaseError:
+        error_message = u"An error occurred while loading the rubric for bulk staff assessment."
+        logger.exception(error_message)
+        raise StaffAssessmentInternalError(error_message)
+
+    submission_uuids = []
+    for start in xrange(0, len(validated), chunk_size):
+        chunk = validated[start:start + chunk_size]
+        try:
+            _create_assessment_chunk(chunk, rubric, scorer_id, scored_at)
+        except DatabaseError:
+            error_message = (
+                u"An error occurred while creating {count} assessments by the scorer with this ID: {scorer_id}. "
+                u"{created} assessments were created before the error."
+            ).format(count=len(validated), scorer_id=scorer_id, created=len(submission_uuids))
+            logger.exception(error_message)
+            raise StaffAssessmentInternalError(error_message)
+        submission_uuids.extend(item['submission_uuid'] for item in chunk)
+
+    logger.info(
+        u"Created {count} staff assessments by the scorer with ID {scorer_id}".format(
+            count=len(submission_uuids), scorer_id=scorer_id
+        )
+    )
+    return submission_uuids
+
+
+def _validate_bulk_assessments(assessments, rubric_index):
+    """
+    Validate the selections of each assessment against the rubric and
+    build its (unsaved) assessment parts.
+
+    Args:
+        assessments (list of dict): See `create_assessments_bulk`.
+        rubric_index (RubricIndex): The index of the rubric's data.
+
+    Returns:
+        list of dict with keys 'submission_uuid', 'overall_feedback' and 'parts'.
+
+    Raises:
+        StaffAssessmentRequestError
+
+    """
+    validated = []
+    seen_uuids = set()
+    for assessment in assessments:
+        submission_uuid = assessment.get('submission_uuid')
+        if not submission_uuid:
+            raise StaffAssessmentRequestError(u"Each assessment must include a submission UUID.")
+        if submission_uuid in seen_uuids:
+            raise StaffAssessmentRequestError(
+                u"The submission {} was assessed more than once.".format(submission_uuid)
+            )
+        seen_uuids.add(submission_uuid)
+
+        try:
+            parts = AssessmentPart.build_from_option_names(
+                rubric_index,
+                assessment.get('options_selected', {}),
+                feedback=assessment.get('criterion_feedback', {})
+            )
+        except InvalidRubricSelection:
+            error_message = u"Invalid options were selected in the rubric for the submission {}.".format(
+                submission_uuid
+            )
+            logger.warning(error_message, exc_info=True)
+            raise StaffAssessmentRequestError(error_message)
+
+        validated.append({
+            'submission_uuid': submission_uuid,
+            'overall_feedback': assessment.get('overall_feedback', u""),
+            'parts': parts,
+        })
+    return validated
+
+
+@transaction.atomic
+def _create_assessment_chunk(chunk, rubric, scorer_id, scored_at):
+    """
+    Insert validated assessments and their parts, and close the
+    corresponding staff workflows, in a single transaction.
+
+    Args:
+        chunk (list of dict): Validated assessments, see `_validate_bulk_assessments`.
+        rubric (Rubric): The rubric the assessments are made against.
+        scorer_id (str): The user ID of the staff member giving these assessments.
+        scored_at (datetime): The time the assessments took place.
+
+    Returns:
+        None
+
+    """
+    submission_uuids = [item['submission_uuid'] for item in chunk]
+    Assessment.objects.bulk_create([
+        Assessment(
+            rubric=rubric,
+            scorer_id=scorer_id,
+            submission_uuid=item['submission_uuid'],
+            score_type=STAFF_TYPE,
+            scored_at=scored_at,
+            feedback=item['overall_feedback'][0:Assessment.MAX_FEEDBACK_SIZE],
+        )
+        for item in chunk
+    ])
+
+    # Not every database returns the primary keys from a bulk insert,
+    # so look the new assessments up again.  If the submission was already
+    # assessed with the same timestamp, the newest assessment wins.
+    assessment_ids = dict(
+        Assessment.objects.filter(
+            submission_uuid__in=submission_uuids,
+            rubric=rubric,
+            scorer_id=scorer_id,
+            score_type=STAFF_TYPE,
+            scored_at=scored_at,
+        ).order_by('id').values_list('submission_uuid', 'id')
+    )
+
+    parts = []
+    for item in chunk:
+        for part in item['parts']:
+            part.assessment_id = assessment_ids[item['submission_uuid']]
+            parts.append(part)
+    AssessmentPart.objects.bulk_create(parts)
+
+    StaffWorkflow.close_active_assessments(assessment_ids, scorer_id)
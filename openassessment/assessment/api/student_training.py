@@ -6,11 +6,16 @@ Public interface for student training:
     they gave to to the instructor's assessment.
 
 """
+import json
 import logging
+from hashlib import sha1
+from django.conf import settings
+from django.core.cache import cache
 from django.utils.translation import ugettext as _
 from django.db import DatabaseError
+from django.utils.functional import SimpleLazyObject
 from submissions import api as sub_api
-from openassessment.assessment.models import StudentTrainingWorkflow, InvalidRubricSelection
+from openassessment.assessment.models import Rubric, StudentTrainingWorkflow, InvalidRubricSelection, TrainingExample
 from openassessment.assessment.serializers import (
     deserialize_training_examples, serialize_training_example,
     validate_training_example_format,
@@ -19,11 +24,36 @@ from openassessment.assessment.serializers import (
 from openassessment.assessment.errors import (
     StudentTrainingRequestError, StudentTrainingInternalError
 )
+from openassessment.cache import create_cache
 
 
 logger = logging.getLogger(__name__)
 
 
+def _training_sets_cache_in_mem():
+    """
+    Create the in-memory cache of training sets, unless settings override it.
+    """
+    cache_in_mem = getattr(settings, 'ORA2_TRAINING_SETS_CACHE_IN_MEM', None)
+    if cache_in_mem is None:
+        cache_in_mem = create_cache(
+            'django.core.cache.backends.locmem.LocMemCache',
+            LOCATION='openassessment.student_training.training_sets'
+        )
+    return cache_in_mem
+
+
+# Training examples are defined by the problem and shared by every learner,
+# so keep the validated and deserialized sets in memory for each process,
+# keyed by their content.  The shared Django cache only holds the IDs of
+# the examples.  The cache is created on first use.
+TRAINING_SETS_CACHE_IN_MEM = SimpleLazyObject(_training_sets_cache_in_mem)
+
+# Time (in seconds) during which the IDs of the examples of a training set are
+# kept in the shared cache.  Training examples are never modified, so this is long.
+TRAINING_SET_IDS_CACHE_TIMEOUT = 60 * 60 * 24
+
+
 def submitter_is_finished(submission_uuid, training_requirements):   # pylint:disable=W0613
     """
     Check whether the student has correctly assessed
@@ -368,13 +398,8 @@ def get_training_example(submission_uuid, rubric, examples):
 
     """
     try:
-        # Validate the training examples
-        errors = validate_training_examples(rubric, examples)
-        if len(errors) > 0:
-            msg = (
-                u"Training examples do not match the rubric (submission UUID is {uuid}): {errors}"
-            ).format(uuid=submission_uuid, errors="\n".join(errors))
-            raise StudentTrainingRequestError(msg)
+        # Validate and get or create the training examples
+        examples = _get_training_set(submission_uuid, rubric, examples)
 
         # Get or create the workflow
         workflow = StudentTrainingWorkflow.get_workflow(submission_uuid=submission_uuid)
@@ -383,9 +408,6 @@ def get_training_example(submission_uuid, rubric, examples):
                 u"No learner training workflow found for submission {}".format(submission_uuid)
             )
 
-        # Get or create the training examples
-        examples = deserialize_training_examples(examples, rubric)
-
         # Pick a training example that the student has not yet completed
         # If the student already started a training example, then return that instead.
         next_example = workflow.next_training_example(examples)
@@ -408,6 +430,82 @@ def get_training_example(submission_uuid, rubric, examples):
         raise StudentTrainingInternalError(msg)
 
 
+def _get_training_set(submission_uuid, rubric, examples):
+    """
+    Validate the training examples against the rubric and deserialize them,
+    reusing the result for every learner that uses the same rubric and examples.
+
+    Compiled training sets are looked up in the in-process cache first; otherwise
+    the IDs of their examples are looked up in the Django cache, and the examples
+    loaded with a single query.  Since the cache key is calculated from the content
+    of the rubric and the examples, entries never need to be invalidated.
+
+    Args:
+        submission_uuid (str): The UUID of the student's submission (used for error messages).
+        rubric (dict): Serialized rubric model.
+        examples (list): List of serialized training examples.
+
+    Returns:
+        list of TrainingExample
+
+    Raises:
+        StudentTrainingRequestError
+        InvalidRubric
+        InvalidRubricSelection
+        InvalidTrainingExample
+        DatabaseError
+
+    """
+    cache_key = _training_set_cache_key(rubric, examples)
+    training_set = TRAINING_SETS_CACHE_IN_MEM.get(cache_key)
+    if training_set is None:
+        training_set = _load_training_set(cache.get(cache_key))
+        if training_set is None:
+            errors = validate_training_examples(rubric, examples)
+            if len(errors) > 0:
+                msg = (
+                    u"Training examples do not match the rubric (submission UUID is {uuid}): {errors}"
+                ).format(uuid=submission_uuid, errors="\n".join(errors))
+                raise StudentTrainingRequestError(msg)
+
+            training_set = deserialize_training_examples(examples, rubric)
+            cache.set(cache_key, [example.id for example in training_set], TRAINING_SET_IDS_CACHE_TIMEOUT)
+        TRAINING_SETS_CACHE_IN_MEM.set(cache_key, training_set)
+    return training_set
+
+
+def _training_set_cache_key(rubric, examples):
+    """
+    Return the key of a training set in the caches, calculated from the content of its rubric and examples.
+    """
+    return u"student_training.training_set.{rubric_hash}.{examples_hash}".format(
+        rubric_hash=Rubric.content_hash_from_dict(rubric),
+        examples_hash=sha1(json.dumps(examples, sort_keys=True)).hexdigest()
+    )
+
+
+def _load_training_set(example_ids):
+    """
+    Load the examples of a training set, in order, from their IDs.
+
+    Args:
+        example_ids (list of int or None): The IDs of the examples.
+
+    Returns:
+        list of TrainingExample, or None if there are no IDs or some examples no longer exist.
+
+    """
+    if example_ids is None:
+        return None
+    examples = {
+        example.id: example
+        for example in TrainingExample.objects.filter(id__in=example_ids).select_related('rubric')
+    }
+    if len(examples) < len(set(example_ids)):
+        return None
+    return [examples[example_id] for example_id in example_ids]
+
+
 def assess_training_example(submission_uuid, options_selected, update_workflow=True):
     """
     Assess a training example and update the workflow.
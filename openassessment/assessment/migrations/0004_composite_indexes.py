@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+# pylint: skip-file
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assessment', '0003_expand_course_id'),
+    ]
+
+    operations = [
+        migrations.AlterIndexTogether(
+            name='assessment',
+            index_together=set([('submission_uuid', 'score_type')]),
+        ),
+        migrations.AlterIndexTogether(
+            name='peerworkflow',
+            index_together=set([('item_id', 'course_id', 'grading_completed_at', 'cancelled_at', 'created_at')]),
+        ),
+        migrations.AlterIndexTogether(
+            name='peerworkflowitem',
+            index_together=set([('scorer', 'assessment'), ('author', 'assessment', 'started_at')]),
+        ),
+        migrations.AlterIndexTogether(
+            name='staffworkflow',
+            index_together=set([('course_id', 'item_id', 'grading_completed_at', 'cancelled_at')]),
+        ),
+    ]
@@ -1,18 +1,22 @@
 """
 Database models for AI assessment.
 """
+from collections import defaultdict
+from importlib import import_module
 from uuid import uuid4
 import json
 import logging
+from celery.signals import import_modules
 from django.conf import settings
-from django.core import signals
 from django.core.files.base import ContentFile
-from django.core.cache import cache, _create_cache
+from django.core.cache import cache
 from django.db import models, transaction, DatabaseError
+from django.utils.functional import SimpleLazyObject
 from django.utils.timezone import now
 from django_extensions.db.fields import UUIDField
 from dogapi import dog_stats_api
 from submissions import api as sub_api
+from openassessment.cache import create_cache
 from .base import Rubric, Criterion, Assessment, AssessmentPart
 from .training import TrainingExample
 
@@ -22,35 +26,50 @@ AI_ASSESSMENT_TYPE = "AI"
 logger = logging.getLogger(__name__)
 
 
-def create_cache(backend, **kwargs):
+def _classifiers_cache_in_mem():
     """
-    Create cache backend. Using this custom function to avoid deprecation warnings.
+    Create the in-memory cache of classifier data, unless settings override it.
     """
-    cache = _create_cache(backend, **kwargs)
-    # Some caches -- python-memcached in particular -- need to do a cleanup at the
-    # end of a request cycle. If not implemented in a particular backend
-    # cache.close is a no-op
-    signals.request_finished.connect(cache.close)
+    cache = getattr(settings, 'ORA2_CLASSIFIERS_CACHE_IN_MEM', None)
+    if cache is None:
+        cache = create_cache(
+            'django.core.cache.backends.locmem.LocMemCache',
+            LOCATION='openassessment.ai.classifiers_dict'
+        )
+    return cache
+
+
+def _classifiers_cache_in_file():
+    """
+    Create the file-based cache of classifier data, unless settings override it.
+    """
+    cache = getattr(settings, 'ORA2_CLASSIFIERS_CACHE_IN_FILE', None)
+    if cache is None:
+        cache = create_cache(
+            'django.core.cache.backends.filebased.FileBasedCache',
+            LOCATION='/tmp/ora2_classifier_cache'
+        )
     return cache
 
 
 # Use an in-memory cache to hold classifier data, but allow settings to override this.
-# The classifier data will generally be larger than memcached's default max size
-CLASSIFIERS_CACHE_IN_MEM = getattr(
-    settings, 'ORA2_CLASSIFIERS_CACHE_IN_MEM',
-    create_cache(
-        'django.core.cache.backends.locmem.LocMemCache',
-        LOCATION='openassessment.ai.classifiers_dict'
-    )
-)
+# The classifier data will generally be larger than memcached's default max size.
+# The caches are only created when they are first used.
+CLASSIFIERS_CACHE_IN_MEM = SimpleLazyObject(_classifiers_cache_in_mem)
 
-CLASSIFIERS_CACHE_IN_FILE = getattr(
-    settings, 'ORA2_CLASSIFIERS_CACHE_IN_FILE',
-    create_cache(
-        'django.core.cache.backends.filebased.FileBasedCache',
-        LOCATION='/tmp/ora2_classifier_cache'
-    )
-)
+CLASSIFIERS_CACHE_IN_FILE = SimpleLazyObject(_classifiers_cache_in_file)
+
+
+def _import_ai_tasks(**kwargs):  # pylint: disable=unused-argument
+    """
+    Register the AI training and grading tasks in celery workers.  Elsewhere,
+    the task modules are only imported when tasks are scheduled.
+    """
+    import_module('openassessment.assessment.worker.training')
+    import_module('openassessment.assessment.worker.grading')
+
+
+import_modules.connect(_import_ai_tasks)
 
 
 def essay_text_from_submission(submission):
@@ -872,3 +891,80 @@ class AIGradingWorkflow(AIWorkflow):
         )
         AssessmentPart.create_from_option_points(self.assessment, criterion_scores)
         self.mark_complete_and_save()
+
+    @classmethod
+    @transaction.atomic
+    def complete_bulk(cls, criterion_scores_by_workflow):
+        """
+        Create assessments with scores from the AI classifiers for many
+        workflows and mark the workflows complete, using a fixed number
+        of queries regardless of the number of workflows.
+
+        Args:
+            criterion_scores_by_workflow (list of tuples): `(workflow, criterion_scores)` pairs,
+                where `criterion_scores` maps criteria names to integer scores.
+                Each workflow's rubric should be retrieved with `select_related`.
+
+        Returns:
+            None
+
+        Raises:
+            InvalidRubricSelection
+            DatabaseError
+
+        """
+        if not criterion_scores_by_workflow:
+            return
+
+        # Validate every set of scores before writing anything.
+        parts_by_workflow = [
+            (workflow, AssessmentPart.build_from_option_points(workflow.rubric.index, criterion_scores))
+            for workflow, criterion_scores in criterion_scores_by_workflow
+        ]
+
+        scored_at = now()
+        Assessment.objects.bulk_create([
+            Assessment(
+                rubric=workflow.rubric,
+                scorer_id=workflow.algorithm_id,
+                submission_uuid=workflow.submission_uuid,
+                score_type=AI_ASSESSMENT_TYPE,
+                scored_at=scored_at,
+            )
+            for workflow, __ in parts_by_workflow
+        ])
+
+        # Not every database returns the primary keys from a bulk insert,
+        # so look the new assessments up again.  A submission can have several
+        # workflows (when it is graded again), whose assessments were inserted
+        # in the order of the workflows.
+        assessment_ids = defaultdict(list)
+        for submission_uuid, assessment_id in Assessment.objects.filter(
+                submission_uuid__in=[workflow.submission_uuid for workflow, __ in parts_by_workflow],
+                score_type=AI_ASSESSMENT_TYPE,
+                scored_at=scored_at,
+        ).order_by('id').values_list('submission_uuid', 'id'):
+            assessment_ids[submission_uuid].append(assessment_id)
+
+        all_parts = []
+        for workflow, parts in parts_by_workflow:
+            workflow.assessment_id = assessment_ids[workflow.submission_uuid].pop(0)
+            for part in parts:
+                part.assessment_id = workflow.assessment_id
+            all_parts.extend(parts)
+        AssessmentPart.objects.bulk_create(all_parts)
+
+        completed_at = now()
+        cls.objects.filter(pk__in=[workflow.pk for workflow, __ in parts_by_workflow]).update(
+            completed_at=completed_at,
+            assessment=models.Case(
+                *[
+                    models.When(pk=workflow.pk, then=models.Value(workflow.assessment_id))
+                    for workflow, __ in parts_by_workflow
+                ],
+                output_field=models.IntegerField()
+            )
+        )
+        for workflow, __ in parts_by_workflow:
+            workflow.completed_at = completed_at
+            workflow._log_complete_workflow()  # pylint:disable=W0212
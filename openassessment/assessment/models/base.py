@@ -13,7 +13,7 @@ need to then generate a matching migration for it using:
 
 """
 import math
-from collections import defaultdict
+from collections import defaultdict, namedtuple
 from copy import deepcopy
 from hashlib import sha1
 import json
@@ -23,6 +23,8 @@ from django.db import models
 from django.utils.timezone import now
 from lazy import lazy
 
+from openassessment.rows import Row
+
 import logging
 logger = logging.getLogger("openassessment.assessment.models")
 
@@ -423,6 +425,10 @@ class Assessment(models.Model):
     class Meta:
         ordering = ["-scored_at", "-id"]
         app_label = "assessment"
+        # Finding the assessments of a given type for a submission
+        index_together = [
+            ("submission_uuid", "score_type"),
+        ]
 
     @property
     def points_earned(self):
@@ -660,8 +666,35 @@ class AssessmentPart(models.Model):
         # Use the rubric index so we can retrieve options/criteria
         # without repeatedly hitting the database.
         # This will also validate our selections against the rubric.
-        rubric_index = assessment.rubric.index
+        parts = cls.build_from_option_names(assessment.rubric.index, selected, feedback=feedback)
+        for part in parts:
+            part.assessment = assessment
+
+        # Create assessment parts for each criterion and associate them with the assessment
+        return cls.objects.bulk_create(parts)
+
+    @classmethod
+    def build_from_option_names(cls, rubric_index, selected, feedback=None):
+        """
+        Validate selected options against a rubric and build (unsaved)
+        assessment parts for them.  The caller is responsible for
+        setting the assessment on each part and saving them.
+
+        Args:
+            rubric_index (RubricIndex): The index of the rubric's data.
+            selected (dict): A dictionary mapping criterion names to option names.
+
+        Keyword Arguments:
+            feedback (dict): A dictionary mapping criterion names to written
+                feedback for the criterion.
+
+        Returns:
+            list of unsaved `AssessmentPart`s
+
+        Raises:
+            InvalidRubricSelection
 
+        """
         # If the assessment type doesn't explicitly provide feedback,
         # then fill in feedback-only criteria with an empty string for feedback.
         if feedback is None:
@@ -697,18 +730,16 @@ class AssessmentPart(models.Model):
                     'feedback': feedback_text[0:cls.MAX_FEEDBACK_SIZE]
                 })
 
-        # Create assessment parts for each criterion and associate them with the assessment
         # We use the dictionary we created earlier, which may have null options
         # for feedback-only assessment parts.
-        return cls.objects.bulk_create([
+        return [
             cls(
-                assessment=assessment,
                 criterion=assessment_part['criterion'],
                 option=assessment_part['option'],
                 feedback=assessment_part['feedback']
             )
             for assessment_part in assessment_parts
-        ])
+        ]
 
     @classmethod
     def create_from_option_points(cls, assessment, selected):
@@ -731,8 +762,29 @@ class AssessmentPart(models.Model):
             DatabaseError
 
         """
-        rubric_index = assessment.rubric.index
+        assessment_parts = cls.build_from_option_points(assessment.rubric.index, selected)
+        for part in assessment_parts:
+            part.assessment = assessment
+        return cls.objects.bulk_create(assessment_parts)
+
+    @classmethod
+    def build_from_option_points(cls, rubric_index, selected):
+        """
+        Validate selected option point values against a rubric and build
+        (unsaved) assessment parts for them.  The caller is responsible for
+        setting the assessment on each part and saving them.
 
+        Args:
+            rubric_index (RubricIndex): The index of the rubric's data.
+            selected (dict): A dictionary mapping criterion names to option point values.
+
+        Returns:
+            list of unsaved `AssessmentPart`s
+
+        Raises:
+            InvalidRubricSelection
+
+        """
         # Retrieve the criteria/option/feedback for criteria that have options.
         # Since we're using the rubric's index, we'll get an `InvalidRubricSelection` error
         # if we select an invalid criterion/option.
@@ -758,17 +810,15 @@ class AssessmentPart(models.Model):
             part['criterion'].name for part in assessment_parts
         ))
 
-        # Create assessment parts for each criterion and associate them with the assessment
         # Since we're not accepting written feedback, set all feedback to an empty string.
-        return cls.objects.bulk_create([
+        return [
             cls(
-                assessment=assessment,
                 criterion=assessment_part['criterion'],
                 option=assessment_part['option'],
                 feedback=u""
             )
             for assessment_part in assessment_parts
-        ])
+        ]
 
     @classmethod
     def _check_has_all_criteria(cls, rubric_index, selected_criteria):
@@ -820,3 +870,36 @@ class AssessmentPart(models.Model):
         if len(missing_criteria) > 0:
             msg = u"Missing selections for criteria: {missing}".format(missing=', '.join(missing_criteria))
             raise InvalidRubricSelection(msg)
+
+
+class AssessmentRow(Row, namedtuple('AssessmentRow', [
+    'id', 'submission_uuid', 'rubric_id', 'scored_at', 'scorer_id', 'score_type', 'feedback',
+])):
+    """
+    Read-only record of the fields of an `Assessment`, for reads of many assessments.
+    """
+    __slots__ = ()
+
+    LOOKUPS = ('id', 'submission_uuid', 'rubric', 'scored_at', 'scorer_id', 'score_type', 'feedback')
+
+
+class AssessmentPartRow(Row, namedtuple('AssessmentPartRow', [
+    'assessment_id', 'criterion_name', 'criterion_label', 'criterion_order_num',
+    'option_name', 'option_label', 'option_points', 'feedback',
+])):
+    """
+    Read-only record of the fields of an `AssessmentPart`, with its criterion
+    and option, for reads of many assessment parts.  The option fields of
+    parts without options (only written feedback) are None.
+    """
+    __slots__ = ()
+
+    LOOKUPS = (
+        'assessment', 'criterion__name', 'criterion__label', 'criterion__order_num',
+        'option__name', 'option__label', 'option__points', 'feedback',
+    )
+
+    @property
+    def points_earned(self):
+        # By convention, an assessment with no options (only feedback) earns 0 points.
+        return self.option_points if self.option_points is not None else 0
@@ -119,6 +119,10 @@ class PeerWorkflow(models.Model):
     class Meta:
         ordering = ["created_at", "id"]
         app_label = "assessment"
+        # Finding the submissions of an item to assess
+        index_together = [
+            ("item_id", "course_id", "grading_completed_at", "cancelled_at", "created_at"),
+        ]
 
     @property
     def is_cancelled(self):
@@ -470,6 +474,11 @@ class PeerWorkflowItem(models.Model):
     class Meta:
         ordering = ["started_at", "id"]
         app_label = "assessment"
+        # Finding the open and completed assessments of a scorer and of an author
+        index_together = [
+            ("scorer", "assessment"),
+            ("author", "assessment", "started_at"),
+        ]
 
     def __repr__(self):
         return (
@@ -2,13 +2,16 @@
 Models for managing staff assessments.
 """
 from datetime import timedelta
+import logging
 
-from django.db import models, DatabaseError
+from django.db import models, transaction, DatabaseError
 from django.utils.timezone import now
 
 from openassessment.assessment.models.base import Assessment
 from openassessment.assessment.errors import StaffAssessmentInternalError
 
+logger = logging.getLogger("openassessment.assessment.models")
+
 
 class StaffWorkflow(models.Model):
     """
@@ -39,6 +42,10 @@ class StaffWorkflow(models.Model):
     class Meta:
         ordering = ["created_at", "id"]
         app_label = "assessment"
+        # Finding the submissions of an item to assess
+        index_together = [
+            ("course_id", "item_id", "grading_completed_at", "cancelled_at"),
+        ]
 
     @property
     def is_cancelled(self):
@@ -137,6 +144,130 @@ class StaffWorkflow(models.Model):
             logger.exception(error_message)
             raise StaffAssessmentInternalError(error_message)
 
+    @classmethod
+    def get_submissions_for_review(cls, course_id, item_id, scorer_id, count):
+        """
+        Check out a batch of submissions for staff assessment in a single transaction.
+
+        Submissions the scorer has already checked out (and not yet graded) are
+        returned first, then the batch is topped up with submissions that are not
+        checked out by anyone or whose lease has expired.  The lease on every
+        returned submission is renewed.
+
+        Args:
+            course_id (str): The course that we would like to fetch submissions from.
+            item_id (str): The student_item that we would like to retrieve submissions for.
+            scorer_id (str): The user id of the staff member scoring these submissions.
+            count (int): The maximum number of submissions to check out.
+
+        Returns:
+            list of submission_uuid (str), in the order they should be graded.
+
+        Raises:
+            StaffAssessmentInternalError: Raised when there is an error retrieving
+                the workflows for this request.
+
+        """
+        timeout = (now() - cls.TIME_LIMIT).strftime("%Y-%m-%d %H:%M:%S")
+        try:
+            with transaction.atomic():
+                open_workflows = cls.objects.select_for_update().filter(
+                    course_id=course_id,
+                    item_id=item_id,
+                    grading_completed_at=None,
+                    cancelled_at=None,
+                )
+                claimed = list(
+                    open_workflows.filter(scorer_id=scorer_id).values_list('id', 'submission_uuid')[:count]
+                )
+                if len(claimed) < count:
+                    claimed += list(
+                        open_workflows.filter(
+                            models.Q(scorer_id='') | models.Q(grading_started_at__lte=timeout)
+                        ).exclude(
+                            id__in=[workflow_id for workflow_id, __ in claimed]
+                        ).values_list('id', 'submission_uuid')[:count - len(claimed)]
+                    )
+                if claimed:
+                    cls.objects.filter(
+                        id__in=[workflow_id for workflow_id, __ in claimed]
+                    ).update(scorer_id=scorer_id, grading_started_at=now())
+            return [submission_uuid for __, submission_uuid in claimed]
+        except DatabaseError:
+            error_message = (
+                u"An internal error occurred while retrieving submissions for staff grading"
+            )
+            logger.exception(error_message)
+            raise StaffAssessmentInternalError(error_message)
+
+    @classmethod
+    def release_submissions_for_review(cls, course_id, item_id, scorer_id, submission_uuids=None):
+        """
+        Release the scorer's lease on submissions that were checked out but not graded,
+        so that other staff members can pick them up immediately.
+
+        Args:
+            course_id (str): The course the submissions belong to.
+            item_id (str): The student_item the submissions belong to.
+            scorer_id (str): The user id of the staff member holding the leases.
+
+        Keyword Arguments:
+            submission_uuids (list of str): If provided, only release these submissions.
+                Otherwise release every ungraded submission checked out by the scorer.
+
+        Returns:
+            int: The number of submissions released.
+
+        Raises:
+            StaffAssessmentInternalError: Raised when the leases could not be released.
+
+        """
+        try:
+            workflows = cls.objects.filter(
+                course_id=course_id,
+                item_id=item_id,
+                scorer_id=scorer_id,
+                grading_completed_at=None,
+            )
+            if submission_uuids is not None:
+                workflows = workflows.filter(submission_uuid__in=submission_uuids)
+            return workflows.update(scorer_id='', grading_started_at=None)
+        except DatabaseError:
+            error_message = (
+                u"An internal error occurred while releasing submissions checked out by {}"
+            ).format(scorer_id)
+            logger.exception(error_message)
+            raise StaffAssessmentInternalError(error_message)
+
+    @classmethod
+    def close_active_assessments(cls, assessment_ids, scorer_id):
+        """
+        Assign assessments to many workflows and mark their grading as
+        complete, using a single UPDATE.
+
+        Args:
+            assessment_ids (dict): Maps submission UUIDs to the ID of the
+                staff assessment made for that submission.
+            scorer_id (str): The user id of the staff member who made the assessments.
+
+        Returns:
+            int: The number of workflows closed.
+
+        """
+        if not assessment_ids:
+            return 0
+        return cls.objects.filter(submission_uuid__in=assessment_ids.keys()).update(
+            scorer_id=scorer_id,
+            grading_completed_at=now(),
+            assessment=models.Case(
+                *[
+                    models.When(submission_uuid=submission_uuid, then=models.Value(unicode(assessment_id)))
+                    for submission_uuid, assessment_id in assessment_ids.iteritems()
+                ],
+                output_field=models.CharField()
+            )
+        )
+
     def close_active_assessment(self, assessment, scorer_id):
         """
         Assign assessment to workflow, and mark the grading as complete.
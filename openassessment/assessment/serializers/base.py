@@ -6,6 +6,7 @@ from copy import deepcopy
 import logging
 
 from django.core.cache import cache
+from django.db.models.query import QuerySet
 from rest_framework import serializers
 from rest_framework.fields import IntegerField, DateTimeField
 from openassessment.assessment.models import (
@@ -161,17 +162,46 @@ class AssessmentSerializer(serializers.ModelSerializer):
 
 
 def serialize_assessments(assessments_qset):
-    assessments = list(assessments_qset.select_related("rubric"))
+    """
+    Serialize many assessments, loading the parts of all the assessments
+    that are not cached with a single query.
+
+    Args:
+        assessments_qset (QuerySet or list): The Assessment models to serialize.
+            Lists must be loaded from a single database, with their rubrics.
+
+    Returns:
+        list of dict, as returned by `full_assessment_dict`.
+    """
+    if isinstance(assessments_qset, QuerySet):
+        assessments_qset = assessments_qset.select_related("rubric")
+    assessments = list(assessments_qset)
     rubric_cache = {}
 
+    cache_keys = [_assessment_cache_key(assessment) for assessment in assessments]
+    cached_dicts = cache.get_many(cache_keys) if cache_keys else {}
+    parts_by_assessment = {
+        assessment.id: []
+        for assessment, cache_key in zip(assessments, cache_keys)
+        if not cached_dicts.get(cache_key)
+    }
+    if parts_by_assessment:
+        # The assessments can be archived, so their parts are read from the same database
+        database = assessments[0]._state.db  # pylint: disable=protected-access
+        parts = AssessmentPart.objects.using(database).filter(
+            assessment__in=parts_by_assessment.keys()
+        ).select_related("criterion", "option").order_by("id")
+        for part in parts:
+            parts_by_assessment[part.assessment_id].append(part)
+
     return [
-        full_assessment_dict(
+        cached_dicts.get(cache_key) or _serialize_assessment(
             assessment,
-            RubricSerializer.serialized_from_cache(
-                assessment.rubric, rubric_cache
-            )
+            RubricSerializer.serialized_from_cache(assessment.rubric, rubric_cache),
+            parts_by_assessment[assessment.id],
+            cache_key
         )
-        for assessment in assessments
+        for assessment, cache_key in zip(assessments, cache_keys)
     ]
 
 
@@ -190,17 +220,32 @@ def full_assessment_dict(assessment, rubric_dict=None):
     Returns:
         dict with keys 'rubric' (serialized Rubric model) and 'parts' (serialized assessment parts)
     """
-    assessment_cache_key = "assessment.full_assessment_dict.{}.{}.{}".format(
-        assessment.id, assessment.submission_uuid, assessment.scored_at.isoformat()
-    )
+    assessment_cache_key = _assessment_cache_key(assessment)
     assessment_dict = cache.get(assessment_cache_key)
     if assessment_dict:
         return assessment_dict
 
-    assessment_dict = AssessmentSerializer(assessment).data
     if not rubric_dict:
         rubric_dict = RubricSerializer.serialized_from_cache(assessment.rubric)
+    parts = assessment.parts.all().select_related("criterion", "option")
+    return _serialize_assessment(assessment, rubric_dict, parts, assessment_cache_key)
 
+
+def _assessment_cache_key(assessment):
+    """
+    Return the cache key of the serialized assessment.
+    """
+    return "assessment.full_assessment_dict.{}.{}.{}".format(
+        assessment.id, assessment.submission_uuid, assessment.scored_at.isoformat()
+    )
+
+
+def _serialize_assessment(assessment, rubric_dict, parts, assessment_cache_key):
+    """
+    Serialize an assessment from its serialized rubric and its parts
+    (with their criteria and options loaded), and cache the result.
+    """
+    assessment_dict = AssessmentSerializer(assessment).data
     assessment_dict["rubric"] = rubric_dict
 
     # This part looks a little goofy, but it's in the name of saving dozens of
@@ -210,14 +255,14 @@ def full_assessment_dict(assessment, rubric_dict=None):
     # the DB model. Instead of invoking the serializers for `Criterion` and
     # `CriterionOption` again, we simply index into the places we expect them to
     # be from the big, saved `Rubric` serialization.
-    parts = []
-    for part in assessment.parts.all().select_related("criterion", "option"):
+    part_dicts = []
+    for part in parts:
         criterion_dict = rubric_dict["criteria"][part.criterion.order_num]
         options_dict = None
         if part.option is not None:
             options_dict = criterion_dict["options"][part.option.order_num]
             options_dict["criterion"] = criterion_dict
-        parts.append({
+        part_dicts.append({
             "option": options_dict,
             "criterion": criterion_dict,
             "feedback": part.feedback
@@ -225,11 +270,11 @@ def full_assessment_dict(assessment, rubric_dict=None):
 
     # Now manually built up the dynamically calculated values on the
     # `Assessment` so we can again avoid DB calls.
-    assessment_dict["parts"] = parts
+    assessment_dict["parts"] = part_dicts
     assessment_dict["points_earned"] = sum(
         part_dict["option"]["points"]
         if part_dict["option"] is not None else 0
-        for part_dict in parts
+        for part_dict in part_dicts
     )
     assessment_dict["points_possible"] = rubric_dict["points_possible"]
     assessment_dict["id"] = assessment.id
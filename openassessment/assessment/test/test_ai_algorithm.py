@@ -147,6 +147,11 @@ class EaseAIAlgorithmTest(AIAlgorithmTest):
         scores = self._scores(deserialized, INPUT_ESSAYS)
         self.assertEqual(len(scores), len(INPUT_ESSAYS))
 
+    def test_score_loaded_classifier(self):
+        classifier = self.algorithm.train_classifier(EXAMPLES)
+        loaded = self.algorithm.load_classifier(classifier)
+        self.assertEqual(self._scores(loaded, INPUT_ESSAYS), self._scores(classifier, INPUT_ESSAYS))
+
     @mock.patch('openassessment.assessment.worker.algorithm.pickle')
     def test_pickle_serialize_error(self, mock_pickle):
         mock_pickle.dumps.side_effect = Exception("Test error!")
@@ -241,6 +241,7 @@ class AIWorkerGradingTest(CacheResetTest):
         expected_params = {
             'essay_text': ANSWER,
             'classifier_set': CLASSIFIERS,
+            'classifier_set_id': AIGradingWorkflow.objects.get(uuid=self.workflow_uuid).classifier_set.pk,
             'algorithm_id': ALGORITHM_ID,
             'valid_scores': {
                 u"vøȼȺƀᵾłȺɍɏ": [0, 1, 2],
@@ -318,6 +319,93 @@ class AIWorkerGradingTest(CacheResetTest):
         with self.assertRaises(AIGradingInternalError):
             ai_worker_api.create_assessment(self.workflow_uuid, self.SCORES)
 
+    def test_get_grading_tasks_params(self):
+        # Create a second workflow graded with the same classifier set
+        other_workflow = self._create_workflow()
+
+        # Unknown and completed workflows are skipped
+        completed_workflow = self._create_workflow()
+        completed_workflow.mark_complete_and_save()
+
+        params = ai_worker_api.get_grading_tasks_params(
+            [self.workflow_uuid, other_workflow.uuid, completed_workflow.uuid, "no such workflow"]
+        )
+        self.assertEqual(len(params), 1)
+        self.assertEqual(params[0]['essays'], {
+            self.workflow_uuid: other_workflow.essay_text,
+            other_workflow.uuid: other_workflow.essay_text,
+        })
+        self.assertEqual(params[0]['classifier_set'], CLASSIFIERS)
+        self.assertEqual(params[0]['classifier_set_id'], other_workflow.classifier_set.pk)
+        self.assertEqual(params[0]['algorithm_id'], ALGORITHM_ID)
+        self.assertEqual(params[0]['valid_scores'], {
+            u"vøȼȺƀᵾłȺɍɏ": [0, 1, 2],
+            u"ﻭɼค๓๓คɼ": [0, 1, 2]
+        })
+
+    def test_get_grading_tasks_params_no_classifiers(self):
+        workflow = AIGradingWorkflow.objects.get(uuid=self.workflow_uuid)
+        workflow.classifier_set = None
+        workflow.save()
+        self.assertEqual(ai_worker_api.get_grading_tasks_params([self.workflow_uuid]), [])
+
+    @mock.patch.object(AIGradingWorkflow.objects, 'filter')
+    def test_get_grading_tasks_params_database_error(self, mock_call):
+        mock_call.side_effect = DatabaseError("KABOOM!")
+        with self.assertRaises(AIGradingInternalError):
+            ai_worker_api.get_grading_tasks_params([self.workflow_uuid])
+
+    def test_create_assessments(self):
+        other_workflow = self._create_workflow()
+        ai_worker_api.create_assessments({
+            self.workflow_uuid: self.SCORES,
+            other_workflow.uuid: {u"vøȼȺƀᵾłȺɍɏ": 2, u"ﻭɼค๓๓คɼ": 2},
+        })
+
+        assessment = Assessment.objects.get(submission_uuid=self.submission_uuid)
+        self.assertEqual(assessment.points_earned, 1)
+        self.assertEqual(assessment.parts.count(), 2)
+        workflow = AIGradingWorkflow.objects.get(uuid=self.workflow_uuid)
+        self.assertTrue(workflow.is_complete)
+        self.assertEqual(workflow.assessment, assessment)
+
+        other_workflow = AIGradingWorkflow.objects.get(uuid=other_workflow.uuid)
+        self.assertTrue(other_workflow.is_complete)
+        self.assertEqual(other_workflow.assessment.points_earned, 4)
+
+    def test_create_assessments_same_submission(self):
+        # The submission is graded again before the first grading task completed
+        other_workflow = AIGradingWorkflow.start_workflow(self.submission_uuid, RUBRIC, ALGORITHM_ID)
+        other_workflow.classifier_set = AIGradingWorkflow.objects.get(uuid=self.workflow_uuid).classifier_set
+        other_workflow.save()
+        ai_worker_api.create_assessments({
+            self.workflow_uuid: self.SCORES,
+            other_workflow.uuid: {u"vøȼȺƀᵾłȺɍɏ": 2, u"ﻭɼค๓๓คɼ": 2},
+        })
+
+        workflow = AIGradingWorkflow.objects.get(uuid=self.workflow_uuid)
+        other_workflow = AIGradingWorkflow.objects.get(uuid=other_workflow.uuid)
+        self.assertNotEqual(workflow.assessment, other_workflow.assessment)
+        self.assertEqual(workflow.assessment.points_earned, 1)
+        self.assertEqual(workflow.assessment.parts.count(), 2)
+        self.assertEqual(other_workflow.assessment.points_earned, 4)
+        self.assertEqual(other_workflow.assessment.parts.count(), 2)
+
+    def test_create_assessments_workflow_already_complete(self):
+        ai_worker_api.create_assessments({self.workflow_uuid: self.SCORES})
+        ai_worker_api.create_assessments({self.workflow_uuid: self.SCORES})
+
+        # Expect that only one assessment is created for the submission
+        num_assessments = Assessment.objects.filter(submission_uuid=self.submission_uuid).count()
+        self.assertEqual(num_assessments, 1)
+
+    @mock.patch.object(Assessment.objects, 'bulk_create')
+    def test_create_assessments_database_error(self, mock_call):
+        mock_call.side_effect = DatabaseError("KABOOM!")
+        with self.assertRaises(AIGradingInternalError):
+            ai_worker_api.create_assessments({self.workflow_uuid: self.SCORES})
+        self.assertFalse(ai_worker_api.is_grading_workflow_complete(self.workflow_uuid))
+
     def test_is_workflow_complete(self):
         self.assertFalse(ai_worker_api.is_grading_workflow_complete(self.workflow_uuid))
         workflow = AIGradingWorkflow.objects.get(uuid=self.workflow_uuid)
@@ -333,3 +421,13 @@ class AIWorkerGradingTest(CacheResetTest):
         mock_call.side_effect = DatabaseError("Oh no!")
         with self.assertRaises(AIGradingInternalError):
             ai_worker_api.is_grading_workflow_complete(self.workflow_uuid)
+
+    def _create_workflow(self):
+        """
+        Create another grading workflow that uses the same classifier set.
+        """
+        submission = sub_api.create_submission(STUDENT_ITEM, ANSWER)
+        workflow = AIGradingWorkflow.start_workflow(submission['uuid'], RUBRIC, ALGORITHM_ID)
+        workflow.classifier_set = AIGradingWorkflow.objects.get(uuid=self.workflow_uuid).classifier_set
+        workflow.save()
+        return workflow
@@ -5,7 +5,9 @@ Tests for the assessment Django models.
 import copy, ddt
 from openassessment.test_utils import CacheResetTest
 from openassessment.assessment.serializers import rubric_from_dict
-from openassessment.assessment.models import Assessment, AssessmentPart, InvalidRubricSelection
+from openassessment.assessment.models import (
+    Assessment, AssessmentPart, AssessmentPartRow, AssessmentRow, InvalidRubricSelection
+)
 from .constants import RUBRIC
 from openassessment.assessment.api.self import create_assessment
 from submissions.api import create_submission
@@ -82,6 +84,35 @@ class AssessmentTest(CacheResetTest):
         feedback_only = AssessmentPart.objects.get(criterion__name="feedback")
         self.assertEqual(feedback_only.feedback, u"")
 
+    def test_rows(self):
+        rubric = self._rubric_with_one_feedback_only_criterion()
+        assessment = Assessment.create(rubric, "Bob", "submission UUID", "PE", feedback=u"Overall")
+        AssessmentPart.create_from_option_names(
+            assessment, {u"vøȼȺƀᵾłȺɍɏ": u"𝓰𝓸𝓸𝓭", u"ﻭɼค๓๓คɼ": u"єχ¢єℓℓєηт"}, feedback={u"feedback": u"Text"}
+        )
+
+        with self.assertNumQueries(1):
+            rows = AssessmentRow.fetch(Assessment.objects.filter(submission_uuid="submission UUID"))
+        self.assertEqual(rows, [AssessmentRow(
+            assessment.id, "submission UUID", rubric.id, assessment.scored_at, "Bob", "PE", u"Overall"
+        )])
+        # Rows have no instance dictionary
+        with self.assertRaises(AttributeError):
+            rows[0].points_possible = 4
+
+        with self.assertNumQueries(1):
+            parts = AssessmentPartRow.fetch(AssessmentPart.objects.filter(assessment=assessment))
+        parts_by_criterion = {part.criterion_name: part for part in parts}
+        self.assertEqual(sum(part.points_earned for part in parts), assessment.points_earned)
+        self.assertEqual(parts_by_criterion[u"vøȼȺƀᵾłȺɍɏ"].option_name, u"𝓰𝓸𝓸𝓭")
+
+        # Feedback-only parts have no option, and earn no points
+        feedback_only = parts_by_criterion[u"feedback"]
+        self.assertEqual(feedback_only.assessment_id, assessment.id)
+        self.assertIsNone(feedback_only.option_name)
+        self.assertEqual(feedback_only.points_earned, 0)
+        self.assertEqual(feedback_only.feedback, u"Text")
+
     def test_create_from_option_points_all_feedback_only_criteria(self):
         rubric = self._rubric_with_all_feedback_only_criteria()
         assessment = Assessment.create(rubric, "Bob", "submission UUID", "PE")
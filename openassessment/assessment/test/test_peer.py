@@ -1244,7 +1244,7 @@ class TestPeerApi(CacheResetTest):
             mock_filter.side_effect = DatabaseError("Bad things happened")
             peer_api.get_rubric_max_scores(tim["uuid"])
 
-    @patch.object(PeerWorkflow.objects, 'get')
+    @patch.object(PeerWorkflowItem.objects, 'filter')
     @raises(peer_api.PeerAssessmentInternalError)
     def test_median_score_db_error(self, mock_filter):
         mock_filter.side_effect = DatabaseError("Bad things happened")
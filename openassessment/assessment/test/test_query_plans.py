@@ -0,0 +1,68 @@
+"""
+Tests that the hot queries of assessments use their indexes.
+"""
+from django.db.models import Q
+from django.utils.timezone import now
+from mock import patch
+
+from openassessment.assessment.models import Assessment, PeerWorkflow, StaffWorkflow
+from openassessment.test_utils import QueryPlanTest
+
+
+class AssessmentQueryPlanTest(QueryPlanTest):
+    """
+    Check the query plans of the peer, staff and assessment queries.
+    """
+
+    def setUp(self):
+        super(AssessmentQueryPlanTest, self).setUp()
+        self.workflow = PeerWorkflow.objects.create(
+            student_id="student", item_id="item", course_id="course", submission_uuid="submission"
+        )
+
+    def _raw_queries(self, method, *args):
+        """
+        Return the SQL and parameters of the raw queries made by a method of the peer workflow.
+        """
+        with patch.object(PeerWorkflow.objects, 'raw', side_effect=PeerWorkflow.objects.raw) as mock_raw:
+            method(*args)
+        return [call[0] for call in mock_raw.call_args_list]
+
+    def test_peer_submission_for_review(self):
+        (sql, params), = self._raw_queries(self.workflow.get_submission_for_review, 3)
+        self.assert_uses_indexes(sql, params, [
+            ("assessment_peerworkflow", "item_id", "course_id", "grading_completed_at", "cancelled_at"),
+            ("assessment_peerworkflowitem", "scorer_id", "assessment_id"),
+            ("assessment_peerworkflowitem", "author_id"),
+        ])
+
+    def test_peer_submission_for_over_grading(self):
+        (sql, params), = self._raw_queries(self.workflow.get_submission_for_over_grading)
+        self.assert_uses_indexes(sql, params, [
+            ("assessment_peerworkflow", "item_id", "course_id"),
+            ("assessment_peerworkflowitem", "scorer_id"),
+        ])
+
+    def test_peer_items(self):
+        self.assert_queryset_uses_indexes(
+            self.workflow.graded.filter(assessment__isnull=False),
+            [("assessment_peerworkflowitem", "scorer_id", "assessment_id")]
+        )
+        self.assert_queryset_uses_indexes(
+            self.workflow.graded_by.filter(Q(assessment__isnull=False) | Q(started_at__gt=now())),
+            [("assessment_peerworkflowitem", "author_id")]
+        )
+
+    def test_staff_submission_for_review(self):
+        self.assert_queryset_uses_indexes(
+            StaffWorkflow.objects.filter(
+                course_id="course", item_id="item", scorer_id="staff", grading_completed_at=None, cancelled_at=None
+            ),
+            [("assessment_staffworkflow", "course_id", "item_id", "grading_completed_at", "cancelled_at")]
+        )
+
+    def test_assessments_of_type(self):
+        self.assert_queryset_uses_indexes(
+            Assessment.objects.filter(submission_uuid="submission", score_type="PE"),
+            [("assessment_assessment", "submission_uuid", "score_type")]
+        )
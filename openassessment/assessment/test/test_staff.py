@@ -6,6 +6,7 @@ import copy
 import mock
 from datetime import timedelta
 
+from django.core.cache import cache
 from django.db import DatabaseError
 from django.test.utils import override_settings
 from django.utils.timezone import now
@@ -19,7 +20,7 @@ from openassessment.assessment.test.test_ai import (
     train_classifiers
 )
 from openassessment.test_utils import CacheResetTest
-from openassessment.assessment.api import staff as staff_api, ai as ai_api, peer as peer_api
+from openassessment.assessment.api import staff as staff_api, ai as ai_api, peer as peer_api, self as self_api
 from openassessment.assessment.api.self import create_assessment as self_assess
 from openassessment.assessment.api.peer import create_assessment as peer_assess
 from openassessment.assessment.models import Assessment, StaffWorkflow
@@ -470,12 +471,186 @@ class TestStaffAssessment(CacheResetTest):
         submission = staff_api.get_submission_to_assess('test_course_id', 'test_item_id', tim['student_id'])
         self.assertIsNone(submission)
 
+    def test_fetch_submission_batch(self):
+        bob_sub, bob = self._create_student_and_submission("bob", "bob's answer")
+        sue_sub, _ = self._create_student_and_submission("Sue", "Sue's answer")
+        self._create_student_and_submission("Tim", "Tim's answer")
+        course_id, item_id = bob['course_id'], bob['item_id']
+
+        batch = staff_api.get_submissions_to_assess(course_id, item_id, "Dumbledore", 2)
+        self.assertEqual([sub['uuid'] for sub in batch], [bob_sub['uuid'], sue_sub['uuid']])
+        self.assertEqual(batch[0]['student_item']['student_id'], "bob")
+        self.assertEqual(batch[0]['answer'], bob_sub['answer'])
+
+        # Another staff member doesn't pick up the checked out submissions.
+        other_batch = staff_api.get_submissions_to_assess(course_id, item_id, "McGonagall", 3)
+        self.assertEqual([sub['student_item']['student_id'] for sub in other_batch], ["Tim"])
+
+    def test_fetch_submission_batch_returns_own_checkouts_first(self):
+        bob_sub, bob = self._create_student_and_submission("bob", "bob's answer")
+        sue_sub, _ = self._create_student_and_submission("Sue", "Sue's answer")
+        course_id, item_id = bob['course_id'], bob['item_id']
+
+        single = staff_api.get_submission_to_assess(course_id, item_id, "Dumbledore")
+        self.assertEqual(single['uuid'], bob_sub['uuid'])
+        batch = staff_api.get_submissions_to_assess(course_id, item_id, "Dumbledore", 2)
+        self.assertEqual([sub['uuid'] for sub in batch], [bob_sub['uuid'], sue_sub['uuid']])
+        stats = staff_api.get_staff_grading_statistics(course_id, item_id)
+        self.assertEqual(stats, {'graded': 0, 'ungraded': 0, 'in-progress': 2})
+
+    def test_fetch_submission_batch_none_available(self):
+        self.assertEqual(staff_api.get_submissions_to_assess('test_course_id', 'test_item_id', "Dumbledore", 3), [])
+
+    def test_release_submissions(self):
+        bob_sub, bob = self._create_student_and_submission("bob", "bob's answer")
+        sue_sub, _ = self._create_student_and_submission("Sue", "Sue's answer")
+        course_id, item_id = bob['course_id'], bob['item_id']
+        staff_api.get_submissions_to_assess(course_id, item_id, "Dumbledore", 2)
+
+        released = staff_api.release_submissions_to_assess(
+            course_id, item_id, "Dumbledore", submission_uuids=[sue_sub['uuid']]
+        )
+        self.assertEqual(released, 1)
+        stats = staff_api.get_staff_grading_statistics(course_id, item_id)
+        self.assertEqual(stats, {'graded': 0, 'ungraded': 1, 'in-progress': 1})
+
+        # Another staff member can now check out the released submission.
+        other_batch = staff_api.get_submissions_to_assess(course_id, item_id, "McGonagall", 2)
+        self.assertEqual([sub['uuid'] for sub in other_batch], [sue_sub['uuid']])
+
+        # Releasing everything only affects the staff member's own checkouts.
+        self.assertEqual(staff_api.release_submissions_to_assess(course_id, item_id, "Dumbledore"), 1)
+        workflow = StaffWorkflow.objects.get(submission_uuid=bob_sub['uuid'])
+        self.assertEqual(workflow.scorer_id, "")
+        self.assertIsNone(workflow.grading_started_at)
+
+    @mock.patch.object(StaffWorkflow.objects, 'select_for_update')
+    def test_fetch_submission_batch_database_error(self, mock_select):
+        mock_select.side_effect = DatabaseError("KABOOM!")
+        with self.assertRaises(StaffAssessmentInternalError):
+            staff_api.get_submissions_to_assess('test_course_id', 'test_item_id', "Dumbledore", 2)
+
     def test_cancel_staff_workflow(self):
         tim_sub, _ = self._create_student_and_submission("Tim", "Tim's answer")
         workflow_api.cancel_workflow(tim_sub['uuid'], "Test Cancel", "Bob", {})
         workflow = StaffWorkflow.objects.get(submission_uuid=tim_sub['uuid'])
         self.assertTrue(workflow.is_cancelled)
 
+    def test_create_assessments_bulk(self):
+        bob_sub, bob = self._create_student_and_submission("Bob", "Bob's answer", problem_steps=['staff'])
+        sue_sub, _ = self._create_student_and_submission("Sue", "Sue's answer", problem_steps=['staff'])
+        tim_sub, _ = self._create_student_and_submission("Tim", "Tim's answer", problem_steps=['staff'])
+        assessments = [
+            {
+                'submission_uuid': sub['uuid'],
+                'options_selected': OPTIONS_SELECTED_DICT[key]["options"],
+                'overall_feedback': u"Feedback for {}".format(key),
+            }
+            for sub, key in [(bob_sub, "none"), (sue_sub, "most"), (tim_sub, "all")]
+        ]
+
+        # Use a small chunk size so that more than one chunk is created
+        assessed = staff_api.create_assessments_bulk(assessments, "Dumbledore", RUBRIC, chunk_size=2)
+        self.assertEqual(assessed, [bob_sub['uuid'], sue_sub['uuid'], tim_sub['uuid']])
+
+        for sub, key in [(bob_sub, "none"), (sue_sub, "most"), (tim_sub, "all")]:
+            assessment = staff_api.get_latest_staff_assessment(sub['uuid'])
+            self.assertEqual(assessment['points_earned'], OPTIONS_SELECTED_DICT[key]["expected_points"])
+            self.assertEqual(assessment['feedback'], u"Feedback for {}".format(key))
+            self.assertEqual(assessment['scorer_id'], "Dumbledore")
+
+            workflow = StaffWorkflow.objects.get(submission_uuid=sub['uuid'])
+            self.assertIsNotNone(workflow.grading_completed_at)
+            self.assertEqual(workflow.assessment, unicode(assessment['id']))
+
+        stats = staff_api.get_staff_grading_statistics(bob['course_id'], bob['item_id'])
+        self.assertEqual(stats, {'graded': 3, 'ungraded': 0, 'in-progress': 0})
+
+    @data(
+        [{'submission_uuid': 'first', 'options_selected': {u"vøȼȺƀᵾłȺɍɏ": u"𝓰𝓸𝓸𝓭"}}],
+        [{'submission_uuid': 'first', 'options_selected': {u"vøȼȺƀᵾłȺɍɏ": u"𝓰𝓸𝓸𝓭", u"ﻭɼค๓๓คɼ": u"Not an option"}}],
+        [{'options_selected': OPTIONS_SELECTED_DICT["all"]["options"]}],
+        [{'submission_uuid': 'first', 'options_selected': OPTIONS_SELECTED_DICT["all"]["options"]}] * 2,
+    )
+    def test_create_assessments_bulk_invalid(self, invalid_assessments):
+        tim_sub, _ = self._create_student_and_submission("Tim", "Tim's answer", problem_steps=['staff'])
+        assessments = [
+            {'submission_uuid': tim_sub['uuid'], 'options_selected': OPTIONS_SELECTED_DICT["all"]["options"]}
+        ] + invalid_assessments
+
+        with self.assertRaises(StaffAssessmentRequestError):
+            staff_api.create_assessments_bulk(assessments, "Dumbledore", RUBRIC)
+
+        # Nothing is created if any of the assessments is invalid
+        self.assertIsNone(staff_api.get_latest_staff_assessment(tim_sub['uuid']))
+        self.assertFalse(Assessment.objects.exists())
+
+    @mock.patch('openassessment.assessment.api.staff.StaffWorkflow.close_active_assessments')
+    def test_create_assessments_bulk_database_error(self, mock_close):
+        mock_close.side_effect = DatabaseError("KABOOM!")
+        tim_sub, _ = self._create_student_and_submission("Tim", "Tim's answer", problem_steps=['staff'])
+        assessments = [
+            {'submission_uuid': tim_sub['uuid'], 'options_selected': OPTIONS_SELECTED_DICT["all"]["options"]}
+        ]
+        with self.assertRaises(StaffAssessmentInternalError):
+            staff_api.create_assessments_bulk(assessments, "Dumbledore", RUBRIC)
+
+        # The chunk is rolled back
+        self.assertFalse(Assessment.objects.exists())
+
+    def test_get_submission_report(self):
+        tim_sub, tim = self._create_student_and_submission("Tim", "Tim's answer", problem_steps=['peer', 'self'])
+        bob_sub, bob = self._create_student_and_submission("Bob", "Bob's answer", problem_steps=['peer', 'self'])
+
+        # Bob and Tim assess each other, Tim assesses himself and staff assess Tim
+        options = OPTIONS_SELECTED_DICT["most"]["options"]
+        peer_api.get_submission_to_assess(bob_sub['uuid'], 1)
+        peer_assess(bob_sub['uuid'], bob['student_id'], options, dict(), "", RUBRIC, 1)
+        peer_api.get_submission_to_assess(tim_sub['uuid'], 1)
+        peer_assess(tim_sub['uuid'], tim['student_id'], options, dict(), "", RUBRIC, 1)
+        self_assess(tim_sub['uuid'], tim['student_id'], options, dict(), "", RUBRIC)
+        staff_api.create_assessment(tim_sub['uuid'], "Dumbledore", options, dict(), "", RUBRIC)
+
+        # All the assessments are loaded with a query, and their parts with another one
+        cache.clear()
+        rubric_max_scores = peer_api.get_rubric_max_scores(tim_sub['uuid'])
+        with self.assertNumQueries(2):
+            report = staff_api.get_submission_report(tim_sub['uuid'])
+
+        # The report matches the assessments returned by each API
+        def summary(assessments):
+            return [(assessment['id'], assessment['points_earned']) for assessment in assessments]
+
+        self.assertEqual(summary(report['peer_assessments']), summary(peer_api.get_assessments(tim_sub['uuid'])))
+        self.assertEqual(
+            summary(report['submitted_assessments']), summary(peer_api.get_submitted_assessments(tim_sub['uuid']))
+        )
+        self.assertEqual(summary([report['self_assessment']]), summary([self_api.get_assessment(tim_sub['uuid'])]))
+        self.assertEqual(
+            summary([report['staff_assessment']]), summary([staff_api.get_latest_staff_assessment(tim_sub['uuid'])])
+        )
+        self.assertIsNone(report['example_based_assessment'])
+        self.assertEqual(report['rubric_max_scores'], rubric_max_scores)
+        self.assertEqual(len(report['peer_assessments']), 1)
+        self.assertEqual(len(report['submitted_assessments']), 1)
+
+    def test_get_submission_report_no_assessments(self):
+        tim_sub, _ = self._create_student_and_submission("Tim", "Tim's answer", problem_steps=['peer'])
+        self.assertEqual(staff_api.get_submission_report(tim_sub['uuid']), {
+            'peer_assessments': [],
+            'submitted_assessments': [],
+            'self_assessment': None,
+            'staff_assessment': None,
+            'example_based_assessment': None,
+            'rubric_max_scores': None,
+        })
+
+    @mock.patch.object(Assessment.objects, 'filter')
+    def test_get_submission_report_database_error(self, mock_filter):
+        mock_filter.side_effect = DatabaseError("KABOOM!")
+        with self.assertRaises(StaffAssessmentInternalError):
+            staff_api.get_submission_report("submission UUID")
+
     def test_grading_statistics(self):
         _, bob = self._create_student_and_submission("bob", "bob's answer")
         course_id = bob['course_id']
@@ -3,6 +3,7 @@
 Tests for training assessment type.
 """
 import copy
+from django.core.cache import cache
 from django.db import DatabaseError
 import ddt
 from mock import patch
@@ -100,16 +101,15 @@ class StudentTrainingAssessmentTest(CacheResetTest):
         self._warm_cache(RUBRIC, EXAMPLES)
 
         # First training example
-        # This will need to create the student training workflow and the first item
-        # NOTE: we *could* cache the rubric model to reduce the number of queries here,
-        # but we're selecting it by content hash, which is indexed and should be plenty fast.
-        with self.assertNumQueries(8):
+        # This will need to create the student training workflow and the first item.
+        # The rubric and training examples come from the cached training set.
+        with self.assertNumQueries(5):
             training_api.get_training_example(self.submission_uuid, RUBRIC, EXAMPLES)
 
         # Without assessing the first training example, try to retrieve a training example.
         # This should return the same example as before, so we won't need to create
         # any workflows or workflow items.
-        with self.assertNumQueries(5):
+        with self.assertNumQueries(2):
             training_api.get_training_example(self.submission_uuid, RUBRIC, EXAMPLES)
 
         # Assess the current training example
@@ -117,9 +117,42 @@ class StudentTrainingAssessmentTest(CacheResetTest):
 
         # Retrieve the next training example, which requires us to create
         # a new workflow item (but not a new workflow).
-        with self.assertNumQueries(8):
+        with self.assertNumQueries(5):
             training_api.get_training_example(self.submission_uuid, RUBRIC, EXAMPLES)
 
+    def test_get_training_example_reuses_training_set(self):
+        self._warm_cache(RUBRIC, EXAMPLES)
+
+        # Other learners reuse the validated and deserialized training set
+        with patch.object(training_api, 'validate_training_examples') as mock_validate:
+            with patch.object(training_api, 'deserialize_training_examples') as mock_deserialize:
+                self._assert_get_example(self.submission_uuid, 0, EXAMPLES, RUBRIC)
+                self.assertFalse(mock_validate.called)
+                self.assertFalse(mock_deserialize.called)
+
+        # Another process loads the training set from the IDs of its examples in the shared cache
+        training_api.TRAINING_SETS_CACHE_IN_MEM.clear()
+        example_ids = cache.get(training_api._training_set_cache_key(RUBRIC, EXAMPLES))
+        self.assertEqual(len(example_ids), len(EXAMPLES))
+        with patch.object(training_api, 'deserialize_training_examples') as mock_deserialize:
+            self._assert_get_example(self.submission_uuid, 0, EXAMPLES, RUBRIC)
+            self.assertFalse(mock_deserialize.called)
+
+        # If the examples no longer exist, the training set is built again
+        training_api.TRAINING_SETS_CACHE_IN_MEM.clear()
+        cache.set(training_api._training_set_cache_key(RUBRIC, EXAMPLES), example_ids + [max(example_ids) + 1])
+        self._assert_get_example(self.submission_uuid, 0, EXAMPLES, RUBRIC)
+        self.assertEqual(cache.get(training_api._training_set_cache_key(RUBRIC, EXAMPLES)), example_ids)
+
+    def test_get_training_example_changed_examples(self):
+        self._warm_cache(RUBRIC, EXAMPLES)
+
+        # If the examples change, the new examples are validated
+        invalid_examples = copy.deepcopy(EXAMPLES)
+        invalid_examples[0]['options_selected'][RUBRIC['criteria'][0]['name']] = u"Not an option"
+        with self.assertRaises(StudentTrainingRequestError):
+            training_api.get_training_example(self.submission_uuid, RUBRIC, invalid_examples)
+
     def test_submitter_is_finished_num_queries(self):
         # Complete the first training example
         training_api.on_start(self.submission_uuid)
@@ -4,12 +4,14 @@ Tests for AI worker tasks.
 """
 from contextlib import contextmanager
 import itertools
+import json
 import mock
 from django.test.utils import override_settings
 from submissions import api as sub_api
 from openassessment.test_utils import CacheResetTest
 from openassessment.assessment.worker.training import train_classifiers, InvalidExample
-from openassessment.assessment.worker.grading import grade_essay
+from openassessment.assessment.worker.grading import grade_essay, grade_essays_batch, reschedule_grading_tasks
+from openassessment.assessment.worker.classifier_cache import LoadedClassifierCache, LOADED_CLASSIFIERS_CACHE
 from openassessment.assessment.api import ai_worker as ai_worker_api
 from openassessment.assessment.models import AITrainingWorkflow, AIGradingWorkflow, AIClassifierSet
 from openassessment.assessment.worker.algorithm import (
@@ -334,6 +336,20 @@ class AIGradingTaskTest(CeleryTaskTest):
         }
         mock_create_assessment.assert_called_with(self.workflow_uuid, expected_scores)
 
+    @mock.patch('openassessment.assessment.api.ai_worker.create_assessment')
+    @override_settings(ORA2_AI_ALGORITHMS=AI_ALGORITHMS)
+    def test_loaded_classifiers_are_reused(self, mock_create_assessment):
+        with mock.patch.object(StubAIAlgorithm, 'load_classifier') as mock_load:
+            mock_load.side_effect = lambda classifier: classifier
+            grade_essay(self.workflow_uuid)
+            self._reset_workflow()
+            grade_essay(self.workflow_uuid)
+
+        # Classifiers are loaded once per criterion, not once per essay
+        self.assertEqual(mock_load.call_count, len(self.CLASSIFIERS))
+        self.assertEqual(LOADED_CLASSIFIERS_CACHE.hits, 1)
+        self.assertEqual(mock_create_assessment.call_count, 2)
+
     @mock.patch('openassessment.assessment.worker.grading.ai_worker_api.get_grading_task_params')
     @override_settings(ORA2_AI_ALGORITHMS=AI_ALGORITHMS)
     def test_retrieve_params_error(self, mock_call):
@@ -368,6 +384,7 @@ class AIGradingTaskTest(CeleryTaskTest):
                 u"vøȼȺƀᵾłȺɍɏ": {},
                 u"ﻭɼค๓๓คɼ": {}
             },
+            'classifier_set_id': 1,
             'algorithm_id': ALGORITHM_ID,
             'valid_scores': {}
         }
@@ -383,6 +400,7 @@ class AIGradingTaskTest(CeleryTaskTest):
                 u"vøȼȺƀᵾłȺɍɏ": {},
                 u"ﻭɼค๓๓คɼ": {}
             },
+            'classifier_set_id': 1,
             'algorithm_id': ALGORITHM_ID,
             'valid_scores': {
                 u"vøȼȺƀᵾłȺɍɏ": [],
@@ -415,3 +433,142 @@ class AIGradingTaskTest(CeleryTaskTest):
         workflow.completed_at = None
         workflow.assessment = None
         workflow.save()
+
+
+class AIGradingBatchTaskTest(CeleryTaskTest):
+    """
+    Tests for the task that grades many essays at once.
+    """
+    CLASSIFIERS = AIGradingTaskTest.CLASSIFIERS
+
+    def setUp(self):
+        """
+        Create submissions and grading workflows that share a classifier set.
+        """
+        rubric = rubric_from_dict(RUBRIC)
+        classifier_set = AIClassifierSet.create_classifier_set(
+            self.CLASSIFIERS, rubric, ALGORITHM_ID, STUDENT_ITEM.get('course_id'), STUDENT_ITEM.get('item_id')
+        )
+        self.workflow_uuids = []
+        for __ in range(3):
+            submission = sub_api.create_submission(STUDENT_ITEM, ANSWER)
+            workflow = AIGradingWorkflow.start_workflow(submission['uuid'], RUBRIC, ALGORITHM_ID)
+            workflow.classifier_set = classifier_set
+            workflow.save()
+            self.workflow_uuids.append(workflow.uuid)
+
+    @override_settings(ORA2_AI_ALGORITHMS=AI_ALGORITHMS)
+    def test_grade_essays_batch(self):
+        with mock.patch.object(StubAIAlgorithm, 'score_batch') as mock_score:
+            mock_score.side_effect = lambda texts, classifier, cache: [1] * len(texts)
+            grade_essays_batch(self.workflow_uuids)
+
+        # Each classifier scores all of the essays at once
+        self.assertEqual(mock_score.call_count, len(self.CLASSIFIERS))
+        for workflow_uuid in self.workflow_uuids:
+            workflow = AIGradingWorkflow.objects.get(uuid=workflow_uuid)
+            self.assertTrue(workflow.is_complete)
+            self.assertEqual(workflow.assessment.points_earned, 2)
+
+    @mock.patch('openassessment.assessment.worker.grading.ai_worker_api.create_assessments')
+    @override_settings(ORA2_AI_ALGORITHMS=AI_ALGORITHMS)
+    def test_skip_completed_workflow(self, mock_create_assessments):
+        AIGradingWorkflow.objects.get(uuid=self.workflow_uuids[0]).mark_complete_and_save()
+        grade_essays_batch(self.workflow_uuids)
+        graded_uuids = mock_create_assessments.call_args[0][0].keys()
+        self.assertItemsEqual(graded_uuids, self.workflow_uuids[1:])
+
+    @override_settings(ORA2_AI_ALGORITHMS=AI_ALGORITHMS)
+    def test_algorithm_gives_invalid_score(self):
+        with mock.patch.object(StubAIAlgorithm, 'score_batch') as mock_score:
+            mock_score.side_effect = lambda texts, classifier, cache: [100] * len(texts)
+            grade_essays_batch(self.workflow_uuids)
+
+        # The closest valid score is chosen for each criterion
+        for workflow_uuid in self.workflow_uuids:
+            workflow = AIGradingWorkflow.objects.get(uuid=workflow_uuid)
+            self.assertEqual(workflow.assessment.points_earned, 4)
+
+    @mock.patch('openassessment.assessment.worker.grading.ai_worker_api.get_grading_tasks_params')
+    def test_retrieve_params_error(self, mock_call):
+        mock_call.side_effect = AIGradingInternalError("Test error")
+        with self.assert_retry(grade_essays_batch, AIGradingInternalError):
+            grade_essays_batch(self.workflow_uuids)
+
+    @override_settings(ORA2_AI_ALGORITHMS=AI_ALGORITHMS)
+    def test_algorithm_score_error(self):
+        with mock.patch.object(grade_essays_batch, 'retry') as mock_retry:
+            mock_retry.return_value = ScoreError("Test error!")
+            with mock.patch.object(StubAIAlgorithm, 'score_batch') as mock_score:
+                mock_score.side_effect = ScoreError("Test error!")
+                with self.assertRaises(ScoreError):
+                    grade_essays_batch(self.workflow_uuids)
+
+        # The task is retried for the essays that could not be scored
+        self.assertItemsEqual(mock_retry.call_args[1]['args'][0], self.workflow_uuids)
+
+    @mock.patch('openassessment.assessment.worker.grading.ai_worker_api.create_assessments')
+    @override_settings(ORA2_AI_ALGORITHMS=AI_ALGORITHMS)
+    def test_create_assessments_error(self, mock_call):
+        mock_call.side_effect = AIGradingInternalError
+        with mock.patch.object(grade_essays_batch, 'retry') as mock_retry:
+            mock_retry.return_value = AIGradingInternalError()
+            with self.assertRaises(AIGradingInternalError):
+                grade_essays_batch(self.workflow_uuids)
+        self.assertItemsEqual(mock_retry.call_args[1]['args'][0], self.workflow_uuids)
+
+    @mock.patch('openassessment.assessment.worker.grading.GRADING_BATCH_SIZE', 2)
+    @mock.patch('openassessment.assessment.worker.grading.grade_essays_batch.apply_async')
+    @override_settings(ORA2_AI_ALGORITHMS=AI_ALGORITHMS)
+    def test_reschedule_in_batches(self, mock_apply_async):
+        reschedule_grading_tasks(STUDENT_ITEM.get('course_id'), STUDENT_ITEM.get('item_id'))
+        batches = [call[1]['args'][0] for call in mock_apply_async.call_args_list]
+        self.assertEqual([len(batch) for batch in batches], [2, 1])
+        self.assertItemsEqual(sum(batches, []), self.workflow_uuids)
+
+
+class LoadedClassifierCacheTest(CacheResetTest):
+    """
+    Tests for the cache of loaded classifiers used by the grading task.
+    """
+    CLASSIFIER_SET = {u"vøȼȺƀᵾłȺɍɏ": {'data': u"x" * 100}}
+
+    def setUp(self):
+        super(LoadedClassifierCacheTest, self).setUp()
+        self.algorithm = mock.MagicMock()
+        self.algorithm.load_classifier.side_effect = lambda classifier: ("loaded", classifier['data'])
+
+    def test_get_or_load(self):
+        cache = LoadedClassifierCache()
+        loaded = cache.get_or_load(self.algorithm, ALGORITHM_ID, 1, self.CLASSIFIER_SET)
+        self.assertEqual(loaded, {u"vøȼȺƀᵾłȺɍɏ": ("loaded", u"x" * 100)})
+        self.assertIs(cache.get_or_load(self.algorithm, ALGORITHM_ID, 1, self.CLASSIFIER_SET), loaded)
+        self.assertEqual(self.algorithm.load_classifier.call_count, 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        # Classifier sets for different algorithms are cached separately
+        cache.get_or_load(self.algorithm, u"other", 1, self.CLASSIFIER_SET)
+        self.assertEqual(self.algorithm.load_classifier.call_count, 2)
+
+    def test_evict_least_recently_used(self):
+        # Leave room for two classifier sets
+        cache = LoadedClassifierCache(max_size=2 * len(json.dumps(self.CLASSIFIER_SET)))
+        for classifier_set_id in [1, 2, 1, 3]:
+            cache.get_or_load(self.algorithm, ALGORITHM_ID, classifier_set_id, self.CLASSIFIER_SET)
+        self.assertEqual(cache.evictions, 1)
+        self.assertLessEqual(cache.size, cache.max_size)
+
+        # Classifier set 2 was evicted, but 1 and 3 are still loaded
+        self.algorithm.load_classifier.reset_mock()
+        cache.get_or_load(self.algorithm, ALGORITHM_ID, 1, self.CLASSIFIER_SET)
+        cache.get_or_load(self.algorithm, ALGORITHM_ID, 3, self.CLASSIFIER_SET)
+        self.assertFalse(self.algorithm.load_classifier.called)
+        cache.get_or_load(self.algorithm, ALGORITHM_ID, 2, self.CLASSIFIER_SET)
+        self.assertTrue(self.algorithm.load_classifier.called)
+
+    def test_classifier_set_larger_than_cache(self):
+        cache = LoadedClassifierCache(max_size=10)
+        cache.get_or_load(self.algorithm, ALGORITHM_ID, 1, self.CLASSIFIER_SET)
+        cache.get_or_load(self.algorithm, ALGORITHM_ID, 1, self.CLASSIFIER_SET)
+        self.assertEqual(self.algorithm.load_classifier.call_count, 2)
+        self.assertEqual(cache.size, 0)
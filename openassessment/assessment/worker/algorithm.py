@@ -106,8 +106,7 @@ class AIAlgorithm(object):
 
         Args:
             text (unicode): The text to classify.
-            classifier (JSON-serializable): A classifier, using the same format
-                as `train_classifier()`.
+            classifier: A classifier loaded by `load_classifier()`.
             cache (dict): An in-memory cache that persists until all criteria
                 in the rubric have been scored.
 
@@ -118,6 +117,55 @@ class AIAlgorithm(object):
         """
         pass
 
+    def score_batch(self, texts, classifier, cache):
+        """
+        Score many essays using the same classifier.
+
+        By default, each essay is scored separately with `score()`.
+        Algorithms that can process many essays at once more efficiently
+        should override this.
+
+        Args:
+            texts (list of unicode): The texts to classify.
+            classifier: A classifier loaded by `load_classifier()`.
+            cache (dict): An in-memory cache that persists until all criteria
+                in the rubric have been scored for all of the essays.
+
+        Returns:
+            list of scores, in the same order as `texts`.
+
+        Raises:
+            InvalidClassifier: The provided classifier cannot be used by this algorithm.
+            ScoreError: An error occurred while scoring.
+
+        """
+        essay_caches = cache.setdefault('essay_caches', [dict() for __ in texts])
+        return [
+            self.score(text, classifier, essay_cache)
+            for text, essay_cache in zip(texts, essay_caches)
+        ]
+
+    def load_classifier(self, classifier):
+        """
+        Convert a serialized classifier into the form used by `score()`.
+
+        Loaded classifiers are cached by the grading worker and re-used
+        for many essays, so algorithms with expensive deserialization
+        should override this.  By default, the serialized classifier is used as-is.
+
+        Args:
+            classifier (JSON-serializable): A classifier, using the same format
+                as `train_classifier()`.
+
+        Returns:
+            The loaded classifier.
+
+        Raises:
+            InvalidClassifier: The provided classifier cannot be used by this algorithm.
+
+        """
+        return classifier
+
     @classmethod
     def algorithm_for_id(cls, algorithm_id):
         """
@@ -213,7 +261,9 @@ class EaseAIAlgorithm(AIAlgorithm):
 
         Args:
             text (unicode): The essay text to score.
-            classifier (dict): The serialized classifiers created during training.
+            classifier (tuple): The `(feature_extractor, score_classifier)` tuple
+                returned by `load_classifier()`.  The serialized classifiers
+                created during training are also accepted.
             cache (dict): An in-memory cache that persists until all criteria
                 in the rubric have been scored.
 
@@ -231,7 +281,9 @@ class EaseAIAlgorithm(AIAlgorithm):
             msg = u"Could not import EASE to grade essays."
             raise ScoreError(msg)
 
-        feature_extractor, score_classifier = self._deserialize_classifiers(classifier)
+        if isinstance(classifier, dict):
+            classifier = self.load_classifier(classifier)
+        feature_extractor, score_classifier = classifier
 
         # The following is a modified version of `ease.grade.grade()`,
         # skipping things we don't use (cross-validation, feedback)
@@ -263,6 +315,72 @@ class EaseAIAlgorithm(AIAlgorithm):
             ).format(traceback=traceback.format_exc())
             raise ScoreError(msg)
 
+    def score_batch(self, texts, classifier, cache):
+        """
+        Score many essays using EASE, extracting the features of
+        all of the essays at once.
+
+        Args:
+            texts (list of unicode): The essay texts to score.
+            classifier (tuple): The `(feature_extractor, score_classifier)` tuple
+                returned by `load_classifier()`.
+            cache (dict): An in-memory cache that persists until all criteria
+                in the rubric have been scored for all of the essays.
+
+        Returns:
+            list of int
+
+        Raises:
+            InvalidClassifier
+            ScoreError
+
+        """
+        try:
+            from ease.essay_set import EssaySet    # pylint:disable=F0401
+        except ImportError:
+            msg = u"Could not import EASE to grade essays."
+            raise ScoreError(msg)
+
+        if isinstance(classifier, dict):
+            classifier = self.load_classifier(classifier)
+        feature_extractor, score_classifier = classifier
+
+        try:
+            # As in `score()`, the essay set (and its expensive part of speech
+            # tagging) is shared by all criteria in the rubric.
+            essay_set = cache.get('grading_batch_essay_set')
+            if essay_set is None:
+                essay_set = EssaySet(essaytype="test")
+                for text in texts:
+                    essay_set.add_essay(text.encode('ascii', 'ignore'), 0)
+                cache['grading_batch_essay_set'] = essay_set
+
+            # Build the feature matrix for all essays, then predict all scores at once
+            features = feature_extractor.gen_feats(essay_set)
+            return [int(score) for score in score_classifier.predict(features)]
+        except:
+            msg = (
+                u"An unexpected error occurred while using "
+                u"EASE to score a batch of essays: {traceback}"
+            ).format(traceback=traceback.format_exc())
+            raise ScoreError(msg)
+
+    def load_classifier(self, classifier):
+        """
+        Unpickle the feature extractor and score classifier.
+
+        Args:
+            classifier (dict): The serialized classifiers created during training.
+
+        Returns:
+            tuple of `(feature_extractor, score_classifier)`
+
+        Raises:
+            InvalidClassifier
+
+        """
+        return self._deserialize_classifiers(classifier)
+
     def _train_classifiers(self, examples):
         """
         Use EASE to train classifiers.
@@ -0,0 +1,127 @@
+"""
+Per-process cache of deserialized classifiers used by the AI grading worker.
+
+Deserializing classifiers (for EASE, unpickling a feature extractor and a
+score classifier for every criterion) can take much longer than scoring an
+essay, and a worker usually grades many essays with the same classifier set.
+The cache keeps the deserialized ("loaded") classifiers of the most recently
+used classifier sets in memory, within a configurable memory budget.
+"""
+from collections import OrderedDict
+import json
+import logging
+import threading
+
+from django.conf import settings
+from dogapi import dog_stats_api
+
+
+logger = logging.getLogger(__name__)
+
+# Approximate number of bytes of classifier data to keep loaded per process.
+# The size of a classifier set is estimated from its serialized size.
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+
+class LoadedClassifierCache(object):
+    """
+    Least-recently-used cache of loaded classifier sets, keyed by
+    algorithm ID and classifier set ID.
+
+    Classifier sets are immutable once they have been created,
+    so entries never need to be invalidated.
+    """
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        """
+        Create an empty cache.
+
+        Keyword Arguments:
+            max_size (int): The memory budget of the cache, in bytes of serialized classifier data.
+
+        """
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_load(self, algorithm, algorithm_id, classifier_set_id, classifier_set):
+        """
+        Retrieve the loaded classifiers for a classifier set,
+        deserializing them with the algorithm if they are not cached.
+
+        Args:
+            algorithm (AIAlgorithm): The algorithm used to load the classifiers.
+            algorithm_id (unicode): The ID of the algorithm.
+            classifier_set_id (int): The ID of the classifier set.
+            classifier_set (dict): Maps criterion names to serialized classifiers.
+
+        Returns:
+            dict: Maps criterion names to loaded classifiers.
+
+        Raises:
+            InvalidClassifier: A classifier could not be loaded.
+
+        """
+        key = (algorithm_id, classifier_set_id)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._entries[key] = entry
+                self.hits += 1
+                dog_stats_api.increment('openassessment.assessment.ai.classifier_cache.hit')
+                return entry[0]
+            self.misses += 1
+
+        dog_stats_api.increment('openassessment.assessment.ai.classifier_cache.miss')
+        loaded = {
+            criterion_name: algorithm.load_classifier(classifier)
+            for criterion_name, classifier in classifier_set.iteritems()
+        }
+        self._add(key, loaded, len(json.dumps(classifier_set)))
+        return loaded
+
+    def clear(self):
+        """
+        Remove all loaded classifiers from the cache and reset the metrics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def _add(self, key, loaded, size):
+        """
+        Add a loaded classifier set to the cache, evicting the least
+        recently used sets until it fits in the memory budget.
+        """
+        if size > self.max_size:
+            logger.info(
+                u"Classifier set {key} ({size} bytes) is larger than the classifier cache ({max_size} bytes)".format(
+                    key=key, size=size, max_size=self.max_size
+                )
+            )
+            return
+
+        with self._lock:
+            if key in self._entries:
+                return
+            while self._entries and self.size + size > self.max_size:
+                evicted_key, (_, evicted_size) = self._entries.popitem(last=False)
+                self.size -= evicted_size
+                self.evictions += 1
+                dog_stats_api.increment('openassessment.assessment.ai.classifier_cache.eviction')
+                logger.info(u"Evicted classifier set {key} from the classifier cache".format(key=evicted_key))
+            self._entries[key] = (loaded, size)
+            self.size += size
+            dog_stats_api.gauge('openassessment.assessment.ai.classifier_cache.size', self.size)
+
+
+LOADED_CLASSIFIERS_CACHE = LoadedClassifierCache(
+    max_size=getattr(settings, 'ORA2_AI_LOADED_CLASSIFIERS_CACHE_SIZE', DEFAULT_MAX_SIZE)
+)
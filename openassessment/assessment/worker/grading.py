@@ -13,6 +13,7 @@ from openassessment.assessment.errors import (
     AIError, AIGradingInternalError, AIReschedulingInternalError, ANTICIPATED_CELERY_ERRORS
 )
 from .algorithm import AIAlgorithm, AIAlgorithmError
+from .classifier_cache import LOADED_CLASSIFIERS_CACHE
 from openassessment.assessment.models.ai import AIGradingWorkflow
 
 MAX_RETRIES = 2
@@ -23,6 +24,10 @@ logger = get_task_logger(__name__)
 # Otherwise, use the default queue.
 RESCHEDULE_TASK_QUEUE = getattr(settings, 'LOW_PRIORITY_QUEUE', None)
 
+# Number of grading workflows scheduled per batch grading task
+# when incomplete grading tasks are rescheduled.
+GRADING_BATCH_SIZE = getattr(settings, 'ORA2_AI_GRADING_BATCH_SIZE', 50)
+
 
 @task(max_retries=MAX_RETRIES)  # pylint: disable=E1102
 @dog_stats_api.timed('openassessment.assessment.ai.grade_essay.time')
@@ -68,6 +73,7 @@ def grade_essay(workflow_uuid):
         params = ai_worker_api.get_grading_task_params(workflow_uuid)
         essay_text = params['essay_text']
         classifier_set = params['classifier_set']
+        classifier_set_id = params['classifier_set_id']
         algorithm_id = params['algorithm_id']
         valid_scores = params['valid_scores']
     except (AIError, KeyError):
@@ -107,16 +113,20 @@ def grade_essay(workflow_uuid):
         raise grade_essay.retry()
 
     # Use the algorithm to evaluate the essay for each criterion
+    # The loaded classifiers are shared by all essays graded with this classifier set.
     # Provide an in-memory cache so the algorithm can re-use
     # results for multiple rubric criteria.
     try:
+        classifiers = LOADED_CLASSIFIERS_CACHE.get_or_load(
+            algorithm, algorithm_id, classifier_set_id, classifier_set
+        )
         cache = dict()
         scores_by_criterion = {
             criterion_name: _closest_valid_score(
                 algorithm.score(essay_text, classifier, cache),
                 valid_scores[criterion_name]
             )
-            for criterion_name, classifier in classifier_set.iteritems()
+            for criterion_name, classifier in classifiers.iteritems()
         }
     except AIAlgorithmError:
         msg = (
@@ -139,6 +149,120 @@ def grade_essay(workflow_uuid):
         raise grade_essay.retry()
 
 
+@task(max_retries=MAX_RETRIES)  # pylint: disable=E1102
+@dog_stats_api.timed('openassessment.assessment.ai.grade_essays_batch.time')
+def grade_essays_batch(workflow_uuids):
+    """
+    Asynchronous task to grade many essays at once.
+
+    The task parameters are retrieved for all workflows in bulk, the essays
+    graded with the same classifier set are scored together, and the
+    assessments are created in a single transaction.
+
+    If some of the essays could not be graded, the task is retried
+    for those workflows only.  Workflows that are already complete
+    are skipped.
+
+    Args:
+        workflow_uuids (list of str): The UUIDs of the grading workflows.
+
+    Returns:
+        None
+
+    Raises:
+        AIError: An error occurred while making an AI worker API call.
+        AIAlgorithmError: An error occurred while retrieving or using an AI algorithm.
+
+    """
+    # Retrieve the task parameters, grouped by classifier set
+    try:
+        params_list = ai_worker_api.get_grading_tasks_params(workflow_uuids)
+    except AIError:
+        msg = (
+            u"An error occurred while retrieving the AI grading task "
+            u"parameters for {count} workflows"
+        ).format(count=len(workflow_uuids))
+        logger.exception(msg)
+        raise grade_essays_batch.retry()
+
+    failed_uuids = []
+    scores_by_workflow = {}
+    for params in params_list:
+        essay_uuids = params['essays'].keys()
+        try:
+            scores_by_workflow.update(_score_essays_batch(params, essay_uuids))
+        except (AIGradingInternalError, AIAlgorithmError):
+            msg = (
+                u"An error occurred while scoring {count} essays using "
+                u"the classifier set with ID {id}"
+            ).format(count=len(essay_uuids), id=params['classifier_set_id'])
+            logger.exception(msg)
+            failed_uuids.extend(essay_uuids)
+
+    # Create the assessments and mark the workflows complete
+    try:
+        ai_worker_api.create_assessments(scores_by_workflow)
+    except AIError:
+        msg = (
+            u"An error occurred while creating assessments "
+            u"for {count} AI grading workflows"
+        ).format(count=len(scores_by_workflow))
+        logger.exception(msg)
+        failed_uuids.extend(scores_by_workflow.keys())
+
+    if failed_uuids:
+        raise grade_essays_batch.retry(args=[failed_uuids])
+
+
+def _score_essays_batch(params, workflow_uuids):
+    """
+    Score the essays of many workflows that share a classifier set.
+
+    Args:
+        params (dict): Grading task parameters for a classifier set,
+            as returned by `ai_worker_api.get_grading_tasks_params`.
+        workflow_uuids (list of str): The workflows to score, in `params['essays']`.
+
+    Returns:
+        dict: Maps workflow UUIDs to dictionaries mapping criteria names to scores.
+
+    Raises:
+        AIGradingInternalError
+        AIAlgorithmError
+
+    """
+    classifier_set = params['classifier_set']
+    valid_scores = params['valid_scores']
+    algorithm_id = params['algorithm_id']
+
+    # Validate that the we have valid scores for each criterion
+    for criterion_name in classifier_set.keys():
+        if not valid_scores.get(criterion_name):
+            raise AIGradingInternalError(
+                u"Could not find valid scores for {criterion} in the classifier set with ID {id}".format(
+                    criterion=criterion_name, id=params['classifier_set_id']
+                )
+            )
+
+    algorithm = AIAlgorithm.algorithm_for_id(algorithm_id)
+    classifiers = LOADED_CLASSIFIERS_CACHE.get_or_load(
+        algorithm, algorithm_id, params['classifier_set_id'], classifier_set
+    )
+
+    # Score all essays for one criterion at a time, re-using
+    # the in-memory cache for all criteria in the rubric.
+    texts = [params['essays'][workflow_uuid] for workflow_uuid in workflow_uuids]
+    cache = dict()
+    scores_by_workflow = {workflow_uuid: dict() for workflow_uuid in workflow_uuids}
+    for criterion_name, classifier in classifiers.iteritems():
+        scores = algorithm.score_batch(texts, classifier, cache)
+        for workflow_uuid, score in zip(workflow_uuids, scores):
+            scores_by_workflow[workflow_uuid][criterion_name] = _closest_valid_score(
+                score, valid_scores[criterion_name]
+            )
+    return scores_by_workflow
+
+
 @task(queue=RESCHEDULE_TASK_QUEUE, max_retries=MAX_RETRIES)  # pylint: disable=E1102
 @dog_stats_api.timed('openassessment.assessment.ai.reschedule_grading_tasks.time')
 def reschedule_grading_tasks(course_id, item_id):
@@ -176,6 +300,9 @@ def reschedule_grading_tasks(course_id, item_id):
     # queries which will return the same value. This loop implements a memoization of the the query.
     maintained_classifiers = {}
 
+    # The UUIDs of the workflows to schedule with the next batch grading task.
+    batch = []
+
     # Try to grade all incomplete grading workflows
     for workflow in grading_workflows:
 
@@ -223,26 +350,21 @@ def reschedule_grading_tasks(course_id, item_id):
                 ).format(id=workflow.uuid)
                 logger.exception(msg)
 
+        # Now we should (unless we had an exception above) have a classifier set,
+        # so the workflow can be graded with the next batch.
         if found_classifiers is not None:
-
-            # Now we should (unless we had an exception above) have a classifier set.
-            # Try to schedule the grading
-            try:
-                grade_essay.apply_async(args=[workflow.uuid])
-                logger.info(
-                    u"Rescheduling of grading was successful for grading workflow with uuid='{}'".format(workflow.uuid)
-                )
-            except ANTICIPATED_CELERY_ERRORS as ex:
-                msg = (
-                    u"An error occurred while try to grade essay with uuid='{id}': {ex}"
-                ).format(id=workflow.uuid, ex=ex)
-                logger.exception(msg)
-                failures += 1
+            batch.append(workflow.uuid)
+            if len(batch) >= GRADING_BATCH_SIZE:
+                failures += _schedule_grading_batch(batch)
+                batch = []
 
         # If we couldn't assign classifiers, we failed.
         else:
             failures += 1
 
+    if batch:
+        failures += _schedule_grading_batch(batch)
+
     # Logs the data from our rescheduling attempt
     time_delta = datetime.datetime.now() - start_time
     _log_complete_reschedule_grading(
@@ -261,6 +383,31 @@ def reschedule_grading_tasks(course_id, item_id):
             raise reschedule_grading_tasks.retry()
 
 
+def _schedule_grading_batch(workflow_uuids):
+    """
+    Schedule a batch grading task.
+
+    Args:
+        workflow_uuids (list of str): The UUIDs of the grading workflows to grade.
+
+    Returns:
+        int: The number of workflows that could not be scheduled.
+
+    """
+    try:
+        grade_essays_batch.apply_async(args=[workflow_uuids])
+        logger.info(
+            u"Rescheduling of grading was successful for {} grading workflows".format(len(workflow_uuids))
+        )
+        return 0
+    except ANTICIPATED_CELERY_ERRORS as ex:
+        msg = (
+            u"An error occurred while trying to schedule grading for {count} essays: {ex}"
+        ).format(count=len(workflow_uuids), ex=ex)
+        logger.exception(msg)
+        return len(workflow_uuids)
+
+
 def _closest_valid_score(score, valid_scores):
     """
     Return the closest valid score for a given score.
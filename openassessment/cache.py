@@ -0,0 +1,17 @@
+"""
+Caches of ORA, in addition to the default Django cache.
+"""
+from django.core import signals
+from django.core.cache import _create_cache
+
+
+def create_cache(backend, **kwargs):
+    """
+    Create cache backend. Using this custom function to avoid deprecation warnings.
+    """
+    cache = _create_cache(backend, **kwargs)
+    # Some caches -- python-memcached in particular -- need to do a cleanup at the
+    # end of a request cycle. If not implemented in a particular backend
+    # cache.close is a no-op
+    signals.request_finished.connect(cache.close)
+    return cache
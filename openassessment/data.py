@@ -5,10 +5,16 @@ import csv
 import json
 
 from collections import defaultdict
-from django.conf import settings
+from itertools import chain
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import Count
 from submissions import api as sub_api
+from openassessment.archive import archive_database, fallback_to_archive, get_with_fallback
+from openassessment.routers import read_replica_database, replica_safe, use_read_replica
 from openassessment.workflow.models import AssessmentWorkflow
-from openassessment.assessment.models import Assessment, AssessmentPart, AssessmentFeedback
+from openassessment.assessment.models import (
+    Assessment, AssessmentFeedback, AssessmentPart, AssessmentPartRow, AssessmentRow, Rubric
+)
 
 
 class CsvWriter(object):
@@ -96,7 +102,8 @@ class CsvWriter(object):
         NOTE: The current implementation optimizes for memory usage,
         but not for the number of database queries.  All the queries
         use indexed fields (the submission uuid), so they should be
-        relatively quick.
+        relatively quick.  The submissions of the course that have
+        been archived are read from the archive database.
 
         Args:
             course_id (unicode): The course ID from which to pull data.
@@ -109,37 +116,44 @@ class CsvWriter(object):
 
         rubric_points_cache = dict()
         feedback_option_set = set()
-        for submission_uuid in self._submission_uuids(course_id):
-            self._write_submission_to_csv(submission_uuid)
-
-            # Django 1.4 doesn't follow reverse relations when using select_related,
-            # so we select AssessmentPart and follow the foreign key to the Assessment.
-            parts = self._use_read_replica(
-                AssessmentPart.objects.select_related('assessment', 'option', 'option__criterion')
-                .filter(assessment__submission_uuid=submission_uuid)
-                .order_by('assessment__pk')
-            )
-            self._write_assessment_to_csv(parts, rubric_points_cache)
+        for database in self._databases():
+            for submission_uuid in self._submission_uuids(course_id, database):
+                self._write_submission_to_csv(submission_uuid)
+
+                # Assessments and their parts are read as rows, which are much faster
+                # to load than models when a course has many submissions.
+                parts = AssessmentPartRow.fetch(
+                    AssessmentPart.objects.using(database)
+                    .filter(assessment__submission_uuid=submission_uuid)
+                    .order_by('assessment__pk')
+                )
+                assessments = {
+                    assessment.id: assessment
+                    for assessment in AssessmentRow.fetch(
+                        Assessment.objects.using(database).filter(submission_uuid=submission_uuid)
+                    )
+                }
+                self._write_assessment_to_csv(parts, assessments, rubric_points_cache, database)
 
-            feedback_query = self._use_read_replica(
-                AssessmentFeedback.objects
-                .filter(submission_uuid=submission_uuid)
-                .prefetch_related('options')
-            )
-            for assessment_feedback in feedback_query:
-                self._write_assessment_feedback_to_csv(assessment_feedback)
-                feedback_option_set.update(set(
-                    option for option in assessment_feedback.options.all()
-                ))
+                feedback_query = (
+                    AssessmentFeedback.objects.using(database)
+                    .filter(submission_uuid=submission_uuid)
+                    .prefetch_related('options')
+                )
+                for assessment_feedback in feedback_query:
+                    self._write_assessment_feedback_to_csv(assessment_feedback)
+                    feedback_option_set.update(set(
+                        option for option in assessment_feedback.options.all()
+                    ))
 
-            if self._progress_callback is not None:
-                self._progress_callback()
+                if self._progress_callback is not None:
+                    self._progress_callback()
 
         # The set of available options should be relatively small,
         # since they're not (currently) user-defined.
         self._write_feedback_options_to_csv(feedback_option_set)
 
-    def _submission_uuids(self, course_id):
+    def _submission_uuids(self, course_id, database):
         """
         Iterate over submission uuids.
         Makes database calls every N submissions to avoid loading
@@ -147,6 +161,7 @@ class CsvWriter(object):
 
         Args:
             course_id (unicode): The ID of the course to retrieve submissions from.
+            database (unicode): The alias of the database to read from.
 
         Yields:
             submission_uuid (unicode)
@@ -154,9 +169,7 @@ class CsvWriter(object):
         """
         num_results = 0
         start = 0
-        total_results = self._use_read_replica(
-            AssessmentWorkflow.objects.filter(course_id=course_id)
-        ).count()
+        total_results = AssessmentWorkflow.objects.using(database).filter(course_id=course_id).count()
 
         while num_results < total_results:
             # Load a subset of the submission UUIDs
@@ -164,15 +177,15 @@ class CsvWriter(object):
             # so if we counted N at the start of the loop,
             # there should be >= N for us to process.
             end = start + self.QUERY_INTERVAL
-            query = self._use_read_replica(
-                AssessmentWorkflow.objects
+            query = (
+                AssessmentWorkflow.objects.using(database)
                 .filter(course_id=course_id)
                 .order_by('created')
-            ).values('submission_uuid')[start:end]
+            ).values_list('submission_uuid', flat=True)[start:end]
 
-            for workflow_dict in query:
+            for submission_uuid in query:
                 num_results += 1
-                yield workflow_dict['submission_uuid']
+                yield submission_uuid
 
             start += self.QUERY_INTERVAL
 
@@ -213,14 +226,16 @@ class CsvWriter(object):
                 score['created_at']
             ])
 
-    def _write_assessment_to_csv(self, assessment_parts, rubric_points_cache):
+    def _write_assessment_to_csv(self, assessment_parts, assessments, rubric_points_cache, database):
         """
         Write assessments and assessment parts to CSV.
 
         Args:
-            assessment_parts (list of AssessmentPart): The assessment parts to write,
+            assessment_parts (list of AssessmentPartRow): The assessment parts to write,
                 not necessarily from the same assessment.
+            assessments (dict): Maps the IDs of the assessments of the parts to `AssessmentRow`s.
             rubric_points_cache (dict): in-memory cache of points possible by rubric ID.
+            database (unicode): The alias of the database that the assessments were read from.
 
         Returns:
             None
@@ -230,18 +245,18 @@ class CsvWriter(object):
 
         for part in assessment_parts:
             self._write_unicode('assessment_part', [
-                part.assessment.id,
+                part.assessment_id,
                 part.points_earned,
-                part.criterion.name,
-                part.criterion.label,
-                part.option.name if part.option is not None else u"",
-                part.option.label if part.option is not None else u"",
+                part.criterion_name,
+                part.criterion_label,
+                part.option_name if part.option_name is not None else u"",
+                part.option_label if part.option_name is not None else u"",
                 part.feedback
             ])
 
             # If we haven't seen this assessment before, write it
-            if part.assessment.id not in assessment_id_set:
-                assessment = part.assessment
+            if part.assessment_id not in assessment_id_set:
+                assessment = assessments[part.assessment_id]
 
                 # The points possible in the rubric will be the same for
                 # every assessment that shares a rubric.  To avoid querying
@@ -250,7 +265,7 @@ class CsvWriter(object):
                 if assessment.rubric_id in rubric_points_cache:
                     points_possible = rubric_points_cache[assessment.rubric_id]
                 else:
-                    points_possible = assessment.points_possible
+                    points_possible = Rubric.objects.using(database).get(id=assessment.rubric_id).points_possible
                     rubric_points_cache[assessment.rubric_id] = points_possible
 
                 self._write_unicode('assessment', [
@@ -320,22 +335,20 @@ class CsvWriter(object):
             encoded_row = [unicode(field).encode('utf-8') for field in row]
             writer.writerow(encoded_row)
 
-    def _use_read_replica(self, queryset):
+    def _databases(self):
         """
-        Use the read replica if it's available.
-
-        Args:
-            queryset (QuerySet)
+        Return the aliases of the databases to read from: the read replica
+        if it's available (or else the primary database), then the archive
+        if it's configured.
 
         Returns:
-            QuerySet
+            list of unicode
 
         """
-        return (
-            queryset.using("read_replica")
-            if "read_replica" in settings.DATABASES
-            else queryset
-        )
+        databases = [read_replica_database() or DEFAULT_DB_ALIAS]
+        if archive_database() is not None:
+            databases.append(archive_database())
+        return databases
 
 
 class OraAggregateData(object):
@@ -343,28 +356,11 @@ class OraAggregateData(object):
     Aggregate all the ORA data into a single table-like data structure.
     """
 
-    @classmethod
-    def _use_read_replica(cls, queryset):
-        """
-        If there's a read replica that can be used, return a cursor to that.
-        Otherwise, return a cursor to the regular database.
-
-        Args:
-            queryset (QuerySet): The queryset that we would like to use the read replica for.
-        Returns:
-            QuerySet
-        """
-        return (
-            queryset.using("read_replica")
-            if "read_replica" in settings.DATABASES
-            else queryset
-        )
-
     @classmethod
     def _build_assessments_cell(cls, assessments):
         """
         Args:
-            assessments (QuerySet) - assessments that we would like to collate into one column.
+            assessments (list of AssessmentRow) - assessments that we would like to collate into one column.
         Returns:
             string that should be included in the 'assessments' column for this set of assessments' row
         """
@@ -382,19 +378,31 @@ class OraAggregateData(object):
     def _build_assessments_parts_cell(cls, assessments):
         """
         Args:
-            assessments (QuerySet) - assessments containing the parts that we would like to collate into one column.
+            assessments (list of AssessmentRow) - assessments containing the parts that we would like to collate
+                into one column.
         Returns:
             string that should be included in the relevant 'assessments_parts' column for this set of assessments' row
         """
+        if not assessments:
+            return u""
+
+        # The parts of all the assessments are read with a single query
+        parts_by_assessment = defaultdict(list)
+        for part in AssessmentPartRow.build(fallback_to_archive(use_read_replica(AssessmentPartRow.values(
+            AssessmentPart.objects.filter(
+                assessment__in=[assessment.id for assessment in assessments]
+            ).order_by('criterion__order_num')
+        )), assessments[0].submission_uuid)):
+            parts_by_assessment[part.assessment_id].append(part)
+
         returned_string = u""
         for assessment in assessments:
             returned_string += u"Assessment #{}\n".format(assessment.id)
-            for part in assessment.parts.order_by('criterion__order_num'):
-                returned_string += u"-- {}".format(part.criterion.label)
-                if part.option is not None and part.option.label is not None:
-                    option_label = part.option.label
+            for part in parts_by_assessment[assessment.id]:
+                returned_string += u"-- {}".format(part.criterion_label)
+                if part.option_label is not None:
                     returned_string += u": {option_label} ({option_points})\n".format(
-                        option_label=option_label, option_points=part.option.points
+                        option_label=part.option_label, option_points=part.option_points
                     )
                 if part.feedback != u"":
                     returned_string += u"-- feedback: {}\n".format(part.feedback)
@@ -404,16 +412,28 @@ class OraAggregateData(object):
     def _build_feedback_options_cell(cls, assessments):
         """
         Args:
-            assessments (QuerySet) - assessment that we would like to use to fetch and read the feedback options.
+            assessments (list of AssessmentRow) - assessment that we would like to use to fetch and read
+                the feedback options.
         Returns:
             string that should be included in the relevant 'feedback_options' column for this set of assessments' row
         """
+        if not assessments:
+            return u""
+
+        # The feedback options of all the assessments are read with a single query
+        options_by_assessment = defaultdict(list)
+        for assessment_id, option_text in fallback_to_archive(use_read_replica(
+            AssessmentFeedback.objects.filter(
+                assessments__in=[assessment.id for assessment in assessments]
+            ).values_list('assessments', 'options__text').order_by('id', 'options__id')
+        ), assessments[0].submission_uuid):
+            if option_text is not None:
+                options_by_assessment[assessment_id].append(option_text)
 
         returned_string = u""
         for assessment in assessments:
-            for feedback in assessment.assessment_feedback.all():
-                for option in feedback.options.all():
-                    returned_string += option.text + u"\n"
+            for option_text in options_by_assessment[assessment.id]:
+                returned_string += option_text + u"\n"
 
         return returned_string
 
@@ -426,7 +446,7 @@ class OraAggregateData(object):
             string that should be included in the relevant 'feedback' column for this set of assessments' row
         """
         try:
-            feedback = AssessmentFeedback.objects.get(submission_uuid=submission_uuid)
+            feedback = get_with_fallback(AssessmentFeedback.objects, submission_uuid)
         except AssessmentFeedback.DoesNotExist:
             return u""
         return feedback.feedback_text
@@ -453,13 +473,9 @@ class OraAggregateData(object):
         rows = []
         for student_item, submission, score in all_submission_information:
             row = []
-            assessments = cls._use_read_replica(
-                Assessment.objects.prefetch_related('parts').
-                prefetch_related('rubric').
-                filter(
-                    submission_uuid=submission['uuid']
-                )
-            )
+            assessments = AssessmentRow.build(fallback_to_archive(use_read_replica(AssessmentRow.values(
+                Assessment.objects.filter(submission_uuid=submission['uuid'])
+            )), submission['uuid']))
             assessments_cell = cls._build_assessments_cell(assessments)
             assessments_parts_cell = cls._build_assessments_parts_cell(assessments)
             feedback_options_cell = cls._build_feedback_options_cell(assessments)
@@ -498,6 +514,7 @@ class OraAggregateData(object):
         return header, rows
 
     @classmethod
+    @replica_safe
     def collect_ora2_responses(cls, course_id, desired_statuses=None):
         """
         Get information about all ora2 blocks in the course with response count for each step
@@ -519,18 +536,21 @@ class OraAggregateData(object):
 
         """
         if desired_statuses:
-            statuses = [st for st in AssessmentWorkflow().STATUS_VALUES if st in desired_statuses]
+            statuses = [st for st in AssessmentWorkflow.STATUS_VALUES if st in desired_statuses]
         else:
-            statuses = AssessmentWorkflow().STATUS_VALUES
+            statuses = AssessmentWorkflow.STATUS_VALUES
 
-        items = AssessmentWorkflow.objects.filter(course_id=course_id, status__in=statuses).values('item_id', 'status')
+        # The workflows are counted by item and status in the database
+        counts = AssessmentWorkflow.objects.filter(
+            course_id=course_id, status__in=statuses
+        ).values_list('item_id', 'status').annotate(count=Count('id')).order_by()
+        if archive_database() is not None:
+            counts = chain(counts, counts.using(archive_database()))
 
         result = defaultdict(lambda: {status: 0 for status in statuses})
-        for item in items:
-            item_id = item['item_id']
-            status = item['status']
-            result[item_id]['total'] = result[item_id].get('total', 0) + 1
+        for item_id, status, count in counts:
+            result[item_id]['total'] = result[item_id].get('total', 0) + count
             if status in statuses:
-                result[item_id][status] += 1
+                result[item_id][status] += count
 
         return result
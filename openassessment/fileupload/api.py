@@ -4,8 +4,118 @@ associated with submissions. This can be used to upload new files and provide
 URLs to the new location.
 
 """
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.encoding import force_bytes
+from dogapi import dog_stats_api
 
 from . import backends
+from .backends.base import BaseBackend
+
+# Time (in seconds) to re-use a download URL.  Download URLs are valid for
+# BaseBackend.DOWNLOAD_URL_TIMEOUT seconds after they are generated, so cached
+# URLs must be handed out for at most half of that time, which leaves every
+# URL valid for at least the other half once it has been rendered.
+DEFAULT_DOWNLOAD_URL_CACHE_TIMEOUT = 300
+MAX_DOWNLOAD_URL_CACHE_TIMEOUT = BaseBackend.DOWNLOAD_URL_TIMEOUT // 2
+
+
+class DownloadUrlCache(object):
+    """
+    Cache of the download URLs of files, keyed by file key.
+
+    Only URLs of files that exist are cached, since a missing
+    file can be uploaded at any time.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, keys):
+        """
+        Retrieve the cached download URLs of files.
+
+        Args:
+            keys (list of str): File keys.
+
+        Returns:
+            dict mapping the file keys that were found to their download URLs.
+
+        """
+        cache_keys = {self._cache_key(key): key for key in keys if key}
+        found = {
+            cache_keys[cache_key]: url
+            for cache_key, url in cache.get_many(cache_keys.keys()).iteritems()
+        }
+        hits, misses = len(found), len(cache_keys) - len(found)
+        self.hits += hits
+        self.misses += misses
+        if hits:
+            dog_stats_api.increment('openassessment.fileupload.download_url_cache.hit', hits)
+        if misses:
+            dog_stats_api.increment('openassessment.fileupload.download_url_cache.miss', misses)
+        return found
+
+    def set_many(self, urls):
+        """
+        Cache the download URLs of files.  Empty URLs are not cached.
+
+        Args:
+            urls (dict): Maps file keys to download URLs.
+
+        """
+        cache.set_many(
+            {self._cache_key(key): url for key, url in urls.iteritems() if url},
+            self.timeout()
+        )
+
+    def delete(self, key):
+        """
+        Forget the download URL of a file, for example when it is removed.
+        """
+        if key:
+            cache.delete(self._cache_key(key))
+
+    def delete_many(self, keys):
+        """
+        Forget the download URLs of many files.
+        """
+        cache.delete_many([self._cache_key(key) for key in keys if key])
+
+    def reset_metrics(self):
+        """
+        Reset the hit and miss counters.
+        """
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def timeout():
+        """
+        Return the time (in seconds) to cache download URLs, which
+        is always safely below the time before they expire.
+        """
+        timeout = getattr(
+            settings, "ORA2_FILEUPLOAD_DOWNLOAD_URL_CACHE_TIMEOUT", DEFAULT_DOWNLOAD_URL_CACHE_TIMEOUT
+        )
+        return min(timeout, MAX_DOWNLOAD_URL_CACHE_TIMEOUT)
+
+    @staticmethod
+    def _cache_key(key):
+        """
+        Return the cache key for the download URL of a file.  File keys can contain
+        characters that are not valid in cache keys, so they are hashed.
+        """
+        backend_name = getattr(settings, "ORA2_FILEUPLOAD_BACKEND", "s3")
+        return "fileupload.download_url.{}.{}".format(
+            backend_name, hashlib.sha1(force_bytes(key)).hexdigest()
+        )
+
+
+DOWNLOAD_URL_CACHE = DownloadUrlCache()
 
 
 def get_upload_url(key, content_type):
@@ -19,11 +129,39 @@ def get_download_url(key):
     """
     Returns the url at which the file that corresponds to the key can be downloaded.
     """
-    return backends.get_backend().get_download_url(key)
+    url = DOWNLOAD_URL_CACHE.get_many([key]).get(key)
+    if url is None:
+        url = backends.get_backend().get_download_url(key)
+        DOWNLOAD_URL_CACHE.set_many({key: url})
+    return url
+
+
+def get_download_urls(keys):
+    """
+    Returns the urls at which the files that correspond to the keys can be downloaded,
+    in the same order as the keys.  The url of a file that does not exist is empty.
+    """
+    urls = DOWNLOAD_URL_CACHE.get_many(keys)
+    missing_keys = [key for key in keys if key not in urls]
+    if missing_keys:
+        new_urls = dict(zip(missing_keys, backends.get_backend().get_download_urls(missing_keys)))
+        DOWNLOAD_URL_CACHE.set_many(new_urls)
+        urls.update(new_urls)
+    return [urls[key] for key in keys]
 
 
 def remove_file(key):
     """
     Remove file from the storage
     """
+    DOWNLOAD_URL_CACHE.delete(key)
     return backends.get_backend().remove_file(key)
+
+
+def remove_files(keys):
+    """
+    Remove many files from the storage.  Returns a list of booleans, in the
+    same order as the keys, telling whether each file was removed.
+    """
+    DOWNLOAD_URL_CACHE.delete_many(keys)
+    return backends.get_backend().remove_files(keys)
@@ -1,21 +1,20 @@
-from . import s3
-from . import filesystem
-from . import swift
-from . import django_storage
+from importlib import import_module
 
 from django.conf import settings
 
+# Backend modules are only imported when they are used, since some of them
+# import heavy client libraries (boto, swiftclient).
+BACKEND_MODULES = {
+    "s3": "s3",
+    "filesystem": "filesystem",
+    "swift": "swift",
+    "django": "django_storage",
+}
+
 
 def get_backend():
     # Use S3 backend by default (current behaviour)
     backend_setting = getattr(settings, "ORA2_FILEUPLOAD_BACKEND", "s3")
-    if backend_setting == "s3":
-        return s3.Backend()
-    elif backend_setting == "filesystem":
-        return filesystem.Backend()
-    elif backend_setting == "swift":
-        return swift.Backend()
-    elif backend_setting == "django":
-        return django_storage.Backend()
-    else:
+    if backend_setting not in BACKEND_MODULES:
         raise ValueError("Invalid ORA2_FILEUPLOAD_BACKEND setting value: %s" % backend_setting)
+    return import_module("." + BACKEND_MODULES[backend_setting], __name__).Backend()
@@ -1,6 +1,9 @@
 import abc
+import hashlib
+from multiprocessing.pool import ThreadPool
 
 from django.conf import settings
+from django.core.cache import cache
 
 from ..exceptions import FileUploadInternalError
 from ..exceptions import FileUploadRequestError
@@ -18,9 +21,16 @@ class Settings(object):
         DEFAULT_FILE_UPLOAD_STORAGE_PREFIX): this will be used to prefix all
         stored file names. The specified file prefix for the storage must be
         publicly viewable or all uploaded files will not be seen.
+
+        ORA2_FILEUPLOAD_MAX_SIZE (int, defaults to DEFAULT_MAX_UPLOAD_SIZE):
+        the maximum size (in bytes) of a file uploaded through the ORA2
+        upload endpoints of the filesystem and django storage backends.
     """
     DEFAULT_FILE_UPLOAD_STORAGE_PREFIX = "submissions_attachments"
 
+    # Same as the limit on the size of all attached files in the LMS
+    DEFAULT_MAX_UPLOAD_SIZE = 10 * 1024 * 1024
+
     @classmethod
     def get_bucket_name(cls):
         bucket_name = getattr(settings, "FILE_UPLOAD_STORAGE_BUCKET_NAME", None)
@@ -36,6 +46,14 @@ class Settings(object):
         """
         return getattr(settings, "FILE_UPLOAD_STORAGE_PREFIX", cls.DEFAULT_FILE_UPLOAD_STORAGE_PREFIX)
 
+    @classmethod
+    def get_max_upload_size(cls):
+        """Return the maximum size (in bytes) of an uploaded file.
+
+        Defaults to the DEFAULT_MAX_UPLOAD_SIZE class attribute.
+        """
+        return getattr(settings, "ORA2_FILEUPLOAD_MAX_SIZE", cls.DEFAULT_MAX_UPLOAD_SIZE)
+
 
 class BaseBackend(object):
 
@@ -47,6 +65,14 @@ class BaseBackend(object):
     # Time (in seconds) before a download url expires
     DOWNLOAD_URL_TIMEOUT = 1000
 
+    # Time (in seconds) to remember that a file exists in storage.
+    # Uploaded files are not modified, and removing a file through the
+    # backend forgets it, so this can safely be long.
+    DEFAULT_EXISTENCE_CACHE_TIMEOUT = 3600
+
+    # Maximum number of files to look up or remove in storage at the same time
+    MAX_CONCURRENT_CHECKS = 8
+
     @abc.abstractmethod
     def get_upload_url(self, key, content_type):
         """Request a one-time upload URL to upload files.
@@ -90,6 +116,22 @@ class BaseBackend(object):
         """
         raise NotImplementedError
 
+    def get_download_urls(self, keys):
+        """Requests URLs to download many files from.
+
+        By default, the URLs are requested one by one with `get_download_url`.
+        Backends that can generate many URLs more efficiently should override this.
+
+        Args:
+            keys (list of str): Unique identifiers of the data requested for download.
+
+        Returns:
+            A list of URLs (str), in the same order as the keys. If no file is found
+            for a key, the corresponding URL is an empty string.
+
+        """
+        return [self.get_download_url(key) for key in keys]
+
     @abc.abstractmethod
     def remove_file(self, key):
         """
@@ -103,6 +145,32 @@ class BaseBackend(object):
         """
         raise NotImplementedError
 
+    def remove_files(self, keys):
+        """
+        Remove many files from the storage.
+
+        The keys are the consecutive slots of the files of a learner, so the
+        files are removed in order up to the first one that does not exist;
+        the files after it are left in place.  Every backend removes the same
+        files: the default implementation uses `remove_file` on each key,
+        and backends that can look up and remove many files more efficiently
+        override it.
+
+        Args:
+            keys (list of str): Unique identifiers of the data requested for remove.
+
+        Returns:
+            A list of booleans, in the same order as the keys: True if the
+            corresponding file was removed, False if it was not found or
+            follows a file that was not found.
+        """
+        removed = []
+        for key in keys:
+            if not self.remove_file(key):
+                break
+            removed.append(True)
+        return removed + [False] * (len(keys) - len(removed))
+
     def _retrieve_parameters(self, key):
         """
         Simple utility function to validate settings and arguments before compiling
@@ -139,3 +207,114 @@ class BaseBackend(object):
             prefix=Settings.get_prefix(),
             key=key
         )
+
+    def _is_known_to_exist(self, bucket_name, key_name):
+        """
+        Return True if the file was recently found in storage.
+
+        Args:
+            bucket_name (str): The name of the bucket (or container) holding the file.
+            key_name (str): The complete key of the file.
+
+        Returns:
+            bool
+
+        """
+        return bool(cache.get(self._get_existence_cache_key(bucket_name, key_name)))
+
+    def _remember_exists(self, bucket_name, key_name):
+        """
+        Remember that a file exists in storage, so that it does not need to be looked up again.
+        Only files that exist are remembered, since a missing file can be uploaded at any time.
+        """
+        timeout = getattr(
+            settings, "ORA2_FILEUPLOAD_EXISTENCE_CACHE_TIMEOUT", self.DEFAULT_EXISTENCE_CACHE_TIMEOUT
+        )
+        cache.set(self._get_existence_cache_key(bucket_name, key_name), True, timeout)
+
+    def _forget_exists(self, bucket_name, key_name):
+        """
+        Forget that a file exists in storage, for example when it is removed.
+        """
+        cache.delete(self._get_existence_cache_key(bucket_name, key_name))
+
+    def _find_existing(self, bucket_name, key_names, check_exists):
+        """
+        Find which of many files exist in storage.  Files that are not known
+        to exist are checked concurrently, and the ones found are remembered.
+
+        Args:
+            bucket_name (str): The name of the bucket (or container) holding the files.
+            key_names (list of str): The complete keys of the files.
+            check_exists (callable): Called with a key name, returns True if the file exists.
+
+        Returns:
+            set of the key names of the files that exist.
+
+        """
+        cache_keys = {
+            self._get_existence_cache_key(bucket_name, key_name): key_name
+            for key_name in key_names
+        }
+        existing = set(cache_keys[cache_key] for cache_key in cache.get_many(cache_keys.keys()))
+        unknown = [key_name for key_name in set(key_names) if key_name not in existing]
+        if not unknown:
+            return existing
+
+        found = self._map_concurrently(check_exists, unknown)
+        timeout = getattr(
+            settings, "ORA2_FILEUPLOAD_EXISTENCE_CACHE_TIMEOUT", self.DEFAULT_EXISTENCE_CACHE_TIMEOUT
+        )
+        found_key_names = [key_name for key_name, exists in zip(unknown, found) if exists]
+        cache.set_many({
+            self._get_existence_cache_key(bucket_name, key_name): True
+            for key_name in found_key_names
+        }, timeout)
+        existing.update(found_key_names)
+        return existing
+
+    def _map_concurrently(self, func, items):
+        """
+        Call a function that accesses the storage on many items concurrently,
+        using at most ORA2_FILEUPLOAD_MAX_CONCURRENT_CHECKS threads.
+
+        Returns:
+            list of the results, in the same order as the items.
+        """
+        if not items:
+            return []
+        max_workers = getattr(settings, "ORA2_FILEUPLOAD_MAX_CONCURRENT_CHECKS", self.MAX_CONCURRENT_CHECKS)
+        pool = ThreadPool(min(max_workers, len(items)))
+        try:
+            return pool.map(func, items)
+        finally:
+            pool.close()
+
+    @staticmethod
+    def _leading_existing(key_names, existing):
+        """
+        Return the key names up to the first one of a file that does not exist,
+        which are the files that `remove_files` removes.
+
+        Args:
+            key_names (list of str): The complete keys of the files, in order.
+            existing (set of str): The complete keys of the files that exist.
+
+        Returns:
+            list of str
+        """
+        leading = []
+        for key_name in key_names:
+            if key_name not in existing:
+                break
+            leading.append(key_name)
+        return leading
+
+    def _get_existence_cache_key(self, bucket_name, key_name):
+        """
+        Return the cache key used to remember that a file exists.  Key names can
+        contain characters that are not valid in cache keys, so they are hashed.
+        """
+        return "fileupload.exists.{}".format(
+            hashlib.sha1(u"{}/{}".format(bucket_name, key_name).encode('utf-8')).hexdigest()
+        )
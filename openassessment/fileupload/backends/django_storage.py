@@ -2,7 +2,7 @@ import os
 from .base import BaseBackend
 
 from django.core.files.storage import default_storage
-from django.core.files.base import ContentFile
+from django.core.files.base import ContentFile, File
 from django.core.urlresolvers import reverse
 
 
@@ -30,9 +30,16 @@ class Backend(BaseBackend):
     def upload_file(self, key, content):
         """
         Upload the given file content to the keyed location.
+
+        The content is either a string or a file-like object,
+        which is copied to the storage in chunks.
         """
         path = self._get_file_path(key)
-        saved_path = default_storage.save(path, ContentFile(content))
+        if isinstance(content, basestring):
+            content = ContentFile(content)
+        else:
+            content = File(content)
+        saved_path = default_storage.save(path, content)
         return saved_path
 
     def remove_file(self, key):
@@ -41,6 +41,11 @@ class Backend(BaseBackend):
         make_download_url_available(self._get_key_name(key), self.DOWNLOAD_URL_TIMEOUT)
         return self._get_url(key)
 
+    def get_download_urls(self, keys):
+        key_names = [self._get_key_name(key) for key in keys]
+        make_download_urls_available(key_names, self.DOWNLOAD_URL_TIMEOUT)
+        return [self._get_url(key) for key in keys]
+
     def remove_file(self, key):
         from openassessment.fileupload.views_filesystem import safe_remove, get_file_path
         return safe_remove(get_file_path(self._get_key_name(key)))
@@ -95,6 +100,20 @@ def make_download_url_available(url_key_name, timeout):
     )
 
 
+def make_download_urls_available(url_key_names, timeout):
+    """
+    Authorize many download URLs at once.
+
+    Arguments:
+        url_key_names (list of str): keys that uniquely identify the urls
+        timeout (int): time in seconds before the urls expire
+    """
+    get_cache().set_many({
+        smart_text(get_download_cache_key(url_key_name)): 1
+        for url_key_name in url_key_names
+    }, timeout)
+
+
 def is_upload_url_available(url_key_name):
     """
     Return True if the corresponding upload URL is available.
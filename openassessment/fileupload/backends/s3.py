@@ -1,8 +1,9 @@
 import boto
 import logging
+import threading
 from django.conf import settings
 
-from .base import BaseBackend
+from .base import BaseBackend, Settings
 from ..exceptions import FileUploadInternalError
 logger = logging.getLogger("openassessment.fileupload.api")
 
@@ -28,23 +29,69 @@ class Backend(BaseBackend):
             raise FileUploadInternalError(ex)
 
     def get_download_url(self, key):
+        """
+        Sign a download URL for a file.
+
+        Signing does not require any network access.  Unless the
+        ORA2_FILEUPLOAD_S3_CHECK_EXISTENCE setting is False, the URL is only
+        returned if the file exists; files known to exist are remembered
+        in the cache, so the bucket is only queried the first time.
+        """
         bucket_name, key_name = self._retrieve_parameters(key)
         try:
             conn = _connect_to_s3()
-            bucket = conn.get_bucket(bucket_name)
-            s3_key = bucket.get_key(key_name)
-            return s3_key.generate_url(expires_in=self.DOWNLOAD_URL_TIMEOUT) if s3_key else ""
+            if _check_existence() and not self._file_exists(conn, bucket_name, key_name):
+                return ""
+            return conn.generate_url(
+                expires_in=self.DOWNLOAD_URL_TIMEOUT,
+                method='GET',
+                bucket=bucket_name,
+                key=key_name
+            )
         except Exception as ex:
             logger.exception(
                 u"An internal exception occurred while generating a download URL."
             )
             raise FileUploadInternalError(ex)
 
+    def get_download_urls(self, keys):
+        """
+        Sign download URLs for many files, looking up the files
+        that are not known to exist concurrently.
+        """
+        key_names = [self._retrieve_parameters(key)[1] for key in keys]
+        if not key_names:
+            return []
+        bucket_name = Settings.get_bucket_name()
+        try:
+            conn = _connect_to_s3()
+            existing = None
+            if _check_existence():
+                bucket = conn.get_bucket(bucket_name, validate=False)
+                existing = self._find_existing(
+                    bucket_name, key_names, lambda key_name: bucket.get_key(key_name) is not None
+                )
+            return [
+                conn.generate_url(
+                    expires_in=self.DOWNLOAD_URL_TIMEOUT,
+                    method='GET',
+                    bucket=bucket_name,
+                    key=key_name
+                ) if existing is None or key_name in existing else ""
+                for key_name in key_names
+            ]
+        except Exception as ex:
+            logger.exception(
+                u"An internal exception occurred while generating download URLs."
+            )
+            raise FileUploadInternalError(ex)
+
     def remove_file(self, key):
         bucket_name, key_name = self._retrieve_parameters(key)
         conn = _connect_to_s3()
-        bucket = conn.get_bucket(bucket_name)
+        bucket = conn.get_bucket(bucket_name, validate=False)
         s3_key = bucket.get_key(key_name)
+        self._forget_exists(bucket_name, key_name)
 
         if s3_key:
             bucket.delete_key(s3_key)
@@ -52,11 +99,74 @@ class Backend(BaseBackend):
         else:
             return False
 
+    def remove_files(self, keys):
+        """
+        Remove the files up to the first missing one with multi-object delete
+        requests.  The first key of a learner's files is the prefix of the
+        others, so the files that exist are found by listing it once; other
+        keys are looked up concurrently.
+        """
+        key_names = [self._retrieve_parameters(key)[1] for key in keys]
+        if not key_names:
+            return []
+        bucket_name = Settings.get_bucket_name()
+        try:
+            conn = _connect_to_s3()
+            bucket = conn.get_bucket(bucket_name, validate=False)
+            if all(key_name.startswith(key_names[0]) for key_name in key_names):
+                existing = set(key_names).intersection(
+                    s3_key.name for s3_key in bucket.list(prefix=key_names[0])
+                )
+            else:
+                existing = self._find_existing(
+                    bucket_name, key_names, lambda key_name: bucket.get_key(key_name) is not None
+                )
+            for key_name in key_names:
+                self._forget_exists(bucket_name, key_name)
+
+            to_delete = self._leading_existing(key_names, existing)
+            removed = set(to_delete)
+            for start in xrange(0, len(to_delete), MAX_KEYS_PER_DELETE):
+                result = bucket.delete_keys(to_delete[start:start + MAX_KEYS_PER_DELETE])
+                for error in result.errors:
+                    logger.error(
+                        u"Could not remove {key} from s3: {message}".format(key=error.key, message=error.message)
+                    )
+                    removed.discard(error.key)
+            return [key_name in removed for key_name in key_names]
+        except Exception as ex:
+            logger.exception(
+                u"An internal exception occurred while removing files."
+            )
+            raise FileUploadInternalError(ex)
+
+    def _file_exists(self, conn, bucket_name, key_name):
+        """
+        Check whether a file exists in the bucket, using the cache if possible.
+        """
+        if self._is_known_to_exist(bucket_name, key_name):
+            return True
+
+        bucket = conn.get_bucket(bucket_name, validate=False)
+        exists = bucket.get_key(key_name) is not None
+        if exists:
+            self._remember_exists(bucket_name, key_name)
+        return exists
+
+
+# Maximum number of objects in a multi-object delete request
+MAX_KEYS_PER_DELETE = 1000
+
+# S3 connections, keyed by credentials.  boto connections keep a pool of
+# HTTP connections, so re-using them avoids a TLS handshake per request.
+_CONNECTIONS = {}
+_CONNECTIONS_LOCK = threading.Lock()
+
 
 def _connect_to_s3():
     """Connect to s3
 
-    Creates a connection to s3 for file URLs.
+    Returns a connection to s3 for file URLs, shared by the whole process.
 
     """
     # Try to get the AWS credentials from settings if they are available
@@ -65,7 +175,30 @@ def _connect_to_s3():
     aws_access_key_id = getattr(settings, 'AWS_ACCESS_KEY_ID', None)
     aws_secret_access_key = getattr(settings, 'AWS_SECRET_ACCESS_KEY', None)
 
-    return boto.connect_s3(
-        aws_access_key_id=aws_access_key_id,
-        aws_secret_access_key=aws_secret_access_key
-    )
+    credentials = (aws_access_key_id, aws_secret_access_key)
+    with _CONNECTIONS_LOCK:
+        conn = _CONNECTIONS.get(credentials)
+        if conn is None:
+            conn = boto.connect_s3(
+                aws_access_key_id=aws_access_key_id,
+                aws_secret_access_key=aws_secret_access_key
+            )
+            _CONNECTIONS[credentials] = conn
+    return conn
+
+
+def clear_connections():
+    """
+    Close the shared s3 connections and forget them, for example after the credentials change.
+    """
+    with _CONNECTIONS_LOCK:
+        for conn in _CONNECTIONS.values():
+            conn.close()
+        _CONNECTIONS.clear()
+
+
+def _check_existence():
+    """
+    Return True if download URLs should only be provided for files that exist.
+    """
+    return getattr(settings, 'ORA2_FILEUPLOAD_S3_CHECK_EXISTENCE', True)
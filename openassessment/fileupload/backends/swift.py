@@ -17,7 +17,7 @@ import swiftclient
 import urlparse
 import requests
 
-from .base import BaseBackend
+from .base import BaseBackend, Settings
 from ..exceptions import FileUploadInternalError
 logger = logging.getLogger("openassessment.fileupload.api")
 
@@ -44,6 +44,14 @@ class Backend(BaseBackend):
             raise FileUploadInternalError(ex)
 
     def get_download_url(self, key):
+        """
+        Sign a download URL for an object.
+
+        Signing is done locally.  Unless the ORA2_FILEUPLOAD_SWIFT_CHECK_EXISTENCE
+        setting is False, the URL is only returned if the object exists; this is
+        checked with a HEAD request, and objects known to exist are remembered
+        in the cache, so the container is only queried the first time.
+        """
         bucket_name, key_name = self._retrieve_parameters(key)
         key, url = get_settings()
         try:
@@ -53,14 +61,48 @@ class Backend(BaseBackend):
                 method='GET',
                 seconds=self.DOWNLOAD_URL_TIMEOUT)
             download_url = '%s://%s%s' % (url.scheme, url.netloc, temp_url)
-            response = requests.get(download_url)
-            return download_url if response.status_code == 200 else ""
+            if _check_existence() and not self._file_exists(bucket_name, key_name, download_url):
+                return ""
+            return download_url
         except Exception as ex:
             logger.exception(
                 u"An internal exception occurred while generating a download URL."
             )
             raise FileUploadInternalError(ex)
 
+    def get_download_urls(self, keys):
+        """
+        Sign download URLs for many objects, looking up the objects
+        that are not known to exist concurrently.
+        """
+        key_names = [self._retrieve_parameters(key)[1] for key in keys]
+        if not key_names:
+            return []
+        bucket_name = Settings.get_bucket_name()
+        key, url = get_settings()
+        try:
+            download_urls = {}
+            for key_name in key_names:
+                temp_url = swiftclient.utils.generate_temp_url(
+                    path='%s/%s/%s' % (url.path, bucket_name, key_name),
+                    key=key,
+                    method='GET',
+                    seconds=self.DOWNLOAD_URL_TIMEOUT)
+                download_urls[key_name] = '%s://%s%s' % (url.scheme, url.netloc, temp_url)
+
+            if _check_existence():
+                existing = self._find_existing(
+                    bucket_name, key_names,
+                    lambda key_name: requests.head(download_urls[key_name]).status_code == 200
+                )
+                return [download_urls[key_name] if key_name in existing else "" for key_name in key_names]
+            return [download_urls[key_name] for key_name in key_names]
+        except Exception as ex:
+            logger.exception(
+                u"An internal exception occurred while generating download URLs."
+            )
+            raise FileUploadInternalError(ex)
+
     def remove_file(self, key):
         bucket_name, key_name = self._retrieve_parameters(key)
         key, url = get_settings()
@@ -72,6 +114,7 @@ class Backend(BaseBackend):
                 seconds=self.DOWNLOAD_URL_TIMEOUT)
             remove_url = '%s://%s%s' % (url.scheme, url.netloc, temp_url)
             response = requests.delete(remove_url)
+            self._forget_exists(bucket_name, key_name)
             return response.status_code == 204
         except Exception as ex:
             logger.exception(
@@ -79,6 +122,60 @@ class Backend(BaseBackend):
             )
             raise FileUploadInternalError(ex)
 
+    def remove_files(self, keys):
+        """
+        Remove the objects up to the first missing one: the objects are looked
+        up concurrently, then the DELETE requests are sent concurrently.
+        """
+        key_names = [self._retrieve_parameters(key)[1] for key in keys]
+        if not key_names:
+            return []
+        bucket_name = Settings.get_bucket_name()
+        key, url = get_settings()
+        try:
+            urls = {}
+            for key_name in set(key_names):
+                urls[key_name] = {}
+                for method in ('GET', 'DELETE'):
+                    temp_url = swiftclient.utils.generate_temp_url(
+                        path='%s/%s/%s' % (url.path, bucket_name, key_name),
+                        key=key,
+                        method=method,
+                        seconds=self.DOWNLOAD_URL_TIMEOUT)
+                    urls[key_name][method] = '%s://%s%s' % (url.scheme, url.netloc, temp_url)
+
+            existing = self._find_existing(
+                bucket_name, key_names,
+                lambda key_name: requests.head(urls[key_name]['GET']).status_code == 200
+            )
+            to_delete = self._leading_existing(key_names, existing)
+            deleted = self._map_concurrently(
+                lambda key_name: requests.delete(urls[key_name]['DELETE']).status_code == 204, to_delete
+            )
+            for key_name in key_names:
+                self._forget_exists(bucket_name, key_name)
+            removed = set(key_name for key_name, was_deleted in zip(to_delete, deleted) if was_deleted)
+            return [key_name in removed for key_name in key_names]
+        except Exception as ex:
+            logger.exception(
+                u"An internal exception occurred while removing objects on swift storage."
+            )
+            raise FileUploadInternalError(ex)
+
+    def _file_exists(self, bucket_name, key_name, download_url):
+        """
+        Check whether an object exists, using the cache if possible.
+        Temp URLs signed for GET also allow HEAD requests, so the
+        object is not downloaded.
+        """
+        if self._is_known_to_exist(bucket_name, key_name):
+            return True
+
+        exists = requests.head(download_url).status_code == 200
+        if exists:
+            self._remember_exists(bucket_name, key_name)
+        return exists
+
 
 def get_settings():
     """
@@ -90,3 +187,10 @@ def get_settings():
     key = getattr(settings, 'ORA2_SWIFT_KEY', None)
     url = urlparse.urlparse(url)
     return key, url
+
+
+def _check_existence():
+    """
+    Return True if download URLs should only be provided for objects that exist.
+    """
+    return getattr(settings, 'ORA2_FILEUPLOAD_SWIFT_CHECK_EXISTENCE', True)
@@ -25,3 +25,10 @@ class FileUploadRequestError(FileUploadError):
 
     """
     pass
+
+
+class FileUploadTooLargeError(FileUploadRequestError):
+    """This error is raised when the file being uploaded exceeds the maximum upload size.
+
+    """
+    pass
@@ -0,0 +1,52 @@
+"""
+Helpers to receive uploaded files without holding them in memory.
+"""
+import hashlib
+
+from .exceptions import FileUploadTooLargeError
+
+# Size (in bytes) of the chunks in which uploaded files are copied
+CHUNK_SIZE = 64 * 1024
+
+
+def copy_request_to_file(request, destination, max_size):
+    """
+    Copy the body of a request to a file in fixed-size chunks.
+
+    Args:
+        request (HttpRequest): The upload request.
+        destination (file): The file to write the content to.
+        max_size (int): The maximum size (in bytes) of the content.
+
+    Returns:
+        tuple of the size (int) and MD5 hex digest (str) of the content.
+
+    Raises:
+        FileUploadTooLargeError: The content is larger than the maximum size.
+            Part of the content may have been written to the file.
+
+    """
+    # Reject uploads that announce their size before reading anything
+    try:
+        content_length = int(request.META.get("CONTENT_LENGTH") or 0)
+    except ValueError:
+        content_length = 0
+    if content_length > max_size:
+        raise FileUploadTooLargeError(
+            "Uploaded file is larger than the maximum size of %d bytes" % max_size
+        )
+
+    size = 0
+    md5 = hashlib.md5()
+    while True:
+        chunk = request.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        size += len(chunk)
+        if size > max_size:
+            raise FileUploadTooLargeError(
+                "Uploaded file is larger than the maximum size of %d bytes" % max_size
+            )
+        md5.update(chunk)
+        destination.write(chunk)
+    return size, md5.hexdigest()
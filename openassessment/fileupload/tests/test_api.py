@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
 
 import boto
+from boto.s3.bucket import Bucket
 from boto.s3.key import Key
 import ddt
 
+from hashlib import md5, sha1
+import hmac
 import json
 from mock import patch, Mock
 import os
@@ -13,7 +16,8 @@ import urllib
 from urlparse import urlparse
 
 from django.conf import settings
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
 from django.test.utils import override_settings
 from django.core.urlresolvers import reverse
 from django.contrib.auth import get_user_model
@@ -25,6 +29,7 @@ from nose.tools import raises
 from openassessment.fileupload import api
 from openassessment.fileupload import exceptions
 from openassessment.fileupload import views_filesystem as views
+from openassessment.fileupload.backends import s3 as s3_backend
 from openassessment.fileupload.backends.base import Settings as FileUploadSettings
 from openassessment.fileupload.backends.filesystem import get_cache as get_filesystem_cache
 
@@ -32,6 +37,11 @@ from openassessment.fileupload.backends.filesystem import get_cache as get_files
 @ddt.ddt
 class TestFileUploadService(TestCase):
 
+    def setUp(self):
+        super(TestFileUploadService, self).setUp()
+        s3_backend.clear_connections()
+        cache.clear()
+
     @mock_s3
     @override_settings(
         AWS_ACCESS_KEY_ID='foobar',
@@ -76,6 +86,140 @@ class TestFileUploadService(TestCase):
         result = api.remove_file("foo")
         self.assertFalse(result)
 
+    @mock_s3
+    @override_settings(
+        AWS_ACCESS_KEY_ID='foobar',
+        AWS_SECRET_ACCESS_KEY='bizbaz',
+        FILE_UPLOAD_STORAGE_BUCKET_NAME="mybucket"
+    )
+    def test_remove_files(self):
+        conn = boto.connect_s3()
+        bucket = conn.create_bucket('mybucket')
+        for name in ["item", "item/1", "item/3"]:
+            key = Key(bucket)
+            key.key = "submissions_attachments/" + name
+            key.set_contents_from_string("Test")
+
+        keys = ["item", "item/1", "item/2", "item/3"]
+        with patch.object(Bucket, 'delete_keys', autospec=True, side_effect=Bucket.delete_keys) as mock_delete:
+            with patch.object(Bucket, 'list', autospec=True, side_effect=Bucket.list) as mock_list:
+                with patch.object(Bucket, 'get_key') as mock_get:
+                    self.assertEqual(api.remove_files(keys), [True, True, False, False])
+            # The files of the learner are listed once, not looked up one by one
+            self.assertEqual(mock_list.call_count, 1)
+            self.assertFalse(mock_get.called)
+            self.assertEqual(mock_delete.call_count, 1)
+        # The file after the first missing one is kept, as with the other backends
+        self.assertEqual([key.name for key in bucket.list()], ["submissions_attachments/item/3"])
+        self.assertEqual(api.remove_files(["item", "item/1"]), [False, False])
+        self.assertEqual(api.remove_files([]), [])
+
+    @mock_s3
+    @override_settings(
+        AWS_ACCESS_KEY_ID='foobar',
+        AWS_SECRET_ACCESS_KEY='bizbaz',
+        FILE_UPLOAD_STORAGE_BUCKET_NAME="mybucket"
+    )
+    def test_remove_files_without_common_prefix(self):
+        conn = boto.connect_s3()
+        bucket = conn.create_bucket('mybucket')
+        for name in ["foo", "bar", "baz"]:
+            key = Key(bucket)
+            key.key = "submissions_attachments/" + name
+            key.set_contents_from_string("Test")
+
+        with patch.object(Bucket, 'list') as mock_list:
+            self.assertEqual(api.remove_files(["foo", "bar", "missing", "baz"]), [True, True, False, False])
+        self.assertFalse(mock_list.called)
+        self.assertEqual([key.name for key in bucket.list()], ["submissions_attachments/baz"])
+
+    @mock_s3
+    @override_settings(
+        AWS_ACCESS_KEY_ID='foobar',
+        AWS_SECRET_ACCESS_KEY='bizbaz',
+        FILE_UPLOAD_STORAGE_BUCKET_NAME="mybucket"
+    )
+    def test_get_download_url_no_file(self):
+        conn = boto.connect_s3()
+        conn.create_bucket('mybucket')
+        self.assertEqual(api.get_download_url("foo"), "")
+
+        # Missing files are not cached, since they could be uploaded at any time
+        key = Key(conn.get_bucket('mybucket'))
+        key.key = "submissions_attachments/foo"
+        key.set_contents_from_string("How d'ya do?")
+        self.assertIn("https://mybucket.s3.amazonaws.com/submissions_attachments/foo", api.get_download_url("foo"))
+
+    @mock_s3
+    @override_settings(
+        AWS_ACCESS_KEY_ID='foobar',
+        AWS_SECRET_ACCESS_KEY='bizbaz',
+        FILE_UPLOAD_STORAGE_BUCKET_NAME="mybucket"
+    )
+    def test_get_download_url_reuses_connection_and_existence(self):
+        conn = boto.connect_s3()
+        bucket = conn.create_bucket('mybucket')
+        key = Key(bucket)
+        key.key = "submissions_attachments/foo"
+        key.set_contents_from_string("How d'ya do?")
+
+        with patch.object(boto, 'connect_s3', wraps=boto.connect_s3) as mock_connect:
+            with patch.object(Bucket, 'get_key', autospec=True, side_effect=Bucket.get_key) as mock_get:
+                api.get_upload_url("foo", "bar")
+                for __ in range(3):
+                    download_url = api.get_download_url("foo")
+                    self.assertIn("https://mybucket.s3.amazonaws.com/submissions_attachments/foo", download_url)
+
+        # One connection is shared by all requests, and the file
+        # is only looked up in the bucket the first time.
+        self.assertEqual(mock_connect.call_count, 1)
+        self.assertEqual(mock_get.call_count, 1)
+
+        # Removing the file forgets that it exists
+        self.assertTrue(api.remove_file("foo"))
+        self.assertEqual(api.get_download_url("foo"), "")
+
+    @mock_s3
+    @override_settings(
+        AWS_ACCESS_KEY_ID='foobar',
+        AWS_SECRET_ACCESS_KEY='bizbaz',
+        FILE_UPLOAD_STORAGE_BUCKET_NAME="mybucket",
+        ORA2_FILEUPLOAD_S3_CHECK_EXISTENCE=False
+    )
+    def test_get_download_url_without_existence_check(self):
+        with patch('boto.s3.bucket.Bucket.get_key') as mock_get:
+            download_url = api.get_download_url("foo")
+        self.assertIn("https://mybucket.s3.amazonaws.com/submissions_attachments/foo", download_url)
+        self.assertFalse(mock_get.called)
+
+    @mock_s3
+    @override_settings(
+        AWS_ACCESS_KEY_ID='foobar',
+        AWS_SECRET_ACCESS_KEY='bizbaz',
+        FILE_UPLOAD_STORAGE_BUCKET_NAME="mybucket"
+    )
+    def test_get_download_urls(self):
+        conn = boto.connect_s3()
+        bucket = conn.create_bucket('mybucket')
+        for key_name in ["foo", "bar"]:
+            key = Key(bucket)
+            key.key = "submissions_attachments/" + key_name
+            key.set_contents_from_string("How d'ya do?")
+
+        # The file "foo" is already known to exist
+        api.get_download_url("foo")
+
+        with patch.object(Bucket, 'get_key', autospec=True, side_effect=Bucket.get_key) as mock_get:
+            download_urls = api.get_download_urls(["foo", "missing", "bar"])
+        self.assertIn("https://mybucket.s3.amazonaws.com/submissions_attachments/foo", download_urls[0])
+        self.assertEqual(download_urls[1], "")
+        self.assertIn("https://mybucket.s3.amazonaws.com/submissions_attachments/bar", download_urls[2])
+        self.assertItemsEqual(
+            [call_args[0][1] for call_args in mock_get.call_args_list],
+            ["submissions_attachments/missing", "submissions_attachments/bar"]
+        )
+        self.assertEqual(api.get_download_urls([]), [])
+
     @raises(exceptions.FileUploadInternalError)
     def test_get_upload_url_no_bucket(self):
         api.get_upload_url("foo", "bar")
@@ -109,6 +253,73 @@ class TestFileUploadService(TestCase):
         api.get_download_url("foo")
 
 
+class TestDownloadUrlCache(TestCase):
+    """
+    Test the cache of download URLs in the file upload API.
+    """
+
+    def setUp(self):
+        super(TestDownloadUrlCache, self).setUp()
+        cache.clear()
+        api.DOWNLOAD_URL_CACHE.reset_metrics()
+        self.backend = Mock()
+        self.backend.get_download_url.side_effect = lambda key: "https://example.com/" + key if key != "missing" else ""
+        self.backend.get_download_urls.side_effect = lambda keys: [
+            self.backend.get_download_url(key) for key in keys
+        ]
+        patcher = patch.object(api.backends, 'get_backend', return_value=self.backend)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_get_download_url(self):
+        for __ in range(3):
+            self.assertEqual(api.get_download_url("foo"), "https://example.com/foo")
+        self.assertEqual(self.backend.get_download_url.call_count, 1)
+        self.assertEqual((api.DOWNLOAD_URL_CACHE.hits, api.DOWNLOAD_URL_CACHE.misses), (2, 1))
+
+    def test_get_download_urls(self):
+        api.get_download_url("foo")
+        urls = api.get_download_urls(["foo", "bar", "missing"])
+        self.assertEqual(urls, ["https://example.com/foo", "https://example.com/bar", ""])
+
+        # Only the URLs that were not cached are requested from the backend
+        self.backend.get_download_urls.assert_called_once_with(["bar", "missing"])
+        self.assertEqual(api.get_download_urls(["bar"]), ["https://example.com/bar"])
+        self.assertEqual(self.backend.get_download_urls.call_count, 1)
+
+    def test_empty_keys_not_counted(self):
+        api.get_download_url("foo")
+        api.DOWNLOAD_URL_CACHE.reset_metrics()
+        self.assertEqual(api.DOWNLOAD_URL_CACHE.get_many(["foo", "", None, "bar"]), {"foo": "https://example.com/foo"})
+        self.assertEqual((api.DOWNLOAD_URL_CACHE.hits, api.DOWNLOAD_URL_CACHE.misses), (1, 1))
+
+    def test_missing_files_not_cached(self):
+        # The file could be uploaded at any time
+        api.get_download_url("missing")
+        api.get_download_url("missing")
+        self.assertEqual(self.backend.get_download_url.call_count, 2)
+
+    def test_remove_file(self):
+        api.get_download_url("foo")
+        api.remove_file("foo")
+        self.backend.remove_file.assert_called_once_with("foo")
+        api.get_download_url("foo")
+        self.assertEqual(self.backend.get_download_url.call_count, 2)
+
+    def test_remove_files(self):
+        api.get_download_urls(["foo", "bar"])
+        api.remove_files(["foo", "bar"])
+        self.backend.remove_files.assert_called_once_with(["foo", "bar"])
+        api.get_download_urls(["foo", "bar"])
+        self.assertEqual(self.backend.get_download_urls.call_count, 2)
+
+    def test_timeout_below_url_expiry(self):
+        with override_settings(ORA2_FILEUPLOAD_DOWNLOAD_URL_CACHE_TIMEOUT=60):
+            self.assertEqual(api.DOWNLOAD_URL_CACHE.timeout(), 60)
+        with override_settings(ORA2_FILEUPLOAD_DOWNLOAD_URL_CACHE_TIMEOUT=10 ** 6):
+            self.assertLess(api.DOWNLOAD_URL_CACHE.timeout(), api.backends.base.BaseBackend.DOWNLOAD_URL_TIMEOUT)
+
+
 @override_settings(
     ORA2_FILEUPLOAD_BACKEND="filesystem",
     ORA2_FILEUPLOAD_ROOT='/tmp',
@@ -258,11 +469,137 @@ class TestFileUploadServiceWithFilesystemBackend(TestCase):
             download_response.get('Content-Disposition')
         )
         self.assertEqual(self.content_type, download_response.get('Content-Type'))
-        self.assertIn("foobar content", download_response.content)
+        self.assertIn("foobar content", "".join(download_response.streaming_content))
         self.assertTrue(os.path.exists(file_path), "File %s does not exist" % file_path)
         with open(file_path) as f:
             self.assertEqual(self.content.read(), f.read())
 
+    def test_upload_streamed_in_chunks(self):
+        upload_url = self.backend.get_upload_url(self.key, self.content_type)
+        file_path = views.get_file_path(self.key_name)
+        content = "0123456789" * 10
+
+        with patch('openassessment.fileupload.streaming.CHUNK_SIZE', 7):
+            upload_response = self.client.put(upload_url, data=content, content_type=self.content_type)
+
+        self.assertEqual(200, upload_response.status_code)
+        with open(file_path) as f:
+            self.assertEqual(content, f.read())
+        metadata = views.get_metadata(self.key_name)
+        self.assertEqual(md5(content).hexdigest(), metadata["Content-MD5"])
+        self.assertEqual(str(len(content)), metadata["Content-Length"])
+        self.assertEqual(self.content_type, metadata["Content-Type"])
+        # The temporary file was renamed into place
+        self.assertEqual(["content", "metadata.json"], sorted(os.listdir(os.path.dirname(file_path))))
+
+    @override_settings(ORA2_FILEUPLOAD_MAX_SIZE=10)
+    def test_upload_too_large(self):
+        upload_url = self.backend.get_upload_url(self.key, self.content_type)
+        file_path = views.get_file_path(self.key_name)
+
+        upload_response = self.client.put(upload_url, data=self.content.read(), content_type=self.content_type)
+
+        self.assertEqual(413, upload_response.status_code)
+        self.assertEqual([], os.listdir(os.path.dirname(file_path)))
+
+    def test_upload_too_large_keeps_previous_file(self):
+        upload_url = self.backend.get_upload_url(self.key, self.content_type)
+        file_path = views.get_file_path(self.key_name)
+        self.client.put(upload_url, data="previous", content_type=self.content_type)
+
+        # The request does not announce its size, so the limit is only reached while copying it
+        request = RequestFactory().put("/", data="new content that is too large", content_type=self.content_type)
+        del request.META["CONTENT_LENGTH"]
+        with override_settings(ORA2_FILEUPLOAD_MAX_SIZE=10):
+            with self.assertRaises(exceptions.FileUploadTooLargeError):
+                views.save_stream_to_file(self.key_name, request, self.content_type)
+
+        with open(file_path) as f:
+            self.assertEqual("previous", f.read())
+        self.assertEqual(["content", "metadata.json"], sorted(os.listdir(os.path.dirname(file_path))))
+
+    def test_get_download_urls(self):
+        """
+        Verify that the download URLs of many files are authorized at once.
+        """
+        urls = self.backend.get_download_urls(["foo", "bar"])
+        self.assertEqual(urls, [self.backend.get_download_url("foo"), self.backend.get_download_url("bar")])
+        for key in ["foo", "bar"]:
+            self.assertTrue(
+                api.backends.filesystem.is_download_url_available(self.backend._get_key_name(key))
+            )
+
+    def _upload(self, content):
+        """
+        Upload a file and return its download URL.
+        """
+        upload_url = self.backend.get_upload_url(self.key, self.content_type)
+        self.client.put(upload_url, data=content, content_type=self.content_type)
+        return self.backend.get_download_url(self.key)
+
+    def test_download_range(self):
+        download_url = self._upload("0123456789")
+        for range_header, expected_content, expected_range in [
+                ("bytes=2-5", "2345", "bytes 2-5/10"),
+                ("bytes=7-", "789", "bytes 7-9/10"),
+                ("bytes=-3", "789", "bytes 7-9/10"),
+                ("bytes=8-100", "89", "bytes 8-9/10"),
+        ]:
+            response = self.client.get(download_url, HTTP_RANGE=range_header)
+            self.assertEqual(206, response.status_code)
+            self.assertEqual(expected_content, "".join(response.streaming_content))
+            self.assertEqual(expected_range, response['Content-Range'])
+            self.assertEqual(str(len(expected_content)), response['Content-Length'])
+
+        # Ranges outside of the file cannot be satisfied
+        response = self.client.get(download_url, HTTP_RANGE="bytes=10-")
+        self.assertEqual(416, response.status_code)
+        self.assertEqual("bytes */10", response['Content-Range'])
+
+        # Multiple ranges are not supported, so the whole file is sent
+        response = self.client.get(download_url, HTTP_RANGE="bytes=0-1,4-5")
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("bytes", response['Accept-Ranges'])
+        self.assertEqual("0123456789", "".join(response.streaming_content))
+
+    def test_download_if_none_match(self):
+        download_url = self._upload("foobar content")
+        etag = self.client.get(download_url)['ETag']
+
+        response = self.client.get(download_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(304, response.status_code)
+
+        # The file changed since
+        self._upload("other content")
+        response = self.client.get(download_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(200, response.status_code)
+        self.assertNotEqual(etag, response['ETag'])
+        self.assertEqual("other content", "".join(response.streaming_content))
+
+    def test_download_metadata_is_cached(self):
+        download_url = self._upload("foobar content")
+        self.client.get(download_url)
+        with patch('openassessment.fileupload.views_filesystem.json.load') as mock_load:
+            response = self.client.get(download_url)
+        self.assertFalse(mock_load.called)
+        self.assertEqual(self.content_type, response['Content-Type'])
+
+    @override_settings(ORA2_FILEUPLOAD_SENDFILE="x-sendfile")
+    def test_download_x_sendfile(self):
+        download_url = self._upload("foobar content")
+        response = self.client.get(download_url)
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("", response.content)
+        self.assertEqual(views.get_file_path(self.key_name), response['X-Sendfile'])
+
+    @override_settings(ORA2_FILEUPLOAD_SENDFILE="x-accel-redirect", ORA2_FILEUPLOAD_ACCEL_REDIRECT_PREFIX="/ora2/")
+    def test_download_x_accel_redirect(self):
+        download_url = self._upload("foobar content")
+        response = self.client.get(download_url)
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("", response.content)
+        self.assertEqual("/ora2/testbucket/" + self.key_name + "/content", response['X-Accel-Redirect'])
+
     def test_download_content_with_no_content_type(self):
         views.save_to_file(self.key_name, "uploaded content", metadata=None)
         download_url = self.backend.get_download_url(self.key)
@@ -271,6 +608,34 @@ class TestFileUploadServiceWithFilesystemBackend(TestCase):
         self.assertEqual(200, download_response.status_code)
         self.assertEqual('application/octet-stream', download_response["Content-Type"])
 
+    def test_metadata_cached_during_save_is_forgotten(self):
+        views.save_to_file(self.key_name, "old content", metadata={"Content-Type": "text/plain"})
+        safe_save = views.safe_save
+
+        def save_and_read_metadata(path, content):
+            # A concurrent download reads the metadata while the file is saved
+            safe_save(path, content)
+            views.get_metadata(self.key_name)
+
+        with patch('openassessment.fileupload.views_filesystem.safe_save', side_effect=save_and_read_metadata):
+            views.save_to_file(self.key_name, "new content", metadata={"Content-Type": "image/png"})
+        self.assertEqual({"Content-Type": "image/png"}, views.get_metadata(self.key_name))
+
+    def test_metadata_cached_during_upload_is_forgotten(self):
+        upload_url = self.backend.get_upload_url(self.key, "text/plain")
+        self.client.put(upload_url, data="old content", content_type="text/plain")
+        safe_save = views.safe_save
+
+        def read_metadata_and_save(path, content):
+            # A concurrent download reads the metadata once the file is renamed
+            views.get_metadata(self.key_name)
+            safe_save(path, content)
+
+        upload_url = self.backend.get_upload_url(self.key, "image/png")
+        with patch('openassessment.fileupload.views_filesystem.safe_save', side_effect=read_metadata_and_save):
+            self.client.put(upload_url, data="new content", content_type="image/png")
+        self.assertEqual("image/png", views.get_metadata(self.key_name)["Content-Type"])
+
     def test_upload_with_unauthorized_key(self):
         upload_url = reverse("openassessment-filesystem-storage", kwargs={'key': self.key_name})
 
@@ -322,6 +687,7 @@ class TestSwiftBackend(TestCase):
     def setUp(self):
         super(TestSwiftBackend, self).setUp()
         self.backend = api.backends.get_backend()
+        cache.clear()
 
     def _verify_url(self, url):
         result = urlparse(url)
@@ -344,29 +710,150 @@ class TestSwiftBackend(TestCase):
         url = self.backend.get_upload_url('foo', '_text')
         self._verify_url(url)
 
-    @patch('openassessment.fileupload.backends.swift.requests.get')
-    def test_get_download_url_success(self, requests_get_mock):
+    @patch('openassessment.fileupload.backends.swift.requests.head')
+    def test_get_download_url_success(self, requests_head_mock):
         """
         Verify the download URL when the object already exists in storage.
         """
         fake_resp = Mock()
         fake_resp.status_code = 200  # always return a 200 status code
-        requests_get_mock.return_value = fake_resp
+        requests_head_mock.return_value = fake_resp
         url = self.backend.get_download_url('foo')
         self._verify_url(url)
 
-    @patch('openassessment.fileupload.backends.swift.requests.get')
-    def test_get_download_url_no_object(self, requests_get_mock):
+    @patch('openassessment.fileupload.backends.swift.requests.head')
+    def test_get_download_url_no_object(self, requests_head_mock):
         """
         Verify the download URL is empty when the object
         cannot be found in storage.
         """
         fake_resp = Mock()
         fake_resp.status_code = 404  # always return a 404 status code
-        requests_get_mock.return_value = fake_resp
+        requests_head_mock.return_value = fake_resp
         url = self.backend.get_download_url('foo')
         self.assertEqual(url, '')
 
+    def test_get_download_url_does_not_download(self):
+        """
+        Verify that the existence of an object is checked without downloading
+        it, and only the first time a download URL is requested.
+        """
+        swift = FakeSwift('bar')
+        swift.objects['/bucket_name/submissions_attachments/foo'] = "foobar content"
+        with swift.patch_requests():
+            for __ in range(3):
+                self._verify_url(self.backend.get_download_url('foo'))
+            self.assertEqual(swift.requests, [('HEAD', '/bucket_name/submissions_attachments/foo')])
+
+            # The signed URL can be used to download the object
+            self.assertEqual(swift.get(self.backend.get_download_url('foo')).content, "foobar content")
+
+            # Removing the object forgets that it exists
+            self.assertTrue(self.backend.remove_file('foo'))
+            self.assertEqual(self.backend.get_download_url('foo'), '')
+
+    def test_remove_files(self):
+        """
+        Verify that the objects up to the first missing one are removed with DELETE requests.
+        """
+        swift = FakeSwift('bar')
+        swift.objects['/bucket_name/submissions_attachments/foo'] = "foobar content"
+        swift.objects['/bucket_name/submissions_attachments/bar'] = "bar content"
+        with swift.patch_requests():
+            self._verify_url(self.backend.get_download_url('foo'))
+            del swift.requests[:]
+            self.assertEqual(self.backend.remove_files(['foo', 'missing', 'bar']), [True, False, False])
+            self.assertEqual(swift.objects.keys(), ['/bucket_name/submissions_attachments/bar'])
+            # The objects not known to exist are looked up, and only the first one is removed
+            self.assertItemsEqual(swift.requests, [
+                ('HEAD', '/bucket_name/submissions_attachments/missing'),
+                ('HEAD', '/bucket_name/submissions_attachments/bar'),
+                ('DELETE', '/bucket_name/submissions_attachments/foo'),
+            ])
+            # Removing the objects forgets that they exist
+            self.assertEqual(self.backend.get_download_url('foo'), '')
+
+    def test_get_download_urls(self):
+        """
+        Verify that the existence of many objects is checked with HEAD requests.
+        """
+        swift = FakeSwift('bar')
+        swift.objects['/bucket_name/submissions_attachments/foo'] = "foobar content"
+        with swift.patch_requests():
+            urls = self.backend.get_download_urls(['foo', 'missing'])
+            self._verify_url(urls[0])
+            self.assertEqual(urls[1], '')
+            self.assertItemsEqual(swift.requests, [
+                ('HEAD', '/bucket_name/submissions_attachments/foo'),
+                ('HEAD', '/bucket_name/submissions_attachments/missing'),
+            ])
+
+    @override_settings(ORA2_FILEUPLOAD_SWIFT_CHECK_EXISTENCE=False)
+    def test_get_download_url_without_existence_check(self):
+        """
+        Verify that download URLs are signed without any request to swift.
+        """
+        swift = FakeSwift('bar')
+        with swift.patch_requests():
+            self._verify_url(self.backend.get_download_url('foo'))
+        self.assertEqual(swift.requests, [])
+
+
+class FakeSwift(object):
+    """
+    Local stand-in for a swift object store, which checks the
+    signatures of temp URLs like the swift tempurl middleware.
+    """
+
+    def __init__(self, temp_url_key):
+        self.temp_url_key = temp_url_key
+        self.objects = {}
+        self.requests = []
+
+    def patch_requests(self):
+        """
+        Send the requests of the swift backend to this object store.
+        """
+        return patch.multiple(
+            'openassessment.fileupload.backends.swift.requests',
+            head=self.head, get=self.get, delete=self.delete
+        )
+
+    def head(self, url):
+        return self._request('HEAD', url)
+
+    def get(self, url):
+        return self._request('GET', url)
+
+    def delete(self, url):
+        return self._request('DELETE', url)
+
+    def _request(self, method, url):
+        parsed = urlparse(url)
+        self.requests.append((method, parsed.path))
+        response = Mock(content="")
+
+        # A temp URL signed for GET also allows HEAD requests
+        query = dict(part.split('=', 1) for part in parsed.query.split('&'))
+        signed_methods = ['GET', 'HEAD'] if method == 'HEAD' else [method]
+        valid_signatures = [
+            hmac.new(
+                self.temp_url_key, '{}\n{}\n{}'.format(signed_method, query['temp_url_expires'], parsed.path), sha1
+            ).hexdigest()
+            for signed_method in signed_methods
+        ]
+        if query['temp_url_sig'] not in valid_signatures:
+            response.status_code = 401
+        elif parsed.path not in self.objects:
+            response.status_code = 404
+        elif method == 'DELETE':
+            del self.objects[parsed.path]
+            response.status_code = 204
+        else:
+            response.status_code = 200
+            response.content = self.objects[parsed.path] if method == 'GET' else ""
+        return response
+
 
 @override_settings(
     ORA2_FILEUPLOAD_BACKEND="django",
@@ -433,6 +920,17 @@ class TestFileUploadServiceWithDjangoStorageBackend(TestCase):
         encoded_key = urllib.quote(self.key.encode('utf-8'))
         self.assertEqual(u"submissions/{}".format(encoded_key), download_url)
 
+    @override_settings(ORA2_FILEUPLOAD_MAX_SIZE=10)
+    def test_upload_too_large(self):
+        """
+        Test that files larger than the maximum upload size are rejected.
+        """
+        self.client.login(username=self.username, password=self.password)
+        upload_url = self.backend.get_upload_url(self.key, "bar")
+        response = self.client.put(upload_url, data=self.content.read(), content_type=self.content_type)
+        self.assertEqual(413, response.status_code)
+        self.assertIsNone(self.backend.get_download_url(self.key))
+
     @ddt.data(u"noël.txt", "myfile.txt")
     def test_remove(self, key):
         """
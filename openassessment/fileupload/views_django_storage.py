@@ -1,11 +1,16 @@
 """
 Provides the upload endpoint for the django storage backend.
 """
+import tempfile
+
 from django.contrib.auth.decorators import login_required
 from django.shortcuts import HttpResponse
 from django.views.decorators.http import require_http_methods
 
+from .backends.base import Settings
 from .backends.django_storage import Backend
+from .exceptions import FileUploadTooLargeError
+from .streaming import copy_request_to_file
 
 
 @login_required()
@@ -13,6 +18,15 @@ from .backends.django_storage import Backend
 def django_storage(request, key):
     """
     Upload files using django storage backend.
+
+    The request body is copied in chunks to a temporary file
+    rather than read into memory.
     """
-    Backend().upload_file(key, request.body)
+    with tempfile.TemporaryFile() as temp_file:
+        try:
+            copy_request_to_file(request, temp_file, Settings.get_max_upload_size())
+        except FileUploadTooLargeError:
+            return HttpResponse(status=413)
+        temp_file.seek(0)
+        Backend().upload_file(key, temp_file)
     return HttpResponse()
@@ -1,15 +1,30 @@
-import hashlib
 import json
 import os
+import re
+import tempfile
+import urllib
 
 from django.conf import settings
+from django.http import FileResponse, HttpResponseNotModified, StreamingHttpResponse
 from django.shortcuts import HttpResponse, Http404
 from django.utils import timezone
+from django.utils.encoding import smart_text
+from django.utils.http import parse_etags, quote_etag
 from django.views.decorators.http import require_http_methods
 
 from . import exceptions
-from .backends.filesystem import is_upload_url_available, is_download_url_available
+from .backends.filesystem import get_cache, is_upload_url_available, is_download_url_available
 from .backends.base import Settings
+from .streaming import copy_request_to_file
+
+# Size (in bytes) of the chunks in which files are streamed
+CHUNK_SIZE = 64 * 1024
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+UNSATISFIABLE_RANGE = 'unsatisfiable'
+
+# Time (in seconds) during which the metadata of a file is kept in the storage cache
+METADATA_CACHE_TIMEOUT = 60 * 60
 
 
 @require_http_methods(["PUT", "GET"])
@@ -22,48 +37,154 @@ def filesystem_storage(request, key):
     if request.method == "PUT":
         if not is_upload_url_available(key):
             raise Http404()
-        content, metadata = get_content_metadata(request)
-        save_to_file(key, content, metadata)
+        try:
+            save_stream_to_file(key, request, request.META.get("CONTENT_TYPE", ""))
+        except exceptions.FileUploadTooLargeError:
+            return HttpResponse(status=413)
         return HttpResponse()
     elif request.method == "GET":
         if not is_download_url_available(key):
             raise Http404()
-        return download_file(key)
+        return download_file(key, request)
 
 
-def download_file(key):
-    """Returns an HttpResponse to download the corresponding file"""
+def download_file(key, request=None):
+    """
+    Returns a response to download the corresponding file.
 
+    The file is streamed in chunks rather than read into memory, or its delivery
+    is offloaded to the web server if the ORA2_FILEUPLOAD_SENDFILE setting is
+    defined.  If the request is provided, conditional (`If-None-Match`) and
+    single range (`Range`) requests are supported.
+    """
     file_path = get_file_path(key)
-    metadata_path = get_metadata_path(key)
     if not os.path.exists(file_path):
         raise Http404()
-    with open(metadata_path) as f:
-        metadata = json.load(f)
-        content_type = metadata.get("Content-Type", 'application/octet-stream')
-    with open(file_path, 'r') as f:
-        response = HttpResponse(f.read(), content_type=content_type)
-        file_name = os.path.basename(os.path.dirname(file_path))
-        response['Content-Disposition'] = 'attachment; filename=' + file_name
+    metadata = get_metadata(key)
+    content_type = metadata.get("Content-Type", 'application/octet-stream')
+    file_size = os.path.getsize(file_path)
+    etag = get_etag(metadata, file_path)
+
+    if request is not None and etag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+        response = HttpResponseNotModified()
+        response['ETag'] = quote_etag(etag)
+        return response
+
+    sendfile = getattr(settings, "ORA2_FILEUPLOAD_SENDFILE", None)
+    byte_range = None
+    if sendfile:
+        # The web server takes care of range requests
+        response = HttpResponse(content_type=content_type)
+        if sendfile == "x-accel-redirect":
+            response['X-Accel-Redirect'] = get_accel_redirect_path(file_path)
+        else:
+            response['X-Sendfile'] = file_path
+    else:
+        if request is not None:
+            byte_range = parse_range(request.META.get('HTTP_RANGE', ''), file_size)
+        if byte_range == UNSATISFIABLE_RANGE:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = 'bytes */%d' % file_size
+            return response
+        elif byte_range is not None:
+            start, end = byte_range
+            response = StreamingHttpResponse(
+                read_range(file_path, start, end - start + 1), status=206, content_type=content_type
+            )
+            response['Content-Range'] = 'bytes %d-%d/%d' % (start, end, file_size)
+            response['Content-Length'] = str(end - start + 1)
+        else:
+            response = FileResponse(open(file_path, 'rb'), content_type=content_type)
+            response['Content-Length'] = str(file_size)
+        response['Accept-Ranges'] = 'bytes'
+
+    response['ETag'] = quote_etag(etag)
+    file_name = os.path.basename(os.path.dirname(file_path))
+    response['Content-Disposition'] = 'attachment; filename=' + file_name
     return response
 
 
-def get_content_metadata(request):
+def get_metadata(key):
     """
-    Read the content and metadata associated to an HttpRequest.
+    Returns the metadata saved with the file, using the storage cache if possible.
+    """
+    cache_key = get_metadata_cache_key(key)
+    metadata = get_cache().get(cache_key)
+    if metadata is None:
+        metadata_path = get_metadata_path(key)
+        if os.path.exists(metadata_path):
+            with open(metadata_path) as f:
+                metadata = json.load(f)
+        else:
+            metadata = {}
+        get_cache().set(cache_key, metadata, METADATA_CACHE_TIMEOUT)
+    return metadata
+
+
+def get_metadata_cache_key(key):
+    return u"metadata/" + smart_text(key)
+
+
+def get_etag(metadata, file_path):
+    """
+    Returns an entity tag for the file: the MD5 digest of the content if it is
+    known, otherwise a tag based on the modification time and size of the file.
+    """
+    if metadata.get("Content-MD5"):
+        return metadata["Content-MD5"]
+    stat = os.stat(file_path)
+    return "%x-%x" % (int(stat.st_mtime), stat.st_size)
+
+
+def parse_range(range_header, file_size):
+    """
+    Parses the value of a `Range` header.
+
+    Only single byte ranges are supported; other ranges are ignored,
+    and the whole file is sent.
 
     Returns:
-        request body (str)
-        request metadata (dict)
+        (start, end) tuple of the first and last byte to send, or None to send the
+        whole file, or UNSATISFIABLE_RANGE if the range is outside the file.
+    """
+    match = RANGE_RE.match(range_header.strip())
+    if match is None:
+        return None
+    start, end = match.groups()
+    if not start:
+        # Suffix range: the last bytes of the file
+        if not end or int(end) == 0:
+            return UNSATISFIABLE_RANGE
+        return max(file_size - int(end), 0), file_size - 1
+    start = int(start)
+    end = min(int(end), file_size - 1) if end else file_size - 1
+    if start >= file_size or start > end:
+        return UNSATISFIABLE_RANGE
+    return start, end
+
+
+def read_range(file_path, start, length):
     """
+    Yields the content of a part of a file in chunks.
+    """
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        while length > 0:
+            chunk = f.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
 
-    metadata = {
-        "Content-Type": request.META["CONTENT_TYPE"],
-        "Date": str(timezone.now()),
-        "Content-MD5": hashlib.md5(request.body).hexdigest(),
-        "Content-Length": request.META["CONTENT_LENGTH"],
-    }
-    return request.body, metadata
+
+def get_accel_redirect_path(file_path):
+    """
+    Returns the internal location of a file for nginx's `X-Accel-Redirect`,
+    which maps the root directory to the ORA2_FILEUPLOAD_ACCEL_REDIRECT_PREFIX setting.
+    """
+    prefix = getattr(settings, "ORA2_FILEUPLOAD_ACCEL_REDIRECT_PREFIX", "/protected")
+    relative_path = os.path.relpath(file_path, os.path.abspath(get_root_directory_path()))
+    return "%s/%s" % (prefix.rstrip("/"), urllib.quote(relative_path))
 
 
 def save_to_file(key, content, metadata=None):
@@ -80,19 +201,83 @@ def save_to_file(key, content, metadata=None):
     if metadata is None:
         metadata = {}
 
-    safe_save(file_path, content)
+    try:
+        safe_save(file_path, content)
+        try:
+            safe_save(metadata_path, json.dumps(metadata))
+        except:
+            safe_remove(file_path)
+            safe_remove(metadata_path)
+            raise
+    finally:
+        # Forget the cached metadata once the new metadata is written, so that
+        # a concurrent download cannot cache the metadata of the previous file
+        get_cache().delete(get_metadata_cache_key(key))
+
+
+def save_stream_to_file(key, request, content_type):
+    """
+    Save the body of an upload request and its metadata to the local file
+    determined by the given key.
+
+    The body is copied in chunks to a temporary file in the same directory,
+    which is then renamed to the content file, so that the upload never sits
+    in memory and a partial upload never replaces an existing file.
+
+    Arguments:
+        key (str): unique file identifier
+        request (HttpRequest): the upload request
+        content_type (str): the content type of the uploaded file
+
+    Raises:
+        FileUploadTooLargeError if the file is larger than the maximum upload size.
+    """
+    file_path = get_file_path(key)
+    metadata_path = get_metadata_path(key)
+    dir_path = make_safe_directory(file_path)
+
+    fd, temp_path = tempfile.mkstemp(dir=dir_path, prefix='.upload-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            size, md5 = copy_request_to_file(request, f, Settings.get_max_upload_size())
+        os.rename(temp_path, file_path)
+    except:
+        safe_remove(temp_path)
+        raise
+
+    metadata = {
+        "Content-Type": content_type,
+        "Date": str(timezone.now()),
+        "Content-MD5": md5,
+        "Content-Length": str(size),
+    }
     try:
         safe_save(metadata_path, json.dumps(metadata))
     except:
         safe_remove(file_path)
         safe_remove(metadata_path)
         raise
+    finally:
+        get_cache().delete(get_metadata_cache_key(key))
 
 
 def safe_save(path, content):
     """
     Save content to path. Creates the appropriate directories, if required.
 
+    Raises:
+        FileUploadInternalError if the root directory does not exist or if we
+        try to save in an unauthorized directory.
+    """
+    make_safe_directory(path)
+    with open(path, 'w') as f:
+        f.write(content)
+
+
+def make_safe_directory(path):
+    """
+    Create the directory of path, if required, and return its absolute path.
+
     Raises:
         FileUploadInternalError if the root directory does not exist or if we
         try to save in an unauthorized directory.
@@ -105,8 +290,7 @@ def safe_save(path, content):
         raise exceptions.FileUploadInternalError("File upload root directory does not exist: %s" % root_directory)
     if not os.path.exists(dir_path):
         os.makedirs(dir_path)
-    with open(path, 'w') as f:
-        f.write(content)
+    return dir_path
 
 
 def safe_remove(path):
@@ -0,0 +1,75 @@
+"""
+Move the assessment data of closed courses to the archive database.
+
+The archive database is configured with the ORA2_ARCHIVE_DATABASE setting,
+and must be migrated like the primary database:
+
+    python manage.py migrate --database=<archive alias>
+
+Courses are archived in batches of submissions.  If the command is interrupted,
+running it again resumes the archival where it stopped.
+"""
+from datetime import datetime
+from optparse import make_option
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.timezone import make_aware, utc
+
+from openassessment import archive
+
+
+class Command(BaseCommand):
+    """
+    Archive the assessment data of closed courses.
+    """
+
+    help = (
+        "Move the assessment data of courses to the archive database: either the given courses, "
+        "or the courses in which no assessment workflow was modified since a date."
+    )
+    args = "[<course_id> ...]"
+
+    option_list = BaseCommand.option_list + (
+        make_option('--before',
+                    action='store', dest='before', default=None,
+                    help="Archive the courses with no activity since this date (YYYY-MM-DD, UTC)"),
+        make_option('--batch-size',
+                    action='store', dest='batch_size', type='int',
+                    default=archive.DEFAULT_BATCH_SIZE,
+                    help="Number of submissions to archive per transaction"),
+    )
+
+    def handle(self, *args, **options):
+        """
+        Execute the command.
+
+        Args:
+            course_ids (list of unicode): The courses to archive.
+
+        Raises:
+            CommandError
+
+        """
+        if args:
+            course_ids = list(args)
+        elif options['before']:
+            try:
+                cutoff = make_aware(datetime.strptime(options['before'], "%Y-%m-%d"), utc)
+            except ValueError:
+                raise CommandError(u"Invalid date {}, expected YYYY-MM-DD".format(options['before']))
+            course_ids = archive.find_closed_courses(cutoff)
+        else:
+            raise CommandError("Course IDs or a date (--before) must be specified")
+
+        if options['batch_size'] < 1:
+            raise CommandError("The batch size must be positive")
+
+        for course_id in course_ids:
+            try:
+                num_archived = archive.archive_course(course_id, batch_size=options['batch_size'])
+            except ImproperlyConfigured as ex:
+                raise CommandError(unicode(ex))
+            self.stdout.write(u"Archived {num} submissions of {course_id}".format(
+                num=num_archived, course_id=course_id
+            ))
@@ -0,0 +1,389 @@
+"""
+Benchmark the hot paths of ORA on a course, usually generated by `generate_ora2_course`:
+
+    python manage.py benchmark_ora2 course-v1:Synthetic+ORA+2017 --output before.json
+    python manage.py benchmark_ora2 course-v1:Synthetic+ORA+2017 --compare before.json
+
+Each benchmark runs on submissions of the course chosen at random, and reports the
+50th, 95th and 99th percentiles of its latency and of its number of database queries.
+
+Every sample runs in a transaction which is rolled back, so the course is unchanged and
+the results of several runs can be compared.  The cache may then hold data of the rolled
+back transactions: with --clear-cache, the default cache is cleared after each sample.
+This empties the cache of the whole site, so only use it with a cache dedicated to the
+benchmark.
+
+The peer assessment benchmark assesses with the rubric of the synthetic courses.
+"""
+from collections import defaultdict, deque, OrderedDict
+import json
+import math
+from optparse import make_option
+import random
+from StringIO import StringIO
+import timeit
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from django.utils.timezone import now
+from submissions import api as sub_api
+
+from openassessment import synthetic
+from openassessment.assessment.api import peer as peer_api
+from openassessment.assessment.api import self as self_api
+from openassessment.assessment.api import staff as staff_api
+from openassessment.data import CsvWriter
+from openassessment.routers import forget_writes
+from openassessment.workflow import api as workflow_api
+from openassessment.workflow.models import AssessmentWorkflow
+
+
+PERCENTILES = [50, 95, 99]
+
+
+class NoSubmissions(Exception):
+    """
+    The course has no submissions to run a benchmark on.
+    """
+    pass
+
+
+class Sample(object):
+    """
+    Time a block of code, and count its queries to every database.
+    """
+
+    def __init__(self):
+        self.seconds = None
+        self.queries = None
+        self._start = None
+        self._connections = []
+        self._forced_debug_cursors = []
+        self._queries_logs = []
+
+    def __enter__(self):
+        # Log the queries like CaptureQueriesContext, without connecting to unused
+        # databases, and without limiting the number of logged queries
+        self._connections = connections.all()
+        self._forced_debug_cursors = [connection.force_debug_cursor for connection in self._connections]
+        self._queries_logs = [connection.queries_log for connection in self._connections]
+        for connection in self._connections:
+            connection.force_debug_cursor = True
+            connection.queries_log = deque()
+        self._start = timeit.default_timer()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        seconds = timeit.default_timer() - self._start
+        if exc_type is None:
+            self.seconds = seconds
+            self.queries = sum(len(connection.queries_log) for connection in self._connections)
+        for connection, forced, queries_log in zip(self._connections, self._forced_debug_cursors, self._queries_logs):
+            connection.force_debug_cursor = forced
+            connection.queries_log = queries_log
+
+
+class BenchmarkCourse(object):
+    """
+    The submissions of a course, and the requirements of its items.
+    """
+
+    def __init__(self, course_id, steps, requirements, rand):
+        self.course_id = course_id
+        self.steps = steps
+        self.requirements = requirements
+        self.rand = rand
+        self.submissions = defaultdict(list)
+        for submission_uuid, status in AssessmentWorkflow.objects.filter(
+                course_id=course_id
+        ).values_list('submission_uuid', 'status'):
+            self.submissions[status].append(submission_uuid)
+
+    def choose_submission(self, *statuses):
+        """
+        Choose a submission at random among the submissions with one of the statuses,
+        or among all submissions.
+
+        Raises:
+            NoSubmissions
+        """
+        candidates = [
+            submission_uuid
+            for status in (statuses or self.submissions.keys())
+            for submission_uuid in self.submissions[status]
+        ]
+        if not candidates:
+            raise NoSubmissions(u"No submissions with status {}".format(u" or ".join(statuses)))
+        return self.rand.choice(candidates)
+
+
+def peer_queue(course, sample):
+    """
+    Select a submission to assess for a learner of the peer step.
+    """
+    submission_uuid = course.choose_submission('peer')
+    with sample:
+        peer_api.get_submission_to_assess(submission_uuid, course.requirements['peer']['must_be_graded_by'])
+
+
+def peer_assessment(course, sample):
+    """
+    Create the peer assessment of a learner of the peer step.
+    """
+    submission_uuid = course.choose_submission('peer')
+    if peer_api.get_submission_to_assess(submission_uuid, course.requirements['peer']['must_be_graded_by']) is None:
+        return
+    student_id = sub_api.get_submission_and_student(submission_uuid)['student_item']['student_id']
+    rubric = synthetic.synthetic_rubric()
+    options_selected = {
+        criterion['name']: course.rand.choice(criterion['options'])['name']
+        for criterion in rubric['criteria']
+    }
+    with sample:
+        peer_api.create_assessment(
+            submission_uuid, student_id, options_selected, {}, u"Benchmark feedback",
+            rubric, course.requirements['peer']['must_be_graded_by']
+        )
+
+
+def workflow_update(course, sample):
+    """
+    Update the workflow of a learner.
+    """
+    submission_uuid = course.choose_submission()
+    with sample:
+        workflow_api.update_from_assessments(submission_uuid, course.requirements)
+
+
+def grade(course, sample):
+    """
+    Read the grade of a learner, like the grade view of the XBlock (without rendering it).
+    """
+    submission_uuid = course.choose_submission(AssessmentWorkflow.STATUS.done)
+    with sample:
+        workflow_api.get_workflow_for_submission(submission_uuid, course.requirements)
+        if 'peer' in course.steps:
+            peer_api.get_score(submission_uuid, course.requirements['peer'])
+            peer_api.get_assessment_feedback(submission_uuid)
+            peer_api.get_assessments(submission_uuid)
+        if 'self' in course.steps:
+            self_api.get_assessment(submission_uuid)
+        staff_assessment = staff_api.get_latest_staff_assessment(submission_uuid)
+        sub_api.get_submission(submission_uuid)
+
+        peer_api.get_rubric_max_scores(submission_uuid)
+        if staff_assessment:
+            staff_api.get_assessment_scores_by_criteria(submission_uuid)
+        elif 'peer' in course.steps:
+            peer_api.get_assessment_median_scores(submission_uuid)
+        else:
+            self_api.get_assessment_scores_by_criteria(submission_uuid)
+
+
+def export(course, sample):
+    """
+    Export the assessment data of the course to CSV.
+    """
+    writer = CsvWriter({model: StringIO() for model in CsvWriter.MODELS})
+    with sample:
+        writer.write_to_csv(course.course_id)
+
+
+BENCHMARKS = OrderedDict([
+    ('peer_queue', peer_queue),
+    ('peer_assessment', peer_assessment),
+    ('workflow_update', workflow_update),
+    ('grade', grade),
+    ('export', export),
+])
+
+
+def percentile(values, percent):
+    """
+    Return a percentile of values, with the nearest-rank method.
+    """
+    ordered = sorted(values)
+    rank = int(math.ceil(percent / 100.0 * len(ordered)))
+    return ordered[max(rank, 1) - 1]
+
+
+def summarize(samples):
+    """
+    Return the percentiles of the latency (in milliseconds) and query counts of samples.
+    """
+    return {
+        'samples': len(samples),
+        'latency_ms': {
+            u"p{}".format(percent): round(percentile([sample.seconds for sample in samples], percent) * 1000, 3)
+            for percent in PERCENTILES
+        },
+        'queries': {
+            u"p{}".format(percent): percentile([sample.queries for sample in samples], percent)
+            for percent in PERCENTILES
+        },
+    }
+
+
+class Command(BaseCommand):
+    """
+    Benchmark the hot paths of ORA on a course.
+    """
+
+    help = (
+        "Report the percentiles of the latency and query counts of peer queue selection, peer assessment, "
+        "workflow update, grade and export on a course, and compare them with a previous run."
+    )
+    args = "<course_id>"
+
+    option_list = BaseCommand.option_list + (
+        make_option('--benchmarks',
+                    action='store', dest='benchmarks', default=u",".join(BENCHMARKS),
+                    help=u"Comma-separated benchmarks to run, among {}".format(u", ".join(BENCHMARKS))),
+        make_option('--iterations',
+                    action='store', dest='iterations', type='int', default=100,
+                    help="Number of samples of each benchmark"),
+        make_option('--export-iterations',
+                    action='store', dest='export_iterations', type='int', default=3,
+                    help="Number of samples of the export of the whole course"),
+        make_option('--steps',
+                    action='store', dest='steps', default=u",".join(synthetic.STEPS),
+                    help="Comma-separated steps of the items of the course"),
+        make_option('--must-grade',
+                    action='store', dest='must_grade', type='int', default=synthetic.MUST_GRADE,
+                    help="Number of peer assessments that learners must make"),
+        make_option('--must-be-graded-by',
+                    action='store', dest='must_be_graded_by', type='int', default=synthetic.MUST_BE_GRADED_BY,
+                    help="Number of peer assessments that learners must receive"),
+        make_option('--seed',
+                    action='store', dest='seed', type='int', default=None,
+                    help="Seed of the choice of submissions"),
+        make_option('--output',
+                    action='store', dest='output', default=None,
+                    help="Save the results to this JSON file"),
+        make_option('--compare',
+                    action='store', dest='compare', default=None,
+                    help="Compare the results with the results of a previous run, saved to this JSON file"),
+        make_option('--clear-cache',
+                    action='store_true', dest='clear_cache', default=False,
+                    help=(
+                        "Clear the whole default cache after each sample, which may hold data of the rolled back "
+                        "sample. Only use it with a cache dedicated to the benchmark"
+                    )),
+    )
+
+    def handle(self, *args, **options):
+        """
+        Execute the command.
+
+        Args:
+            course_id (unicode): The course to benchmark.
+
+        Raises:
+            CommandError
+
+        """
+        if len(args) != 1:
+            raise CommandError("Usage: benchmark_ora2 <course_id>")
+        course_id = unicode(args[0])
+
+        names = [name.strip() for name in options['benchmarks'].split(u",") if name.strip()]
+        unknown = [name for name in names if name not in BENCHMARKS]
+        if unknown:
+            raise CommandError(u"Unknown benchmarks: {}".format(u", ".join(unknown)))
+        if options['iterations'] < 1 or options['export_iterations'] < 1:
+            raise CommandError("The numbers of iterations must be positive")
+
+        baseline = None
+        if options['compare']:
+            try:
+                with open(options['compare']) as baseline_file:
+                    baseline = json.load(baseline_file)
+            except (IOError, ValueError) as ex:
+                raise CommandError(u"Could not read the results to compare with: {}".format(ex))
+
+        steps = [step.strip() for step in options['steps'].split(u",") if step.strip()]
+        course = BenchmarkCourse(
+            course_id, steps,
+            synthetic.workflow_requirements(steps, options['must_grade'], options['must_be_graded_by']),
+            random.Random(options['seed'])
+        )
+        if not course.submissions:
+            raise CommandError(u"Course {} has no submissions".format(course_id))
+
+        results = OrderedDict()
+        for name in names:
+            iterations = options['export_iterations'] if name == 'export' else options['iterations']
+            samples = self._run(BENCHMARKS[name], course, iterations, options['clear_cache'])
+            if samples:
+                results[name] = summarize(samples)
+
+        self._report(results, baseline['benchmarks'] if baseline else {})
+
+        if options['output']:
+            with open(options['output'], 'w') as output_file:
+                json.dump({
+                    'course_id': course_id,
+                    'created_at': now().isoformat(),
+                    'benchmarks': results,
+                }, output_file, indent=4, separators=(',', ': '), sort_keys=True)
+
+    def _run(self, benchmark, course, iterations, clear_cache=False):
+        """
+        Take samples of a benchmark, rolling back their changes.
+
+        Keyword Arguments:
+            clear_cache (bool): If True, clear the default cache after each sample.
+
+        Returns:
+            list of Sample
+
+        """
+        samples = []
+        for __ in range(iterations):
+            sample = Sample()
+            forget_writes()
+            try:
+                with transaction.atomic():
+                    benchmark(course, sample)
+                    transaction.set_rollback(True)
+            except NoSubmissions as ex:
+                self.stdout.write(u"Skipped {}: {}".format(benchmark.__name__, ex))
+                return samples
+            finally:
+                if clear_cache:
+                    cache.clear()
+            if sample.seconds is not None:
+                samples.append(sample)
+        return samples
+
+    def _report(self, results, baseline):
+        """
+        Write the results, and their change from the baseline.
+        """
+        self.stdout.write(u"{:<16} {:>7} {:>9} {:>9} {:>9} {:>8} {:>8} {:>8}".format(
+            u"benchmark", u"samples", u"p50 ms", u"p95 ms", u"p99 ms", u"p50 qs", u"p95 qs", u"p99 qs"
+        ))
+        for name, result in results.iteritems():
+            keys = [u"p{}".format(percent) for percent in PERCENTILES]
+            self.stdout.write(u"{:<16} {:>7} {:>9.2f} {:>9.2f} {:>9.2f} {:>8} {:>8} {:>8}".format(
+                name, result['samples'],
+                *([result['latency_ms'][key] for key in keys] + [result['queries'][key] for key in keys])
+            ))
+            if name in baseline:
+                self.stdout.write(u"{:<16} {:>7} {:>9} {:>9} {:>9} {:>8} {:>8} {:>8}".format(
+                    u"  vs baseline", u"",
+                    *(
+                        [_change(baseline[name]['latency_ms'][key], result['latency_ms'][key]) for key in keys] +
+                        [u"{:+d}".format(result['queries'][key] - baseline[name]['queries'][key]) for key in keys]
+                    )
+                ))
+
+
+def _change(before, after):
+    """
+    Format the relative change between two latencies.
+    """
+    if not before:
+        return u"n/a"
+    return u"{:+.1f}%".format((after - before) * 100.0 / before)
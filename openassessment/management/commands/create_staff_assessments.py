@@ -0,0 +1,93 @@
+"""
+Apply staff assessments in bulk, for example grades that were entered
+offline or score overrides for a whole section.
+
+The input file is JSON of the form:
+
+    {
+        "rubric": { ... rubric dict, as passed to staff_api.create_assessment ... },
+        "assessments": [
+            {
+                "submission_uuid": "...",
+                "options_selected": {"<criterion name>": "<option name>", ...},
+                "criterion_feedback": {"<criterion name>": "...", ...},
+                "overall_feedback": "..."
+            },
+            ...
+        ]
+    }
+"""
+import json
+from optparse import make_option
+
+from django.core.management.base import BaseCommand, CommandError
+
+from openassessment.assessment.api import staff as staff_api
+from openassessment.assessment.errors import StaffAssessmentError
+from openassessment.workflow.tasks import update_workflows
+
+
+class Command(BaseCommand):
+    """
+    Create staff assessments for many submissions at once.
+    """
+
+    help = 'Create staff assessments in bulk from a JSON file.'
+    args = '<SCORER_ID> <ASSESSMENTS_FILE>'
+
+    option_list = BaseCommand.option_list + (
+        make_option('--chunk-size',
+                    action='store', dest='chunk_size', type='int',
+                    default=staff_api.BULK_ASSESSMENT_CHUNK_SIZE,
+                    help="Number of assessments to create per transaction and per workflow update task"),
+        make_option('--full-grade',
+                    action='store_true', dest='full_grade', default=False,
+                    help=(
+                        "Record the assessments as regular staff grades. By default they override "
+                        "the learners' outstanding requirements, like a staff grade override."
+                    )),
+    )
+
+    def handle(self, *args, **options):
+        """
+        Execute the command.
+
+        Args:
+            scorer_id (unicode): The user ID of the staff member giving the assessments.
+            assessments_file (unicode): Path to the JSON file with the rubric and assessments.
+
+        Raises:
+            CommandError
+
+        """
+        if len(args) < 2:
+            raise CommandError(u'Usage: create_staff_assessments {}'.format(self.args))
+
+        scorer_id, assessments_path = args[0].decode('utf-8'), args[1]
+        chunk_size = options['chunk_size']
+        if chunk_size < 1:
+            raise CommandError(u'Chunk size must be a positive integer')
+
+        try:
+            with open(assessments_path) as assessments_file:
+                data = json.load(assessments_file)
+            rubric_dict = data['rubric']
+            assessments = data['assessments']
+        except (IOError, ValueError, KeyError, TypeError) as ex:
+            raise CommandError(u'Could not read assessments from {}: {}'.format(assessments_path, ex))
+
+        try:
+            submission_uuids = staff_api.create_assessments_bulk(
+                assessments, scorer_id, rubric_dict, chunk_size=chunk_size
+            )
+        except StaffAssessmentError as ex:
+            raise CommandError(u'Could not create staff assessments: {}'.format(ex))
+        self.stdout.write(u"Created {} staff assessments".format(len(submission_uuids)))
+
+        override_submitter_requirements = not options['full_grade']
+        for start in xrange(0, len(submission_uuids), chunk_size):
+            update_workflows.apply_async(
+                args=[submission_uuids[start:start + chunk_size]],
+                kwargs={'override_submitter_requirements': override_submitter_requirements}
+            )
+        self.stdout.write(u"Scheduled workflow updates for {} submissions".format(len(submission_uuids)))
@@ -0,0 +1,99 @@
+"""
+Generate a synthetic course with many learners, to measure the performance of ORA at scale.
+
+The data is inserted in bulk, in the state that the workflow API would leave it in,
+which is much faster than `create_oa_submissions`:
+
+    python manage.py generate_ora2_course course-v1:Synthetic+ORA+2017 --learners 10000 --items 5
+
+Use `benchmark_ora2` to measure the performance of the generated course.
+"""
+from optparse import make_option
+
+from django.core.management.base import BaseCommand, CommandError
+
+from openassessment import synthetic
+
+
+class Command(BaseCommand):
+    """
+    Generate a synthetic course.
+    """
+
+    help = (
+        "Generate the submissions, workflows, assessments and scores of a synthetic course, "
+        "with learners at every stage of their workflows."
+    )
+    args = "<course_id>"
+
+    option_list = BaseCommand.option_list + (
+        make_option('--learners',
+                    action='store', dest='learners', type='int', default=1000,
+                    help="Number of learners who submitted an answer to each item"),
+        make_option('--items',
+                    action='store', dest='items', type='int', default=1,
+                    help="Number of items of the course"),
+        make_option('--steps',
+                    action='store', dest='steps', default=u",".join(synthetic.STEPS),
+                    help="Comma-separated steps of the items, among peer, self and staff (staff grading required)"),
+        make_option('--complete-percent',
+                    action='store', dest='complete_percent', type='float', default=70,
+                    help="Percentage of learners who completed every step"),
+        make_option('--staff-percent',
+                    action='store', dest='staff_percent', type='float', default=5,
+                    help="Percentage of learners graded by staff"),
+        make_option('--must-grade',
+                    action='store', dest='must_grade', type='int', default=synthetic.MUST_GRADE,
+                    help="Number of peer assessments that learners must make"),
+        make_option('--must-be-graded-by',
+                    action='store', dest='must_be_graded_by', type='int', default=synthetic.MUST_BE_GRADED_BY,
+                    help="Number of peer assessments that learners must receive"),
+        make_option('--seed',
+                    action='store', dest='seed', type='int', default=None,
+                    help="Seed of the random choices, to generate the same course again"),
+    )
+
+    def handle(self, *args, **options):
+        """
+        Execute the command.
+
+        Args:
+            course_id (unicode): The course to generate, which must not have submissions.
+
+        Raises:
+            CommandError
+
+        """
+        if len(args) != 1:
+            raise CommandError("Usage: generate_ora2_course <course_id>")
+        course_id = unicode(args[0])
+
+        if options['learners'] < 1 or options['items'] < 1:
+            raise CommandError("The numbers of learners and items must be positive")
+        if options['must_grade'] < 1 or options['must_be_graded_by'] < 1:
+            raise CommandError("The numbers of peer assessments must be positive")
+        for name in ['complete_percent', 'staff_percent']:
+            if not 0 <= options[name] <= 100:
+                raise CommandError(u"Percentages must be between 0 and 100")
+
+        steps = [step.strip() for step in options['steps'].split(u",") if step.strip()]
+        for item_num in range(options['items']):
+            item_id = u"{}+item_{}".format(course_id, item_num)
+            try:
+                status_counts = synthetic.generate_item(
+                    course_id, item_id, options['learners'],
+                    steps=steps,
+                    complete_fraction=options['complete_percent'] / 100.0,
+                    staff_fraction=options['staff_percent'] / 100.0,
+                    must_grade=options['must_grade'],
+                    must_be_graded_by=options['must_be_graded_by'],
+                    seed=options['seed'],
+                )
+            except ValueError as ex:
+                raise CommandError(unicode(ex))
+            self.stdout.write(u"Generated {item_id}: {counts}".format(
+                item_id=item_id,
+                counts=u", ".join(
+                    u"{} {}".format(count, status) for status, count in sorted(status_counts.items())
+                ),
+            ))
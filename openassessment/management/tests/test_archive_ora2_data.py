@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the management command that archives the assessment data of closed courses.
+"""
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test.utils import override_settings
+from mock import patch
+
+from openassessment import archive
+from openassessment.test_utils import CacheResetTest
+
+
+class ArchiveOra2DataTest(CacheResetTest):
+    """
+    Test the archive_ora2_data management command.
+    """
+
+    @patch.object(archive, 'archive_course', return_value=2)
+    def test_archive_courses(self, mock_archive):
+        call_command('archive_ora2_data', 'course_1', 'course_2', batch_size=10)
+        self.assertEqual(
+            [call_args[0][0] for call_args in mock_archive.call_args_list], ['course_1', 'course_2']
+        )
+        self.assertEqual(mock_archive.call_args[1], {'batch_size': 10})
+
+    @patch.object(archive, 'find_closed_courses', return_value=['course_1'])
+    @patch.object(archive, 'archive_course', return_value=0)
+    def test_archive_closed_courses(self, mock_archive, mock_find):
+        call_command('archive_ora2_data', before='2016-01-31')
+        self.assertEqual(mock_find.call_args[0][0].isoformat(), '2016-01-31T00:00:00+00:00')
+        mock_archive.assert_called_once_with('course_1', batch_size=archive.DEFAULT_BATCH_SIZE)
+
+    def test_no_courses(self):
+        with self.assertRaises(CommandError):
+            call_command('archive_ora2_data')
+
+    def test_invalid_date(self):
+        with self.assertRaises(CommandError):
+            call_command('archive_ora2_data', before='last year')
+
+    @override_settings(ORA2_ARCHIVE_DATABASE=None)
+    def test_archive_not_configured(self):
+        with self.assertRaises(CommandError):
+            call_command('archive_ora2_data', 'course_1')
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the management command that benchmarks the hot paths of ORA.
+"""
+import json
+import os
+import shutil
+from StringIO import StringIO
+import tempfile
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from submissions.models import Score
+
+from openassessment import synthetic
+from openassessment.assessment.models import Assessment, PeerWorkflowItem
+from openassessment.management.commands import benchmark_ora2
+from openassessment.test_utils import CacheResetTest
+from openassessment.workflow.models import AssessmentWorkflow
+
+
+COURSE_ID = u"course-v1:Synthetic+ORA+2017"
+
+
+class BenchmarkTest(CacheResetTest):
+    """
+    Test the benchmark_ora2 management command.
+    """
+
+    def setUp(self):
+        super(BenchmarkTest, self).setUp()
+        self.temp_dir = tempfile.mkdtemp()
+        synthetic.generate_item(COURSE_ID, u"item", 30, complete_fraction=0.5, staff_fraction=0.2, seed=1)
+
+    def tearDown(self):
+        super(BenchmarkTest, self).tearDown()
+        shutil.rmtree(self.temp_dir)
+
+    def _benchmark(self, **options):
+        """
+        Run the benchmarks, returning their output.
+        """
+        stdout = StringIO()
+        call_command('benchmark_ora2', COURSE_ID, iterations=5, export_iterations=1, seed=1, stdout=stdout, **options)
+        return stdout.getvalue()
+
+    def _data(self):
+        """
+        Return a summary of the data of the course.
+        """
+        return (
+            list(AssessmentWorkflow.objects.order_by('id').values_list('status', 'modified')),
+            Assessment.objects.count(),
+            PeerWorkflowItem.objects.count(),
+            Score.objects.count(),
+        )
+
+    def test_benchmark(self):
+        data = self._data()
+        output_path = os.path.join(self.temp_dir, 'results.json')
+        output = self._benchmark(output=output_path)
+
+        # The samples are rolled back
+        self.assertEqual(self._data(), data)
+
+        with open(output_path) as output_file:
+            results = json.load(output_file)
+        self.assertEqual(results['course_id'], COURSE_ID)
+        self.assertItemsEqual(results['benchmarks'].keys(), benchmark_ora2.BENCHMARKS.keys())
+        for name, result in results['benchmarks'].iteritems():
+            self.assertIn(name, output)
+            self.assertEqual(result['samples'], 1 if name == 'export' else 5)
+            self.assertItemsEqual(result['latency_ms'].keys(), ['p50', 'p95', 'p99'])
+            self.assertLessEqual(result['latency_ms']['p50'], result['latency_ms']['p99'])
+            self.assertGreater(result['queries']['p50'], 0)
+        self.assertNotIn("vs baseline", output)
+
+        output = self._benchmark(benchmarks=u"grade,export", compare=output_path)
+        self.assertEqual(output.count("vs baseline"), 2)
+
+    def test_clear_cache(self):
+        cache.set(u"benchmark_ora2.test", 1)
+        self._benchmark(benchmarks=u"grade")
+        self.assertEqual(cache.get(u"benchmark_ora2.test"), 1)
+
+        self._benchmark(benchmarks=u"grade", clear_cache=True)
+        self.assertIsNone(cache.get(u"benchmark_ora2.test"))
+
+    def test_skip_benchmarks_without_submissions(self):
+        AssessmentWorkflow.objects.filter(status='peer').update(status='self')
+        output = self._benchmark(benchmarks=u"peer_queue,grade")
+        self.assertIn("Skipped peer_queue", output)
+        self.assertIn("grade", output)
+
+    def test_invalid_options(self):
+        with self.assertRaisesRegexp(CommandError, "Unknown benchmarks: render"):
+            self._benchmark(benchmarks=u"grade,render")
+        with self.assertRaisesRegexp(CommandError, "Could not read"):
+            self._benchmark(compare=os.path.join(self.temp_dir, 'missing.json'))
+        with self.assertRaisesRegexp(CommandError, "has no submissions"):
+            call_command('benchmark_ora2', u"other_course")
+
+    def test_percentile(self):
+        values = range(1, 101)
+        self.assertEqual(benchmark_ora2.percentile(values, 50), 50)
+        self.assertEqual(benchmark_ora2.percentile(values, 99), 99)
+        self.assertEqual(benchmark_ora2.percentile([3, 1, 2], 95), 3)
+        self.assertEqual(benchmark_ora2.percentile([3], 50), 3)
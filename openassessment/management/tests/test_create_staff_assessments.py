@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the management command that creates staff assessments in bulk.
+"""
+import json
+import os
+import shutil
+import tempfile
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from openassessment.assessment.api import staff as staff_api
+from openassessment.assessment.test.constants import OPTIONS_SELECTED_DICT, RUBRIC
+from openassessment.test_utils import CacheResetTest
+from openassessment.workflow import api as workflow_api
+from submissions import api as sub_api
+
+
+class CreateStaffAssessmentsTest(CacheResetTest):
+    """
+    Test the create_staff_assessments management command.
+    """
+
+    def setUp(self):
+        super(CreateStaffAssessmentsTest, self).setUp()
+        self.temp_dir = tempfile.mkdtemp()
+        self.submissions = []
+        for index in range(3):
+            student_item = {
+                'student_id': "test_user_{}".format(index),
+                'course_id': "test_course",
+                'item_id': 'test_item',
+                'item_type': 'openassessment',
+            }
+            submission = sub_api.create_submission(student_item, "test submission {}".format(index))
+            workflow_api.create_workflow(submission['uuid'], ['peer', 'staff'])
+            self.submissions.append(submission)
+
+    def tearDown(self):
+        super(CreateStaffAssessmentsTest, self).tearDown()
+        shutil.rmtree(self.temp_dir)
+
+    def _write_assessments(self, data):
+        """
+        Write the input file for the command and return its path.
+        """
+        path = os.path.join(self.temp_dir, "assessments.json")
+        with open(path, 'w') as assessments_file:
+            json.dump(data, assessments_file)
+        return path
+
+    def test_create_staff_assessments(self):
+        path = self._write_assessments({
+            'rubric': RUBRIC,
+            'assessments': [
+                {
+                    'submission_uuid': submission['uuid'],
+                    'options_selected': OPTIONS_SELECTED_DICT["all"]["options"],
+                    'overall_feedback': u"Well done",
+                }
+                for submission in self.submissions
+            ]
+        })
+        call_command('create_staff_assessments', 'staff_user', path, chunk_size=2)
+
+        for submission in self.submissions:
+            assessment = staff_api.get_latest_staff_assessment(submission['uuid'])
+            self.assertEqual(assessment['points_earned'], OPTIONS_SELECTED_DICT["all"]["expected_points"])
+
+            # The workflow was updated, and the staff grade overrides the peer step
+            workflow = workflow_api.get_workflow_for_submission(submission['uuid'], None)
+            self.assertEqual(workflow['status'], "done")
+            self.assertEqual(workflow['score']['points_earned'], OPTIONS_SELECTED_DICT["all"]["expected_points"])
+
+    def test_full_grade(self):
+        path = self._write_assessments({
+            'rubric': RUBRIC,
+            'assessments': [{
+                'submission_uuid': self.submissions[0]['uuid'],
+                'options_selected': OPTIONS_SELECTED_DICT["all"]["options"],
+            }]
+        })
+        call_command('create_staff_assessments', 'staff_user', path, full_grade=True)
+
+        # The learner must still complete the peer step
+        workflow = workflow_api.get_workflow_for_submission(self.submissions[0]['uuid'], None)
+        self.assertEqual(workflow['status'], "peer")
+
+    def test_invalid_selection(self):
+        path = self._write_assessments({
+            'rubric': RUBRIC,
+            'assessments': [{
+                'submission_uuid': self.submissions[0]['uuid'],
+                'options_selected': {u"vøȼȺƀᵾłȺɍɏ": u"Not an option"},
+            }]
+        })
+        with self.assertRaises(CommandError):
+            call_command('create_staff_assessments', 'staff_user', path)
+        self.assertIsNone(staff_api.get_latest_staff_assessment(self.submissions[0]['uuid']))
+
+    def test_invalid_file(self):
+        with self.assertRaises(CommandError):
+            call_command('create_staff_assessments', 'staff_user', os.path.join(self.temp_dir, "missing.json"))
+
+        path = self._write_assessments({'assessments': []})
+        with self.assertRaises(CommandError):
+            call_command('create_staff_assessments', 'staff_user', path)
+
+    def test_missing_args(self):
+        with self.assertRaises(CommandError):
+            call_command('create_staff_assessments', 'staff_user')
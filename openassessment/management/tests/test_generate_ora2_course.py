@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the management command that generates a synthetic course.
+"""
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from submissions import api as sub_api
+from submissions.models import Score
+
+from openassessment import synthetic
+from openassessment.assessment.api import peer as peer_api
+from openassessment.assessment.models import Assessment, PeerWorkflow
+from openassessment.test_utils import CacheResetTest
+from openassessment.workflow import api as workflow_api
+from openassessment.workflow.models import AssessmentWorkflow
+
+
+COURSE_ID = u"course-v1:Synthetic+ORA+2017"
+
+
+class GenerateCourseTest(CacheResetTest):
+    """
+    Test generating synthetic courses.
+    """
+
+    def _generate(self, *steps, **options):
+        """
+        Generate the course, returning the workflows of the first item by submission UUID.
+        """
+        options.setdefault('seed', 1)
+        call_command(
+            'generate_ora2_course', COURSE_ID,
+            steps=u",".join(steps or synthetic.STEPS), learners=40, **options
+        )
+        return {
+            workflow.submission_uuid: workflow
+            for workflow in AssessmentWorkflow.objects.filter(item_id=u"{}+item_0".format(COURSE_ID))
+        }
+
+    def _assert_up_to_date(self, workflows, requirements):
+        """
+        Updating the workflows must not change their status or score.
+        """
+        num_scores = Score.objects.count()
+        for submission_uuid, workflow in workflows.iteritems():
+            score = sub_api.get_latest_score_for_submission(submission_uuid)
+            updated = workflow_api.get_workflow_for_submission(submission_uuid, requirements)
+            self.assertEqual(updated['status'], workflow.status)
+            if workflow.status == 'done':
+                self.assertEqual(updated['score']['points_earned'], score['points_earned'])
+            else:
+                self.assertIs(updated['score'], None)
+        self.assertEqual(Score.objects.count(), num_scores)
+
+    def test_generate(self):
+        workflows = self._generate(items=2, complete_percent=50)
+        self.assertEqual(AssessmentWorkflow.objects.filter(course_id=COURSE_ID).count(), 80)
+        self.assertEqual(len(workflows), 40)
+
+        # Learners are at every stage of their workflows
+        statuses = set(workflow.status for workflow in workflows.itervalues())
+        self.assertEqual(statuses, {'peer', 'self', 'waiting', 'done'})
+        self.assertTrue(Assessment.objects.filter(score_type='ST').exists())
+
+        self._assert_up_to_date(workflows, synthetic.workflow_requirements(synthetic.STEPS))
+
+        # Peer scores are the median scores of the peer assessment API
+        requirements = synthetic.workflow_requirements(synthetic.STEPS)
+        for submission_uuid, workflow in workflows.iteritems():
+            score = sub_api.get_latest_score_for_submission(submission_uuid)
+            if score and not score['annotations']:
+                peer_score = peer_api.get_score(submission_uuid, requirements['peer'])
+                self.assertEqual(peer_score['points_earned'], score['points_earned'])
+
+    def test_learners_grade_their_peers(self):
+        self._generate()
+        for peer_workflow in PeerWorkflow.objects.filter(completed_at__isnull=False):
+            self.assertEqual(peer_workflow.num_peers_graded(), synthetic.MUST_GRADE)
+
+    def test_self_and_required_staff(self):
+        workflows = self._generate('self', 'staff', staff_percent=50)
+        self.assertFalse(PeerWorkflow.objects.exists())
+        self.assertEqual(
+            set(workflow.status for workflow in workflows.itervalues()),
+            {'self', 'waiting', 'done'}
+        )
+        self._assert_up_to_date(workflows, synthetic.workflow_requirements(['self', 'staff']))
+
+    def test_existing_item(self):
+        self._generate()
+        with self.assertRaisesRegexp(CommandError, "already has submissions"):
+            self._generate()
+
+        # Other courses generated with the same seed have other submissions
+        call_command('generate_ora2_course', u"other_course", learners=40, seed=1)
+        uuids = set(AssessmentWorkflow.objects.filter(course_id=COURSE_ID).values_list('submission_uuid', flat=True))
+        other_uuids = set(
+            AssessmentWorkflow.objects.filter(course_id=u"other_course").values_list('submission_uuid', flat=True)
+        )
+        self.assertEqual(len(uuids | other_uuids), 80)
+
+    def test_invalid_options(self):
+        with self.assertRaises(CommandError):
+            call_command('generate_ora2_course')
+        with self.assertRaises(CommandError):
+            self._generate('peer', 'ai')
+        with self.assertRaises(CommandError):
+            self._generate(staff_percent=110)
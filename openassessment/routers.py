@@ -0,0 +1,142 @@
+"""
+Database router that sends the reads of replica-safe API calls to a read replica.
+
+Reads are only sent to the replica within code marked with `replica_safe`,
+used as a decorator or as a context manager:
+
+    @replica_safe
+    def get_status_counts(course_id, item_id, steps):
+        ...
+
+    with replica_safe():
+        ...
+
+Replicas lag behind the primary database, so once a request (or a task)
+has written to the database, its reads go to the primary database, where
+its own writes are visible, until the next request starts.
+
+The replica is the database configured in DATABASES with the alias given by
+the ORA2_READ_REPLICA_DATABASE setting ("read_replica" by default).  To enable
+the router, add it to the DATABASE_ROUTERS setting:
+
+    DATABASE_ROUTERS = ['openassessment.routers.ReadReplicaRouter']
+
+Without the router, replica-safe code reads from the primary database.
+"""
+from functools import wraps
+import threading
+
+from celery.signals import task_prerun
+from django.conf import settings
+from django.core.signals import request_started
+from django.db import DEFAULT_DB_ALIAS
+
+
+DEFAULT_READ_REPLICA_DATABASE = "read_replica"
+
+# State of the current thread: how many replica-safe blocks it is in,
+# and whether it has written to the database since its request started.
+_STATE = threading.local()
+
+
+def read_replica_database():
+    """
+    Return the alias of the read replica, or None if it is not configured.
+    """
+    alias = getattr(settings, 'ORA2_READ_REPLICA_DATABASE', DEFAULT_READ_REPLICA_DATABASE)
+    return alias if alias in settings.DATABASES else None
+
+
+def use_read_replica(queryset):
+    """
+    Run a query on the read replica if it's available, whatever the current
+    request has written.  Only for reads that tolerate lag, like reports.
+
+    Args:
+        queryset (QuerySet)
+
+    Returns:
+        QuerySet
+
+    """
+    alias = read_replica_database()
+    return queryset.using(alias) if alias is not None else queryset
+
+
+class ReplicaSafe(object):
+    """
+    Context manager and decorator marking code whose reads can be served by the read replica.
+    """
+
+    def __enter__(self):
+        _STATE.depth = getattr(_STATE, 'depth', 0) + 1
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _STATE.depth -= 1
+
+    def __call__(self, func):
+        @wraps(func)
+        def _replica_safe(*args, **kwargs):  # pylint: disable=missing-docstring
+            with self:
+                return func(*args, **kwargs)
+        return _replica_safe
+
+
+def replica_safe(func=None):
+    """
+    Mark code whose reads can be served by the read replica.
+
+    Can be used as a decorator, with or without parentheses, or as a context manager.
+    """
+    if callable(func):
+        return ReplicaSafe()(func)
+    return ReplicaSafe()
+
+
+def forget_writes(**kwargs):  # pylint: disable=unused-argument
+    """
+    Start reading from the read replica again at the start of a request or task.
+    """
+    _STATE.has_written = False
+
+
+request_started.connect(forget_writes)
+task_prerun.connect(forget_writes)
+
+
+def _reads_from_replica():
+    """
+    Check whether the current thread can read from the replica.
+    """
+    return getattr(_STATE, 'depth', 0) > 0 and not getattr(_STATE, 'has_written', False)
+
+
+class ReadReplicaRouter(object):
+    """
+    Route the reads of replica-safe code to the read replica.
+    """
+
+    def db_for_read(self, model, **hints):  # pylint: disable=unused-argument
+        """
+        Read from the replica within replica-safe code.  Related models
+        are read from the database of the model that they relate to.
+        """
+        if hints.get('instance') is None and _reads_from_replica():
+            return read_replica_database()
+        return None
+
+    def db_for_write(self, model, **hints):  # pylint: disable=unused-argument
+        """
+        Remember that the current thread wrote to the primary database.
+        """
+        _STATE.has_written = True
+        return None
+
+    def allow_relation(self, obj1, obj2, **hints):  # pylint: disable=unused-argument
+        """
+        Allow relations between models of the primary database and of the replica, which hold the same data.
+        """
+        databases = (DEFAULT_DB_ALIAS, read_replica_database())
+        if obj1._state.db in databases and obj2._state.db in databases:  # pylint: disable=protected-access
+            return True
+        return None
@@ -0,0 +1,68 @@
+"""
+Lightweight read-only records of database rows.
+
+Reports and bulk APIs that read thousands of rows don't need full Django
+models, which are slow to build.  Row types are named tuples, which have
+no instance dictionary, built from the results of `values_list()` queries:
+
+    class AssessmentRow(Row, namedtuple('AssessmentRow', ['id', 'rubric_id'])):
+        __slots__ = ()
+
+    rows = AssessmentRow.fetch(Assessment.objects.filter(submission_uuid=submission_uuid))
+
+The fields of a row are read from the model fields of the same names,
+unless `LOOKUPS` lists the model fields (or lookups across relations) to read.
+"""
+
+
+class Row(object):
+    """
+    Mixin for named tuples, building them from the values of model fields.
+    """
+    __slots__ = ()
+
+    # The model fields to read, in the order of the fields of the row.
+    # Defaults to the fields of the row.
+    LOOKUPS = None
+
+    @classmethod
+    def values(cls, queryset):
+        """
+        Return a query of the values of the rows.
+
+        Args:
+            queryset (QuerySet): The models to read.
+
+        Returns:
+            ValuesListQuerySet
+
+        """
+        return queryset.values_list(*(cls.LOOKUPS or cls._fields))  # pylint: disable=no-member
+
+    @classmethod
+    def build(cls, values):
+        """
+        Build rows from the values returned by `values()`.
+
+        Args:
+            values (iterable of tuples)
+
+        Returns:
+            list of rows
+
+        """
+        return [cls._make(row_values) for row_values in values]  # pylint: disable=no-member
+
+    @classmethod
+    def fetch(cls, queryset):
+        """
+        Read the rows of a query.
+
+        Args:
+            queryset (QuerySet): The models to read.
+
+        Returns:
+            list of rows
+
+        """
+        return cls.build(cls.values(queryset))
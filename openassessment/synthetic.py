@@ -0,0 +1,567 @@
+"""
+Synthetic courses, to measure the performance of ORA at the scale of large courses.
+
+The submissions, workflows, assessments and scores of a synthetic item are
+created in bulk, directly in the database, in the state that the workflow API
+leaves them in once every workflow is up to date: updating the workflows
+with the same requirements doesn't change them.
+
+Some learners have completed every step of their workflow, the others stopped
+at one of the steps, and some of them were graded by staff.  Learners grade
+the answers submitted just before theirs, so the last learners to submit may
+not have received enough peer assessments, and wait for their grade.
+"""
+import hashlib
+import random
+import uuid
+from collections import Counter
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils.timezone import now
+import loremipsum
+from submissions.models import Score, ScoreAnnotation, ScoreSummary, StudentItem, Submission
+
+from openassessment.assessment.api.peer import PEER_TYPE
+from openassessment.assessment.api.self import SELF_TYPE
+from openassessment.assessment.api.staff import STAFF_TYPE
+from openassessment.assessment.models import (
+    Assessment, AssessmentFeedback, AssessmentPart, PeerWorkflow, PeerWorkflowItem, StaffWorkflow
+)
+from openassessment.assessment.serializers import rubric_from_dict
+from openassessment.workflow.models import AssessmentWorkflow, AssessmentWorkflowStep
+
+
+# The steps of the synthetic items, in order.
+# A staff step is added if staff assessment is not required.
+STEPS = ['peer', 'self']
+VALID_STEPS = ['peer', 'self', 'staff']
+
+# The defaults of the peer assessment step of the XBlock
+MUST_GRADE = 5
+MUST_BE_GRADED_BY = 3
+
+NUM_CRITERIA = 5
+NUM_OPTIONS = 4
+
+# Fraction of the learners who have received their peer grade
+# that left feedback on the peer assessments.
+PEER_FEEDBACK_FRACTION = 0.25
+
+# Number of distinct answers and assessment feedbacks
+NUM_TEXTS = 50
+
+# Number of rows to insert per query
+BATCH_SIZE = 500
+
+# Maximum number of values in an IN clause, which keeps
+# queries below the limit of parameters of SQLite.
+MAX_IDS_PER_QUERY = 500
+
+
+def synthetic_rubric():
+    """
+    Return the rubric of the synthetic items, in the format of `rubric_from_dict`.
+    Options are worth 0 to NUM_OPTIONS - 1 points.
+    """
+    return {
+        'prompts': [{'description': u"Synthetic prompt"}],
+        'criteria': [
+            {
+                'order_num': criterion_num,
+                'name': u"criterion_{}".format(criterion_num),
+                'label': u"Criterion {}".format(criterion_num + 1),
+                'prompt': u"How good is the answer on criterion {}?".format(criterion_num + 1),
+                'options': [
+                    {
+                        'order_num': option_num,
+                        'points': option_num,
+                        'name': u"option_{}".format(option_num),
+                        'label': u"Option {}".format(option_num + 1),
+                        'explanation': u"",
+                    }
+                    for option_num in range(NUM_OPTIONS)
+                ],
+            }
+            for criterion_num in range(NUM_CRITERIA)
+        ],
+    }
+
+
+def workflow_requirements(steps, must_grade=MUST_GRADE, must_be_graded_by=MUST_BE_GRADED_BY):
+    """
+    Return the requirements of the workflows of a synthetic item,
+    in the format of the XBlock's `workflow_requirements()`.
+    """
+    requirements = {'staff': {'required': 'staff' in steps}}
+    if 'peer' in steps:
+        requirements['peer'] = {'must_grade': must_grade, 'must_be_graded_by': must_be_graded_by}
+    return requirements
+
+
+def anonymous_id(course_id, name):
+    """
+    Return a stable anonymous user ID, shaped like the IDs of the LMS.
+    """
+    return hashlib.md5(u"{}:{}".format(course_id, name).encode('utf-8')).hexdigest()
+
+
+class SyntheticLearner(object):
+    """
+    The state of the workflow of a synthetic learner.
+    """
+
+    def __init__(self, student_id, submission_uuid, progress, quality):
+        self.student_id = student_id
+        self.submission_uuid = submission_uuid
+
+        # Number of learner steps completed by the learner
+        self.progress = progress
+
+        # Typical option chosen by assessors of the learner's answer
+        self.quality = quality
+
+        self.num_graded = 0
+        self.scorers = []
+        self.staff_graded = False
+        self.status = None
+        self.score = None
+
+
+def generate_item(
+        course_id, item_id, num_learners, steps=STEPS,
+        complete_fraction=0.7, staff_fraction=0.05,
+        must_grade=MUST_GRADE, must_be_graded_by=MUST_BE_GRADED_BY,
+        seed=None
+):
+    """
+    Create the submissions, workflows, assessments and scores of a synthetic item.
+
+    Args:
+        course_id (unicode): The course of the item.
+        item_id (unicode): The item, which must not have submissions.
+        num_learners (int): The number of learners who submitted an answer.
+
+    Keyword Arguments:
+        steps (list of str): The steps of the workflows, among VALID_STEPS.
+        complete_fraction (float): The fraction of learners who completed every step.
+        staff_fraction (float): The fraction of learners graded by staff.
+        must_grade (int): The number of peer assessments that learners must make.
+        must_be_graded_by (int): The number of peer assessments that learners must receive.
+        seed (int): Seed of the random choices; the same seed creates the same item.
+
+    Returns:
+        Counter: The number of workflows of each status.
+
+    Raises:
+        ValueError: The item already has submissions, or the steps are invalid.
+
+    """
+    if not steps or any(step not in VALID_STEPS for step in steps):
+        raise ValueError(u"Steps must be among {}".format(u", ".join(VALID_STEPS)))
+    if StudentItem.objects.filter(course_id=course_id, item_id=item_id).exists():
+        raise ValueError(u"Item {} of course {} already has submissions".format(item_id, course_id))
+
+    rand = random.Random(u"{}:{}:{}".format(course_id, item_id, seed) if seed is not None else None)
+    learners = _plan_learners(
+        course_id, num_learners, steps, complete_fraction, staff_fraction, must_grade, must_be_graded_by, rand
+    )
+    with transaction.atomic():
+        _ItemWriter(course_id, item_id, steps, must_be_graded_by, rand).write(learners)
+    return Counter(learner.status for learner in learners)
+
+
+def _plan_learners(course_id, num_learners, steps, complete_fraction, staff_fraction, must_grade,
+                   must_be_graded_by, rand):
+    """
+    Decide the state of the workflows of the learners.
+
+    Returns:
+        list of SyntheticLearner
+
+    """
+    learner_steps = [step for step in steps if step != 'staff']
+    learners = [
+        SyntheticLearner(
+            anonymous_id(course_id, num),
+            unicode(uuid.UUID(int=rand.getrandbits(128), version=4)),
+            len(learner_steps) if rand.random() < complete_fraction else rand.randrange(len(learner_steps) or 1),
+            rand.randrange(NUM_OPTIONS),
+        )
+        for num in range(num_learners)
+    ]
+
+    if 'peer' in learner_steps:
+        peer_index = learner_steps.index('peer')
+        participants = [learner for learner in learners if learner.progress >= peer_index]
+
+        # Learners past the peer step graded enough peers, if there are enough of them
+        for learner in participants:
+            if learner.progress > peer_index:
+                learner.num_graded = min(must_grade, len(participants) - 1)
+            else:
+                learner.num_graded = rand.randrange(min(must_grade, len(participants)))
+            if learner.num_graded < must_grade:
+                learner.progress = peer_index
+
+        # Learners grade the previous submissions, or the next ones if there are not enough of them
+        for position, scorer in enumerate(participants):
+            authors = participants[max(position - scorer.num_graded, 0):position]
+            authors += participants[position + 1:position + 1 + scorer.num_graded - len(authors)]
+            for author in authors:
+                author.scorers.append(scorer)
+
+    for learner in learners:
+        learner.staff_graded = rand.random() < staff_fraction
+        completed = learner_steps[:learner.progress]
+        assessed = [
+            learner.staff_graded or
+            (step == 'staff' and 'staff' not in steps) or
+            (step == 'peer' and len(learner.scorers) >= must_be_graded_by) or
+            (step == 'self' and step in completed)
+            for step in ['staff'] + learner_steps
+        ]
+        if learner.progress < len(learner_steps):
+            learner.status = learner_steps[learner.progress]
+        elif all(assessed):
+            learner.status = AssessmentWorkflow.STATUS.done
+        else:
+            learner.status = AssessmentWorkflow.STATUS.waiting
+    return learners
+
+
+class _ItemWriter(object):
+    """
+    Insert the data of the learners of a synthetic item.
+    """
+
+    def __init__(self, course_id, item_id, steps, must_be_graded_by, rand):
+        self.course_id = course_id
+        self.item_id = item_id
+        self.steps = steps if 'staff' in steps else ['staff'] + steps
+        self.staff_required = 'staff' in steps
+        self.must_be_graded_by = must_be_graded_by
+        self.rand = rand
+        self.staff_id = anonymous_id(course_id, 'staff')
+
+        self.rubric = rubric_from_dict(synthetic_rubric())
+        self.options = [
+            list(criterion.options.order_by('order_num'))
+            for criterion in self.rubric.criteria.order_by('order_num')
+        ]
+        self.points_possible = self.rubric.points_possible
+
+        words = loremipsum.Generator().words
+        self.answers = [self._text(words, 300) for __ in range(NUM_TEXTS)]
+        self.feedbacks = [self._text(words, 30) for __ in range(NUM_TEXTS)]
+
+    def _text(self, words, num_words):
+        """
+        Return random lorem ipsum text.
+        """
+        return u" ".join(self.rand.choice(words) for __ in range(num_words)).capitalize() + u"."
+
+    def write(self, learners):
+        """
+        Insert the data of the learners.
+        """
+        first_submitted_at = now() - timedelta(minutes=len(learners))
+        submitted_at = {
+            learner.submission_uuid: first_submitted_at + timedelta(minutes=num)
+            for num, learner in enumerate(learners)
+        }
+        student_item_ids, submission_ids = self._create_submissions(learners, submitted_at)
+        self._create_workflows(learners, submitted_at)
+        peer_workflow_ids = self._create_peer_workflows(learners, submitted_at)
+        assessments = self._create_assessments(learners)
+        self._create_peer_workflow_items(learners, peer_workflow_ids, assessments)
+        self._create_staff_workflows(learners, submitted_at, assessments)
+        self._create_scores(learners, student_item_ids, submission_ids, assessments)
+        self._create_feedback(learners, assessments)
+
+    def _create_submissions(self, learners, submitted_at):
+        """
+        Returns:
+            Two dicts: the IDs of the student items by student ID,
+            and the IDs of the submissions by UUID.
+        """
+        StudentItem.objects.bulk_create([
+            StudentItem(
+                student_id=learner.student_id, course_id=self.course_id,
+                item_id=self.item_id, item_type='openassessment'
+            )
+            for learner in learners
+        ], batch_size=BATCH_SIZE)
+        student_item_ids = dict(
+            StudentItem.objects.filter(course_id=self.course_id, item_id=self.item_id).values_list('student_id', 'id')
+        )
+        Submission.objects.bulk_create([
+            Submission(
+                uuid=learner.submission_uuid,
+                student_item_id=student_item_ids[learner.student_id],
+                attempt_number=1,
+                submitted_at=submitted_at[learner.submission_uuid],
+                created_at=submitted_at[learner.submission_uuid],
+                answer={'parts': [{'text': self.rand.choice(self.answers)}]},
+            )
+            for learner in learners
+        ], batch_size=BATCH_SIZE)
+        submission_ids = dict(
+            Submission.objects.filter(
+                student_item__course_id=self.course_id, student_item__item_id=self.item_id
+            ).values_list('uuid', 'id')
+        )
+        return student_item_ids, submission_ids
+
+    def _create_workflows(self, learners, submitted_at):
+        """
+        Create the assessment workflows and their steps.
+        """
+        AssessmentWorkflow.objects.bulk_create([
+            AssessmentWorkflow(
+                submission_uuid=learner.submission_uuid, status=learner.status,
+                course_id=self.course_id, item_id=self.item_id
+            )
+            for learner in learners
+        ], batch_size=BATCH_SIZE)
+        workflow_ids = dict(
+            AssessmentWorkflow.objects.filter(
+                course_id=self.course_id, item_id=self.item_id
+            ).values_list('submission_uuid', 'id')
+        )
+
+        steps = []
+        for learner in learners:
+            created = submitted_at[learner.submission_uuid]
+            completed = self.steps[:self.steps.index(learner.status)] if learner.status in self.steps else self.steps
+            for order_num, name in enumerate(self.steps):
+                if name == 'staff':
+                    submitter_completed = True
+                    assessment_completed = learner.staff_graded or not self.staff_required
+                else:
+                    submitter_completed = name in completed
+                    assessment_completed = learner.staff_graded or (
+                        len(learner.scorers) >= self.must_be_graded_by if name == 'peer' else submitter_completed
+                    )
+                steps.append(AssessmentWorkflowStep(
+                    workflow_id=workflow_ids[learner.submission_uuid],
+                    name=name,
+                    order_num=order_num,
+                    submitter_completed_at=created if submitter_completed else None,
+                    assessment_completed_at=created if assessment_completed else None,
+                ))
+        AssessmentWorkflowStep.objects.bulk_create(steps, batch_size=BATCH_SIZE)
+
+    def _create_peer_workflows(self, learners, submitted_at):
+        """
+        Create the peer workflows of the learners who started the peer step.
+
+        Returns:
+            dict: The IDs of the peer workflows by submission UUID.
+        """
+        if 'peer' not in self.steps:
+            return {}
+        peer_index = self.steps.index('peer')
+        PeerWorkflow.objects.bulk_create([
+            PeerWorkflow(
+                student_id=learner.student_id,
+                course_id=self.course_id,
+                item_id=self.item_id,
+                submission_uuid=learner.submission_uuid,
+                created_at=submitted_at[learner.submission_uuid],
+                completed_at=(
+                    submitted_at[learner.submission_uuid]
+                    if learner.status not in self.steps[:peer_index + 1] else None
+                ),
+                grading_completed_at=now() if len(learner.scorers) >= self.must_be_graded_by else None,
+            )
+            for learner in learners
+            if learner.status not in self.steps[:peer_index]
+        ], batch_size=BATCH_SIZE)
+        return dict(
+            PeerWorkflow.objects.filter(
+                course_id=self.course_id, item_id=self.item_id
+            ).values_list('submission_uuid', 'id')
+        )
+
+    def _create_assessments(self, learners):
+        """
+        Create the peer, self and staff assessments and their parts.
+
+        Returns:
+            dict: The assessments by (submission UUID, scorer ID, score type),
+                as tuples of their ID and the selected options.
+        """
+        planned = []
+        for learner in learners:
+            for scorer in learner.scorers:
+                planned.append((learner, scorer.student_id, PEER_TYPE))
+        for learner in learners:
+            if 'self' in self.steps and learner.status not in self.steps[:self.steps.index('self') + 1]:
+                planned.append((learner, learner.student_id, SELF_TYPE))
+            if learner.staff_graded:
+                planned.append((learner, self.staff_id, STAFF_TYPE))
+
+        scored_at = now()
+        Assessment.objects.bulk_create([
+            Assessment(
+                submission_uuid=learner.submission_uuid, rubric=self.rubric, scored_at=scored_at,
+                scorer_id=scorer_id, score_type=score_type, feedback=self.rand.choice(self.feedbacks)
+            )
+            for learner, scorer_id, score_type in planned
+        ], batch_size=BATCH_SIZE)
+
+        submission_uuids = [learner.submission_uuid for learner in learners]
+        assessment_ids = {}
+        for start in xrange(0, len(submission_uuids), MAX_IDS_PER_QUERY):
+            for submission_uuid, scorer_id, score_type, assessment_id in Assessment.objects.filter(
+                    submission_uuid__in=submission_uuids[start:start + MAX_IDS_PER_QUERY]
+            ).values_list('submission_uuid', 'scorer_id', 'score_type', 'id'):
+                assessment_ids[(submission_uuid, scorer_id, score_type)] = assessment_id
+
+        assessments = {}
+        parts = []
+        for learner, scorer_id, score_type in planned:
+            key = (learner.submission_uuid, scorer_id, score_type)
+            selected = [
+                min(max(int(round(self.rand.gauss(learner.quality, 0.7))), 0), NUM_OPTIONS - 1)
+                for __ in self.options
+            ]
+            assessments[key] = (assessment_ids[key], selected)
+            parts.extend(
+                AssessmentPart(
+                    assessment_id=assessment_ids[key],
+                    criterion_id=criterion_options[option_num].criterion_id,
+                    option_id=criterion_options[option_num].id,
+                )
+                for criterion_options, option_num in zip(self.options, selected)
+            )
+        AssessmentPart.objects.bulk_create(parts, batch_size=BATCH_SIZE)
+        return assessments
+
+    def _create_peer_workflow_items(self, learners, peer_workflow_ids, assessments):
+        """
+        Create the peer workflow items of the peer assessments, and compute
+        the peer scores like the peer assessment API: the sum of the median
+        points of the first required assessments.
+        """
+        items = []
+        for learner in learners:
+            peer_assessments = sorted(
+                (assessments[(learner.submission_uuid, scorer.student_id, PEER_TYPE)], scorer)
+                for scorer in learner.scorers
+            )
+            if learner.status == AssessmentWorkflow.STATUS.done and not learner.staff_graded:
+                scored = [assessment for assessment, __ in peer_assessments][:self.must_be_graded_by]
+                learner.score = sum(
+                    Assessment.get_median_score([selected[criterion_num] for __, selected in scored])
+                    for criterion_num in range(len(self.options))
+                )
+            else:
+                scored = []
+            items.extend(
+                PeerWorkflowItem(
+                    scorer_id=peer_workflow_ids[scorer.submission_uuid],
+                    author_id=peer_workflow_ids[learner.submission_uuid],
+                    submission_uuid=learner.submission_uuid,
+                    assessment_id=assessment[0],
+                    scored=assessment in scored,
+                )
+                for assessment, scorer in peer_assessments
+            )
+        PeerWorkflowItem.objects.bulk_create(items, batch_size=BATCH_SIZE)
+
+    def _create_staff_workflows(self, learners, submitted_at, assessments):
+        """
+        Create the staff workflows, which are closed for the learners graded by staff.
+        """
+        graded_at = now()
+        workflows = []
+        for learner in learners:
+            staff_assessment = assessments.get((learner.submission_uuid, self.staff_id, STAFF_TYPE))
+            workflows.append(StaffWorkflow(
+                course_id=self.course_id,
+                item_id=self.item_id,
+                submission_uuid=learner.submission_uuid,
+                created_at=submitted_at[learner.submission_uuid],
+                scorer_id=self.staff_id if staff_assessment else u"",
+                grading_started_at=graded_at if staff_assessment else None,
+                grading_completed_at=graded_at if staff_assessment else None,
+                assessment=unicode(staff_assessment[0]) if staff_assessment else None,
+            ))
+        StaffWorkflow.objects.bulk_create(workflows, batch_size=BATCH_SIZE)
+
+    def _create_scores(self, learners, student_item_ids, submission_ids, assessments):
+        """
+        Create the scores of the graded learners and their summaries,
+        annotating the staff scores like the workflow API.
+
+        Staff scores have priority over peer scores, which have
+        priority over self scores.
+        """
+        for learner in learners:
+            staff_assessment = assessments.get((learner.submission_uuid, self.staff_id, STAFF_TYPE))
+            if staff_assessment:
+                learner.score = sum(staff_assessment[1])
+            elif learner.status == AssessmentWorkflow.STATUS.done and 'peer' not in self.steps:
+                learner.score = sum(assessments[(learner.submission_uuid, learner.student_id, SELF_TYPE)][1])
+
+        graded = [learner for learner in learners if learner.score is not None]
+        Score.objects.bulk_create([
+            Score(
+                student_item_id=student_item_ids[learner.student_id],
+                submission_id=submission_ids[learner.submission_uuid],
+                points_earned=learner.score,
+                points_possible=self.points_possible,
+            )
+            for learner in graded
+        ], batch_size=BATCH_SIZE)
+        score_ids = dict(
+            Score.objects.filter(
+                student_item__course_id=self.course_id, student_item__item_id=self.item_id
+            ).values_list('student_item_id', 'id')
+        )
+        ScoreSummary.objects.bulk_create([
+            ScoreSummary(student_item_id=student_item_id, highest_id=score_id, latest_id=score_id)
+            for student_item_id, score_id in score_ids.iteritems()
+        ], batch_size=BATCH_SIZE)
+        ScoreAnnotation.objects.bulk_create([
+            ScoreAnnotation(
+                score_id=score_ids[student_item_ids[learner.student_id]],
+                annotation_type=AssessmentWorkflow.STAFF_ANNOTATION_TYPE,
+                creator=self.staff_id,
+                reason=u"A staff member has defined the score for this submission",
+            )
+            for learner in graded if learner.staff_graded
+        ], batch_size=BATCH_SIZE)
+
+    def _create_feedback(self, learners, assessments):
+        """
+        Create the feedback of some of the learners on the peer assessments they received.
+        """
+        commenters = [
+            learner for learner in learners
+            if learner.status == AssessmentWorkflow.STATUS.done and len(learner.scorers) >= self.must_be_graded_by
+            and self.rand.random() < PEER_FEEDBACK_FRACTION
+        ]
+        AssessmentFeedback.objects.bulk_create([
+            AssessmentFeedback(submission_uuid=learner.submission_uuid, feedback_text=self.rand.choice(self.feedbacks))
+            for learner in commenters
+        ], batch_size=BATCH_SIZE)
+
+        submission_uuids = [learner.submission_uuid for learner in commenters]
+        feedback_ids = {}
+        for start in xrange(0, len(submission_uuids), MAX_IDS_PER_QUERY):
+            feedback_ids.update(AssessmentFeedback.objects.filter(
+                submission_uuid__in=submission_uuids[start:start + MAX_IDS_PER_QUERY]
+            ).values_list('submission_uuid', 'id'))
+
+        through = AssessmentFeedback.assessments.through
+        through.objects.bulk_create([
+            through(
+                assessmentfeedback_id=feedback_ids[learner.submission_uuid],
+                assessment_id=assessments[(learner.submission_uuid, scorer.student_id, PEER_TYPE)][0],
+            )
+            for learner in commenters
+            for scorer in learner.scorers
+        ], batch_size=BATCH_SIZE)
@@ -1,11 +1,19 @@
 """
 Test utilities
 """
+import re
+from unittest import SkipTest
+
 from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase, TransactionTestCase
 from openassessment.assessment.models.ai import (
     CLASSIFIERS_CACHE_IN_MEM, CLASSIFIERS_CACHE_IN_FILE
 )
+from openassessment.assessment.api.student_training import TRAINING_SETS_CACHE_IN_MEM
+from openassessment.assessment.worker.classifier_cache import LOADED_CLASSIFIERS_CACHE
+from openassessment.fileupload.api import DOWNLOAD_URL_CACHE
+from openassessment.fileupload.backends import s3 as s3_backend
 
 
 def _clear_all_caches():
@@ -13,6 +21,10 @@ def _clear_all_caches():
     cache.clear()
     CLASSIFIERS_CACHE_IN_MEM.clear()
     CLASSIFIERS_CACHE_IN_FILE.clear()
+    TRAINING_SETS_CACHE_IN_MEM.clear()
+    LOADED_CLASSIFIERS_CACHE.clear()
+    s3_backend.clear_connections()
+    DOWNLOAD_URL_CACHE.reset_metrics()
 
 
 class CacheResetTest(TestCase):
@@ -39,3 +51,101 @@ class TransactionCacheResetTest(TransactionTestCase):
     def tearDown(self):
         super(TransactionCacheResetTest, self).tearDown()
         _clear_all_caches()
+
+
+class QueryPlanTest(CacheResetTest):
+    """
+    Test case that checks the query plans of the database for hot queries,
+    so that a query that stops using its indexes fails the tests.
+
+    Query plans are only checked with SQLite and MySQL.
+    """
+    # Table accesses in SQLite query plans, for example
+    # "SEARCH TABLE assessment_assessment USING INDEX assessment_assessment_idx (submission_uuid=?)"
+    SQLITE_ACCESS_PATTERN = re.compile(
+        r'^(?P<access>SEARCH|SCAN) (?:TABLE )?(?P<table>\w+)(?: AS \w+)?(?: USING (?:COVERING )?INDEX (?P<index>\w+))?'
+    )
+    # Plan steps that scan intermediate results rather than tables
+    SQLITE_NON_TABLES = ('SUBQUERY', 'CONSTANT')
+
+    def assert_uses_indexes(self, sql, params, expected_indexes):
+        """
+        Check that a query does not scan any table, and that it uses indexes on the given columns.
+
+        Args:
+            sql (unicode): The query, with placeholders for its parameters.
+            params (list): The parameters of the query.
+            expected_indexes (list of tuples): Each tuple is a table name followed by the
+                leading columns of an index of the table that the query must use.
+
+        Raises:
+            AssertionError
+            SkipTest: The database does not support checking query plans.
+
+        """
+        if connection.vendor == 'sqlite':
+            scans, used_indexes = self._sqlite_plan(sql, params)
+        elif connection.vendor == 'mysql':
+            scans, used_indexes = self._mysql_plan(sql, params)
+        else:
+            raise SkipTest(u"Query plans are not checked for {} databases".format(connection.vendor))
+
+        self.assertEqual(scans, [], u"The query scans {}: {}".format(u", ".join(scans), sql))
+        for expected in expected_indexes:
+            table, columns = expected[0], list(expected[1:])
+            indexed_columns = self._index_columns(table)
+            self.assertTrue(
+                any(
+                    indexed_columns.get(index, [])[:len(columns)] == columns
+                    for index in used_indexes
+                ),
+                u"The query does not use an index on {} of {}: {}".format(columns, table, sql)
+            )
+
+    def assert_queryset_uses_indexes(self, queryset, expected_indexes):
+        """
+        Check the query plan of a queryset, see `assert_uses_indexes`.
+        """
+        sql, params = queryset.query.sql_with_params()
+        self.assert_uses_indexes(sql, params, expected_indexes)
+
+    def _sqlite_plan(self, sql, params):
+        """
+        Return the tables that a query scans and the indexes that it uses, with SQLite.
+        """
+        scans, used_indexes = [], set()
+        cursor = connection.cursor()
+        cursor.execute(u"EXPLAIN QUERY PLAN " + sql, params)
+        for row in cursor.fetchall():
+            match = self.SQLITE_ACCESS_PATTERN.match(row[-1])
+            if match is None:
+                continue
+            # Scanning a table in the order of an index still reads the whole table
+            if match.group('access') == 'SCAN' and match.group('table') not in self.SQLITE_NON_TABLES:
+                scans.append(match.group('table'))
+            elif match.group('index'):
+                used_indexes.add(match.group('index'))
+        return scans, used_indexes
+
+    def _mysql_plan(self, sql, params):
+        """
+        Return the tables that a query scans and the indexes that it uses, with MySQL.
+        """
+        scans, used_indexes = [], set()
+        cursor = connection.cursor()
+        cursor.execute(u"EXPLAIN " + sql, params)
+        columns = [column[0] for column in cursor.description]
+        for row in cursor.fetchall():
+            row = dict(zip(columns, row))
+            if row['type'] == 'ALL':
+                scans.append(row['table'])
+            if row['key']:
+                used_indexes.add(row['key'])
+        return scans, used_indexes
+
+    def _index_columns(self, table):
+        """
+        Return a dict mapping the names of the indexes of a table to their columns.
+        """
+        constraints = connection.introspection.get_constraints(connection.cursor(), table)
+        return {name: constraint['columns'] for name, constraint in constraints.iteritems()}
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the archival of the assessment data of closed courses.
+"""
+import datetime
+from StringIO import StringIO
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DatabaseError, transaction
+from django.test.utils import override_settings
+from mock import patch
+import pytz
+
+from openassessment import archive
+from openassessment.assessment.api import peer as peer_api
+from openassessment.assessment.api import self as self_api
+from openassessment.assessment.api import staff as staff_api
+from openassessment.assessment.models import (
+    Assessment, AssessmentFeedback, AssessmentPart, PeerWorkflow, PeerWorkflowItem
+)
+from openassessment.assessment.test.constants import OPTIONS_SELECTED_DICT, RUBRIC
+from openassessment.data import CsvWriter, OraAggregateData
+from openassessment.test_utils import TransactionCacheResetTest
+from openassessment.workflow import api as workflow_api
+from openassessment.workflow.models import AssessmentWorkflow, AssessmentWorkflowStep
+from submissions import api as sub_api
+
+
+COURSE_ID = u"archived_course"
+OTHER_COURSE_ID = u"running_course"
+ITEM_ID = u"item"
+
+REQUIREMENTS = {
+    "peer": {"must_grade": 1, "must_be_graded_by": 1},
+    "self": {},
+}
+
+ARCHIVED_MODELS = [
+    AssessmentWorkflow, AssessmentWorkflowStep, PeerWorkflow, PeerWorkflowItem,
+    Assessment, AssessmentPart, AssessmentFeedback,
+]
+
+
+@override_settings(ORA2_ARCHIVE_DATABASE='archive')
+class ArchiveTest(TransactionCacheResetTest):
+    """
+    Test archiving courses and reading the archived data.
+    """
+    multi_db = True
+
+    def setUp(self):
+        super(ArchiveTest, self).setUp()
+        self.submission_uuids = self._create_course(COURSE_ID, 3)
+        self.other_submission_uuids = self._create_course(OTHER_COURSE_ID, 2)
+
+    def _create_course(self, course_id, num_students):
+        """
+        Create the submissions of the learners of a course, who all assess a peer and themselves,
+        with a staff assessment and feedback on the peer assessments of the first submission.
+        """
+        submission_uuids = []
+        for index in range(num_students):
+            student_item = {
+                'student_id': u"student_{}".format(index),
+                'course_id': course_id,
+                'item_id': ITEM_ID,
+                'item_type': 'openassessment',
+            }
+            submission = sub_api.create_submission(student_item, u"ẗëṡẗ äṅṡẅëṛ {}".format(index))
+            workflow_api.create_workflow(submission['uuid'], ['peer', 'self'])
+            submission_uuids.append(submission['uuid'])
+
+        for index, submission_uuid in enumerate(submission_uuids):
+            peer_api.get_submission_to_assess(submission_uuid, 1)
+            peer_api.create_assessment(
+                submission_uuid, u"student_{}".format(index), OPTIONS_SELECTED_DICT["most"]["options"],
+                {}, u"Peer feedback", RUBRIC, 1
+            )
+            self_api.create_assessment(
+                submission_uuid, u"student_{}".format(index), OPTIONS_SELECTED_DICT["few"]["options"],
+                {}, u"Self feedback", RUBRIC
+            )
+
+        staff_api.create_assessment(
+            submission_uuids[0], u"staff", OPTIONS_SELECTED_DICT["all"]["options"], {}, u"Staff feedback", RUBRIC
+        )
+        for submission_uuid in submission_uuids:
+            workflow_api.update_from_assessments(submission_uuid, REQUIREMENTS)
+        peer_api.set_assessment_feedback({
+            'submission_uuid': submission_uuids[0],
+            'feedback_text': u"Thanks",
+            'options': [u"These assessments were useful."],
+        })
+        return submission_uuids
+
+    def _read_submission(self, submission_uuid):
+        """
+        Read the data of a submission through the public APIs.
+        """
+        workflow = workflow_api.get_workflow_for_submission(submission_uuid, REQUIREMENTS)
+        report = staff_api.get_submission_report(submission_uuid)
+        return {
+            'status': workflow['status'],
+            'score': workflow['score'],
+            'status_details': workflow['status_details'],
+            'peer_assessments': [
+                (assessment['id'], assessment['points_earned'], assessment['feedback'])
+                for assessment in peer_api.get_assessments(submission_uuid)
+            ],
+            'median_scores': peer_api.get_assessment_median_scores(submission_uuid),
+            'max_scores': peer_api.get_rubric_max_scores(submission_uuid),
+            'feedback': peer_api.get_assessment_feedback(submission_uuid),
+            'self_assessment': self_api.get_assessment(submission_uuid)['points_earned'],
+            'self_scores': self_api.get_assessment_scores_by_criteria(submission_uuid),
+            'staff_assessment': (staff_api.get_latest_staff_assessment(submission_uuid) or {}).get('points_earned'),
+            'staff_scores': staff_api.get_assessment_scores_by_criteria(submission_uuid),
+            'submitted_assessments': [assessment['id'] for assessment in report['submitted_assessments']],
+        }
+
+    def _count(self, model, database):
+        """
+        Count the rows of a model in a database.
+        """
+        return model.objects.using(database).count()
+
+    def test_archive_course(self):
+        before = {uuid: self._read_submission(uuid) for uuid in self.submission_uuids}
+        counts = {model: self._count(model, 'default') for model in ARCHIVED_MODELS}
+
+        num_archived = archive.archive_course(COURSE_ID, batch_size=1)
+        self.assertEqual(num_archived, 3)
+
+        # The data of the course moved to the archive
+        self.assertFalse(AssessmentWorkflow.objects.filter(course_id=COURSE_ID).exists())
+        self.assertFalse(PeerWorkflow.objects.filter(course_id=COURSE_ID).exists())
+        self.assertFalse(Assessment.objects.filter(submission_uuid__in=self.submission_uuids).exists())
+        self.assertFalse(AssessmentFeedback.objects.filter(submission_uuid__in=self.submission_uuids).exists())
+        for model in ARCHIVED_MODELS:
+            self.assertEqual(
+                self._count(model, 'default') + self._count(model, 'archive'), counts[model], model.__name__
+            )
+
+        # The read APIs return the same data from the archive
+        for submission_uuid in self.submission_uuids:
+            self.assertEqual(self._read_submission(submission_uuid), before[submission_uuid])
+
+        # The other course was not archived
+        self.assertEqual(AssessmentWorkflow.objects.filter(course_id=OTHER_COURSE_ID).count(), 2)
+        self.assertFalse(AssessmentWorkflow.objects.using('archive').filter(course_id=OTHER_COURSE_ID).exists())
+
+    def test_running_courses_do_not_read_archive(self):
+        self.assertEqual(archive.archived_course_ids(), frozenset())
+        archive.archive_course(COURSE_ID)
+
+        # Archiving forgets the cached IDs of the archived courses
+        self.assertEqual(archive.archived_course_ids(), frozenset([COURSE_ID]))
+        with self.assertNumQueries(0, using='archive'):
+            self.assertEqual(archive.archived_course_ids(), frozenset([COURSE_ID]))
+
+            # The submissions of running courses without assessments or feedback are not looked up in the archive
+            self.assertIsNone(staff_api.get_latest_staff_assessment(self.other_submission_uuids[1]))
+            self.assertIsNone(peer_api.get_assessment_feedback(self.other_submission_uuids[1]))
+            self.assertIsNone(self_api.get_assessment(u"missing_submission"))
+
+        self.assertIsNotNone(staff_api.get_latest_staff_assessment(self.submission_uuids[0]))
+
+    def test_archive_keeps_modification_times(self):
+        modified = dict(AssessmentWorkflow.objects.filter(course_id=COURSE_ID).values_list('id', 'modified'))
+        archive.archive_course(COURSE_ID)
+        self.assertEqual(
+            dict(AssessmentWorkflow.objects.using('archive').values_list('id', 'modified')), modified
+        )
+
+    def test_archived_workflows_read_only(self):
+        archive.archive_course(COURSE_ID)
+        with patch.object(AssessmentWorkflow, 'update_from_assessments') as mock_update:
+            workflow = workflow_api.get_workflow_for_submission(self.submission_uuids[0], REQUIREMENTS)
+            self.assertFalse(mock_update.called)
+        self.assertEqual(workflow['status'], 'done')
+
+    def test_resume_interrupted_archival(self):
+        before = self._read_submission(self.submission_uuids[1])
+        counts = {model: self._count(model, 'default') for model in ARCHIVED_MODELS}
+        atomic = transaction.atomic
+
+        def fail_removal(using=None, savepoint=True):
+            """
+            Fail to remove the archived data from the primary database.
+            """
+            if using is None:
+                raise DatabaseError(u"Connection lost")
+            return atomic(using, savepoint)
+
+        with patch.object(archive.transaction, 'atomic', side_effect=fail_removal):
+            with self.assertRaises(DatabaseError):
+                archive.archive_course(COURSE_ID, batch_size=2)
+
+        # The copied data is still read from the primary database, where it can change
+        self.assertEqual(self._read_submission(self.submission_uuids[1]), before)
+        AssessmentFeedback.objects.filter(submission_uuid=self.submission_uuids[0]).update(feedback_text=u"Updated")
+
+        self.assertEqual(archive.archive_course(COURSE_ID, batch_size=2), 3)
+        for model in ARCHIVED_MODELS:
+            self.assertEqual(
+                self._count(model, 'default') + self._count(model, 'archive'), counts[model], model.__name__
+            )
+        self.assertEqual(self._read_submission(self.submission_uuids[1]), before)
+        self.assertEqual(peer_api.get_assessment_feedback(self.submission_uuids[0])['feedback_text'], u"Updated")
+
+    def test_find_closed_courses(self):
+        AssessmentWorkflow.objects.filter(course_id=COURSE_ID).update(
+            modified=datetime.datetime(2015, 1, 1, tzinfo=pytz.UTC)
+        )
+        self.assertEqual(archive.find_closed_courses(datetime.datetime(2016, 1, 1, tzinfo=pytz.UTC)), [COURSE_ID])
+        self.assertEqual(archive.find_closed_courses(datetime.datetime(2014, 1, 1, tzinfo=pytz.UTC)), [])
+
+    def test_export_archived_course(self):
+        output_streams = {'assessment': StringIO(), 'submission': StringIO()}
+        CsvWriter(output_streams).write_to_csv(COURSE_ID)
+        headers, rows = OraAggregateData.collect_ora2_data(COURSE_ID)
+        responses = OraAggregateData.collect_ora2_responses(COURSE_ID)
+
+        archive.archive_course(COURSE_ID)
+
+        archived_streams = {'assessment': StringIO(), 'submission': StringIO()}
+        CsvWriter(archived_streams).write_to_csv(COURSE_ID)
+        for name, stream in output_streams.iteritems():
+            self.assertEqual(
+                sorted(archived_streams[name].getvalue().splitlines()), sorted(stream.getvalue().splitlines())
+            )
+        self.assertEqual(len(output_streams['assessment'].getvalue().splitlines()), 8)
+        self.assertEqual(OraAggregateData.collect_ora2_data(COURSE_ID), (headers, rows))
+        self.assertEqual(OraAggregateData.collect_ora2_responses(COURSE_ID), responses)
+
+    @override_settings(ORA2_ARCHIVE_DATABASE=None)
+    def test_archive_not_configured(self):
+        with self.assertRaises(ImproperlyConfigured):
+            archive.archive_course(COURSE_ID)
+        self.assertEqual(AssessmentWorkflow.objects.filter(course_id=COURSE_ID).count(), 3)
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+Tests that importing the XBlock doesn't import the modules that are only needed on first use.
+"""
+import os
+import subprocess
+import sys
+
+from django.test import TestCase
+
+
+SCRIPT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'scripts', 'import_time.py'
+)
+
+
+class ImportTimeTest(TestCase):
+    """
+    Run the import-time benchmark in a fresh process.
+    """
+
+    def _run(self, *args):
+        """
+        Run the benchmark, returning its exit code and report.
+        """
+        process = subprocess.Popen(
+            [sys.executable, SCRIPT] + list(args), stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        _, report = process.communicate()
+        return process.returncode, report
+
+    def test_lazy_imports(self):
+        returncode, report = self._run()
+        self.assertEqual(returncode, 0, report)
+        self.assertIn("| openassessment.xblock.openassessmentblock\n", report)
+        self.assertNotIn("boto", report)
+
+    def test_forbidden_import(self):
+        returncode, report = self._run('--forbid', 'openassessment.xblock.openassessmentblock')
+        self.assertEqual(returncode, 1)
+        self.assertIn("should be imported lazily: openassessment.xblock.openassessmentblock", report)
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the database router that sends the reads of replica-safe code to the read replica.
+"""
+from django.core.signals import request_started
+from django.test.utils import override_settings
+
+from openassessment import routers
+from openassessment.routers import forget_writes, replica_safe
+from openassessment.test_utils import TransactionCacheResetTest
+from openassessment.workflow import api as workflow_api
+from openassessment.workflow.models import AssessmentWorkflow, AssessmentWorkflowStep
+
+
+COURSE_ID = u"test_course"
+ITEM_ID = u"test_item"
+
+
+@override_settings(
+    DATABASE_ROUTERS=['openassessment.routers.ReadReplicaRouter'],
+    ORA2_READ_REPLICA_DATABASE='lagging_replica',
+)
+class ReadReplicaRouterTest(TransactionCacheResetTest):
+    """
+    Test routing reads to a replica which doesn't have the data of the primary database.
+    """
+    multi_db = True
+
+    def setUp(self):
+        super(ReadReplicaRouterTest, self).setUp()
+        self.primary_workflow = self._create_workflow(u"primary_uuid", 'default')
+        self.replica_workflow = self._create_workflow(u"replica_uuid", 'lagging_replica')
+        forget_writes()
+
+    def _create_workflow(self, submission_uuid, database):
+        """
+        Create a workflow in a database, with its peer step.
+        """
+        workflow = AssessmentWorkflow.objects.using(database).create(
+            submission_uuid=submission_uuid, status='peer', course_id=COURSE_ID, item_id=ITEM_ID
+        )
+        AssessmentWorkflowStep.objects.using(database).create(workflow=workflow, name='peer', order_num=0)
+        return workflow
+
+    def _read_uuids(self):
+        """
+        Read the submission UUIDs of the workflows of the default database for reads.
+        """
+        return list(AssessmentWorkflow.objects.values_list('submission_uuid', flat=True))
+
+    def test_read_from_primary(self):
+        self.assertEqual(self._read_uuids(), [u"primary_uuid"])
+
+    def test_context_manager(self):
+        with replica_safe():
+            self.assertEqual(self._read_uuids(), [u"replica_uuid"])
+        self.assertEqual(self._read_uuids(), [u"primary_uuid"])
+
+    def test_decorator(self):
+        self.assertEqual(replica_safe(self._read_uuids)(), [u"replica_uuid"])
+        self.assertEqual(replica_safe()(self._read_uuids)(), [u"replica_uuid"])
+        self.assertEqual(self._read_uuids.__name__, replica_safe(self._read_uuids).__name__)
+
+    def test_nested(self):
+        with replica_safe():
+            with replica_safe():
+                self.assertEqual(self._read_uuids(), [u"replica_uuid"])
+            self.assertEqual(self._read_uuids(), [u"replica_uuid"])
+        self.assertEqual(self._read_uuids(), [u"primary_uuid"])
+
+    def test_read_from_primary_after_write(self):
+        with replica_safe():
+            AssessmentWorkflow.objects.filter(submission_uuid=u"primary_uuid").update(status='done')
+            self.assertEqual(self._read_uuids(), [u"primary_uuid"])
+
+        # The next request reads from the replica again
+        request_started.send(sender=None)
+        with replica_safe():
+            self.assertEqual(self._read_uuids(), [u"replica_uuid"])
+
+    def test_related_models_read_from_instance_database(self):
+        with replica_safe():
+            workflow = AssessmentWorkflow.objects.get(submission_uuid=u"replica_uuid")
+            self.assertEqual(workflow.steps.get().name, 'peer')
+        self.assertEqual(self.primary_workflow.steps.get().name, 'peer')
+
+    @override_settings(ORA2_READ_REPLICA_DATABASE='missing_replica')
+    def test_replica_not_configured(self):
+        self.assertIs(routers.read_replica_database(), None)
+        with replica_safe():
+            self.assertEqual(self._read_uuids(), [u"primary_uuid"])
+
+    def test_status_counts_read_from_replica(self):
+        self._create_workflow(u"other_replica_uuid", 'lagging_replica')
+        forget_writes()
+        counts = workflow_api.get_status_counts(COURSE_ID, ITEM_ID, ['peer'])
+        self.assertEqual(counts[0], {"status": "Peer Assessment", "count": 2})
@@ -2,14 +2,22 @@
 Public interface for the Assessment Workflow.
 
 """
+from collections import defaultdict
 import logging
 
 from django.db import DatabaseError
+from django.db.models import Count
 
+from openassessment.archive import archive_database, in_archived_course, is_archived
 from openassessment.assessment.errors import PeerAssessmentError, PeerAssessmentInternalError
+from openassessment.routers import replica_safe
 from submissions import api as sub_api
-from .models import AssessmentWorkflow, AssessmentWorkflowCancellation
-from .serializers import AssessmentWorkflowSerializer, AssessmentWorkflowCancellationSerializer
+from submissions.models import Submission
+from . import leaderboard
+from .models import AssessmentWorkflow, AssessmentWorkflowCancellation, AssessmentWorkflowStep, WorkflowRow
+from .serializers import (
+    AssessmentWorkflowSerializer, AssessmentWorkflowCancellationSerializer, UnscoredAssessmentWorkflowSerializer
+)
 from .errors import (
     AssessmentWorkflowError, AssessmentWorkflowInternalError,
     AssessmentWorkflowRequestError, AssessmentWorkflowNotFoundError
@@ -260,6 +268,9 @@ def update_from_assessments(submission_uuid, assessment_requirements, override_s
 
     """
     workflow = _get_workflow_model(submission_uuid)
+    if is_archived(workflow):
+        # Archived workflows are read-only
+        return _serialized_with_details(workflow)
 
     try:
         workflow.update_from_assessments(assessment_requirements, override_submitter_requirements)
@@ -274,6 +285,7 @@ def update_from_assessments(submission_uuid, assessment_requirements, override_s
         raise AssessmentWorkflowInternalError(err_msg)
 
 
+@replica_safe
 def get_status_counts(course_id, item_id, steps):
     """
     Count how many workflows have each status, for a given item in a course.
@@ -300,25 +312,151 @@ def get_status_counts(course_id, item_id, steps):
     # the AI status, so we should never return it.
     statuses = steps + AssessmentWorkflow.STATUSES
     if 'ai' in statuses: statuses.remove('ai')
+
+    # Count the workflows of every status with a single query
+    counts = dict(
+        AssessmentWorkflow.objects.filter(
+            course_id=course_id,
+            item_id=item_id,
+        ).values_list('status').annotate(count=Count('id')).order_by()
+    )
     return [
         {
             "status": AssessmentWorkflow.STATUS_VERBOSE_NAMES.get(status, status),
-            "count": AssessmentWorkflow.objects.filter(
-                status=status,
-                course_id=course_id,
-                item_id=item_id,
-            ).count()
+            "count": counts.get(status, 0)
         }
         for status in statuses
     ]
 
 
+def get_workflows_for_student(course_id, student_id, assessment_requirements=None, update=True):
+    """
+    Retrieve the workflows of the latest submissions of a student
+    to every item in a course, for example for a progress page.
+
+    The workflows, their steps and their scores are loaded with a few bulk
+    queries, whatever the number of items.  Unless `update` is False, each
+    workflow is first updated from the assessments, like `get_workflow_for_submission`
+    does, which queries the assessment APIs for every item.
+
+    Args:
+        course_id (unicode): The ID of the course.
+        student_id (unicode): The anonymous ID of the student.
+
+    Keyword Arguments:
+        assessment_requirements (dict): Maps item IDs to the assessment requirements
+            of the items, as passed to `update_from_assessments`.  Items without
+            requirements are updated with None requirements.
+        update (bool): If False, return the last persisted state of the workflows.
+
+    Returns:
+        dict mapping item IDs to workflow information, in the format returned by
+            `get_workflow_for_submission`.  Scores do not include annotations.
+
+    Raises:
+        AssessmentWorkflowInternalError: Unexpected internal error.
+
+    """
+    if assessment_requirements is None:
+        assessment_requirements = {}
+
+    try:
+        # Submissions are ordered from the most recent
+        latest_submissions = {}
+        for submission_uuid, item_id in Submission.objects.filter(
+            student_item__course_id=course_id,
+            student_item__student_id=student_id,
+        ).values_list('uuid', 'student_item__item_id'):
+            latest_submissions.setdefault(item_id, submission_uuid)
+
+        workflows = AssessmentWorkflow.objects.filter(
+            course_id=course_id,
+            submission_uuid__in=latest_submissions.values()
+        )
+        if update:
+            workflows = list(workflows)
+            for workflow in workflows:
+                workflow.update_from_assessments(assessment_requirements.get(workflow.item_id))
+        else:
+            # Workflows that aren't updated are only read, so they're read as rows
+            workflows = WorkflowRow.fetch(workflows)
+
+        steps_by_workflow = defaultdict(list)
+        for step in AssessmentWorkflowStep.objects.filter(
+            workflow__in=[workflow.id for workflow in workflows],
+            name__in=AssessmentWorkflow.STEPS
+        ):
+            steps_by_workflow[step.workflow_id].append(step)
+
+        scores = sub_api.get_scores(course_id, student_id)
+    except (DatabaseError, sub_api.SubmissionError) as exc:
+        err_msg = (
+            u"Could not get the assessment workflows of student {} in course {} due to error: {}"
+        ).format(student_id, course_id, exc)
+        logger.exception(err_msg)
+        raise AssessmentWorkflowInternalError(err_msg)
+
+    workflows_by_item = {}
+    for workflow in workflows:
+        score = scores.get(workflow.item_id)
+        is_scored = (
+            workflow.status == AssessmentWorkflow.STATUS.done and
+            score is not None and unicode(score['submission_uuid']) == workflow.submission_uuid
+        )
+        workflow_dict = UnscoredAssessmentWorkflowSerializer(workflow).data
+        workflow_dict['score'] = score if is_scored else None
+        workflow_dict['status_details'] = {
+            step.name: {
+                "complete": step.is_submitter_complete(),
+                "graded": step.is_assessment_complete(),
+            }
+            for step in steps_by_workflow[workflow.id]
+        }
+        workflows_by_item[workflow.item_id] = workflow_dict
+    return workflows_by_item
+
+
+def get_leaderboard(course_id, item_id, item_type, number_of_top_scores):
+    """
+    Retrieve the top scores of an item from its materialized leaderboard.
+
+    Args:
+        course_id (unicode): The course of the item.
+        item_id (unicode): The item.
+        item_type (unicode): The type of the item.
+        number_of_top_scores (int): The number of scores to return.
+
+    Returns:
+        list of dict with keys 'score', 'content', 'file_keys' and 'files_descriptions',
+            ordered from the highest score.
+
+    Raises:
+        SubmissionError: The top submissions could not be retrieved.
+
+    """
+    return leaderboard.get_leaderboard(course_id, item_id, item_type, number_of_top_scores)
+
+
+def invalidate_leaderboard(course_id, item_id):
+    """
+    Forget the materialized leaderboard of an item, so that it is built again
+    the next time it is read.  Used when scores are reset outside of the workflow.
+
+    Args:
+        course_id (unicode): The course of the item.
+        item_id (unicode): The item.
+
+    """
+    leaderboard.invalidate(course_id, item_id)
+
+
 def _get_workflow_model(submission_uuid):
     """Return the `AssessmentWorkflow` model for a given `submission_uuid`.
 
     This method will raise the appropriate `AssessmentWorkflowError` while
     trying to fetch the model object. This method assumes the object already
-    exists and will not attempt to create one.
+    exists and will not attempt to create one.  Workflows of archived courses
+    that are not in the primary database are looked up in the archive.
 
     Args:
         submission_uuid (str): Identifier for the submission the
@@ -346,6 +484,10 @@ def _get_workflow_model(submission_uuid):
 
     try:
         workflow = AssessmentWorkflow.get_by_submission_uuid(submission_uuid)
+        if workflow is None and in_archived_course(submission_uuid):
+            workflow = AssessmentWorkflow.objects.using(archive_database()).filter(
+                submission_uuid=submission_uuid
+            ).first()
     except AssessmentWorkflowError as exc:
         raise AssessmentWorkflowInternalError(repr(exc))
     except Exception as exc:
@@ -0,0 +1,190 @@
+"""
+Materialized leaderboards of the top scores of each item.
+
+The leaderboard of an item is built from the top submissions once, with the
+files of every entry already extracted from the submissions, and is kept in
+the cache until a workflow publishes a score that could change it.  Rendering
+the leaderboard is then a single cache read.
+
+Publishing a score bumps the version of the leaderboard of the item, and a
+leaderboard is only used if it was built at the current version, so that a
+leaderboard built while a score was published is never kept.
+"""
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from dogapi import dog_stats_api
+
+from submissions import api as sub_api
+
+
+logger = logging.getLogger(__name__)
+
+# Time (in seconds) to keep a leaderboard.  Leaderboards are invalidated when
+# workflows publish scores, so this only bounds how long scores set outside
+# of the workflows (for example when staff reset a learner's state) go unnoticed.
+DEFAULT_LEADERBOARD_CACHE_TIMEOUT = 60 * 60
+
+
+def get_leaderboard(course_id, item_id, item_type, number_of_top_scores):
+    """
+    Retrieve the top scores of an item, building its leaderboard if it is not materialized.
+
+    Args:
+        course_id (unicode): The course of the item.
+        item_id (unicode): The item.
+        item_type (unicode): The type of the item.
+        number_of_top_scores (int): The number of scores to return.
+
+    Returns:
+        list of dict, ordered from the highest score, with keys:
+            'score' (int): The points earned.
+            'content': The answer of the submission.
+            'file_keys' (list of unicode): The keys of the files of the submission.
+            'files_descriptions' (list of unicode): The descriptions of the files.
+
+    Raises:
+        SubmissionError: The top submissions could not be retrieved.
+
+    """
+    leaderboard, version = _get_current(course_id, item_id)
+    if leaderboard is None or leaderboard['size'] < number_of_top_scores:
+        dog_stats_api.increment('openassessment.workflow.leaderboard.miss')
+        if version is None:
+            version = _start_version(course_id, item_id)
+        # Leaderboards are kept until the next score is published,
+        # so they are built from the primary database.
+        top_submissions = sub_api.get_top_submissions(
+            course_id, item_id, item_type, number_of_top_scores, use_cache=False, read_replica=False
+        )
+        # If a score is published meanwhile, the version changes and this leaderboard is not used
+        leaderboard = {
+            'size': number_of_top_scores,
+            'version': version,
+            'entries': [_create_entry(top['score'], top['content']) for top in top_submissions],
+        }
+        cache.set(_cache_key(course_id, item_id), leaderboard, _timeout())
+    else:
+        dog_stats_api.increment('openassessment.workflow.leaderboard.hit')
+    return [dict(entry) for entry in leaderboard['entries'][:number_of_top_scores]]
+
+
+def publish_score(course_id, item_id, points_earned):
+    """
+    Update the leaderboard of an item after a score has been published.
+
+    The leaderboard is only rebuilt if the score could enter it: it has
+    free places or the score is at least as high as its lowest score.  If
+    there is no current leaderboard, one may be being built, so its version
+    is bumped anyway.
+
+    Args:
+        course_id (unicode): The course of the item.
+        item_id (unicode): The item.
+        points_earned (int): The points of the published score.
+
+    """
+    if points_earned <= 0:
+        return
+
+    leaderboard, __ = _get_current(course_id, item_id)
+    if leaderboard is None:
+        _bump_version(course_id, item_id)
+        return
+
+    entries = leaderboard['entries']
+    if len(entries) < leaderboard['size'] or points_earned >= entries[-1]['score']:
+        invalidate(course_id, item_id)
+
+
+def invalidate(course_id, item_id):
+    """
+    Forget the leaderboard of an item, for example when a score is overridden or reset,
+    which can remove an entry from the leaderboard.
+    """
+    _bump_version(course_id, item_id)
+    cache.delete(_cache_key(course_id, item_id))
+
+
+def _get_current(course_id, item_id):
+    """
+    Read the leaderboard of an item and its version with a single cache read.
+
+    Returns:
+        tuple of the leaderboard (dict), or None if there is none at the current version,
+        and the current version (int), or None if it is not known.
+
+    """
+    cache_key, version_key = _cache_key(course_id, item_id), _version_key(course_id, item_id)
+    values = cache.get_many([cache_key, version_key])
+    leaderboard, version = values.get(cache_key), values.get(version_key)
+    if leaderboard is None or version is None or leaderboard.get('version') != version:
+        return None, version
+    return leaderboard, version
+
+
+def _start_version(course_id, item_id):
+    """
+    Return the version of the leaderboard of an item, starting one if it is not known.
+
+    Versions start from the current time, so that a leaderboard built before
+    the version was evicted from the cache never matches the new version.
+    """
+    version_key = _version_key(course_id, item_id)
+    cache.add(version_key, int(time.time() * 1000), None)
+    return cache.get(version_key)
+
+
+def _bump_version(course_id, item_id):
+    """
+    Change the version of the leaderboard of an item, so that the leaderboards
+    built at the previous version are not used.
+    """
+    try:
+        cache.incr(_version_key(course_id, item_id))
+    except ValueError:
+        # The version is not known, so no leaderboard matches it
+        _start_version(course_id, item_id)
+
+
+def _create_entry(score, content):
+    """
+    Create a leaderboard entry, extracting the files from the submission.
+    """
+    file_keys, descriptions = [], []
+    if isinstance(content, dict):
+        if 'file_keys' in content:
+            file_keys = content.get('file_keys', [])
+            descriptions = content.get('files_descriptions', [])
+        elif 'file_key' in content:
+            file_keys = [content['file_key']]
+    return {
+        'score': score,
+        'content': content,
+        'file_keys': file_keys,
+        'files_descriptions': descriptions,
+    }
+
+
+def _cache_key(course_id, item_id):
+    """
+    Return the cache key of the leaderboard of an item.  Item IDs are unique,
+    so the type of the item is not part of the key.
+    """
+    return u"workflow.leaderboard.{course}.{item}".format(course=course_id, item=item_id)
+
+
+def _version_key(course_id, item_id):
+    """
+    Return the cache key of the version of the leaderboard of an item.
+    """
+    return u"workflow.leaderboard.version.{course}.{item}".format(course=course_id, item=item_id)
+
+
+def _timeout():
+    """
+    Return the time (in seconds) to keep leaderboards.
+    """
+    return getattr(settings, 'ORA2_LEADERBOARD_CACHE_TIMEOUT', DEFAULT_LEADERBOARD_CACHE_TIMEOUT)
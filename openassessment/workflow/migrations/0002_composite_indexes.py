@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+# pylint: skip-file
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workflow', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterIndexTogether(
+            name='assessmentworkflow',
+            index_together=set([('course_id', 'item_id', 'status')]),
+        ),
+    ]
@@ -9,6 +9,7 @@ need to then generate a matching migration for it using:
     ./manage.py schemamigration openassessment.workflow --auto
 
 """
+from collections import namedtuple
 import logging
 import importlib
 from django.conf import settings
@@ -22,6 +23,8 @@ from model_utils.models import StatusModel, TimeStampedModel
 from submissions import api as sub_api
 from openassessment.assessment.errors.base import AssessmentError
 from openassessment.assessment.signals import assessment_complete_signal
+from openassessment.rows import Row
+from . import leaderboard
 from .errors import AssessmentApiLoadError, AssessmentWorkflowError, AssessmentWorkflowInternalError
 
 
@@ -108,21 +111,10 @@ class AssessmentWorkflow(TimeStampedModel, StatusModel):
 
     class Meta:
         ordering = ["-created"]
-        # TODO: In migration, need a non-unique index on (course_id, item_id, status)
-
-    def __init__(self, *args, **kwargs):
-        super(AssessmentWorkflow, self).__init__(*args, **kwargs)
-        if 'staff' not in AssessmentWorkflow.STEPS:
-            new_list = ['staff']
-            new_list.extend(AssessmentWorkflow.STEPS)
-            AssessmentWorkflow.STEPS = new_list
-            AssessmentWorkflow.STATUS_VALUES = AssessmentWorkflow.STEPS + AssessmentWorkflow.STATUSES
-            AssessmentWorkflow.STATUS = Choices(*AssessmentWorkflow.STATUS_VALUES)
-
-        if 'staff' not in AssessmentWorkflow.ASSESSMENT_SCORE_PRIORITY:
-            new_list = ['staff']
-            new_list.extend(AssessmentWorkflow.ASSESSMENT_SCORE_PRIORITY)
-            AssessmentWorkflow.ASSESSMENT_SCORE_PRIORITY = new_list
+        # Counting the workflows of an item by status
+        index_together = [
+            ("course_id", "item_id", "status"),
+        ]
 
     @classmethod
     @transaction.atomic
@@ -460,6 +452,8 @@ class AssessmentWorkflow(TimeStampedModel, StatusModel):
             annotation_type=self.STAFF_ANNOTATION_TYPE,
             annotation_reason=reason
         )
+        # An override can lower a score that is on the leaderboard
+        leaderboard.invalidate(self.course_id, self.item_id)
 
     def set_score(self, score):
         """
@@ -479,6 +473,7 @@ class AssessmentWorkflow(TimeStampedModel, StatusModel):
                 score["points_earned"],
                 score["points_possible"]
             )
+            leaderboard.publish_score(self.course_id, self.item_id, score["points_earned"])
 
     def staff_score_exists(self):
         """
@@ -616,6 +611,35 @@ class AssessmentWorkflow(TimeStampedModel, StatusModel):
         return self.cancellations.exists()
 
 
+def _add_staff_step():
+    """
+    Add the staff step, which every workflow has, to the steps and
+    score priorities of the workflows, whatever the settings are.
+
+    This is done once the model is created, so that the choices
+    of the status field (and the migrations) don't include it.
+    """
+    if 'staff' not in AssessmentWorkflow.STEPS:
+        AssessmentWorkflow.STEPS = ['staff'] + AssessmentWorkflow.STEPS
+        AssessmentWorkflow.STATUS_VALUES = AssessmentWorkflow.STEPS + AssessmentWorkflow.STATUSES
+        AssessmentWorkflow.STATUS = Choices(*AssessmentWorkflow.STATUS_VALUES)
+
+    if 'staff' not in AssessmentWorkflow.ASSESSMENT_SCORE_PRIORITY:
+        AssessmentWorkflow.ASSESSMENT_SCORE_PRIORITY = ['staff'] + AssessmentWorkflow.ASSESSMENT_SCORE_PRIORITY
+
+
+_add_staff_step()
+
+
+class WorkflowRow(Row, namedtuple('WorkflowRow', [
+    'id', 'uuid', 'submission_uuid', 'course_id', 'item_id', 'status', 'created', 'modified',
+])):
+    """
+    Read-only record of the fields of an `AssessmentWorkflow`, for reads of many workflows.
+    """
+    __slots__ = ()
+
+
 class AssessmentWorkflowStep(models.Model):
     """An individual step in the overall workflow process.
 
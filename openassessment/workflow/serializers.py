@@ -23,6 +23,23 @@ class AssessmentWorkflowSerializer(serializers.ModelSerializer):
         )
 
 
+class UnscoredAssessmentWorkflowSerializer(serializers.ModelSerializer):
+    """
+    Serialize an `AssessmentWorkflow` model without looking up its score,
+    for callers that retrieve the scores of many workflows at once.
+    """
+
+    class Meta:
+        model = AssessmentWorkflow
+        fields = (
+            'uuid',
+            'submission_uuid',
+            'status',
+            'created',
+            'modified',
+        )
+
+
 class AssessmentWorkflowCancellationSerializer(serializers.ModelSerializer):
     """
     Serialize a `AssessmentWorkflowCancellation` model.
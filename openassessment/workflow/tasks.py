@@ -0,0 +1,64 @@
+"""
+Asynchronous tasks for updating assessment workflows.
+"""
+from celery import task
+from celery.utils.log import get_task_logger
+from django.conf import settings
+from dogapi import dog_stats_api
+
+from openassessment.workflow import api as workflow_api
+from openassessment.workflow.errors import AssessmentWorkflowError
+
+MAX_RETRIES = 2
+
+logger = get_task_logger(__name__)
+
+# Workflow updates scheduled for bulk operations are not time critical.
+# If the Django settings define a low-priority queue, use that.
+# Otherwise, use the default queue.
+UPDATE_WORKFLOWS_TASK_QUEUE = getattr(settings, 'LOW_PRIORITY_QUEUE', None)
+
+
+@task(queue=UPDATE_WORKFLOWS_TASK_QUEUE, max_retries=MAX_RETRIES)  # pylint: disable=E1102
+@dog_stats_api.timed('openassessment.workflow.update_workflows.time')
+def update_workflows(submission_uuids, assessment_requirements=None, override_submitter_requirements=False):
+    """
+    Update the assessment workflows of many submissions, for example
+    after staff assessments were created for them in bulk.
+
+    If any of the workflows could not be updated, the task is retried
+    for those workflows only.
+
+    Args:
+        submission_uuids (list of str): The submissions whose workflows should be updated.
+
+    Keyword Arguments:
+        assessment_requirements (dict): See `workflow_api.update_from_assessments`.
+        override_submitter_requirements (bool): See `workflow_api.update_from_assessments`.
+
+    Returns:
+        None
+
+    """
+    failed_uuids = []
+    for submission_uuid in submission_uuids:
+        try:
+            workflow_api.update_from_assessments(
+                submission_uuid,
+                assessment_requirements,
+                override_submitter_requirements=override_submitter_requirements
+            )
+        except AssessmentWorkflowError:
+            logger.exception(
+                u"An error occurred while updating the workflow for submission {}".format(submission_uuid)
+            )
+            failed_uuids.append(submission_uuid)
+
+    if failed_uuids:
+        raise update_workflows.retry(
+            args=[failed_uuids],
+            kwargs={
+                'assessment_requirements': assessment_requirements,
+                'override_submitter_requirements': override_submitter_requirements,
+            }
+        )
@@ -370,12 +370,13 @@ class TestAssessmentWorkflowApi(CacheResetTest):
         self._create_workflow_with_status("user 10", "test/1/1", "peer-problem", "done")
         self._create_workflow_with_status("user 11", "test/1/1", "peer-problem", "cancelled")
 
-        # Now the counts should be updated
-        counts = workflow_api.get_status_counts(
-            "test/1/1",
-            "peer-problem",
-            ["ai", "training", "peer", "self"]
-        )
+        # Now the counts should be updated, with a single query
+        with self.assertNumQueries(1):
+            counts = workflow_api.get_status_counts(
+                "test/1/1",
+                "peer-problem",
+                ["ai", "training", "peer", "self"]
+            )
         self._assert_counts_equal_raw(counts, [
             {"status": "training", "count": 1},
             {"status": "peer", "count": 1},
@@ -536,6 +537,53 @@ class TestAssessmentWorkflowApi(CacheResetTest):
         workflow = workflow_api.get_assessment_workflow_cancellation(submission["uuid"])
         self.assertIsNotNone(workflow)
 
+    def test_get_workflows_for_student(self):
+        # The first submission to an item is replaced by the second one
+        self._create_workflow_with_status("user 1", "test/1/1", "item 1", "self", steps=["self"])
+        _, self_sub = self._create_workflow_with_status("user 1", "test/1/1", "item 1", "self", steps=["self"])
+        _, done_sub = self._create_workflow_with_status("user 1", "test/1/1", "item 2", "done", steps=["self"])
+        sub_api.set_score(done_sub['uuid'], 8, 10)
+
+        # Workflows of other students and courses are ignored
+        self._create_workflow_with_status("user 2", "test/1/1", "item 1", "self", steps=["self"])
+        self._create_workflow_with_status("user 1", "test/2/2", "item 1", "self", steps=["self"])
+
+        # The learner self-assesses, but the persisted state is not updated
+        self_api.create_assessment(self_sub['uuid'], "user 1", {"secret": "yes"}, {}, "", RUBRIC_DICT)
+        with self.assertNumQueries(4):
+            workflows = workflow_api.get_workflows_for_student("test/1/1", "user 1", update=False)
+        self.assertEqual(sorted(workflows.keys()), ["item 1", "item 2"])
+        self.assertEqual(workflows["item 1"]["submission_uuid"], self_sub['uuid'])
+        self.assertEqual(workflows["item 1"]["status"], "self")
+        self.assertIsNone(workflows["item 1"]["score"])
+        self.assertEqual(workflows["item 2"]["status"], "done")
+        self.assertEqual(workflows["item 2"]["score"]["points_earned"], 8)
+
+        # Updating the workflows completes the self assessment step
+        workflows = workflow_api.get_workflows_for_student("test/1/1", "user 1")
+        self.assertEqual(workflows["item 1"]["status"], "done")
+        self.assertEqual(workflows["item 1"]["score"]["points_earned"], 1)
+
+        # The information matches the workflows of each submission
+        for item_id, sub in [("item 1", self_sub), ("item 2", done_sub)]:
+            expected = workflow_api.get_workflow_for_submission(sub['uuid'], None)
+            expected_score, score = expected.pop('score'), workflows[item_id].pop('score')
+            self.assertEqual(workflows[item_id], expected)
+            self.assertEqual(
+                (score['points_earned'], score['points_possible']),
+                (expected_score['points_earned'], expected_score['points_possible'])
+            )
+
+    def test_get_workflows_for_student_no_submissions(self):
+        self.assertEqual(workflow_api.get_workflows_for_student("test/1/1", "user 1"), {})
+
+    @patch.object(AssessmentWorkflow.objects, 'filter')
+    def test_get_workflows_for_student_database_error(self, mock_filter):
+        mock_filter.side_effect = DatabaseError("Kaboom!")
+        sub_api.create_submission(dict(ITEM_1, student_id="user 1", course_id="test/1/1"), ANSWER_1)
+        with self.assertRaises(AssessmentWorkflowInternalError):
+            workflow_api.get_workflows_for_student("test/1/1", "user 1")
+
     def _create_workflow_with_status(
         self, student_id, course_id, item_id,
         status, answer="answer", steps=None
@@ -0,0 +1,123 @@
+"""
+Tests for the materialized leaderboards of items.
+"""
+from mock import patch
+
+from openassessment.test_utils import CacheResetTest
+from openassessment.workflow import api as workflow_api
+from openassessment.workflow import leaderboard
+from openassessment.workflow.models import AssessmentWorkflow
+from submissions import api as sub_api
+
+
+STUDENT_ITEM = {
+    "student_id": "test_student",
+    "course_id": "test_course",
+    "item_id": "test_item",
+    "item_type": "openassessment",
+}
+
+
+class LeaderboardTest(CacheResetTest):
+    """
+    Test building and updating the leaderboards.
+    """
+
+    def _create_scored_submission(self, student_id, answer, points_earned):
+        """
+        Create a submission with a score, and return its workflow.
+        """
+        student_item = dict(STUDENT_ITEM, student_id=student_id)
+        submission = sub_api.create_submission(student_item, answer)
+        workflow_api.create_workflow(submission['uuid'], ['self'])
+        workflow = AssessmentWorkflow.objects.get(submission_uuid=submission['uuid'])
+        if points_earned is not None:
+            workflow.set_score({'points_earned': points_earned, 'points_possible': 10})
+        return workflow
+
+    def _get_leaderboard(self, number_of_top_scores=2):
+        """
+        Retrieve the leaderboard of the test item.
+        """
+        return workflow_api.get_leaderboard(
+            STUDENT_ITEM['course_id'], STUDENT_ITEM['item_id'], STUDENT_ITEM['item_type'], number_of_top_scores
+        )
+
+    def test_get_leaderboard(self):
+        self._create_scored_submission('student_1', {'text': u"Answer 1"}, 3)
+        self._create_scored_submission(
+            'student_2', {'text': u"Answer 2", 'file_keys': ['key_1', 'key_2'], 'files_descriptions': [u"File"]}, 5
+        )
+        self._create_scored_submission('student_3', {'text': u"Answer 3", 'file_key': 'key_3'}, 1)
+
+        self.assertEqual(self._get_leaderboard(), [
+            {
+                'score': 5,
+                'content': {'text': u"Answer 2", 'file_keys': ['key_1', 'key_2'], 'files_descriptions': [u"File"]},
+                'file_keys': ['key_1', 'key_2'],
+                'files_descriptions': [u"File"],
+            },
+            {'score': 3, 'content': {'text': u"Answer 1"}, 'file_keys': [], 'files_descriptions': []},
+        ])
+        self.assertEqual(self._get_leaderboard(3)[2]['file_keys'], ['key_3'])
+
+    def test_leaderboard_materialized(self):
+        self._create_scored_submission('student_1', {'text': u"Answer 1"}, 3)
+        with patch.object(sub_api, 'get_top_submissions', side_effect=sub_api.get_top_submissions) as mock_top:
+            self._get_leaderboard()
+            self._get_leaderboard(1)
+            self.assertEqual(mock_top.call_count, 1)
+
+            # A larger leaderboard is built again
+            self._get_leaderboard(3)
+            self.assertEqual(mock_top.call_count, 2)
+
+    def test_publish_score_updates_leaderboard(self):
+        self._create_scored_submission('student_1', {'text': u"Answer 1"}, 3)
+        self._create_scored_submission('student_2', {'text': u"Answer 2"}, 5)
+        self.assertEqual([entry['score'] for entry in self._get_leaderboard()], [5, 3])
+
+        # A score lower than the whole leaderboard does not change it
+        with patch.object(leaderboard, 'invalidate') as mock_invalidate:
+            self._create_scored_submission('student_3', {'text': u"Answer 3"}, 1)
+            self.assertFalse(mock_invalidate.called)
+
+        # A score that enters the leaderboard updates it
+        self._create_scored_submission('student_4', {'text': u"Answer 4"}, 4)
+        self.assertEqual([entry['score'] for entry in self._get_leaderboard()], [5, 4])
+
+    def test_score_published_while_building_leaderboard(self):
+        self._create_scored_submission('student_1', {'text': u"Answer 1"}, 3)
+        workflow = self._create_scored_submission('student_2', {'text': u"Answer 2"}, None)
+        get_top_submissions = sub_api.get_top_submissions
+
+        def _publish_while_reading(*args, **kwargs):
+            """
+            Read the top submissions, then publish a score before the leaderboard is stored.
+            """
+            top_submissions = get_top_submissions(*args, **kwargs)
+            workflow.set_score({'points_earned': 5, 'points_possible': 10})
+            return top_submissions
+
+        with patch.object(sub_api, 'get_top_submissions', side_effect=_publish_while_reading):
+            self.assertEqual([entry['score'] for entry in self._get_leaderboard()], [3])
+
+        # The leaderboard built before the score was published is not kept
+        self.assertEqual([entry['score'] for entry in self._get_leaderboard()], [5, 3])
+
+    def test_staff_score_updates_leaderboard(self):
+        workflow = self._create_scored_submission('student_1', {'text': u"Answer 1"}, 3)
+        self._create_scored_submission('student_2', {'text': u"Answer 2"}, 5)
+        self.assertEqual([entry['score'] for entry in self._get_leaderboard()], [5, 3])
+
+        # Overriding a score on the leaderboard can lower it
+        workflow.set_staff_score({'points_earned': 1, 'points_possible': 10, 'staff_id': 'staff'})
+        self.assertEqual([entry['score'] for entry in self._get_leaderboard()], [5, 1])
+
+    def test_invalidate_leaderboard(self):
+        self._create_scored_submission('student_1', {'text': u"Answer 1"}, 3)
+        self.assertEqual(len(self._get_leaderboard()), 1)
+
+        sub_api.reset_score('student_1', STUDENT_ITEM['course_id'], STUDENT_ITEM['item_id'])
+        workflow_api.invalidate_leaderboard(STUDENT_ITEM['course_id'], STUDENT_ITEM['item_id'])
+        self.assertEqual(self._get_leaderboard(), [])
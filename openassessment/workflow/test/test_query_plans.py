@@ -0,0 +1,17 @@
+"""
+Tests that the hot queries of workflows use their indexes.
+"""
+from openassessment.test_utils import QueryPlanTest
+from openassessment.workflow.models import AssessmentWorkflow
+
+
+class WorkflowQueryPlanTest(QueryPlanTest):
+    """
+    Check the query plans of the workflow queries.
+    """
+
+    def test_status_counts(self):
+        self.assert_queryset_uses_indexes(
+            AssessmentWorkflow.objects.filter(status="peer", course_id="course", item_id="item"),
+            [("workflow_assessmentworkflow", "course_id", "item_id", "status")]
+        )
@@ -9,6 +9,7 @@ from submissions import api as sub_api
 from openassessment.assessment.errors import SelfAssessmentError, PeerAssessmentError
 from openassessment.fileupload import api as file_upload_api
 from openassessment.fileupload.exceptions import FileUploadError
+from openassessment.workflow import api as workflow_api
 from openassessment.xblock.data_conversion import create_submission_dict
 
 
@@ -64,30 +65,29 @@ class LeaderboardMixin(object):
             template_path (string), tuple of context (dict)
         """
 
-        # Retrieve top scores from the submissions API
-        # Since this uses the read-replica and caches the results,
-        # there will be some delay in the request latency.
-        scores = sub_api.get_top_submissions(
+        # Retrieve the top scores from the materialized leaderboard of the item,
+        # which is updated when the workflows publish scores.
+        scores = workflow_api.get_leaderboard(
             student_item_dict['course_id'],
             student_item_dict['item_id'],
             student_item_dict['item_type'],
             self.leaderboard_show
         )
+        # Generate the download urls of the files of every entry at once
+        file_download_urls = iter(self._get_file_download_urls(
+            [key for score in scores for key in score['file_keys']]
+        ))
+
         for score in scores:
+            file_keys = score.pop('file_keys')
+            descriptions = score.pop('files_descriptions')
             score['files'] = []
-            if 'file_keys' in score['content']:
-                file_keys = score['content'].get('file_keys', [])
-                descriptions = score['content'].get('files_descriptions', [])
-                for idx, key in enumerate(file_keys):
-                    file_download_url = self._get_file_download_url(key)
-                    if file_download_url:
-                        file_description = descriptions[idx] if idx < len(descriptions) else ''
-                        score['files'].append((file_download_url, file_description))
-
-            elif 'file_key' in score['content']:
-                file_download_url = self._get_file_download_url(score['content']['file_key'])
+            for idx in range(len(file_keys)):
+                file_download_url = next(file_download_urls)
                 if file_download_url:
-                    score['files'].append((file_download_url, ''))
+                    file_description = descriptions[idx] if idx < len(descriptions) else ''
+                    score['files'].append((file_download_url, file_description))
+
             if 'text' in score['content'] or 'parts' in score['content']:
                 submission = {'answer': score.pop('content')}
                 score['submission'] = create_submission_dict(submission, self.prompts)
@@ -115,18 +115,23 @@ class LeaderboardMixin(object):
         """
         return 'openassessmentblock/leaderboard/oa_leaderboard_waiting.html', {'xblock_id': self.get_xblock_id()}
 
-    def _get_file_download_url(self, file_key):
+    def _get_file_download_urls(self, file_keys):
         """
-        Internal function for retrieving the download url at which the file that corresponds
-        to the file_key can be downloaded.
+        Internal function for retrieving the download urls at which the files that correspond
+        to the file_keys can be downloaded.
 
         Arguments:
-            file_key (string): Corresponding file key.
+            file_keys (list of string): Corresponding file keys.
         Returns:
-            file_download_url (string) or empty string in case of error.
+            list of file_download_url (string), or empty strings for missing files and in case of error.
         """
-        try:
-            file_download_url = file_upload_api.get_download_url(file_key)
-        except FileUploadError:
-            file_download_url = ''
-        return file_download_url
+        file_download_urls = [''] * len(file_keys)
+        indices = [idx for idx, file_key in enumerate(file_keys) if file_key]
+        if indices:
+            try:
+                found_urls = file_upload_api.get_download_urls([file_keys[idx] for idx in indices])
+            except FileUploadError:
+                return file_download_urls
+            for idx, file_download_url in zip(indices, found_urls):
+                file_download_urls[idx] = file_download_url or ''
+        return file_download_urls
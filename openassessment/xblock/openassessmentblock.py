@@ -1,7 +1,9 @@
 """An XBlock where students can read a question and compose their response"""
 
+from collections import namedtuple
 import copy
 import datetime as dt
+import hashlib
 import json
 import logging
 import os
@@ -30,7 +32,7 @@ from openassessment.xblock.submission_mixin import SubmissionMixin
 from openassessment.xblock.studio_mixin import StudioMixin
 from openassessment.xblock.xml import parse_from_xml, serialize_content_to_xml
 from openassessment.xblock.staff_area_mixin import StaffAreaMixin
-from openassessment.xblock.workflow_mixin import WorkflowMixin
+from openassessment.xblock.workflow_mixin import WorkflowMixin, workflow_requirements_for
 from openassessment.xblock.staff_assessment_mixin import StaffAssessmentMixin
 from openassessment.workflow.errors import AssessmentWorkflowError
 from openassessment.xblock.student_training_mixin import StudentTrainingMixin
@@ -84,6 +86,21 @@ UI_MODELS = {
     }
 }
 
+# Components rendered by the render_all_steps handler, in rendering order.
+# The message is rendered after the peer step, because it depends on whether
+# the peer step found a submission to assess.
+RENDERABLE_COMPONENTS = [
+    "submission",
+    "student_training",
+    "peer_assessment",
+    "staff_assessment",
+    "self_assessment",
+    "grade",
+    "leaderboard",
+    "message",
+    "staff_area",
+]
+
 VALID_ASSESSMENT_TYPES = [
     "student-training",
     "example-based-assessment",
@@ -99,6 +116,115 @@ def load(path):
     return data.decode("utf8")
 
 
+# Resolved dates of blocks, keyed by the dates configured in the block.  Resolving
+# dates parses date strings, so the result is shared by all the requests for the
+# same version of a block.  The cache is emptied when it reaches its maximum size.
+_RESOLVED_DATES_CACHE = {}
+MAX_RESOLVED_DATES_CACHE_SIZE = 1000
+
+# Snapshots of the configuration derived from the problem definition, keyed by
+# the serialized definition fields, so that the prompts are parsed and the
+# assessments are normalized once for each version of a block.  The cache is
+# emptied when it reaches its maximum size.
+_CONFIG_SNAPSHOT_CACHE = {}
+MAX_CONFIG_SNAPSHOT_CACHE_SIZE = 1000
+
+
+def _read_only(self, *args, **kwargs):
+    """
+    Refuse to modify a frozen value.
+    """
+    raise TypeError(u"The configuration snapshot of a block is shared and must not be modified")
+
+
+class FrozenList(list):
+    """
+    A list of a configuration snapshot, which cannot be modified.
+    Copies of it are ordinary lists.
+    """
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __setslice__ = __delslice__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(item, memo) for item in self]
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+class FrozenDict(dict):
+    """
+    A dictionary of a configuration snapshot, which cannot be modified.
+    Copies of it are ordinary dictionaries.
+    """
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {copy.deepcopy(key, memo): copy.deepcopy(value, memo) for key, value in self.iteritems()}
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+def freeze(value):
+    """
+    Return a copy of a structure of lists and dictionaries which cannot be modified.
+    """
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.iteritems())
+    if isinstance(value, (list, tuple)):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+class ConfigSnapshot(namedtuple('ConfigSnapshot', [
+        'prompts', 'valid_assessments', 'assessment_steps', 'workflow_requirements'
+])):
+    """
+    Configuration derived from the definition of a block: the parsed prompts,
+    the normalized valid assessments, the names of the assessment steps and
+    the requirements of the workflow.
+
+    Snapshots are shared by all the blocks with the same definition, so their
+    values are frozen: modifying them raises a TypeError, and callers that
+    need to modify them work on a copy.
+    """
+    __slots__ = ()
+
+# Decoded static assets (CSS and JavaScript) and their versions, keyed by path.
+# Static assets only change when the package is deployed, so each process
+# loads them once rather than on every render.
+_STATIC_ASSETS = {}
+_STATIC_ASSET_VERSIONS = {}
+
+
+def load_static(path):
+    """Get a static asset from our kit, loading it only once per process."""
+    asset = _STATIC_ASSETS.get(path)
+    if asset is None:
+        asset = _STATIC_ASSETS[path] = load(path)
+    return asset
+
+
+def static_asset_version(path):
+    """Get a short digest of a static asset, which changes whenever its content does."""
+    version = _STATIC_ASSET_VERSIONS.get(path)
+    if version is None:
+        digest = hashlib.md5(load_static(path).encode("utf8")).hexdigest()
+        version = _STATIC_ASSET_VERSIONS[path] = digest[:12]
+    return version
+
+
 @XBlock.needs("i18n")
 @XBlock.needs("user")
 class OpenAssessmentBlock(MessageMixin,
@@ -119,6 +245,9 @@ class OpenAssessmentBlock(MessageMixin,
 
     public_dir = 'static'
 
+    # The configuration snapshot of the block, with the prompt and assessments it was built from
+    _config_snapshot_memo = None
+
     submission_start = String(
         default=DEFAULT_START, scope=Scope.settings,
         help="ISO-8601 formatted string representing the submission start date."
@@ -518,14 +647,21 @@ class OpenAssessmentBlock(MessageMixin,
             self.add_javascript_files(fragment, "static/js/src/oa_shared.js")
             self.add_javascript_files(fragment, "static/js/src/oa_server.js")
             self.add_javascript_files(fragment, "static/js/src/lms")
+        elif getattr(settings, "ORA2_STATIC_ASSETS_AS_URLS", False):
+            # The URLs change with the content of the assets, so browsers can cache them indefinitely
+            for css in additional_css:
+                fragment.add_css_url(self._versioned_resource_url(css))
+            fragment.add_css_url(self._versioned_resource_url(css_url))
+
+            # minified additional_js should be already included in 'make javascript'
+            fragment.add_javascript_url(self._versioned_resource_url("static/js/openassessment-lms.min.js"))
         else:
-            # TODO: load CSS and JavaScript as URLs once they can be served by the CDN
             for css in additional_css:
-                fragment.add_css(load(css))
-            fragment.add_css(load(css_url))
+                fragment.add_css(load_static(css))
+            fragment.add_css(load_static(css_url))
 
             # minified additional_js should be already included in 'make javascript'
-            fragment.add_javascript(load("static/js/openassessment-lms.min.js"))
+            fragment.add_javascript(load_static("static/js/openassessment-lms.min.js"))
         js_context_dict = {
             "ALLOWED_IMAGE_MIME_TYPES": self.ALLOWED_IMAGE_MIME_TYPES,
             "ALLOWED_FILE_MIME_TYPES": self.ALLOWED_FILE_MIME_TYPES,
@@ -535,6 +671,16 @@ class OpenAssessmentBlock(MessageMixin,
         fragment.initialize_js(initialize_js_func, js_context_dict)
         return fragment
 
+    def _versioned_resource_url(self, path):
+        """
+        Return the URL of a static asset, with a query string identifying its version.
+        """
+        url = self.runtime.local_resource_url(self, path)
+        separator = "&" if "?" in url else "?"
+        return u"{url}{separator}v={version}".format(
+            url=url, separator=separator, version=static_asset_version(path)
+        )
+
     @property
     def is_admin(self):
         """
@@ -735,10 +881,12 @@ class OpenAssessmentBlock(MessageMixin,
         parse and return it. Otherwise, assume it is a simple string prompt
         and return it in a list of dict.
 
+        The result is shared with other blocks, so it cannot be modified.
+
         Returns:
             list of dict
         """
-        return create_prompts_list(self.prompt)
+        return self.config_snapshot.prompts
 
     @prompts.setter
     def prompts(self, value):
@@ -766,19 +914,62 @@ class OpenAssessmentBlock(MessageMixin,
         assessment types are stored in the XBlock field (e.g. because
         we roll back code after releasing a feature).
 
+        The result is shared with other blocks, so it cannot be modified.
+
         Returns:
             list
 
         """
-        _valid_assessments = [
-            asmnt for asmnt in self.rubric_assessments
-            if asmnt.get('name') in VALID_ASSESSMENT_TYPES
-        ]
-        return update_assessments_format(copy.deepcopy(_valid_assessments))
+        return self.config_snapshot.valid_assessments
 
     @property
     def assessment_steps(self):
-        return [asmnt['name'] for asmnt in self.valid_assessments]
+        return self.config_snapshot.assessment_steps
+
+    @property
+    def config_snapshot(self):
+        """
+        Return the configuration derived from the definition of the problem.
+
+        The snapshot is built once for each version of the definition and shared by the
+        blocks of the process.  It is also remembered by the block until its prompt or
+        assessments are set again; callers that modify the assessments in place must
+        call `invalidate_config_snapshot`.
+
+        Returns:
+            ConfigSnapshot
+
+        """
+        prompt, assessments = self.prompt, self.rubric_assessments
+        memo = self._config_snapshot_memo
+        if memo is not None and memo[0] == prompt and memo[1] is assessments:
+            return memo[2]
+
+        key = (prompt, json.dumps(assessments, sort_keys=True, default=unicode))
+        snapshot = _CONFIG_SNAPSHOT_CACHE.get(key)
+        if snapshot is None:
+            valid_assessments = update_assessments_format(copy.deepcopy([
+                asmnt for asmnt in assessments
+                if asmnt.get('name') in VALID_ASSESSMENT_TYPES
+            ]))
+            snapshot = ConfigSnapshot(
+                prompts=freeze(create_prompts_list(prompt)),
+                valid_assessments=freeze(valid_assessments),
+                assessment_steps=freeze([asmnt['name'] for asmnt in valid_assessments]),
+                workflow_requirements=freeze(workflow_requirements_for(valid_assessments)),
+            )
+            if len(_CONFIG_SNAPSHOT_CACHE) >= MAX_CONFIG_SNAPSHOT_CACHE_SIZE:
+                _CONFIG_SNAPSHOT_CACHE.clear()
+            _CONFIG_SNAPSHOT_CACHE[key] = snapshot
+        self._config_snapshot_memo = (prompt, assessments, snapshot)
+        return snapshot
+
+    def invalidate_config_snapshot(self):
+        """
+        Forget the configuration snapshot of the block, so that it is
+        rebuilt from the definition of the problem when it is next used.
+        """
+        self._config_snapshot_memo = None
 
     def get_step_verbose_name(self, step):
         step_verbose_names = {
@@ -818,6 +1009,38 @@ class OpenAssessmentBlock(MessageMixin,
                     option['label'] = option['name']
         return criteria
 
+    @XBlock.handler
+    def render_all_steps(self, request, suffix=''):  # pylint: disable=unused-argument
+        """
+        Render many components of the XBlock with a single request, instead of
+        calling each `render_<component>` handler separately.  The workflow of
+        the student is retrieved once and shared by all the components.
+
+        Args:
+            request (webob.Request): Its JSON body may contain a "components" list,
+                which defaults to all RENDERABLE_COMPONENTS.
+
+        Returns:
+            (Response): JSON mapping each component to its HTML.  Components that
+                could not be rendered are omitted, so that the client can request
+                them separately; if any component raises an error, the client
+                requests all of them separately.
+        """
+        try:
+            requested = json.loads(request.body).get("components", RENDERABLE_COMPONENTS)
+        except (ValueError, AttributeError):
+            requested = RENDERABLE_COMPONENTS
+
+        rendered = {}
+        with self.sharing_workflow_info():
+            for component in RENDERABLE_COMPONENTS:
+                if component not in requested:
+                    continue
+                response = getattr(self, "render_" + component)(request, suffix)
+                if response.status_code == 200:
+                    rendered[component] = response.unicode_body
+        return Response(json.dumps(rendered), content_type='application/json', charset='UTF-8')
+
     def render_assessment(self, path, context_dict=None):
         """Render an Assessment Module's HTML
 
@@ -902,24 +1125,8 @@ class OpenAssessmentBlock(MessageMixin,
             datetime.datetime(2015, 3, 27, 22, 7, 38, 788861)
 
         """
-        submission_range = (self.submission_start, self.submission_due)
-        assessment_ranges = [
-            (asmnt.get('start'), asmnt.get('due'))
-            for asmnt in self.valid_assessments
-        ]
-
-        # Resolve unspecified dates and date strings to datetimes
-        start, due, date_ranges = resolve_dates(
-            self.start, self.due, [submission_range] + assessment_ranges, self._
-        )
-
-        open_range = (start, due)
-        assessment_steps = self.assessment_steps
-        if step == 'submission':
-            open_range = date_ranges[0]
-        elif step in assessment_steps:
-            step_index = assessment_steps.index(step)
-            open_range = date_ranges[1 + step_index]
+        problem_range, step_ranges, __ = self._resolved_dates()
+        open_range = step_ranges.get(step, problem_range)
 
         # Course staff always have access to the problem
         if course_staff is None:
@@ -941,6 +1148,54 @@ class OpenAssessmentBlock(MessageMixin,
         else:
             return False, None, open_range[0], open_range[1]
 
+    def _resolved_dates(self):
+        """
+        Resolve the dates of the problem and its steps to datetimes.
+
+        The dates are resolved once for each version of the block: the result is
+        cached by the start and due dates of the problem, submission and assessments.
+
+        Returns:
+            tuple of the form (problem_range, step_ranges, release_date), where
+                problem_range (tuple): the (start, due) datetimes of the problem.
+                step_ranges (dict): maps "submission" and the name of each assessment
+                    step to its (start, due) datetimes.
+                release_date (datetime or None): the parsed start date of the problem, if it is set.
+
+        Raises:
+            DateValidationError
+            InvalidDateFormat
+        """
+        assessments = [
+            asmnt for asmnt in self.rubric_assessments
+            if asmnt.get('name') in VALID_ASSESSMENT_TYPES
+        ]
+        key = (
+            self.start, self.due, self.submission_start, self.submission_due,
+            tuple((asmnt['name'], asmnt.get('start'), asmnt.get('due')) for asmnt in assessments)
+        )
+        resolved = _RESOLVED_DATES_CACHE.get(key)
+        if resolved is None:
+            submission_range = (self.submission_start, self.submission_due)
+            assessment_ranges = [(asmnt.get('start'), asmnt.get('due')) for asmnt in assessments]
+
+            # Resolve unspecified dates and date strings to datetimes
+            start, due, date_ranges = resolve_dates(
+                self.start, self.due, [submission_range] + assessment_ranges, self._
+            )
+
+            # If a step is repeated, its first occurrence is used
+            step_names = ["submission"] + [asmnt['name'] for asmnt in assessments]
+            step_ranges = {}
+            for step_name, date_range in zip(step_names, date_ranges):
+                step_ranges.setdefault(step_name, date_range)
+            release_date = parse_date_value(self.start, self._) if self.start else None
+
+            if len(_RESOLVED_DATES_CACHE) >= MAX_RESOLVED_DATES_CACHE_SIZE:
+                _RESOLVED_DATES_CACHE.clear()
+            resolved = _RESOLVED_DATES_CACHE[key] = ((start, due), step_ranges, release_date)
+        return resolved
+
     def get_waiting_details(self, status_details):
         """
         Returns waiting status (boolean value) based on the given status_details.
@@ -997,8 +1252,9 @@ class OpenAssessmentBlock(MessageMixin,
             is_published = True
         is_closed, reason, __, __ = self.is_closed(step=step)
         is_released = is_published and (not is_closed or reason == 'due')
-        if self.start:
-            is_released = is_released and dt.datetime.now(pytz.UTC) > parse_date_value(self.start, self._)
+        __, __, release_date = self._resolved_dates()
+        if release_date is not None:
+            is_released = is_released and dt.datetime.now(pytz.UTC) > release_date
         return is_released
 
     def get_assessment_module(self, mixin_name):
@@ -8,7 +8,7 @@ import logging
 
 from xblock.core import XBlock
 from openassessment.assessment.errors import (
-    PeerAssessmentInternalError,
+    PeerAssessmentInternalError, StaffAssessmentInternalError,
 )
 from openassessment.workflow.errors import (
     AssessmentWorkflowError, AssessmentWorkflowInternalError
@@ -20,15 +20,20 @@ from openassessment.xblock.data_conversion import (
 )
 from submissions import api as submission_api
 from openassessment.assessment.api import peer as peer_api
-from openassessment.assessment.api import self as self_api
 from openassessment.assessment.api import ai as ai_api
 from openassessment.workflow import api as workflow_api
 from openassessment.assessment.api import staff as staff_api
+from openassessment.fileupload.exceptions import FileUploadError
 from .user_data import get_user_preferences
 
 
 logger = logging.getLogger(__name__)
 
+# Number of learner responses checked out and rendered at once for staff grading,
+# so the next grading form can be shown without waiting for the server.
+STAFF_GRADE_PREFETCH_COUNT = 3
+MAX_STAFF_GRADE_PREFETCH_COUNT = 10
+
 
 def require_global_admin(error_key):
     """
@@ -262,21 +267,10 @@ class StaffAreaMixin(object):
             submission_to_assess = staff_api.get_submission_to_assess(course_id, item_id, staff_id)
 
             if submission_to_assess is not None:
-                # This is posting a tracking event to the runtime.
-                self.runtime.publish(self, 'openassessmentblock.get_submission_for_staff_grading', {
-                    'type': 'full-grade',
-                    'requesting_staff_id': staff_id,
-                    'item_id': item_id,
-                    'submission_returned_uuid': submission_to_assess['uuid']
-                })
+                self._publish_staff_grade_checkout(staff_id, item_id, submission_to_assess['uuid'])
                 submission = submission_api.get_submission_and_student(submission_to_assess['uuid'])
                 if submission:
-                    anonymous_student_id = submission['student_item']['student_id']
-                    submission_context = self.get_student_submission_context(
-                        self.get_username(anonymous_student_id), submission
-                    )
-                    path = 'openassessmentblock/staff_area/oa_staff_grade_learners_assessment.html'
-                    return self.render_assessment(path, submission_context)
+                    return self._render_staff_grade_form(submission)
                 else:
                     return self.render_error(self._(u"Error loading the checked out learner response."))
             else:
@@ -285,6 +279,115 @@ class StaffAreaMixin(object):
         except PeerAssessmentInternalError:
             return self.render_error(self._(u"Error getting staff grade information."))
 
+    @XBlock.json_handler
+    @require_course_staff("STUDENT_GRADE", with_json_handler=True)
+    def prefetch_staff_grade_forms(self, data, suffix=''):  # pylint: disable=W0613
+        """
+        Check out a batch of learner submissions for staff grading and render a
+        grading form for each of them, so that the next form can be displayed
+        while the current one is being graded.
+
+        Must be course staff to call this handler.
+
+        Args:
+            data (dict): May contain "count", the number of forms to render
+                (defaults to STAFF_GRADE_PREFETCH_COUNT).
+            suffix (not used)
+
+        Returns:
+            Json serializable dict with the following elements:
+                'success': (bool) Indicates whether the submissions were checked out.
+                'msg': An error message, if any.
+                'forms': A list of dicts with the 'submission_uuid' and rendered 'html'
+                    of each checked out submission, in grading order.
+        """
+        try:
+            count = int(data.get('count', STAFF_GRADE_PREFETCH_COUNT))
+        except (TypeError, ValueError):
+            return {'success': False, 'msg': self._(u"The number of responses to load must be an integer.")}
+        count = max(1, min(count, MAX_STAFF_GRADE_PREFETCH_COUNT))
+
+        student_item_dict = self.get_student_item_dict()
+        course_id = student_item_dict.get('course_id')
+        item_id = student_item_dict.get('item_id')
+        staff_id = student_item_dict['student_id']
+
+        try:
+            submissions = staff_api.get_submissions_to_assess(course_id, item_id, staff_id, count)
+        except StaffAssessmentInternalError:
+            return {'success': False, 'msg': self._(u"Error getting staff grade information.")}
+
+        forms = []
+        for submission in submissions:
+            self._publish_staff_grade_checkout(staff_id, item_id, submission['uuid'])
+            forms.append({
+                'submission_uuid': submission['uuid'],
+                'html': self._render_staff_grade_form(submission).text,
+            })
+        return {'success': True, 'msg': u"", 'forms': forms}
+
+    @XBlock.json_handler
+    @require_course_staff("STUDENT_GRADE", with_json_handler=True)
+    def release_staff_grade_forms(self, data, suffix=''):  # pylint: disable=W0613
+        """
+        Release learner submissions that were checked out for staff grading
+        but will not be graded (for example, when the grading form is closed),
+        so that other staff members can grade them.
+
+        Must be course staff to call this handler.
+
+        Args:
+            data (dict): May contain "submission_uuids", the submissions to release.
+                If not provided, every submission checked out by the current user
+                for this problem is released.
+            suffix (not used)
+
+        Returns:
+            Json serializable dict with the following elements:
+                'success': (bool) Indicates whether the submissions were released.
+                'msg': An error message, if any.
+        """
+        student_item_dict = self.get_student_item_dict()
+        try:
+            staff_api.release_submissions_to_assess(
+                student_item_dict.get('course_id'),
+                student_item_dict.get('item_id'),
+                student_item_dict['student_id'],
+                submission_uuids=data.get('submission_uuids'),
+            )
+        except StaffAssessmentInternalError:
+            return {'success': False, 'msg': self._(u"Error releasing the checked out learner responses.")}
+        return {'success': True, 'msg': u""}
+
+    def _publish_staff_grade_checkout(self, staff_id, item_id, submission_uuid):
+        """
+        Emit a tracking event for a submission checked out for staff grading.
+        """
+        self.runtime.publish(self, 'openassessmentblock.get_submission_for_staff_grading', {
+            'type': 'full-grade',
+            'requesting_staff_id': staff_id,
+            'item_id': item_id,
+            'submission_returned_uuid': submission_uuid
+        })
+
+    def _render_staff_grade_form(self, submission):
+        """
+        Render the staff grading form for a submission.
+
+        Args:
+            submission (dict): A submission including its student item, as returned
+                by submission_api.get_submission_and_student.
+
+        Returns:
+            Response: A response object with an HTML body.
+        """
+        anonymous_student_id = submission['student_item']['student_id']
+        submission_context = self.get_student_submission_context(
+            self.get_username(anonymous_student_id), submission
+        )
+        path = 'openassessmentblock/staff_area/oa_staff_grade_learners_assessment.html'
+        return self.render_assessment(path, submission_context)
+
     @XBlock.handler
     @require_course_staff("STUDENT_GRADE")
     def render_staff_grade_counts(self, data, suffix=''):  # pylint: disable=W0613
@@ -389,6 +492,9 @@ class StaffAreaMixin(object):
         """
         assessment_steps = self.assessment_steps
 
+        # All the assessments of the submission and of its author are loaded at once
+        report = staff_api.get_submission_report(submission_uuid)
+
         example_based_assessment = None
         example_based_assessment_grade_context = None
 
@@ -398,7 +504,7 @@ class StaffAreaMixin(object):
         peer_assessments = None
         peer_assessments_grade_context = []
 
-        staff_assessment = staff_api.get_latest_staff_assessment(submission_uuid)
+        staff_assessment = report['staff_assessment']
         staff_assessment_grade_context = None
 
         submitted_assessments = None
@@ -409,8 +515,8 @@ class StaffAreaMixin(object):
         grade_exists = workflow.get('status') == "done"
 
         if "peer-assessment" in assessment_steps:
-            peer_assessments = peer_api.get_assessments(submission_uuid)
-            submitted_assessments = peer_api.get_submitted_assessments(submission_uuid)
+            peer_assessments = report['peer_assessments']
+            submitted_assessments = report['submitted_assessments']
             if grade_exists:
                 peer_api.get_score(submission_uuid, self.workflow_requirements()["peer"])
                 peer_assessments_grade_context = [
@@ -419,12 +525,12 @@ class StaffAreaMixin(object):
                 ]
 
         if "self-assessment" in assessment_steps:
-            self_assessment = self_api.get_assessment(submission_uuid)
+            self_assessment = report['self_assessment']
             if grade_exists:
                 self_assessment_grade_context = self._assessment_grade_context(self_assessment)
 
         if "example-based-assessment" in assessment_steps:
-            example_based_assessment = ai_api.get_latest_assessment(submission_uuid)
+            example_based_assessment = report['example_based_assessment']
             if grade_exists:
                 example_based_assessment_grade_context = self._assessment_grade_context(example_based_assessment)
 
@@ -456,7 +562,7 @@ class StaffAreaMixin(object):
         })
 
         if peer_assessments or self_assessment or example_based_assessment or staff_assessment:
-            max_scores = peer_api.get_rubric_max_scores(submission_uuid)
+            max_scores = report['rubric_max_scores']
             for criterion in context["rubric_criteria"]:
                 criterion["total_value"] = max_scores[criterion["name"]]
 
@@ -504,6 +610,7 @@ class StaffAreaMixin(object):
         This xblock method is called (from our LMS runtime, which defines this method signature) to clear student state
         for a given problem. It will cancel the workflow using traditional methods to remove it from the grading pools,
         and pass through to the submissions API to orphan the submission so that the user can create a new one.
+        The files uploaded by the user are removed as well.
         """
         # Note that student_item cannot be constructed using get_student_item_dict, since we're in a staff context
         student_item = {
@@ -527,6 +634,16 @@ class StaffAreaMixin(object):
             )
             # TODO: try to remove the above pylint disable once edx-submissions release is done
 
+        if submissions:
+            # The learner's score may have been on the leaderboard
+            workflow_api.invalidate_leaderboard(course_id, item_id)
+
+        if self.file_upload_type:
+            try:
+                self._remove_uploaded_files(student_item)
+            except FileUploadError:
+                logger.exception(u"Error removing the uploaded files of user {}".format(user_id))
+
     @XBlock.json_handler
     @require_course_staff("STUDENT_INFO", with_json_handler=True)
     def cancel_submission(self, data, suffix=''):  # pylint: disable=W0613
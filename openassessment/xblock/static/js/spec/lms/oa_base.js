@@ -18,6 +18,7 @@ describe("OpenAssessment.BaseView", function() {
 
         // Remember which fragments were requested
         this.fragmentsLoaded = [];
+        this.componentsRenderedTogether = [];
 
         this.render = function(component) {
             var server = this;
@@ -27,6 +28,15 @@ describe("OpenAssessment.BaseView", function() {
             }).promise();
         };
 
+        this.renderAll = function(components) {
+            this.componentsRenderedTogether = components;
+            return $.Deferred(function(defer) {
+                defer.resolve();
+            }).promise();
+        };
+
+        this.clearRendered = function() {};
+
         var successPromise = $.Deferred(
             function(defer) {
                 defer.resolve();
@@ -68,6 +78,13 @@ describe("OpenAssessment.BaseView", function() {
         expect(server.fragmentsLoaded).toContain("grade");
     });
 
+    it("Renders all the steps with a single request", function() {
+        expect(server.componentsRenderedTogether).toEqual([
+            'submission', 'student_training', 'peer_assessment', 'staff_assessment',
+            'self_assessment', 'grade', 'leaderboard', 'message'
+        ]);
+    });
+
     it("Only load the peer section once on submit", function() {
         // Simulate a server error
         view.peerView.peerAssess();
@@ -75,6 +75,20 @@ describe('OpenAssessment.StaffAreaView', function() {
             return this.mockLoadTemplate(server.staffGradeCountsTemplate);
         };
 
+        // By default nothing is prefetched, so the view falls back to staffGradeForm
+        this.prefetchedForms = [];
+
+        this.prefetchStaffGradeForms = function() {
+            var server = this;
+            return $.Deferred(function(defer) {
+                defer.resolveWith(server, [server.prefetchedForms]);
+            }).promise();
+        };
+
+        this.releaseStaffGradeForms = function() {
+            return successPromise;
+        };
+
         this.data = {};
     };
 
@@ -705,6 +719,45 @@ describe('OpenAssessment.StaffAreaView', function() {
             verifyFocused($staffGradeButton[0]);
         });
 
+        it('shows prefetched staff grade forms without requesting them again', function() {
+            var staffArea = createStaffArea({}, 'oa_staff_area_full_grading.html'),
+                $assessment;
+            server.prefetchedForms = [
+                {submission_uuid: 'uuid_1', html: readFixtures('oa_staff_grade_learners_assessment.html')},
+                {submission_uuid: 'uuid_2', html: readFixtures('oa_staff_grade_learners_assessment_2.html')}
+            ];
+            spyOn(server, 'staffGradeForm').and.callThrough();
+            showInstructorAssessmentForm(staffArea);
+            expect($('.staff-assessment__display__title', staffArea.element).text().trim()).toBe(
+                'Response for: mock_user'
+            );
+
+            // The second form was already rendered, so grading the first one shows it directly
+            $assessment = getAssessment(staffArea, staffAreaTab);
+            fillAssessment($assessment, gradingType);
+            $('.continue_grading--action', $assessment).click();
+            expect($('.staff-assessment__display__title', staffArea.element).text().trim()).toBe(
+                'Response for: mock_user_2'
+            );
+            expect(server.staffGradeForm).not.toHaveBeenCalled();
+        });
+
+        it('releases prefetched staff grade forms when grading stops', function() {
+            var staffArea = createStaffArea({}, 'oa_staff_area_full_grading.html'),
+                $assessment;
+            server.prefetchedForms = [
+                {submission_uuid: 'uuid_1', html: readFixtures('oa_staff_grade_learners_assessment.html')},
+                {submission_uuid: 'uuid_2', html: readFixtures('oa_staff_grade_learners_assessment_2.html')}
+            ];
+            spyOn(server, 'releaseStaffGradeForms').and.callThrough();
+            showInstructorAssessmentForm(staffArea);
+
+            $assessment = getAssessment(staffArea, staffAreaTab);
+            fillAssessment($assessment, gradingType);
+            submitAssessment(staffArea, staffAreaTab);
+            expect(server.releaseStaffGradeForms).toHaveBeenCalledWith(['uuid_2']);
+        });
+
         it('shows an error message when failing to load the staff grade form', function() {
             var staffArea = createStaffArea({}, 'oa_staff_area_full_grading.html'), $error;
             server.staffGradeForm = failWith(server);
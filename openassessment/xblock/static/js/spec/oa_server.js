@@ -110,6 +110,34 @@ describe("OpenAssessment.Server", function() {
         });
     });
 
+    it("renders many components with a single request", function() {
+        stubAjax(true, {submission: "<div>Response</div>", grade: "<div>Grade</div>"});
+        server.renderAll(['submission', 'grade']);
+        expect($.ajax).toHaveBeenCalledWith({
+            url: '/render_all_steps',
+            type: "POST",
+            data: JSON.stringify({components: ['submission', 'grade']}),
+            contentType: jsonContentType,
+            dataType: "json"
+        });
+
+        // The rendered components are used once, without another request
+        var loadedHtml = "";
+        server.render('submission').done(function(html) {
+            loadedHtml = html;
+        });
+        expect(loadedHtml).toEqual("<div>Response</div>");
+        expect($.ajax.calls.count()).toEqual(1);
+
+        server.render('submission');
+        expect($.ajax.calls.count()).toEqual(2);
+
+        // Unused components are forgotten when cleared
+        server.clearRendered();
+        server.render('grade');
+        expect($.ajax.calls.count()).toEqual(3);
+    });
+
     it("sends a submission to the XBlock", function() {
         // Status, student ID, attempt number
         stubAjax(true, [true, 1, 2]);
@@ -363,6 +391,18 @@ describe("OpenAssessment.Server", function() {
         expect(receivedMsg).toContain("This section could not be loaded");
     });
 
+    it("informs the caller of an Ajax error when rendering many components", function() {
+        stubAjax(false, null);
+
+        var receivedMsg = "";
+        server.renderAll(['submission']).fail(function(msg) {
+            receivedMsg = msg;
+        });
+
+        expect(receivedMsg).toContain("This section could not be loaded");
+        expect(server.renderedComponents).toEqual({});
+    });
+
     it("informs the caller of an Ajax error when sending a submission", function() {
         stubAjax(false, null);
 
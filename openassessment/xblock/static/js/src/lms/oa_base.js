@@ -229,11 +229,30 @@ OpenAssessment.BaseView.prototype = {
 
     /**
      * Asynchronously load each sub-view into the DOM.
+     *
+     * All the sub-views are rendered by the server with a single request; if
+     * it fails, each sub-view requests its own rendering instead.
      */
     load: function() {
-        this.responseView.load();
-        this.loadAssessmentModules();
-        this.staffAreaView.load();
+        var view = this;
+        var components = [
+            'submission', 'student_training', 'peer_assessment', 'staff_assessment',
+            'self_assessment', 'grade', 'leaderboard', 'message'
+        ];
+        if ($('.openassessment__staff-area', this.element).length > 0) {
+            components.push('staff_area');
+        }
+        var loadViews = function() {
+            view.responseView.load();
+            view.loadAssessmentModules();
+            view.staffAreaView.load();
+            view.server.clearRendered();
+        };
+        if (this.server.renderAll instanceof Function) {
+            this.server.renderAll(components).always(loadViews);
+        } else {
+            loadViews();
+        }
     },
 
     /**
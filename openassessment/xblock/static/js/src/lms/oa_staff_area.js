@@ -16,6 +16,9 @@
         this.element = element;
         this.server = server;
         this.baseView = baseView;
+        this.staffGradeQueue = [];
+        this.staffGradeCurrentID = null;
+        this.staffGradePrefetch = null;
     };
 
     OpenAssessment.StaffAreaView.prototype = {
@@ -23,6 +26,9 @@
         FULL_GRADE_UNSAVED_WARNING_KEY: "staff-grade",
         OVERRIDE_UNSAVED_WARNING_KEY: "staff-override",
 
+        // Number of grading forms to keep rendered ahead of the one being graded.
+        STAFF_GRADE_PREFETCH_COUNT: 3,
+
         /**
          * Load the staff area.
          */
@@ -162,7 +168,7 @@
             }
             else {
                 this.staffGradeFormLoaded = true;
-                this.server.staffGradeForm().done(function(html) {
+                this.nextStaffGradeForm().done(function(html) {
                     showFormError('');
 
                     // Load the HTML and install event handlers
@@ -217,6 +223,86 @@
             return deferred.promise();
         },
 
+        /**
+         * Retrieve the next staff grading form, taking it from the prefetched queue when possible.
+         * The queue is refilled in the background, so that the following form is ready
+         * by the time the current one has been graded.
+         *
+         * @returns {promise} A promise that resolves with the HTML of the grading form.
+         */
+        nextStaffGradeForm: function() {
+            var view = this;
+            var deferred = $.Deferred();
+            var showNext = function() {
+                var next = view.staffGradeQueue.shift();
+                if (next) {
+                    view.staffGradeCurrentID = next.submission_uuid;
+                    deferred.resolve(next.html);
+                    view.prefetchStaffGradeForms();
+                }
+                else {
+                    // Nothing was checked out, so let the server render the appropriate message.
+                    view.staffGradeCurrentID = null;
+                    view.server.staffGradeForm().done(function(html) {
+                        deferred.resolve(html);
+                    }).fail(function() {
+                        deferred.reject();
+                    });
+                }
+            };
+
+            if (this.staffGradeQueue.length > 0) {
+                showNext();
+            }
+            else {
+                this.prefetchStaffGradeForms().always(showNext);
+            }
+            return deferred.promise();
+        },
+
+        /**
+         * Check out and render grading forms until the queue holds STAFF_GRADE_PREFETCH_COUNT forms
+         * in addition to the one being graded.
+         *
+         * @returns {promise} A promise that resolves once the queue has been refilled.
+         */
+        prefetchStaffGradeForms: function() {
+            var view = this;
+            if (this.staffGradePrefetch === null) {
+                // The server returns the submissions already checked out by this user first,
+                // including the one being graded and the queued ones, so skip those.
+                this.staffGradePrefetch = this.server.prefetchStaffGradeForms(
+                    this.STAFF_GRADE_PREFETCH_COUNT + 1
+                ).done(function(forms) {
+                    var knownIDs = _.pluck(view.staffGradeQueue, 'submission_uuid');
+                    knownIDs.push(view.staffGradeCurrentID);
+                    _.each(forms, function(form) {
+                        if (!_.contains(knownIDs, form.submission_uuid)) {
+                            view.staffGradeQueue.push(form);
+                        }
+                    });
+                }).always(function() {
+                    view.staffGradePrefetch = null;
+                });
+            }
+            return this.staffGradePrefetch;
+        },
+
+        /**
+         * Release the submissions whose grading forms were prefetched but not shown,
+         * so that other staff members can grade them.
+         *
+         * @returns {promise} A promise that resolves once the submissions have been released.
+         */
+        releaseStaffGradeQueue: function() {
+            var submissionIDs = _.pluck(this.staffGradeQueue, 'submission_uuid');
+            this.staffGradeQueue = [];
+            if (submissionIDs.length > 0) {
+                return this.server.releaseStaffGradeForms(submissionIDs);
+            }
+            return $.Deferred().resolve().promise();
+        },
+
         /**
          * Closes the staff grade/assessment section of the staff area.
          *
@@ -236,7 +322,9 @@
                 // Collapse the editor and update the counts.
                 // This is the case of submitting an assessment and NOT continuing with grading.
                 $staffGradeTab.find('.staff__grade__form').replaceWith('<div class="staff__grade__form"></div>');
-                this.updateStaffGradeCounts();
+                this.releaseStaffGradeQueue().always(function() {
+                    view.updateStaffGradeCounts();
+                });
             }
             else {
                 // Just hide the form currently being shown (no need to update counts).
@@ -279,6 +367,12 @@
                 return;
             }
 
+            // Give back any prefetched grading forms when the staff member leaves the page.
+            // This is best effort: unreleased submissions are released when their lease expires.
+            $(window).on('unload', function() {
+                view.releaseStaffGradeQueue();
+            });
+
             // Install a click handler for the staff button panel
             $staffArea.find('.ui-staff__button').click(
                 function(eventObject) {
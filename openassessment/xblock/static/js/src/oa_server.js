@@ -16,6 +16,8 @@ if (typeof OpenAssessment.Server === "undefined" || !OpenAssessment.Server) {
     OpenAssessment.Server = function(runtime, element) {
         this.runtime = runtime;
         this.element = element;
+        // HTML of components rendered in advance by renderAll, keyed by component.
+        this.renderedComponents = {};
     };
 
     var jsonContentType = "application/json; charset=utf-8";
@@ -42,6 +44,14 @@ if (typeof OpenAssessment.Server === "undefined" || !OpenAssessment.Server) {
         render: function(component) {
             var view = this;
             var url = this.url('render_' + component);
+            if (this.renderedComponents.hasOwnProperty(component)) {
+                // Use the HTML rendered in advance, only once
+                var html = this.renderedComponents[component];
+                delete this.renderedComponents[component];
+                return $.Deferred(function(defer) {
+                    defer.resolveWith(view, [html]);
+                }).promise();
+            }
             return $.Deferred(function(defer) {
                 $.ajax({
                     url: url,
@@ -55,6 +65,42 @@ if (typeof OpenAssessment.Server === "undefined" || !OpenAssessment.Server) {
             }).promise();
         },
 
+        /**
+         * Render many components of the XBlock with a single request.  The HTML of
+         * each component is then returned by the next call to `render` for it,
+         * and components the server could not render are requested separately.
+         *
+         * @param {string[]} components The components to render.
+         * @returns {promise} A JQuery promise, which resolves when the components
+         *     have been rendered and fails with an error message.
+         */
+        renderAll: function(components) {
+            var server = this;
+            var url = this.url('render_all_steps');
+            return $.Deferred(function(defer) {
+                $.ajax({
+                    url: url,
+                    type: "POST",
+                    data: JSON.stringify({components: components}),
+                    contentType: jsonContentType,
+                    dataType: "json"
+                }).done(function(data) {
+                    server.renderedComponents = data;
+                    defer.resolveWith(server, [data]);
+                }).fail(function() {
+                    defer.rejectWith(server, [gettext('This section could not be loaded.')]);
+                });
+            }).promise();
+        },
+
+        /**
+         * Forget the components rendered in advance that were not used,
+         * so that they are rendered again when they are next loaded.
+         */
+        clearRendered: function() {
+            this.renderedComponents = {};
+        },
+
         /**
          * Render Latex for all new DOM elements with class 'allow--latex'.
          *
@@ -136,6 +182,58 @@ if (typeof OpenAssessment.Server === "undefined" || !OpenAssessment.Server) {
             }).promise();
         },
 
+        /**
+         * Checks out a batch of submissions for staff grading and renders a grading form for each.
+         *
+         * @param {int} count - The maximum number of grading forms to render.
+         * @returns {promise} A JQuery promise, which resolves with a list of objects containing
+         *     the submission UUID and HTML of each grading form, or fails with an error message.
+         */
+        prefetchStaffGradeForms: function(count) {
+            var url = this.url('prefetch_staff_grade_forms');
+            var payload = JSON.stringify({count: count});
+            return $.Deferred(function(defer) {
+                $.ajax({
+                    type: "POST", url: url, data: payload, contentType: jsonContentType
+                }).done(function(data) {
+                    if (data.success) {
+                        defer.resolveWith(this, [data.forms]);
+                    }
+                    else {
+                        defer.rejectWith(this, [data.msg]);
+                    }
+                }).fail(function() {
+                    defer.rejectWith(this, [gettext('The staff assessment form could not be loaded.')]);
+                });
+            }).promise();
+        },
+
+        /**
+         * Releases submissions that were checked out for staff grading but will not be graded.
+         *
+         * @param {Array} submissionIDs - The UUIDs of the submissions to release.
+         * @returns {promise} A JQuery promise, which resolves with no arguments if successful,
+         *     and fails with an error message otherwise.
+         */
+        releaseStaffGradeForms: function(submissionIDs) {
+            var url = this.url('release_staff_grade_forms');
+            var payload = JSON.stringify({submission_uuids: submissionIDs});
+            return $.Deferred(function(defer) {
+                $.ajax({
+                    type: "POST", url: url, data: payload, contentType: jsonContentType
+                }).done(function(data) {
+                    if (data.success) {
+                        defer.resolve();
+                    }
+                    else {
+                        defer.rejectWith(this, [data.msg]);
+                    }
+                }).fail(function() {
+                    defer.rejectWith(this, [gettext('The checked out responses could not be released.')]);
+                });
+            }).promise();
+        },
+
         /**
          * Renders the count of ungraded and checked out assessemtns.
          *
@@ -272,6 +272,7 @@ class StudioMixin(object):
             self.white_listed_file_types_string = None
         self.allow_latex = bool(data['allow_latex'])
         self.leaderboard_show = data['leaderboard_show']
+        self.invalidate_config_snapshot()
 
         return {'success': True, 'msg': self._(u'Successfully updated OpenAssessment XBlock')}
 
@@ -330,14 +330,21 @@ class SubmissionMixin(object):
         Removes all uploaded user files.
 
         """
-        removed_num = 0
-        for i in range(self.MAX_FILES_COUNT):
-            removed = file_upload_api.remove_file(self._get_student_item_key(i))
-            if removed:
-                removed_num += 1
-            else:
-                break
-        return {'success': True, 'removed_num': removed_num}
+        return {'success': True, 'removed_num': self._remove_uploaded_files()}
+
+    def _remove_uploaded_files(self, student_item_dict=None):
+        """
+        Remove the files uploaded by a student, up to the first empty slot, with a single call to the file upload API.
+
+        Args:
+            student_item_dict (dict): The student item of the student, defaults to the current student.
+
+        Returns:
+            The number of files removed (int).
+
+        """
+        keys = [self._get_student_item_key(i, student_item_dict) for i in range(self.MAX_FILES_COUNT)]
+        return sum(1 for removed in file_upload_api.remove_files(keys) if removed)
 
     def _get_download_url(self, file_num=0):
         """
@@ -350,16 +357,20 @@ class SubmissionMixin(object):
             logger.exception("Error retrieving download URL.")
             return ''
 
-    def _get_student_item_key(self, num=0):
+    def _get_student_item_key(self, num=0, student_item_dict=None):
         """
         Simple utility method to generate a common file upload key based on
         the student item.
 
+        Args:
+            num (int): The index of the file.
+            student_item_dict (dict): The student item, defaults to the current student's.
+
         Returns:
             A string representation of the key.
 
         """
-        student_item_dict = self.get_student_item_dict()
+        student_item_dict = dict(student_item_dict or self.get_student_item_dict())
         num = int(num)
         if num > 0:
             student_item_dict['num'] = num
@@ -371,18 +382,24 @@ class SubmissionMixin(object):
                 **student_item_dict
             )
 
-    def _get_url_by_file_key(self, key):
+    def _get_urls_by_file_keys(self, keys):
         """
-        Return download url for some particular file key.
+        Return download urls for many file keys, in the same order as the keys.
+        The url is empty for keys that are empty, or if the urls cannot be generated.
 
         """
-        url = ''
+        urls = [''] * len(keys)
+        indices = [idx for idx, key in enumerate(keys) if key]
+        if not indices:
+            return urls
         try:
-            if key:
-                url = file_upload_api.get_download_url(key)
+            found_urls = file_upload_api.get_download_urls([keys[idx] for idx in indices])
         except FileUploadError:
-            logger.exception("Unable to generate download url for file key {}".format(key))
-        return url
+            logger.exception("Unable to generate download urls for file keys {}".format(keys))
+            return urls
+        for idx, url in zip(indices, found_urls):
+            urls[idx] = url or ''
+        return urls
 
     def get_download_urls_from_submission(self, submission):
         """
@@ -403,8 +420,7 @@ class SubmissionMixin(object):
         if 'file_keys' in submission['answer']:
             keys = submission['answer'].get('file_keys', [])
             descriptions = submission['answer'].get('files_descriptions', [])
-            for idx, key in enumerate(keys):
-                url = self._get_url_by_file_key(key)
+            for idx, url in enumerate(self._get_urls_by_file_keys(keys)):
                 if url:
                     description = ''
                     try:
@@ -416,7 +432,7 @@ class SubmissionMixin(object):
                     break
         elif 'file_key' in submission['answer']:
             key = submission['answer'].get('file_key', '')
-            url = self._get_url_by_file_key(key)
+            url = self._get_urls_by_file_keys([key])[0]
             if url:
                 urls.append((url, ''))
         return urls
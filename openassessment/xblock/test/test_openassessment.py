@@ -1,6 +1,7 @@
 """
 Tests the Open Assessment XBlock functionality.
 """
+import copy
 import ddt
 import json
 
@@ -9,11 +10,13 @@ import datetime as dt
 from freezegun import freeze_time
 import pytz
 from mock import Mock, patch, MagicMock, PropertyMock
+from django.test.utils import override_settings
 from lxml import etree
 from StringIO import StringIO
 
 from openassessment.xblock import openassessmentblock
 from openassessment.xblock.resolve_dates import DISTANT_PAST, DISTANT_FUTURE
+from openassessment.workflow import api as workflow_api
 from openassessment.workflow.errors import AssessmentWorkflowError
 from .base import XBlockHandlerTestCase, scenario
 
@@ -141,6 +144,72 @@ class TestOpenAssessment(XBlockHandlerTestCase):
         items = json.loads(scripts[0].text)
         self.assertEqual(items, defined_ora_items)
 
+    @scenario('data/basic_scenario.xml')
+    def test_static_assets_loaded_once(self, xblock):
+        openassessmentblock._STATIC_ASSETS.clear()
+        with patch('openassessment.xblock.openassessmentblock.load', side_effect=openassessmentblock.load) as mock_load:
+            first_fragment = self.runtime.render(xblock, "student_view")
+            second_fragment = self.runtime.render(xblock, "student_view")
+
+        # The CSS and JavaScript are loaded by the first render only
+        self.assertEqual(mock_load.call_count, 2)
+        self.assertEqual(
+            [resource.data for resource in first_fragment.resources],
+            [resource.data for resource in second_fragment.resources]
+        )
+        self.assertIn(
+            openassessmentblock.load("static/js/openassessment-lms.min.js"),
+            [resource.data for resource in second_fragment.resources]
+        )
+
+    @override_settings(ORA2_STATIC_ASSETS_AS_URLS=True)
+    @scenario('data/basic_scenario.xml')
+    def test_static_assets_as_urls(self, xblock):
+        xblock_fragment = self.runtime.render(xblock, "student_view")
+
+        # The assets are referenced by versioned URLs instead of being inlined
+        for resource in xblock_fragment.resources:
+            self.assertEqual(resource.kind, "url")
+        urls = [resource.data for resource in xblock_fragment.resources]
+        for path in ["static/css/openassessment-ltr.css", "static/js/openassessment-lms.min.js"]:
+            version = openassessmentblock.static_asset_version(path)
+            self.assertEqual(
+                len([url for url in urls if path in url and url.endswith("v=" + version)]), 1
+            )
+
+    @scenario('data/basic_scenario.xml', user_id='Bob')
+    def test_render_all_steps(self, xblock):
+        submission = json.dumps({"submission": ["First answer", "Second answer"]})
+        self.assertTrue(self.request(xblock, 'submit', submission, response_format='json')[0])
+
+        with patch.object(
+            workflow_api, 'get_workflow_for_submission', side_effect=workflow_api.get_workflow_for_submission
+        ) as mock_get_workflow:
+            rendered = self.request(xblock, 'render_all_steps', json.dumps({}), response_format='json')
+
+        # The workflow is retrieved once for all the steps
+        self.assertEqual(mock_get_workflow.call_count, 1)
+        self.assertItemsEqual(rendered.keys(), openassessmentblock.RENDERABLE_COMPONENTS)
+        self.assertIn("step--response", rendered["submission"])
+        self.assertIn("step--peer-assessment", rendered["peer_assessment"])
+        self.assertIn("step--self-assessment", rendered["self_assessment"])
+        self.assertIn("step--grade", rendered["grade"])
+
+        # The rendered steps are the same as when they are rendered separately
+        for component in ["submission", "grade"]:
+            html = self.request(xblock, 'render_' + component, json.dumps({}))
+            self.assertEqual(rendered[component], html.decode('utf-8'))
+
+        # The workflow is not shared outside of the request
+        self.assertIsNone(xblock._shared_workflow_info)  # pylint: disable=protected-access
+
+    @scenario('data/basic_scenario.xml', user_id='Bob')
+    def test_render_some_steps(self, xblock):
+        rendered = self.request(
+            xblock, 'render_all_steps', json.dumps({"components": ["submission", "message"]}), response_format='json'
+        )
+        self.assertItemsEqual(rendered.keys(), ["submission", "message"])
+
     @scenario('data/empty_prompt.xml')
     def test_prompt_intentionally_empty(self, xblock):
         # Verify that prompts intentionally left empty don't create DOM elements
@@ -452,6 +521,48 @@ class TestOpenAssessment(XBlockHandlerTestCase):
         xblock.prompts = [{'description': 'Prompt 4.'}, {'description': 'Prompt 5.'}]
         self.assertEqual(xblock.prompt, '[{"description": "Prompt 4."}, {"description": "Prompt 5."}]')
 
+    @scenario('data/basic_scenario.xml', user_id='Bob')
+    def test_config_snapshot_cached(self, xblock):
+        openassessmentblock._CONFIG_SNAPSHOT_CACHE.clear()  # pylint: disable=protected-access
+        other_xblock = self.load_scenario('data/basic_scenario.xml')
+        with patch(
+            'openassessment.xblock.openassessmentblock.update_assessments_format',
+            side_effect=openassessmentblock.update_assessments_format
+        ) as mock_format:
+            snapshot = xblock.config_snapshot
+            self.assertEqual(snapshot.assessment_steps, ['peer-assessment', 'self-assessment'])
+            self.assertEqual(xblock.assessment_steps, snapshot.assessment_steps)
+            self.assertEqual(xblock.workflow_requirements()["peer"], {"must_grade": 5, "must_be_graded_by": 3})
+
+            # The snapshot is built once, and shared by other instances of the same block
+            self.assertIs(other_xblock.config_snapshot, snapshot)
+            self.assertEqual(mock_format.call_count, 1)
+
+            # The values of the shared snapshot cannot be modified, but their copies can
+            with self.assertRaises(TypeError):
+                xblock.valid_assessments[0]['must_grade'] = 1
+            with self.assertRaises(TypeError):
+                xblock.assessment_steps.append('staff-assessment')
+            with self.assertRaises(TypeError):
+                xblock.workflow_requirements()["peer"].update(must_grade=1)
+            with self.assertRaises(TypeError):
+                del xblock.prompts[0]
+            assessments = copy.deepcopy(xblock.valid_assessments)
+            assessments[0]['must_grade'] = 1
+            self.assertEqual(type(assessments[0]), dict)
+            self.assertEqual(other_xblock.valid_assessments[0]['must_grade'], 5)
+
+            # Setting the assessments builds a new snapshot
+            xblock.rubric_assessments = [{'name': 'self-assessment'}]
+            self.assertEqual(xblock.assessment_steps, ['self-assessment'])
+            self.assertEqual(xblock.workflow_requirements(), {})
+            self.assertEqual(mock_format.call_count, 2)
+
+            # Modifying the assessments in place requires invalidating the snapshot
+            xblock.rubric_assessments.append({'name': 'staff-assessment', 'required': False})
+            xblock.invalidate_config_snapshot()
+            self.assertEqual(xblock.assessment_steps, ['self-assessment', 'staff-assessment'])
+
     @scenario('data/neither_response_type.xml')
     def test_no_response_type(self, xblock):
         """
@@ -682,6 +793,28 @@ class TestDates(XBlockHandlerTestCase):
         is_closed, __, __, __ = xblock.is_closed()
         self.assertTrue(is_closed)
 
+    @scenario('data/basic_scenario.xml')
+    def test_resolved_dates_cached(self, xblock):
+        openassessmentblock._RESOLVED_DATES_CACHE.clear()  # pylint: disable=protected-access
+        with patch(
+            'openassessment.xblock.openassessmentblock.resolve_dates', side_effect=openassessmentblock.resolve_dates
+        ) as mock_resolve:
+            for step in [None, "submission", "peer-assessment", "self-assessment"]:
+                xblock.is_closed(step=step)
+                xblock.is_released(step=step)
+
+            # The dates are resolved once, and shared by other instances of the same block
+            self.assertEqual(mock_resolve.call_count, 1)
+            other_xblock = self.load_scenario('data/basic_scenario.xml')
+            other_xblock.is_closed()
+            self.assertEqual(mock_resolve.call_count, 1)
+
+            # Changing a date resolves the dates again
+            xblock.submission_due = "2040-01-01T00:00:00"
+            __, __, __, due_date = xblock.is_closed(step="submission")
+            self.assertEqual(mock_resolve.call_count, 2)
+            self.assertEqual(due_date, dt.datetime(2040, 1, 1, tzinfo=pytz.utc))
+
     @scenario('data/basic_scenario.xml')
     def test_is_released_unpublished(self, xblock):
         # The scenario doesn't provide a start date, so `is_released()`
@@ -6,7 +6,7 @@ from collections import namedtuple
 import json
 import datetime
 import urllib
-from mock import MagicMock, Mock, call, patch
+from mock import MagicMock, Mock, patch
 from django.test.utils import override_settings
 
 from openassessment.assessment.api import peer as peer_api
@@ -414,14 +414,14 @@ class TestCourseStaff(XBlockHandlerTestCase):
 
         # Mock the file upload API to avoid hitting S3
         with patch("openassessment.xblock.submission_mixin.file_upload_api") as file_api:
-            file_api.get_download_url.return_value = "http://www.example.com/image.jpeg"
+            file_api.get_download_urls.return_value = ["http://www.example.com/image.jpeg"]
             # also fake a file_upload_type so our patched url gets rendered
             xblock.file_upload_type_raw = 'image'
 
             __, context = xblock.get_student_info_path_and_context("Bob")
 
             # Check that the right file key was passed to generate the download url
-            file_api.get_download_url.assert_called_with("test_key")
+            file_api.get_download_urls.assert_called_with(["test_key"])
 
             # Check the context passed to the template
             self.assertEquals([('http://www.example.com/image.jpeg', 'test_description')], context['staff_file_urls'])
@@ -460,17 +460,15 @@ class TestCourseStaff(XBlockHandlerTestCase):
 
         # Mock the file upload API to avoid hitting S3
         with patch("openassessment.xblock.submission_mixin.file_upload_api") as file_api:
-            file_api.get_download_url.return_value = Mock()
-            file_api.get_download_url.side_effect = lambda file_key: file_keys_with_images[file_key]
+            file_api.get_download_urls.side_effect = lambda keys: [file_keys_with_images[key] for key in keys]
 
             # also fake a file_upload_type so our patched url gets rendered
             xblock.file_upload_type_raw = 'image'
 
             __, context = xblock.get_student_info_path_and_context("Bob")
 
-            # Check that the right file key was passed to generate the download url
-            calls = [call("test_key%d" % i) for i in range(3)]
-            file_api.get_download_url.assert_has_calls(calls)
+            # Check that the urls of all files were generated at once
+            file_api.get_download_urls.assert_called_with(file_keys)
 
             # Check the context passed to the template
             self.assertEquals([(image, "test_description%d" % i) for i, image in enumerate(images)],
@@ -502,7 +500,7 @@ class TestCourseStaff(XBlockHandlerTestCase):
         }, ['self'])
 
         # Mock the file upload API to simulate an error
-        with patch("openassessment.fileupload.api.get_download_url") as file_api_call:
+        with patch("openassessment.fileupload.api.get_download_urls") as file_api_call:
             file_api_call.side_effect = FileUploadInternalError("Error!")
             __, context = xblock.get_student_info_path_and_context("Bob")
 
@@ -840,6 +838,72 @@ class TestCourseStaff(XBlockHandlerTestCase):
             'submission_returned_uuid': submission['uuid']
         })
 
+    @scenario('data/staff_grade_scenario.xml', user_id='Bob')
+    def test_prefetch_staff_grade_forms(self, xblock):
+        resp = self.request(xblock, 'prefetch_staff_grade_forms', json.dumps({}), response_format='json')
+        self.assertFalse(resp['success'])
+        self.assertIn("You do not have permission", resp['msg'])
+
+        # Simulate that we are course staff
+        xblock.xmodule_runtime = self._create_mock_runtime(
+            xblock.scope_ids.usage_id, True, False, "Bob"
+        )
+
+        resp = self.request(xblock, 'prefetch_staff_grade_forms', json.dumps({}), response_format='json')
+        self.assertTrue(resp['success'])
+        self.assertEqual(resp['forms'], [])
+
+        submissions = []
+        for student_id in ("Alice", "Carol", "Dave"):
+            student_item = STUDENT_ITEM.copy()
+            student_item["student_id"] = student_id
+            student_item["item_id"] = xblock.scope_ids.usage_id
+            submissions.append(self._create_submission(student_item, {'text': "Answer from " + student_id}, []))
+
+        resp = self.request(
+            xblock, 'prefetch_staff_grade_forms', json.dumps({'count': 2}), response_format='json'
+        )
+        self.assertTrue(resp['success'])
+        self.assertEqual(
+            [form['submission_uuid'] for form in resp['forms']],
+            [submissions[0]['uuid'], submissions[1]['uuid']]
+        )
+        self.assertIn("Answer from Alice", resp['forms'][0]['html'])
+        self.assertIn("Answer from Carol", resp['forms'][1]['html'])
+        self.assert_event_published(xblock, 'openassessmentblock.get_submission_for_staff_grading', {
+            'type': 'full-grade',
+            'requesting_staff_id': 'Bob',
+            'item_id': xblock.scope_ids.usage_id,
+            'submission_returned_uuid': submissions[1]['uuid']
+        })
+
+        resp = self.request(
+            xblock, 'prefetch_staff_grade_forms', json.dumps({'count': 'many'}), response_format='json'
+        )
+        self.assertFalse(resp['success'])
+
+    @scenario('data/staff_grade_scenario.xml', user_id='Bob')
+    def test_release_staff_grade_forms(self, xblock):
+        xblock.xmodule_runtime = self._create_mock_runtime(
+            xblock.scope_ids.usage_id, True, False, "Bob"
+        )
+        student_item = STUDENT_ITEM.copy()
+        student_item["item_id"] = xblock.scope_ids.usage_id
+        submission = self._create_submission(student_item, {'text': "Grade me, please!"}, [])
+
+        resp = self.request(xblock, 'prefetch_staff_grade_forms', json.dumps({}), response_format='json')
+        self.assertEqual(len(resp['forms']), 1)
+        _, context = xblock.get_staff_path_and_context()
+        self._verify_staff_assessment_context(context, True, 0, 1)
+
+        resp = self.request(
+            xblock, 'release_staff_grade_forms',
+            json.dumps({'submission_uuids': [submission['uuid']]}), response_format='json'
+        )
+        self.assertTrue(resp['success'])
+        _, context = xblock.get_staff_path_and_context()
+        self._verify_staff_assessment_context(context, True, 1, 0)
+
     @scenario('data/self_only_scenario.xml', user_id='Bob')
     def test_staff_delete_student_state(self, xblock):
         # Simulate that we are course staff
@@ -876,6 +940,36 @@ class TestCourseStaff(XBlockHandlerTestCase):
         resp = xblock.render_student_info(request)
         self.assertIn("response was not found", resp.body.lower())
 
+    @scenario('data/self_only_scenario.xml', user_id='Bob')
+    def test_staff_delete_student_state_removes_files(self, xblock):
+        xblock.xmodule_runtime = self._create_mock_runtime(
+            xblock.scope_ids.usage_id, True, False, 'Bob'
+        )
+        xblock.file_upload_type_raw = 'image'
+
+        with patch("openassessment.xblock.submission_mixin.file_upload_api") as file_api:
+            file_api.remove_files.return_value = [True, False]
+            xblock.clear_student_state('Bob', 'test_course', xblock.scope_ids.usage_id, 'Bob')
+
+        # All the files of the learner are removed with a single call
+        keys = file_api.remove_files.call_args[0][0]
+        self.assertEqual(file_api.remove_files.call_count, 1)
+        self.assertEqual(len(keys), xblock.MAX_FILES_COUNT)
+        self.assertEqual(keys[0], u"Bob/test_course/{}".format(xblock.scope_ids.usage_id))
+        self.assertEqual(keys[1], u"Bob/test_course/{}/1".format(xblock.scope_ids.usage_id))
+
+    @scenario('data/self_only_scenario.xml', user_id='Bob')
+    def test_staff_delete_student_state_file_error(self, xblock):
+        xblock.xmodule_runtime = self._create_mock_runtime(
+            xblock.scope_ids.usage_id, True, False, 'Bob'
+        )
+        xblock.file_upload_type_raw = 'image'
+
+        # Errors removing the files do not prevent the reset
+        with patch("openassessment.xblock.submission_mixin.file_upload_api") as file_api:
+            file_api.remove_files.side_effect = FileUploadInternalError("Oh no")
+            xblock.clear_student_state('Bob', 'test_course', xblock.scope_ids.usage_id, 'Bob')
+
     def _verify_staff_assessment_context(self, context, required, ungraded=None, in_progress=None):
         """
         Internal helper for common staff assessment context verification.
@@ -221,6 +221,35 @@ class SubmissionTest(XBlockHandlerTestCase):
         self.assertTrue(resp['success'])
         self.assertEqual(u'', resp['url'])
 
+    @mock_s3
+    @override_settings(
+        AWS_ACCESS_KEY_ID='foobar',
+        AWS_SECRET_ACCESS_KEY='bizbaz',
+        FILE_UPLOAD_STORAGE_BUCKET_NAME="mybucket"
+    )
+    @scenario('data/file_upload_scenario.xml')
+    def test_remove_all_uploaded_files_at_once(self, xblock):
+        """ Test that the user files up to the first missing one are removed with a single call """
+        conn = boto.connect_s3()
+        bucket = conn.create_bucket('mybucket')
+        key_prefix = "submissions_attachments/test_student/test_course/" + xblock.scope_ids.usage_id
+        for key_name in [key_prefix, key_prefix + "/1", key_prefix + "/3"]:
+            key = Key(bucket)
+            key.key = key_name
+            key.set_contents_from_string("How d'ya do?")
+
+        xblock.xmodule_runtime = Mock(
+            course_id='test_course',
+            anonymous_student_id='test_student',
+        )
+
+        with patch('openassessment.fileupload.api.remove_files', side_effect=api.remove_files) as mock_remove:
+            resp = self.request(xblock, 'remove_all_uploaded_files', json.dumps(dict()), response_format='json')
+        self.assertTrue(resp['success'])
+        self.assertEqual(resp['removed_num'], 2)
+        self.assertEqual(mock_remove.call_count, 1)
+        self.assertEqual([key.name for key in bucket.list()], [key_prefix + "/3"])
+
     @mock_s3
     @override_settings(
         AWS_ACCESS_KEY_ID='foobar',
@@ -1,6 +1,7 @@
 """
 Handle OpenAssessment XBlock requests to the Workflow API.
 """
+from contextlib import contextmanager
 
 from xblock.core import XBlock
 
@@ -9,6 +10,45 @@ from openassessment.workflow.models import AssessmentWorkflowCancellation
 from openassessment.xblock.data_conversion import create_rubric_dict
 
 
+def workflow_requirements_for(assessments):
+    """
+    Build the requirements that the workflow checks before the student can receive a score.
+
+    Args:
+        assessments (list of dict): The valid assessment modules of the problem.
+
+    Returns:
+        dict
+
+    """
+    modules = {}
+    for assessment in assessments:
+        modules.setdefault(assessment["name"], assessment)
+
+    requirements = {}
+
+    peer_assessment_module = modules.get('peer-assessment')
+    if peer_assessment_module:
+        requirements["peer"] = {
+            "must_grade": peer_assessment_module["must_grade"],
+            "must_be_graded_by": peer_assessment_module["must_be_graded_by"]
+        }
+
+    training_module = modules.get('student-training')
+    if training_module:
+        requirements["training"] = {
+            "num_required": len(training_module["examples"])
+        }
+
+    staff_assessment_module = modules.get('staff-assessment')
+    if staff_assessment_module:
+        requirements["staff"] = {
+            "required": staff_assessment_module["required"]
+        }
+
+    return requirements
+
+
 class WorkflowMixin(object):
     """
     Handle OpenAssessment XBlock requests to the Workflow API.
@@ -24,6 +64,10 @@ class WorkflowMixin(object):
         "staff-assessment": "staff"
     }
 
+    # Workflow info of the current student, keyed by submission UUID, while
+    # it is shared by the steps rendered in one request; None otherwise.
+    _shared_workflow_info = None
+
     @XBlock.json_handler
     def handle_workflow_info(self, data, suffix=''):    # pylint:disable=W0613
         """
@@ -72,28 +116,7 @@ class WorkflowMixin(object):
             dict
 
         """
-        requirements = {}
-
-        peer_assessment_module = self.get_assessment_module('peer-assessment')
-        if peer_assessment_module:
-            requirements["peer"] = {
-                "must_grade": peer_assessment_module["must_grade"],
-                "must_be_graded_by": peer_assessment_module["must_be_graded_by"]
-            }
-
-        training_module = self.get_assessment_module('student-training')
-        if training_module:
-            requirements["training"] = {
-                "num_required": len(training_module["examples"])
-            }
-
-        staff_assessment_module = self.get_assessment_module('staff-assessment')
-        if staff_assessment_module:
-            requirements["staff"] = {
-                "required": staff_assessment_module["required"]
-            }
-
-        return requirements
+        return self.config_snapshot.workflow_requirements
 
     def update_workflow_status(self, submission_uuid=None):
         """
@@ -137,10 +160,30 @@ class WorkflowMixin(object):
             submission_uuid = self.submission_uuid
             if submission_uuid is None:
                 return {}
+            if self._shared_workflow_info is not None:
+                if submission_uuid not in self._shared_workflow_info:
+                    self._shared_workflow_info[submission_uuid] = workflow_api.get_workflow_for_submission(
+                        submission_uuid, self.workflow_requirements()
+                    )
+                return self._shared_workflow_info[submission_uuid]
         return workflow_api.get_workflow_for_submission(
             submission_uuid, self.workflow_requirements()
         )
 
+    @contextmanager
+    def sharing_workflow_info(self):
+        """
+        Within this context, the workflow of the current student is retrieved
+        only once, and the same description is returned by every call to
+        `get_workflow_info`.  The steps of the workflow must not be updated
+        within the context.
+        """
+        self._shared_workflow_info = {}
+        try:
+            yield
+        finally:
+            self._shared_workflow_info = None
+
     def get_workflow_status_counts(self):
         """
         Retrieve the counts of students in each step of the workflow.
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+"""
+Measure the time spent importing the ORA XBlock, like `python -X importtime`
+(which is not available in Python 2.7).
+
+Usage:
+    python scripts/import_time.py [--top N] [--forbid MODULE ...] [MODULE ...]
+
+Django is set up (loading the models of the installed apps) and the modules
+are imported (by default, the XBlock), then the time spent importing each
+module is reported on stderr, in the format of `python -X importtime`:
+
+    import time: self [us] | cumulative | imported package
+
+Run it in a fresh process, with the DJANGO_SETTINGS_MODULE environment
+variable set (settings.test by default).
+
+The script fails if any of the forbidden modules were imported: by default,
+the client libraries of the file upload backends and the AI grading tasks,
+which are only imported when they are used.
+"""
+import __builtin__
+import argparse
+import os
+import sys
+import timeit
+
+
+DEFAULT_MODULES = ['openassessment.xblock.openassessmentblock']
+
+FORBIDDEN_MODULES = [
+    'boto',
+    'swiftclient',
+    'openassessment.fileupload.backends.s3',
+    'openassessment.fileupload.backends.swift',
+    'openassessment.assessment.worker.grading',
+    'openassessment.assessment.worker.training',
+]
+
+
+class ImportTimer(object):
+    """
+    Time the imports of modules by wrapping the `__import__` builtin.
+    """
+
+    def __init__(self):
+        self.records = []
+        self._children_times = []
+        self._original_import = __builtin__.__import__
+
+    def install(self):
+        """
+        Start timing imports.
+        """
+        __builtin__.__import__ = self._timed_import
+
+    def uninstall(self):
+        """
+        Stop timing imports.
+        """
+        __builtin__.__import__ = self._original_import
+
+    def _timed_import(  # pylint: disable=redefined-builtin
+            self, name, globals=None, locals=None, fromlist=None, level=-1
+    ):
+        """
+        Import a module, recording its self and cumulative import times (in seconds)
+        if it was not imported yet.  Time spent importing other modules is not part
+        of the self time.
+        """
+        module_names = self._module_names(name, globals, level)
+        is_new = not any(sys.modules.get(module_name) for module_name in module_names)
+
+        self._children_times.append(0.0)
+        start = timeit.default_timer()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            cumulative = timeit.default_timer() - start
+            children = self._children_times.pop()
+            if self._children_times:
+                self._children_times[-1] += cumulative
+            imported = [module_name for module_name in module_names if sys.modules.get(module_name)]
+            if is_new and imported:
+                self.records.append((len(self._children_times), imported[0], cumulative - children, cumulative))
+
+    @staticmethod
+    def _module_names(name, globals, level):  # pylint: disable=redefined-builtin
+        """
+        Return the names that an import can resolve to: in Python 2, imports
+        are relative to the current package before they are absolute.
+        """
+        names = [name]
+        if level != 0 and globals:
+            package = globals.get('__package__') or globals.get('__name__', '').rpartition('.')[0]
+            if package:
+                names.insert(0, u"{}.{}".format(package, name))
+        return names
+
+    def report(self, stream, top=None):
+        """
+        Write the import times (in microseconds), in the order in which the imports completed,
+        or the `top` slowest imports by cumulative time.
+        """
+        records = self.records
+        if top is not None:
+            records = sorted(records, key=lambda record: record[3], reverse=True)[:top]
+        stream.write("import time: self [us] | cumulative | imported package\n")
+        for depth, name, self_time, cumulative in records:
+            stream.write("import time: {:>9} | {:>10} | {}{}\n".format(
+                int(self_time * 1e6), int(cumulative * 1e6), "  " * depth, name
+            ))
+
+    def total(self):
+        """
+        Return the total time (in seconds) spent in top-level imports.
+        """
+        return sum(record[3] for record in self.records if record[0] == 0)
+
+
+def main():
+    """
+    Time the imports of the modules, then check that no forbidden module was imported.
+    """
+    parser = argparse.ArgumentParser(description="Measure the time spent importing the ORA XBlock.")
+    parser.add_argument('modules', nargs='*', default=DEFAULT_MODULES, help="Modules to import")
+    parser.add_argument('--top', type=int, default=None, help="Only report the N slowest imports")
+    parser.add_argument(
+        '--forbid', action='append', default=None,
+        help="Fail if this module is imported (defaults to the lazily imported modules)"
+    )
+    args = parser.parse_args()
+
+    # Make sure that the root repo directory is in the Python path, so Django can find the settings module.
+    sys.path.insert(1, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'settings.test')
+
+    timer = ImportTimer()
+    timer.install()
+    try:
+        import django
+        django.setup()
+        for module in args.modules:
+            __import__(module)
+    finally:
+        timer.uninstall()
+
+    timer.report(sys.stderr, top=args.top)
+    sys.stderr.write("Total import time: {:.3f} s\n".format(timer.total()))
+
+    forbidden = [module for module in (args.forbid or FORBIDDEN_MODULES) if module in sys.modules]
+    if forbidden:
+        sys.stderr.write("Imported modules that should be imported lazily: {}\n".format(", ".join(forbidden)))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
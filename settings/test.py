@@ -27,6 +27,15 @@ DATABASES = {
         'ENGINE': 'django.db.backends.sqlite3',
         'TEST_MIRROR': 'default',
     },
+    'archive': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': 'test_ora2db_archive',
+    },
+    # A read replica that is not a mirror of the primary database, to test the database router
+    'lagging_replica': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': 'test_ora2db_lagging_replica',
+    },
 }
 
 TEST_RUNNER = 'django_nose.NoseTestSuiteRunner'